@@ -12,19 +12,30 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from fastestimator import architecture, backend, dataset, layers, op, schedule, summary, trace, util, xai
-from fastestimator.estimator import Estimator, enable_deterministic
-from fastestimator.network import Network, build
-from fastestimator.pipeline import Pipeline
+from fastestimator.util.lazy_util import make_lazy
 
-# Fix known bugs with libraries which use multi-processing in a way which conflicts with pytorch data loader
-import cv2
-cv2.setNumThreads(0)
-try:
-    import SimpleITK as sitk
-    sitk.ProcessObject.SetGlobalDefaultNumberOfThreads(1)
-except ModuleNotFoundError:
-    pass
+# Subpackages are only imported when they are first used, so that `import fastestimator` does not pull in TensorFlow
+# and PyTorch until they are actually needed
+make_lazy(
+    __name__, {
+        "architecture": "fastestimator.architecture",
+        "backend": "fastestimator.backend",
+        "dataset": "fastestimator.dataset",
+        "export": "fastestimator.export",
+        "layers": "fastestimator.layers",
+        "op": "fastestimator.op",
+        "schedule": "fastestimator.schedule",
+        "summary": "fastestimator.summary",
+        "trace": "fastestimator.trace",
+        "util": "fastestimator.util",
+        "xai": "fastestimator.xai",
+        "Estimator": "fastestimator.estimator",
+        "enable_deterministic": "fastestimator.estimator",
+        "InferenceSession": "fastestimator.inference",
+        "Network": "fastestimator.network",
+        "build": "fastestimator.network",
+        "Pipeline": "fastestimator.pipeline",
+    })
 
 __version__ = '1.1.3'
 fe_deterministic_seed = None
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar
+from typing import TypeVar, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def argmax(tensor: Tensor, axis: int = 0) -> Tensor:
@@ -55,9 +61,9 @@ def argmax(tensor: Tensor, axis: int = 0) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.argmax(tensor, axis=axis)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return tensor.max(dim=axis, keepdim=False)[1]
     elif isinstance(tensor, np.ndarray):
         return np.argmax(tensor, axis=axis)
@@ -12,15 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Collection, TypeVar, Union
+from typing import Collection, TypeVar, Union, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-from fastestimator.util.util import STRING_TO_TF_DTYPE, STRING_TO_TORCH_DTYPE
+from fastestimator.util import util  # The dtype tables are built on first use, so look them up at call time
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def cast(data: Union[Collection, Tensor], dtype: str) -> Union[Collection, Tensor]:
@@ -67,9 +72,9 @@ def cast(data: Union[Collection, Tensor], dtype: str) -> Union[Collection, Tenso
         return tuple([cast(val, dtype) for val in data])
     elif isinstance(data, set):
         return set([cast(val, dtype) for val in data])
-    elif tf.is_tensor(data):
-        return tf.cast(data, STRING_TO_TF_DTYPE[dtype])
-    elif isinstance(data, torch.Tensor):
-        return data.type(STRING_TO_TORCH_DTYPE[dtype])
+    elif is_tf_tensor(data):
+        return tf.cast(data, util.STRING_TO_TF_DTYPE[dtype])
+    elif is_torch_tensor(data):
+        return data.type(util.STRING_TO_TORCH_DTYPE[dtype])
     else:
         return np.array(data, dtype=dtype)
@@ -15,11 +15,15 @@
 from typing import Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-def check_nan(val: Union[int, float, np.ndarray, tf.Tensor, torch.Tensor]) -> bool:
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+
+def check_nan(val: Union[int, float, np.ndarray, 'tf.Tensor', 'torch.Tensor']) -> bool:
     """Checks if the input contains NaN values.
 
     This method can be used with Numpy data:
@@ -46,9 +50,9 @@ def check_nan(val: Union[int, float, np.ndarray, tf.Tensor, torch.Tensor]) -> bo
     Returns:
         True iff `val` contains NaN
     """
-    if tf.is_tensor(val):
+    if is_tf_tensor(val):
         return tf.reduce_any(tf.math.is_nan(val)) or tf.reduce_any(tf.math.is_inf(val))
-    elif isinstance(val, torch.Tensor):
+    elif is_torch_tensor(val):
         return torch.isnan(val).any() or torch.isinf(val).any()
     else:
         return np.isnan(val).any() or np.isinf(val).any()
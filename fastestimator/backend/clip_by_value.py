@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar, Union
+from typing import TypeVar, Union, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def clip_by_value(tensor: Tensor,
@@ -62,17 +68,17 @@ def clip_by_value(tensor: Tensor,
         ValueError: If `tensor` is an unacceptable data type.
     """
     assert min_value is not None or max_value is not None, "Both min_value and max_value must not be NoneType"
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         if min_value is None:
             return tf.math.minimum(tensor, max_value)
         elif max_value is None:
             return tf.math.maximum(tensor, min_value)
         else:
             return tf.clip_by_value(tensor, clip_value_min=min_value, clip_value_max=max_value)
-    elif isinstance(tensor, torch.Tensor):
-        if isinstance(min_value, torch.Tensor):
+    elif is_torch_tensor(tensor):
+        if is_torch_tensor(min_value):
             min_value = min_value.item()
-        if isinstance(max_value, torch.Tensor):
+        if is_torch_tensor(max_value):
             max_value = max_value.item()
         return tensor.clamp(min=min_value, max=max_value)
     elif isinstance(tensor, np.ndarray):
@@ -15,10 +15,14 @@
 from typing import List, Optional, TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def concat(tensors: List[Tensor], axis: int = 0) -> Optional[Tensor]:
@@ -57,9 +61,9 @@ def concat(tensors: List[Tensor], axis: int = 0) -> Optional[Tensor]:
     """
     if len(tensors) == 0:
         return None
-    if tf.is_tensor(tensors[0]):
+    if is_tf_tensor(tensors[0]):
         return tf.concat(tensors, axis=axis)
-    elif isinstance(tensors[0], torch.Tensor):
+    elif is_torch_tensor(tensors[0]):
         return torch.cat(tensors, dim=axis)
     elif isinstance(tensors[0], np.ndarray):
         return np.concatenate(tensors, axis=axis)
@@ -15,10 +15,14 @@
 from typing import TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def exp(tensor: Tensor) -> Tensor:
@@ -51,9 +55,9 @@ def exp(tensor: Tensor) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.exp(tensor)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return torch.exp(tensor)
     elif isinstance(tensor, np.ndarray):
         return np.exp(tensor)
@@ -15,10 +15,14 @@
 from typing import TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def expand_dims(tensor: Tensor, axis: int = 1) -> Tensor:
@@ -55,9 +59,9 @@ def expand_dims(tensor: Tensor, axis: int = 1) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.expand_dims(tensor, axis=axis)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return torch.unsqueeze(tensor, dim=axis)
     elif isinstance(tensor, np.ndarray):
         return np.expand_dims(tensor, axis=axis)
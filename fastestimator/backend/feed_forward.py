@@ -12,18 +12,22 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar, Union
+from typing import TypeVar, Union, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
 from fastestimator.backend.to_tensor import to_tensor
+from fastestimator.util.distributed import get_replica_module
+from fastestimator.util.util import is_tf_model, is_tf_tensor, is_torch_model, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
 
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
-def feed_forward(model: Union[tf.keras.Model, torch.nn.Module], x: Union[Tensor, np.ndarray],
+
+def feed_forward(model: Union['tf.keras.Model', 'torch.nn.Module'], x: Union[Tensor, np.ndarray],
                  training: bool = True) -> Tensor:
     """Run a forward step on a given model.
 
@@ -54,15 +58,16 @@ def feed_forward(model: Union[tf.keras.Model, torch.nn.Module], x: Union[Tensor,
     Raises:
         ValueError: If `model` is an unacceptable data type.
     """
-    if isinstance(model, tf.keras.Model):
-        if not tf.is_tensor(x):
+    if is_tf_model(model):
+        if not is_tf_tensor(x):
             x = to_tensor(x, "tf")
         x = model(x, training=training)
-    elif isinstance(model, torch.nn.Module):
+    elif is_torch_model(model):
         model.train(mode=training)
-        if not isinstance(x, torch.Tensor):
+        if not is_torch_tensor(x):
             x = to_tensor(x, "torch")
-        x = model(x)
+        # When training with multiple processes, run through the DistributedDataParallel wrapper to sync the gradients
+        x = get_replica_module(model)(x)
     else:
         raise ValueError("Unrecognized model instance {}".format(type(model)))
     return x
@@ -15,14 +15,17 @@
 from typing import TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
 from fastestimator.backend.expand_dims import expand_dims
 from fastestimator.backend.squeeze import squeeze
 from fastestimator.backend.to_tensor import to_tensor
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def gather_from_batch(tensor: Tensor, indices: Tensor) -> Tensor:
@@ -68,13 +71,13 @@ def gather_from_batch(tensor: Tensor, indices: Tensor) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         indices = to_tensor(indices, 'tf')
         indices = tf.cast(indices, tf.int64)
         if len(indices.shape) == 1:  # Indices not batched
             indices = expand_dims(indices, 1)
         return tf.gather_nd(tensor, indices=indices, batch_dims=1)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return tensor[torch.arange(tensor.shape[0]), squeeze(indices)]
     elif isinstance(tensor, np.ndarray):
         return tensor[np.arange(tensor.shape[0]), squeeze(indices)]
@@ -12,20 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Iterable, Optional, TypeVar, Union
+from typing import Iterable, Optional, TypeVar, Union, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import NonContext, is_tf_tensor, is_torch_tensor
 
-from fastestimator.util.util import NonContext
+if TYPE_CHECKING:
+    import tensorflow as tf
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 def get_gradient(target: Tensor,
                  sources: Union[Iterable[Tensor], Tensor],
                  higher_order: bool = False,
-                 tape: Optional[tf.GradientTape] = None,
+                 tape: Optional['tf.GradientTape'] = None,
                  retain_graph: bool = True) -> Union[Iterable[Tensor], Tensor]:
     """Calculate gradients of a target w.r.t sources.
 
@@ -67,10 +70,10 @@ def get_gradient(target: Tensor,
     Raises:
         ValueError: If `target` is an unacceptable data type.
     """
-    if tf.is_tensor(target):
+    if is_tf_tensor(target):
         with NonContext() if higher_order else tape.stop_recording():
             gradients = tape.gradient(target, sources)
-    elif isinstance(target, torch.Tensor):
+    elif is_torch_tensor(target):
         gradients = torch.autograd.grad(target,
                                         sources,
                                         grad_outputs=torch.ones_like(target),
@@ -78,7 +81,7 @@ def get_gradient(target: Tensor,
                                         create_graph=higher_order,
                                         only_inputs=True)
 
-        if isinstance(sources, torch.Tensor):
+        if is_torch_tensor(sources):
             #  The behavior table of tf and torch backend
             #  ---------------------------------------------------------------
             #        | case 1                     | case 2                    |
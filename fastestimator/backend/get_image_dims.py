@@ -12,13 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar
+from typing import TypeVar, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def get_image_dims(tensor: Tensor) -> Tensor:
@@ -53,9 +57,9 @@ def get_image_dims(tensor: Tensor) -> Tensor:
     """
     assert len(tensor.shape) == 3 or len(tensor.shape) == 4, "Number of dimensions of input must be either 3 or 4"
     shape_length = len(tensor.shape)
-    if tf.is_tensor(tensor) or isinstance(tensor, np.ndarray):
+    if is_tf_tensor(tensor) or isinstance(tensor, np.ndarray):
         return tensor.shape[-1], tensor.shape[-3], tensor.shape[-2]
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return tensor.shape[-3], tensor.shape[-2], tensor.shape[-1]
     else:
         raise ValueError("Unrecognized tensor type {}".format(type(tensor)))
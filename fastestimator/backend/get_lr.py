@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Union
+from typing import Union, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_model, is_torch_model
 
+if TYPE_CHECKING:
+    import torch
 
-def get_lr(model: Union[tf.keras.Model, torch.nn.Module]) -> float:
+tf = lazy_import('tensorflow')
+
+
+def get_lr(model: Union['tf.keras.Model', 'torch.nn.Module']) -> float:
     """Get the learning rate of a given `model` generated by `fe.build`.
 
     This method can be used with TensorFlow models:
@@ -43,9 +48,9 @@ def get_lr(model: Union[tf.keras.Model, torch.nn.Module]) -> float:
         ValueError: If `model` is an unacceptable data type.
     """
     assert hasattr(model, "fe_compiled") and model.fe_compiled, "get_lr only accept models from fe.build"
-    if isinstance(model, tf.keras.Model):
+    if is_tf_model(model):
         lr = tf.keras.backend.get_value(model.current_optimizer.lr)
-    elif isinstance(model, torch.nn.Module):
+    elif is_torch_model(model):
         lr = model.current_optimizer.param_groups[0]['lr']
     else:
         raise ValueError("Unrecognized model instance {}".format(type(model)))
@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar
-
-import tensorflow as tf
-import torch
+from typing import TypeVar, TYPE_CHECKING
 
 from fastestimator.backend.cast import cast
 from fastestimator.backend.clip_by_value import clip_by_value
 from fastestimator.backend.reduce_mean import reduce_mean
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 def hinge(y_true: Tensor, y_pred: Tensor) -> Tensor:
@@ -13,20 +13,25 @@
 # limitations under the License.
 # ==============================================================================
 import math
-from typing import Optional, TypeVar
+from typing import Optional, TypeVar, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
 from fastestimator.backend.maximum import maximum
 from fastestimator.backend.reduce_sum import reduce_sum
 from fastestimator.backend.reshape import reshape
 from fastestimator.backend.tensor_pow import tensor_pow
 from fastestimator.backend.to_tensor import to_tensor
-from fastestimator.util.util import TENSOR_TO_NP_DTYPE
+from fastestimator.util import util  # The dtype tables are built on first use, so look them up at call time
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def iwd(tensor: Tensor,
@@ -79,10 +84,9 @@ def iwd(tensor: Tensor,
     """
     if eps is None:
         eps = np.array(pairwise_distance * math.pow((1.0 - max_prob) / (max_prob * (tensor.shape[-1] - 1)), 1 / power),
-                       dtype=TENSOR_TO_NP_DTYPE[tensor.dtype])
-        eps = to_tensor(
-            eps, target_type='torch' if isinstance(tensor, torch.Tensor) else 'tf' if tf.is_tensor(tensor) else 'np')
-        if isinstance(eps, torch.Tensor):
+                       dtype=util.TENSOR_TO_NP_DTYPE[tensor.dtype])
+        eps = to_tensor(eps, target_type='torch' if is_torch_tensor(tensor) else 'tf' if is_tf_tensor(tensor) else 'np')
+        if is_torch_tensor(eps):
             eps = eps.to("cuda:0" if torch.cuda.is_available() else "cpu")
     tensor = maximum(tensor, eps)
     tensor = tensor_pow(1.0 / tensor, power)
@@ -16,12 +16,21 @@ import math
 from typing import TypeVar
 
 import numpy as np
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
 from scipy.special import lambertw as lamw
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
+
+# The piecewise initial guess is accurate to ~2% everywhere on the principal branch, and Halley iteration roughly cubes
+# the relative error at each step, so a fixed number of steps per dtype is enough to reach machine precision.
+_HALLEY_STEPS = {'float16': 1, 'bfloat16': 1, 'float32': 2, 'float64': 3}
+_BRANCH_CUTOFF = -0.25  # Below this use the series about the branch point
+_PADE_CUTOFF = 0.5  # Below this (and above _BRANCH_CUTOFF) use the Pade approximant about 0
 
 
 def lambertw(tensor: Tensor) -> Tensor:
@@ -31,6 +40,11 @@ def lambertw(tensor: Tensor) -> Tensor:
     do not check this for the sake of speed, but if an input is out of domain the return value may be random /
     inconsistent or even NaN.
 
+    TensorFlow and PyTorch inputs are evaluated with a fixed number of Halley iterations (chosen based on the input
+    dtype) starting from a piecewise rational approximation, so the computation never has to synchronize with the
+    device in order to check for convergence. Half precision inputs are computed in float32 and cast back to their
+    original dtype.
+
     This method can be used with Numpy data:
     ```python
     n = np.array([-1.0/math.e, -0.34, -0.32, -0.2, 0, 0.12, 0.15, math.e, 5, math.exp(1 + math.e), 100])
@@ -58,9 +72,9 @@ def lambertw(tensor: Tensor) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
-        return tfp.math.lambertw(tensor)
-    if isinstance(tensor, torch.Tensor):
+    if is_tf_tensor(tensor):
+        return _tf_lambertw(tensor)
+    if is_torch_tensor(tensor):
         return _torch_lambertw(tensor)
     elif isinstance(tensor, np.ndarray):
         # scipy implementation is numerically unstable at exactly -1/e, but the result should be -1.0
@@ -69,8 +83,8 @@ def lambertw(tensor: Tensor) -> Tensor:
         raise ValueError("Unrecognized tensor type {}".format(type(tensor)))
 
 
-def _torch_lambertw(z: torch.Tensor) -> torch.Tensor:
-    """Approximate the LambertW function value using Halley iteration.
+def _tf_lambertw(z: 'tf.Tensor') -> 'tf.Tensor':
+    """Approximate the LambertW function value using a fixed number of Halley iterations.
 
     Args:
         z: The inputs to the LambertW function.
@@ -78,26 +92,97 @@ def _torch_lambertw(z: torch.Tensor) -> torch.Tensor:
     Returns:
         An approximation of W(z).
     """
-    # Make some starting guesses in order to converge faster.
-    z0 = torch.where(z < -0.2649, _taylor_approx(z), _lambertw_winitzki_approx(z))
-    tolerance = 1e-6
-    # Perform at most 20 halley iteration refinements of the value (usually finishes in 2)
-    for _ in range(20):
-        f = z0 - z * torch.exp(-z0)
-        z01 = z0 + 1.0000001  # Numerical stability when z0 == -1
-        delta = f / (z01 - (z0 + 2.) * f / (2. * z01))
-        z0 = z0 - delta
-        converged = torch.abs(delta) <= tolerance * torch.abs(z0)
-        if torch.all(converged):
-            break
-    return z0
-
-
-def _taylor_approx(z: torch.Tensor) -> torch.Tensor:
+    dtype = z.dtype
+    if dtype in (tf.float16, tf.bfloat16):
+        z = tf.cast(z, tf.float32)
+    elif not dtype.is_floating:
+        z = tf.cast(z, tf.float32)
+        dtype = tf.float32
+    w = tf.where(z < _BRANCH_CUTOFF,
+                 _branch_point_approx(z, tf.sqrt, tf.maximum),
+                 tf.where(z < _PADE_CUTOFF, _pade_approx(z), _lambertw_winitzki_approx(z, tf.math.log1p)))
+    for _ in range(_halley_steps(dtype.name)):
+        w = _halley_step(w, z, tf.exp)
+    return tf.cast(w, dtype)
+
+
+def _torch_lambertw(z: 'torch.Tensor') -> 'torch.Tensor':
+    """Approximate the LambertW function value using a fixed number of Halley iterations.
+
+    Args:
+        z: The inputs to the LambertW function.
+
+    Returns:
+        An approximation of W(z).
+    """
+    dtype = z.dtype
+    if dtype in (torch.float16, torch.bfloat16):
+        z = z.float()
+    elif not dtype.is_floating_point:
+        z = z.float()
+        dtype = torch.float32
+    w = torch.where(z < _BRANCH_CUTOFF,
+                    _branch_point_approx(z, torch.sqrt, torch.clamp_min),
+                    torch.where(z < _PADE_CUTOFF, _pade_approx(z), _lambertw_winitzki_approx(z, torch.log1p)))
+    for _ in range(_halley_steps(str(dtype).split('.')[-1])):
+        w = _halley_step(w, z, torch.exp)
+    return w.to(dtype)
+
+
+def _halley_steps(dtype: str) -> int:
+    """Determine how many Halley iterations are required to converge for a given `dtype`.
+
+    Args:
+        dtype: The name of the dtype of the original input.
+
+    Returns:
+        The number of Halley iterations to perform.
+    """
+    return _HALLEY_STEPS.get(dtype, _HALLEY_STEPS['float64'])
+
+
+def _halley_step(w: Tensor, z: Tensor, exp_fn) -> Tensor:
+    """Refine an estimate of the lambertw function using a single Halley iteration.
+
+    The iteration is performed on f(w) = w - z*exp(-w) rather than w*exp(w) - z in order to avoid overflow for large
+    inputs.
+
+    Args:
+        w: The current estimate of lambertw(z).
+        z: The input to the lambertw function.
+        exp_fn: The framework-specific exponential function.
+
+    Returns:
+        An improved estimate of lambertw(z).
+    """
+    f = w - z * exp_fn(-w)
+    w1 = w + 1.0000001  # Numerical stability when w == -1
+    return w - f / (w1 - (w + 2.) * f / (2. * w1))
+
+
+def _branch_point_approx(z: Tensor, sqrt_fn, max_fn) -> Tensor:
+    """Compute an approximation of the lambertw function at z.
+
+    Based on the series expansion about the branch point in https://arxiv.org/pdf/1003.1628.pdf. This is the most
+    accurate of the initial approximations when z < -0.25.
+
+    Args:
+        z: The input to the lambertw function.
+        sqrt_fn: The framework-specific square root function.
+        max_fn: The framework-specific elementwise maximum function.
+
+    Returns:
+        An estimated value of lambertw(z).
+    """
+    p = sqrt_fn(max_fn(2. * (1. + math.e * z), 0.))
+    return -1. + p * (1. + p * (-1. / 3. + p * (11. / 72. + p * (-43. / 540. + p * (769. / 17280.)))))
+
+
+def _pade_approx(z: Tensor) -> Tensor:
     """Compute an approximation of the lambertw function at z.
 
-    Based on the polynomial expansion in https://arxiv.org/pdf/1003.1628.pdf. An empirical comparison of this polynomial
-    expansion against the winitzki approximation found that this one is better when z < -0.2649.
+    This is the [2/2] Pade approximant of lambertw about 0, which is the most accurate of the initial approximations
+    when -0.25 <= z < 0.5.
 
     Args:
         z: The input to the lambertw function.
@@ -105,19 +190,18 @@ def _taylor_approx(z: torch.Tensor) -> torch.Tensor:
     Returns:
         An estimated value of lambertw(z).
     """
-    p2 = 2 * (1. + math.e * z)
-    p = torch.sqrt(p2)
-    return -1. + p - p2 / 3. + 0.1527777777 * p2 * p
+    return z * (1. + 4. / 3. * z) / (1. + z * (7. / 3. + 5. / 6. * z))
 
 
-def _lambertw_winitzki_approx(z: torch.Tensor) -> torch.Tensor:
+def _lambertw_winitzki_approx(z: Tensor, log1p_fn) -> Tensor:
     """Compute an approximation of the lambertw function at z.
 
     Args:
         z: The input to the lambertw function.
+        log1p_fn: The framework-specific log(1+x) function.
 
     Returns:
         An estimated value of lambertw(z).
     """
-    log1pz = torch.log1p(z)
-    return log1pz * (1. - torch.log1p(log1pz) / (2. + log1pz))
+    log1pz = log1p_fn(z)
+    return log1pz * (1. - log1p_fn(log1pz) / (2. + log1pz))
@@ -14,15 +14,19 @@
 # ==============================================================================
 import os
 import pickle
-from typing import Union
-
-import tensorflow as tf
-import torch
+from typing import Union, TYPE_CHECKING
 
 from fastestimator.backend.set_lr import set_lr
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_model, is_torch_model
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+torch = lazy_import('torch')
 
 
-def load_model(model: Union[tf.keras.Model, torch.nn.Module], weights_path: str, load_optimizer: bool = False):
+def load_model(model: Union['tf.keras.Model', 'torch.nn.Module'], weights_path: str, load_optimizer: bool = False):
     """Load saved weights for a given model.
 
     This method can be used with TensorFlow models:
@@ -48,7 +52,7 @@ def load_model(model: Union[tf.keras.Model, torch.nn.Module], weights_path: str,
         ValueError: If `model` is an unacceptable data type.
     """
     assert hasattr(model, "fe_compiled") and model.fe_compiled, "model must be built by fe.build"
-    if isinstance(model, tf.keras.Model):
+    if is_tf_model(model):
         model.load_weights(weights_path)
         if load_optimizer:
             assert model.current_optimizer, "optimizer does not exist"
@@ -58,8 +62,14 @@ def load_model(model: Union[tf.keras.Model, torch.nn.Module], weights_path: str,
                 state_dict = pickle.load(f)
             model.current_optimizer.set_weights(state_dict['weights'])
             set_lr(model, state_dict['lr'])
-    elif isinstance(model, torch.nn.Module):
-        model.load_state_dict(torch.load(weights_path))
+    elif is_torch_model(model):
+        state_dict = torch.load(weights_path)
+        # Weights saved by older versions on multi-gpu machines carry the key prefix of a DataParallel wrapper
+        prefix = "module."
+        wrapped = all(key.startswith(prefix) for key in state_dict)
+        if wrapped and not any(key.startswith(prefix) for key in model.state_dict()):
+            state_dict = {key[len(prefix):]: value for key, value in state_dict.items()}
+        model.load_state_dict(state_dict)
         if load_optimizer:
             assert model.current_optimizer, "optimizer does not exist"
             optimizer_path = "{}_opt.pt".format(os.path.splitext(weights_path)[0])
@@ -12,13 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import TypeVar
+from typing import TypeVar, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def matmul(a: Tensor, b: Tensor) -> Tensor:
@@ -55,9 +61,9 @@ def matmul(a: Tensor, b: Tensor) -> Tensor:
     Raises:
         ValueError: If either `a` or `b` are unacceptable or non-matching data types.
     """
-    if tf.is_tensor(a) and tf.is_tensor(b):
+    if is_tf_tensor(a) and is_tf_tensor(b):
         return tf.matmul(a, b)
-    elif isinstance(a, torch.Tensor) and isinstance(b, torch.Tensor):
+    elif is_torch_tensor(a) and is_torch_tensor(b):
         return a.matmul(b)
     elif isinstance(a, np.ndarray) and isinstance(b, np.ndarray):
         return np.matmul(a, b)
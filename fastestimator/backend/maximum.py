@@ -15,10 +15,14 @@
 from typing import List, TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def maximum(tensor1: Tensor, tensor2: Tensor) -> Tensor:
@@ -55,9 +59,9 @@ def maximum(tensor1: Tensor, tensor2: Tensor) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor1) and tf.is_tensor(tensor2):
+    if is_tf_tensor(tensor1) and is_tf_tensor(tensor2):
         return tf.maximum(tensor1, tensor2)
-    elif isinstance(tensor1, torch.Tensor) and isinstance(tensor2, torch.Tensor):
+    elif is_torch_tensor(tensor1) and is_torch_tensor(tensor2):
         return torch.max(tensor1, tensor2)
     elif isinstance(tensor1, np.ndarray) and isinstance(tensor2, np.ndarray):
         return np.maximum(tensor1, tensor2)
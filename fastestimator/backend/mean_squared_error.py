@@ -14,12 +14,14 @@
 # ==============================================================================
 from typing import TypeVar
 
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.reduce_mean import reduce_mean
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 def mean_squared_error(y_true: Tensor, y_pred: Tensor) -> Tensor:
@@ -59,9 +61,9 @@ def mean_squared_error(y_true: Tensor, y_pred: Tensor) -> Tensor:
     assert type(y_pred) == type(y_true), "y_pred and y_true must be of the same tensor type"
     assert y_pred.shape == y_true.shape, \
         f"MSE requires y_true and y_pred to have the same shape, but found {y_true.shape} and {y_pred.shape}"
-    if tf.is_tensor(y_pred):
+    if is_tf_tensor(y_pred):
         mse = tf.losses.MSE(y_true, y_pred)
-    elif isinstance(y_pred, torch.Tensor):
+    elif is_torch_tensor(y_pred):
         mse = reduce_mean(
             torch.nn.MSELoss(reduction="none")(y_pred, y_true), axis=[ax for ax in range(y_pred.ndim)][1:])
     else:
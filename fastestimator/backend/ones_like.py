@@ -15,12 +15,15 @@
 from typing import TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-from fastestimator.util.util import STRING_TO_TORCH_DTYPE
+from fastestimator.util import util  # The dtype tables are built on first use, so look them up at call time
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, tf.Variable, torch.Tensor, np.ndarray)
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'tf.Variable', 'torch.Tensor', np.ndarray)
 
 
 def ones_like(tensor: Tensor, dtype: Union[None, str] = None) -> Tensor:
@@ -57,10 +60,10 @@ def ones_like(tensor: Tensor, dtype: Union[None, str] = None) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.ones_like(tensor, dtype=dtype)
-    elif isinstance(tensor, torch.Tensor):
-        return torch.ones_like(tensor, dtype=STRING_TO_TORCH_DTYPE[dtype])
+    elif is_torch_tensor(tensor):
+        return torch.ones_like(tensor, dtype=util.STRING_TO_TORCH_DTYPE[dtype])
     elif isinstance(tensor, np.ndarray):
         return np.ones_like(tensor, dtype=dtype)
     else:
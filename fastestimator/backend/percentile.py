@@ -16,13 +16,15 @@ import math
 from typing import List, TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
 
-from fastestimator.util.util import to_list
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor, to_list
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+tf = lazy_import('tensorflow')
+tfp = lazy_import('tensorflow_probability')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def percentile(tensor: Tensor,
@@ -70,11 +72,11 @@ def percentile(tensor: Tensor,
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         if isinstance(percentiles, List):
             percentiles = tf.convert_to_tensor(percentiles)
         return tfp.stats.percentile(tensor, percentiles, axis=axis, keep_dims=keepdims, interpolation='lower')
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         n_dims = len(tensor.shape)
         if axis is None:
             # Default behavior in tf without axis is to compress all dimensions
@@ -15,12 +15,15 @@
 from typing import TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-from fastestimator.util.util import STRING_TO_TORCH_DTYPE
+from fastestimator.util import util  # The dtype tables are built on first use, so look them up at call time
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def random_normal_like(tensor: Tensor, mean: float = 0.0, std: float = 1.0,
@@ -61,10 +64,10 @@ def random_normal_like(tensor: Tensor, mean: float = 0.0, std: float = 1.0,
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.random.normal(shape=tensor.shape, mean=mean, stddev=std, dtype=dtype)
-    elif isinstance(tensor, torch.Tensor):
-        return torch.randn_like(tensor, dtype=STRING_TO_TORCH_DTYPE[dtype]) * std + mean
+    elif is_torch_tensor(tensor):
+        return torch.randn_like(tensor, dtype=util.STRING_TO_TORCH_DTYPE[dtype]) * std + mean
     elif isinstance(tensor, np.ndarray):
         return np.random.normal(loc=mean, scale=std, size=tensor.shape).astype(dtype=dtype)
     else:
@@ -12,15 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Sequence, TypeVar, Union
+from typing import Sequence, TypeVar, Union, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-from fastestimator.util.util import to_list
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor, to_list
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def reduce_mean(tensor: Tensor, axis: Union[None, int, Sequence[int]] = None, keepdims: bool = False) -> Tensor:
@@ -64,9 +68,9 @@ def reduce_mean(tensor: Tensor, axis: Union[None, int, Sequence[int]] = None, ke
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.reduce_mean(tensor, axis=axis, keepdims=keepdims)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         if axis is None:
             if not keepdims:
                 return tensor.mean()
@@ -15,10 +15,14 @@
 from typing import List, TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def roll(tensor: Tensor, shift: Union[int, List[int]], axis: Union[int, List[int]]) -> Tensor:
@@ -66,9 +70,9 @@ def roll(tensor: Tensor, shift: Union[int, List[int]], axis: Union[int, List[int
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.roll(tensor, shift=shift, axis=axis)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return torch.roll(tensor, shifts=shift, dims=axis)
     elif isinstance(tensor, np.ndarray):
         return np.roll(tensor, shift=shift, axis=axis)
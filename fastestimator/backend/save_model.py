@@ -14,15 +14,19 @@
 # ==============================================================================
 import os
 import pickle
-from typing import Optional, Union
-
-import tensorflow as tf
-import torch
+from typing import Optional, Union, TYPE_CHECKING
 
 from fastestimator.backend.get_lr import get_lr
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_model, is_torch_model
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+torch = lazy_import('torch')
 
 
-def save_model(model: Union[tf.keras.Model, torch.nn.Module],
+def save_model(model: Union['tf.keras.Model', 'torch.nn.Module'],
                save_dir: str,
                model_name: Optional[str] = None,
                save_optimizer: bool = False):
@@ -57,7 +61,7 @@ def save_model(model: Union[tf.keras.Model, torch.nn.Module],
         model_name = model.model_name
     save_dir = os.path.normpath(save_dir)
     os.makedirs(save_dir, exist_ok=True)
-    if isinstance(model, tf.keras.Model):
+    if is_tf_model(model):
         model_path = os.path.join(save_dir, "{}.h5".format(model_name))
         model.save_weights(model_path)
         if save_optimizer:
@@ -66,7 +70,7 @@ def save_model(model: Union[tf.keras.Model, torch.nn.Module],
             with open(optimizer_path, 'wb') as f:
                 pickle.dump({'weights': model.current_optimizer.get_weights(), 'lr': get_lr(model)}, f)
         return model_path
-    elif isinstance(model, torch.nn.Module):
+    elif is_torch_model(model):
         model_path = os.path.join(save_dir, "{}.pt".format(model_name))
         torch.save(model.state_dict(), model_path)
         if save_optimizer:
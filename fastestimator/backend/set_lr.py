@@ -12,13 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Union
+from typing import Union, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_model, is_torch_model
 
+if TYPE_CHECKING:
+    import torch
 
-def set_lr(model: Union[tf.keras.Model, torch.nn.Module], lr: float):
+tf = lazy_import('tensorflow')
+
+
+def set_lr(model: Union['tf.keras.Model', 'torch.nn.Module'], lr: float):
     """Set the learning rate of a given `model` generated by `fe.build`.
 
     This method can be used with TensorFlow models:
@@ -41,9 +46,9 @@ def set_lr(model: Union[tf.keras.Model, torch.nn.Module], lr: float):
         ValueError: If `model` is an unacceptable data type.
     """
     assert hasattr(model, "fe_compiled") and model.fe_compiled, "set_lr only accept models from fe.build"
-    if isinstance(model, tf.keras.Model):
+    if is_tf_model(model):
         tf.keras.backend.set_value(model.current_optimizer.lr, lr)
-    elif isinstance(model, torch.nn.Module):
+    elif is_torch_model(model):
         for param_group in model.current_optimizer.param_groups:
             param_group['lr'] = lr
     else:
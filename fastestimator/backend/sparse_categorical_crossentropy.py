@@ -14,12 +14,14 @@
 # ==============================================================================
 from typing import TypeVar
 
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.reduce_mean import reduce_mean
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 def sparse_categorical_crossentropy(y_pred: Tensor,
@@ -62,9 +64,9 @@ def sparse_categorical_crossentropy(y_pred: Tensor,
         AssertionError: If `y_true` or `y_pred` are unacceptable data types.
     """
     assert type(y_pred) == type(y_true), "y_pred and y_true must be same tensor type"
-    assert isinstance(y_pred, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_pred"
-    assert isinstance(y_true, (tf.Tensor, torch.Tensor)), "only support tf.Tensor or torch.Tensor as y_true"
-    if tf.is_tensor(y_pred):
+    assert is_tf_tensor(y_pred) or is_torch_tensor(y_pred), "only support tf.Tensor or torch.Tensor as y_pred"
+    assert is_tf_tensor(y_true) or is_torch_tensor(y_true), "only support tf.Tensor or torch.Tensor as y_true"
+    if is_tf_tensor(y_pred):
         ce = tf.losses.sparse_categorical_crossentropy(y_pred=y_pred, y_true=y_true, from_logits=from_logits)
     else:
         y_true = y_true.view(-1)
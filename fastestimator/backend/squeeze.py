@@ -15,10 +15,14 @@
 from typing import Optional, TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def squeeze(tensor: Tensor, axis: Optional[int] = None) -> Tensor:
@@ -58,9 +62,9 @@ def squeeze(tensor: Tensor, axis: Optional[int] = None) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.squeeze(tensor, axis=axis)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         if axis is None:
             return torch.squeeze(tensor)
         else:
@@ -15,10 +15,14 @@
 from typing import TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def tensor_pow(tensor: Tensor, power: Union[int, float]) -> Tensor:
@@ -55,9 +59,9 @@ def tensor_pow(tensor: Tensor, power: Union[int, float]) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         return tf.pow(tensor, power)
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         return torch.pow(tensor, power)
     elif isinstance(tensor, np.ndarray):
         return np.power(tensor, power)
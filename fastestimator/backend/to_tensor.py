@@ -15,10 +15,13 @@
 from typing import Collection, TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def to_tensor(data: Union[Collection, Tensor, float, int, None], target_type: str) -> Union[Collection, Tensor, None]:
@@ -54,11 +57,15 @@ def to_tensor(data: Union[Collection, Tensor, float, int, None], target_type: st
     Returns:
         A collection with the same structure as `data`, but with any tensors converted to the `target_type`.
     """
-    target_instance = {
-        "tf": (tf.Tensor, tf.Variable, tf.distribute.DistributedValues), "torch": torch.Tensor, "np": np.ndarray
-    }
-    conversion_function = {"tf": tf.convert_to_tensor, "torch": torch.from_numpy, "np": np.array}
-    if isinstance(data, target_instance[target_type]):
+    # Only the target framework is looked up, so that converting to one framework never imports the other
+    if target_type == "tf":
+        target_instance = (tf.Tensor, tf.Variable, tf.distribute.DistributedValues)
+        conversion_function = tf.convert_to_tensor
+    elif target_type == "torch":
+        target_instance, conversion_function = torch.Tensor, torch.from_numpy
+    else:
+        target_instance, conversion_function = {"np": (np.ndarray, np.array)}[target_type]
+    if isinstance(data, target_instance):
         return data
     elif data is None:
         return None
@@ -71,4 +78,4 @@ def to_tensor(data: Union[Collection, Tensor, float, int, None], target_type: st
     elif isinstance(data, set):
         return set([to_tensor(val, target_type) for val in data])
     else:
-        return conversion_function[target_type](np.array(data))
+        return conversion_function(np.array(data))
@@ -12,22 +12,24 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Callable, Dict, List, Optional, Union
-
-import tensorflow as tf
-import torch
-from tensorflow.keras.mixed_precision import experimental as mixed_precision
+from typing import Callable, Dict, List, Optional, Union, TYPE_CHECKING
 
 from fastestimator.backend.get_gradient import get_gradient
 from fastestimator.backend.reduce_mean import reduce_mean
+from fastestimator.util.distributed import get_tf_strategy
+from fastestimator.util.util import is_tf_model, is_torch_model
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
 
 
-def update_model(model: Union[tf.keras.Model, torch.nn.Module],
-                 loss: Union[None, tf.Tensor, torch.Tensor] = None,
-                 gradients: Optional[List[Union[tf.Tensor, torch.Tensor]]] = None,
-                 tape: Optional[tf.GradientTape] = None,
+def update_model(model: Union['tf.keras.Model', 'torch.nn.Module'],
+                 loss: Union[None, 'tf.Tensor', 'torch.Tensor'] = None,
+                 gradients: Optional[List[Union['tf.Tensor', 'torch.Tensor']]] = None,
+                 tape: Optional['tf.GradientTape'] = None,
                  retain_graph: bool = True,
-                 scaler: Optional[torch.cuda.amp.GradScaler] = None,
+                 scaler: Optional['torch.cuda.amp.GradScaler'] = None,
                  defer: bool = False,
                  deferred: Optional[Dict[str, List[Callable[[], None]]]] = None) -> None:
     """Update `model` weights based on a given `loss`.
@@ -71,14 +73,15 @@ def update_model(model: Union[tf.keras.Model, torch.nn.Module],
     """
     if loss is not None:
         loss = reduce_mean(loss)
-    if isinstance(model, tf.keras.Model):
+    if is_tf_model(model):
+        from tensorflow.keras.mixed_precision import experimental as mixed_precision
         if loss is not None:
             # scale up loss for mixed precision training to avoid underflow
             if isinstance(model.current_optimizer, mixed_precision.LossScaleOptimizer):
                 loss = model.current_optimizer.get_scaled_loss(loss)
-            # for multi-gpu training, the gradient will be combined by sum, normalize the loss
-            strategy = tf.distribute.get_strategy()
-            if isinstance(strategy, tf.distribute.MirroredStrategy):
+            # for multi-gpu (or multi-worker) training, the gradient will be combined by sum, normalize the loss
+            strategy = get_tf_strategy()
+            if strategy:
                 loss = loss / strategy.num_replicas_in_sync
             gradients = get_gradient(loss, model.trainable_variables, tape=tape)
         with tape.stop_recording():
@@ -90,7 +93,7 @@ def update_model(model: Union[tf.keras.Model, torch.nn.Module],
                     lambda: model.current_optimizer.apply_gradients(zip(gradients, model.trainable_variables)))
             else:
                 model.current_optimizer.apply_gradients(zip(gradients, model.trainable_variables))
-    elif isinstance(model, torch.nn.Module):
+    elif is_torch_model(model):
         trainable_params = [p for p in model.parameters() if p.requires_grad]
         # scale up loss for mixed precision training to avoid underflow
         if scaler is not None:
@@ -124,7 +127,7 @@ def update_model(model: Union[tf.keras.Model, torch.nn.Module],
         raise ValueError("Unrecognized model instance {}".format(type(model)))
 
 
-def _torch_step(optimizer: torch.optim.Optimizer, scaler: Optional[torch.cuda.amp.GradScaler] = None) -> None:
+def _torch_step(optimizer: 'torch.optim.Optimizer', scaler: Optional['torch.cuda.amp.GradScaler'] = None) -> None:
     if scaler is None:
         optimizer.step()
     else:
@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Optional, TypeVar
+from typing import Optional, TypeVar, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
 
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
-def watch(tensor: Tensor, tape: Optional[tf.GradientTape] = None) -> Tensor:
+
+def watch(tensor: Tensor, tape: Optional['tf.GradientTape'] = None) -> Tensor:
     """Monitor the given `tensor` for later gradient computations.
 
     This method can be used with TensorFlow tensors:
@@ -47,10 +50,10 @@ def watch(tensor: Tensor, tape: Optional[tf.GradientTape] = None) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(tensor):
+    if is_tf_tensor(tensor):
         tape.watch(tensor)
         return tensor
-    elif isinstance(tensor, torch.Tensor):
+    elif is_torch_tensor(tensor):
         if tensor.requires_grad:
             return tensor
         # It is tempting to just do tensor.requires_grad = True here, but that will lead to trouble
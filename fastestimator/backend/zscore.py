@@ -15,10 +15,14 @@
 from typing import TypeVar
 
 import numpy as np
-import tensorflow as tf
-import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 def zscore(data: Tensor, epsilon: float = 1e-7) -> Tensor:
@@ -51,12 +55,12 @@ def zscore(data: Tensor, epsilon: float = 1e-7) -> Tensor:
     Raises:
         ValueError: If `tensor` is an unacceptable data type.
     """
-    if tf.is_tensor(data):
+    if is_tf_tensor(data):
         data = tf.cast(data, tf.float32)
         mean = tf.reduce_mean(data)
         std = tf.keras.backend.std(data)
         return (data - mean) / tf.maximum(std, epsilon)
-    elif isinstance(data, torch.Tensor):
+    elif is_torch_tensor(data):
         data = data.type(torch.float32)
         mean = torch.mean(data)
         std = torch.std(data, unbiased=False)
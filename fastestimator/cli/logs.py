@@ -41,7 +41,9 @@ def logs(args: Dict[str, Any], unknown: List[str]) -> None:
                   args['save_dir'],
                   args['ignore'],
                   args['share_legend'],
-                  args['pretty_names'])
+                  args['pretty_names'],
+                  args['num_process'],
+                  args['cache'])
 
 
 def configure_log_parser(subparsers: argparse._SubParsersAction) -> None:
@@ -75,6 +77,15 @@ def configure_log_parser(subparsers: argparse._SubParsersAction) -> None:
                         help="The amount of gaussian smoothing to apply (zero for no smoothing)",
                         default=1)
     parser.add_argument('--pretty_names', help="Clean up the metric names for display", action='store_true')
+    parser.add_argument('--num_process',
+                        metavar='<int>',
+                        type=int,
+                        help="How many processes to use when parsing log files (defaults to one per CPU core)",
+                        default=None)
+    parser.add_argument('--no_cache',
+                        dest='cache',
+                        help="Don't cache the parsed metrics next to the log files",
+                        action='store_false')
 
     legend_group = parser.add_argument_group('legend arguments')
     legend_x_group = legend_group.add_mutually_exclusive_group(required=False)
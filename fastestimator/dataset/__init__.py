@@ -13,7 +13,7 @@
 # limitations under the License.
 # ==============================================================================
 # FEDataset and OpDataset intentionally not imported here to reduce user confusion with auto-complete
-from fastestimator.dataset import data
+from fastestimator.dataset.array_cache import RaggedArray, cache_arrays
 from fastestimator.dataset.batch_dataset import BatchDataset
 from fastestimator.dataset.csv_dataset import CSVDataset
 from fastestimator.dataset.dir_dataset import DirDataset
@@ -21,4 +21,10 @@ from fastestimator.dataset.generator_dataset import GeneratorDataset
 from fastestimator.dataset.labeled_dir_dataset import LabeledDirDataset
 from fastestimator.dataset.numpy_dataset import NumpyDataset
 from fastestimator.dataset.pickle_dataset import PickleDataset
-from fastestimator.dataset.siamese_dir_dataset import SiameseDirDataset
\ No newline at end of file
+from fastestimator.dataset.shard_dataset import ShardDataset, write_shards
+from fastestimator.dataset.siamese_dir_dataset import SiameseDirDataset
+from fastestimator.dataset.view_dataset import ConcatDataset, RepeatDataset, SubsetDataset
+from fastestimator.util.lazy_util import make_lazy
+
+# Some of the built-in datasets depend on TensorFlow, so they are only imported once they are first used
+make_lazy(__name__, {"data": "fastestimator.dataset.data"})
@@ -0,0 +1,194 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import shutil
+from typing import Callable, Dict, Sequence, Union
+
+import numpy as np
+
+_INDEX_FILE = "index.json"
+_FORMAT_NAME = "fastestimator-arrays"
+_FORMAT_VERSION = 1
+
+
+class RaggedArray:
+    """A sequence of arrays with differing shapes, packed end to end into one contiguous array.
+
+    This lets collections like variable-sized images be stored (and memory-mapped) as a handful of flat arrays rather
+    than as thousands of separate objects. Indexing returns a view into the packed values.
+
+    ```python
+    ragged = RaggedArray.from_arrays([np.zeros((2, 3)), np.ones((4, 5))])
+    ragged[1]  # <4x5 array of ones>
+    ```
+
+    This class is intentionally not @traceable.
+
+    Args:
+        values: The flattened contents of every array, concatenated together.
+        offsets: Where each array starts within `values`, followed by the total length of `values`.
+        shapes: The shape of each array, as a 2D integer array. Every array must have the same number of dimensions.
+    """
+    def __init__(self, values: np.ndarray, offsets: np.ndarray, shapes: np.ndarray) -> None:
+        self.values = values
+        self.offsets = offsets
+        self.shapes = shapes
+
+    @classmethod
+    def from_arrays(cls, arrays: Sequence[np.ndarray]) -> 'RaggedArray':
+        """Pack a sequence of arrays together.
+
+        Args:
+            arrays: The arrays to be packed. They must all have the same number of dimensions.
+
+        Returns:
+            A RaggedArray containing copies of the `arrays`.
+
+        Raises:
+            ValueError: If the `arrays` have different numbers of dimensions.
+        """
+        arrays = [np.asarray(array) for array in arrays]
+        if len({array.ndim for array in arrays}) > 1:
+            raise ValueError("All of the arrays in a RaggedArray must have the same number of dimensions")
+        shapes = np.array([array.shape for array in arrays], dtype=np.int64).reshape(len(arrays), -1)
+        offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+        np.cumsum([array.size for array in arrays], out=offsets[1:])
+        values = np.concatenate([array.reshape(-1) for array in arrays]) if arrays else np.zeros(0)
+        return cls(values, offsets, shapes)
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self.values.dtype
+
+    def __len__(self) -> int:
+        return self.shapes.shape[0]
+
+    def __getitem__(self, index: int) -> np.ndarray:
+        if not -len(self) <= index < len(self):
+            raise IndexError("RaggedArray index out of range")
+        index = index % len(self)
+        return self.values[self.offsets[index]:self.offsets[index + 1]].reshape(self.shapes[index])
+
+
+def write_arrays(arrays: Dict[str, Union[np.ndarray, RaggedArray]], save_dir: str) -> str:
+    """Write a collection of arrays to disk in a form which can later be memory-mapped by `read_arrays`.
+
+    Every array is written to its own contiguous .npy file. The index file is written last, so a directory without an
+    index file is an incomplete cache.
+
+    Args:
+        arrays: The arrays to be written, like {"x": <array>, "y": <array>}.
+        save_dir: The directory into which to write the arrays and their index. It will be created if it doesn't exist.
+
+    Returns:
+        The path to the index file which was written.
+
+    Raises:
+        ValueError: If any of the `arrays` are not numpy arrays or RaggedArrays.
+    """
+    os.makedirs(save_dir, exist_ok=True)
+    entries = {}
+    for idx, (key, array) in enumerate(arrays.items()):
+        prefix = "array-{:05d}".format(idx)
+        if isinstance(array, RaggedArray):
+            for part in ("values", "offsets", "shapes"):
+                np.save(os.path.join(save_dir, "{}.{}.npy".format(prefix, part)), getattr(array, part))
+            entries[key] = {"prefix": prefix, "ragged": True}
+        elif isinstance(array, np.ndarray):
+            np.save(os.path.join(save_dir, "{}.npy".format(prefix)), np.ascontiguousarray(array))
+            entries[key] = {"prefix": prefix, "ragged": False}
+        else:
+            raise ValueError("write_arrays only supports numpy arrays and RaggedArrays, but '{}' was a {}".format(
+                key, type(array).__name__))
+    index_path = os.path.join(save_dir, _INDEX_FILE)
+    with open(index_path, "w") as f:
+        json.dump({"format": _FORMAT_NAME, "version": _FORMAT_VERSION, "arrays": entries}, f)
+    return index_path
+
+
+def read_arrays(save_dir: str, mmap: bool = True) -> Dict[str, Union[np.ndarray, RaggedArray]]:
+    """Read back a collection of arrays which was written by `write_arrays`.
+
+    Memory-mapped arrays are opened copy-on-write: they can be modified in memory, but the files on disk never change.
+
+    Args:
+        save_dir: The directory containing the arrays.
+        mmap: Whether to memory-map the arrays rather than reading them into memory.
+
+    Returns:
+        The arrays, like {"x": <array>, "y": <array>}.
+
+    Raises:
+        ValueError: If the index file is not a recognized array index.
+    """
+    index_path = os.path.join(save_dir, _INDEX_FILE)
+    with open(index_path, "r") as f:
+        index = json.load(f)
+    if index.get("format") != _FORMAT_NAME or index.get("version", 0) > _FORMAT_VERSION:
+        raise ValueError("{} is not a supported array index".format(index_path))
+    mmap_mode = 'c' if mmap else None
+    arrays = {}
+    for key, entry in index["arrays"].items():
+        path = os.path.join(save_dir, entry["prefix"])
+        if entry["ragged"]:
+            arrays[key] = RaggedArray(*[
+                np.load("{}.{}.npy".format(path, part), mmap_mode=mmap_mode)
+                for part in ("values", "offsets", "shapes")
+            ])
+        else:
+            arrays[key] = np.load("{}.npy".format(path), mmap_mode=mmap_mode)
+    return arrays
+
+
+def cache_arrays(save_dir: str,
+                 build: Callable[[], Dict[str, Union[np.ndarray, RaggedArray]]],
+                 mmap: bool = True) -> Dict[str, Union[np.ndarray, RaggedArray]]:
+    """Get a collection of arrays from an on-disk cache, building and caching them first if necessary.
+
+    The first call invokes `build` and writes its result into `save_dir`. Every later call (including those from other
+    processes) memory-maps the cached arrays instead, so startup does not need to re-parse the original data, and
+    processes which read the same cache share its memory via the OS page cache.
+
+    ```python
+    def build():
+        (x, y), _ = tf.keras.datasets.mnist.load_data()
+        return {"x": x, "y": y}
+    ds = fe.dataset.NumpyDataset(cache_arrays("/data/mnist_cache", build))
+    ```
+
+    Args:
+        save_dir: The directory which holds (or will hold) the cache.
+        build: A function which produces the arrays to be cached.
+        mmap: Whether to memory-map the arrays rather than reading them into memory.
+
+    Returns:
+        The cached arrays.
+    """
+    if not os.path.exists(os.path.join(save_dir, _INDEX_FILE)):
+        arrays = build()
+        # Build in a private directory and then move it into place, so that concurrent processes never see a partial
+        # cache
+        tmp_dir = "{}.tmp-{}".format(save_dir.rstrip(os.sep), os.getpid())
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        write_arrays(arrays, tmp_dir)
+        del arrays
+        if os.path.isdir(save_dir) and not os.path.exists(os.path.join(save_dir, _INDEX_FILE)):
+            shutil.rmtree(save_dir, ignore_errors=True)  # Left behind by an interrupted build
+        try:
+            os.rename(tmp_dir, save_dir)
+        except OSError:
+            shutil.rmtree(tmp_dir, ignore_errors=True)  # Another process finished building the cache first
+    return read_arrays(save_dir, mmap=mmap)
@@ -13,16 +13,99 @@
 # limitations under the License.
 # ==============================================================================
 import math
-import random
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 
 import numpy as np
 
 from fastestimator.dataset.dataset import DatasetSummary, FEDataset
+from fastestimator.util.random_util import DATASET_STREAM, get_rng
 from fastestimator.util.traceability_util import traceable
 from fastestimator.util.util import to_list
 
 
+class _IndexMap:
+    """A lazily generated sequence formed by concatenating independent random permutations of range(`size`).
+
+    Each permutation (block) is only generated the first time that one of its positions is requested, so creating a new
+    index map is free and memory is only spent on the parts which are actually used.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        size: The size of each permutation (the length of the underlying dataset).
+        length: The total number of positions in the index map.
+        seed: The base seed of the random streams which generate the permutations. If None, the permutations are drawn
+            from the global NumPy random state instead.
+        key: The key of the random streams. Each permutation uses the stream (*`key`, block index).
+    """
+    def __init__(self, size: int, length: int, seed: Optional[int] = None, key: Tuple[int, ...] = ()) -> None:
+        self.size = size
+        self.length = length
+        self.seed = seed
+        self.key = key
+        self._dtype = np.int32 if size <= np.iinfo(np.int32).max else np.int64
+        self._blocks = {}  # type: Dict[int, np.ndarray]
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __getitem__(self, position: int) -> int:
+        block, offset = divmod(position, self.size)
+        return int(self._get_block(block)[offset])
+
+    def take(self, start: int, count: int) -> np.ndarray:
+        """Look up a contiguous range of positions at once.
+
+        Args:
+            start: The first position to look up.
+            count: How many positions to look up.
+
+        Returns:
+            The dataset indices corresponding to positions [`start`, `start` + `count`).
+        """
+        block, offset = divmod(start, self.size)
+        if offset + count <= self.size:
+            return self._get_block(block)[offset:offset + count]  # Fast path, since ranges rarely cross blocks
+        pieces = []
+        while count > 0:
+            piece = self._get_block(block)[offset:offset + count]
+            pieces.append(piece)
+            count -= len(piece)
+            block, offset = block + 1, 0
+        return np.concatenate(pieces)
+
+    def _get_block(self, block: int) -> np.ndarray:
+        """Get (generating if necessary) a particular permutation.
+
+        Args:
+            block: Which permutation to get.
+
+        Returns:
+            A random permutation of range(`size`).
+        """
+        perm = self._blocks.get(block)
+        if perm is None:
+            rng = np.random if self.seed is None else get_rng(self.seed, *self.key, block)
+            perm = self._blocks[block] = rng.permutation(self.size).astype(self._dtype, copy=False)
+        return perm
+
+
+def _get_items(dataset: FEDataset, indices: np.ndarray) -> List[Dict[str, Any]]:
+    """Fetch several elements from a dataset, in bulk if the dataset supports it.
+
+    Args:
+        dataset: The dataset to read from.
+        indices: Which elements to read.
+
+    Returns:
+        The data dictionaries corresponding to the `indices`.
+    """
+    indices = indices.tolist()
+    if isinstance(dataset, FEDataset):
+        return dataset.get_items(indices)
+    return [dataset[index] for index in indices]
+
+
 @traceable()
 class BatchDataset(FEDataset):
     """BatchDataset extracts a list (batch) of data from a single dataset or multiple datasets.
@@ -68,8 +151,11 @@ class BatchDataset(FEDataset):
         self.all_fe_datasets = False
         self._check_input()
         self.index_maps = []
+        self.seed = None
+        self.epoch = 0
         self.reset_index_maps()
         self.pad_value = None
+        self.pad_multiple = None
 
     def _check_input(self) -> None:
         """Verify that the given input values are valid.
@@ -115,7 +201,10 @@ class BatchDataset(FEDataset):
         """
         raise AssertionError("This method should not have been invoked. Please file a bug report")
 
-    def split(self, *fractions: Union[float, int, Iterable[int]]) -> Union['BatchDataset', List['BatchDataset']]:
+    def split(self,
+              *fractions: Union[float, int, Iterable[int]],
+              stratify: Optional[str] = None,
+              group: Optional[str] = None) -> Union['BatchDataset', List['BatchDataset']]:
         """Split this dataset into multiple smaller datasets.
 
         This function enables several types of splitting:
@@ -142,6 +231,8 @@ class BatchDataset(FEDataset):
             *fractions: Floating point values will be interpreted as percentages, integers as an absolute number of
                 datapoints, and an iterable of integers as the exact indices of the data that should be removed in order
                 to create the new dataset.
+            stratify: The key of a label whose distribution should be preserved within each of the underlying datasets.
+            group: The key of a group identifier whose members should not be divided between the new datasets.
 
         Returns:
             One or more new datasets which are created by removing elements from the current dataset. The number of
@@ -154,12 +245,12 @@ class BatchDataset(FEDataset):
         if not self.all_fe_datasets:
             raise NotImplementedError(
                 "BatchDataset.split() is not supported when BatchDataset contains non-FEDataset objects")
-        new_datasets = [to_list(ds.split(*fractions)) for ds in self.datasets]
+        new_datasets = [to_list(ds.split(*fractions, stratify=stratify, group=group)) for ds in self.datasets]
         num_splits = len(new_datasets[0])
         new_datasets = [[ds[i] for ds in new_datasets] for i in range(num_splits)]
         results = [BatchDataset(ds, self.num_samples, self.probability) for ds in new_datasets]
         # Re-compute personal variables
-        self.reset_index_maps()
+        self.reset_index_maps(seed=self.seed, epoch=self.epoch)
         FEDataset.fix_split_traceabilty(self, results, fractions)
         # Unpack response if only a single split
         if len(results) == 1:
@@ -202,39 +293,45 @@ class BatchDataset(FEDataset):
         Returns:
             A list of data instance dictionaries corresponding to the current `batch_idx`.
         """
-        items = []
+        rng = np.random if self.seed is None else get_rng(self.seed, DATASET_STREAM, self.epoch, 0, batch_idx)
         if self.same_feature:
             if self.probability:
-                index = list(np.random.choice(range(len(self.datasets)), size=self.num_samples, p=self.probability))
-                num_samples = [index.count(i) for i in range(len(self.datasets))]
+                # A single multinomial draw decides how many samples come from each dataset
+                num_samples = rng.multinomial(self.num_samples[0], self.probability).tolist()
             else:
                 num_samples = self.num_samples
+            items = []
             for dataset, num_sample, index_map in zip(self.datasets, num_samples, self.index_maps):
-                for idx in range(num_sample):
-                    items.append(dataset[index_map[batch_idx * num_sample + idx]])
+                if num_sample:
+                    items.extend(_get_items(dataset, index_map.take(batch_idx * num_sample, num_sample)))
         else:
             num_sample = self.num_samples[0]
-            for idx in range(num_sample):
-                paired_items = [
-                    dataset[index_map[batch_idx * num_sample + idx]] for dataset,
-                    index_map in zip(self.datasets, self.index_maps)
-                ]
-                items.append({k: v for d in paired_items for k, v in d.items()})
-        random.shuffle(items)
-        return items
-
-    def reset_index_maps(self) -> None:
+            paired_items = [
+                _get_items(dataset, index_map.take(batch_idx * num_sample, num_sample)) for dataset,
+                index_map in zip(self.datasets, self.index_maps)
+            ]
+            items = [{k: v for d in pair for k, v in d.items()} for pair in zip(*paired_items)]
+        return [items[idx] for idx in rng.permutation(len(items)).tolist()]
+
+    def reset_index_maps(self, seed: Optional[int] = None, epoch: int = 0) -> None:
         """Rearrange the index maps of this BatchDataset.
 
         This method is invoked every epoch by OpDataset which allows each epoch to have different random pairings of the
-        basis datasets.
+        basis datasets. The new index maps are generated lazily, so this method is cheap regardless of dataset size.
+
+        Args:
+            seed: The base seed of the random streams which decide the contents of each batch. Every batch (and every
+                block of each index map) is drawn from its own stream keyed by `epoch`, so the batches don't depend on
+                the order in which they are requested. If None, the global NumPy random state is used instead.
+            epoch: The epoch index which the random streams are keyed by.
         """
+        self.seed = seed
+        self.epoch = epoch
         num_samples = self.num_samples
         if self.probability:
             num_samples = num_samples * len(self.datasets)
-        self.index_maps = []
-        for dataset, num_sample in zip(self.datasets, num_samples):
-            index_map = [list(range(len(dataset))) for _ in range(math.ceil(len(self) * num_sample / len(dataset)))]
-            for mapping in index_map:
-                random.shuffle(mapping)
-            self.index_maps.append([item for sublist in index_map for item in sublist])
+        length = len(self)
+        self.index_maps = [
+            _IndexMap(size=len(dataset), length=length * num_sample, seed=seed, key=(DATASET_STREAM, epoch, 1, idx))
+            for idx, (dataset, num_sample) in enumerate(zip(self.datasets, num_samples))
+        ]
@@ -14,28 +14,52 @@
 # ==============================================================================
 import os
 import pickle
-from typing import Tuple, List
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
-from tensorflow.python.keras.utils.data_utils import get_file
 
+from fastestimator.dataset.array_cache import cache_arrays
 from fastestimator.dataset.numpy_dataset import NumpyDataset
 
 
-def load_data(image_key: str = "x", label_key: str = "y") -> Tuple[NumpyDataset, NumpyDataset]:
+def load_data(image_key: str = "x", label_key: str = "y",
+              root_dir: Optional[str] = None) -> Tuple[NumpyDataset, NumpyDataset]:
     """Load and return the ciFAIR10 dataset.
 
     This is the cifar10 dataset but with test set duplicates removed and replaced. See
     https://arxiv.org/pdf/1902.00423.pdf or https://cvjena.github.io/cifair/ for details. Cite the paper if you use the
     dataset.
 
+    The first call packs the data into a cache of contiguous arrays, which later calls memory-map rather than reading.
+
     Args:
         image_key: The key for image.
         label_key: The key for label.
+        root_dir: The path to store the packed data. When `path` is not provided, the data will be saved into
+            `fastestimator_data` under the user's home directory.
 
     Returns:
         (train_data, test_data)
     """
+    if root_dir is None:
+        root_dir = os.path.join(str(Path.home()), 'fastestimator_data', 'ciFAIR10')
+    else:
+        root_dir = os.path.join(os.path.abspath(root_dir), 'ciFAIR10')
+    arrays = cache_arrays(os.path.join(root_dir, "packed"), _build)
+    train_data = NumpyDataset({image_key: arrays["x_train"], label_key: arrays["y_train"]})
+    test_data = NumpyDataset({image_key: arrays["x_test"], label_key: arrays["y_test"]})
+    return train_data, test_data
+
+
+def _build() -> Dict[str, np.ndarray]:
+    """Download and parse the ciFAIR10 data for packing into a cache.
+
+    Returns:
+        The train and test arrays.
+    """
+    # Only needed the first time, so avoid the import cost when loading from the cache
+    from tensorflow.python.keras.utils.data_utils import get_file
     dirname = 'ciFAIR-10'
     archive_name = 'ciFAIR-10.zip'
     origin = 'https://github.com/cvjena/cifair/releases/download/v1.0/ciFAIR-10.zip'
@@ -67,9 +91,7 @@ def load_data(image_key: str = "x", label_key: str = "y") -> Tuple[NumpyDataset,
     x_test = x_test.astype(x_train.dtype)
     y_test = y_test.astype(y_train.dtype)
 
-    train_data = NumpyDataset({image_key: x_train, label_key: y_train})
-    test_data = NumpyDataset({image_key: x_test, label_key: y_test})
-    return train_data, test_data
+    return {"x_train": x_train, "y_train": y_train, "x_test": x_test, "y_test": y_test}
 
 
 def _load_batch(file_path: str, label_key: str = 'labels') -> Tuple[np.ndarray, List[int]]:
@@ -13,28 +13,35 @@
 # limitations under the License.
 # ==============================================================================
 import os
-from typing import Tuple
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 import numpy as np
-from tensorflow.python.keras.utils.data_utils import get_file
 
+from fastestimator.dataset.array_cache import cache_arrays
 from fastestimator.dataset.data.cifair10 import _load_batch
 from fastestimator.dataset.numpy_dataset import NumpyDataset
 
 
 def load_data(image_key: str = "x",
               label_key: str = "y",
-              label_mode: str = "fine") -> Tuple[NumpyDataset, NumpyDataset]:
+              label_mode: str = "fine",
+              root_dir: Optional[str] = None) -> Tuple[NumpyDataset, NumpyDataset]:
     """Load and return the ciFAIR100 dataset.
 
     This is the cifar100 dataset but with test set duplicates removed and replaced. See
     https://arxiv.org/pdf/1902.00423.pdf or https://cvjena.github.io/cifair/ for details. Cite the paper if you use the
     dataset.
 
+    The first call packs the data into a cache of contiguous arrays, which later calls memory-map rather than reading.
+
     Args:
         image_key: The key for image.
         label_key: The key for label.
         label_mode: Either "fine" for 100 classes or "coarse" for 20 classes.
+        root_dir: The path to store the packed data. When `path` is not provided, the data will be saved into
+            `fastestimator_data` under the user's home directory.
 
     Returns:
         (train_data, test_data)
@@ -44,7 +51,27 @@ def load_data(image_key: str = "x",
     """
     if label_mode not in ['fine', 'coarse']:
         raise ValueError("label_mode must be one of either 'fine' or 'coarse'.")
+    if root_dir is None:
+        root_dir = os.path.join(str(Path.home()), 'fastestimator_data', 'ciFAIR100')
+    else:
+        root_dir = os.path.join(os.path.abspath(root_dir), 'ciFAIR100')
+    arrays = cache_arrays(os.path.join(root_dir, "packed_{}".format(label_mode)), partial(_build, label_mode))
+    train_data = NumpyDataset({image_key: arrays["x_train"], label_key: arrays["y_train"]})
+    test_data = NumpyDataset({image_key: arrays["x_test"], label_key: arrays["y_test"]})
+    return train_data, test_data
+
+
+def _build(label_mode: str) -> Dict[str, np.ndarray]:
+    """Download and parse the ciFAIR100 data for packing into a cache.
+
+    Args:
+        label_mode: Either "fine" for 100 classes or "coarse" for 20 classes.
 
+    Returns:
+        The train and test arrays.
+    """
+    # Only needed the first time, so avoid the import cost when loading from the cache
+    from tensorflow.python.keras.utils.data_utils import get_file
     dirname = 'ciFAIR-100'
     archive_name = 'ciFAIR-100.zip'
     origin = 'https://github.com/cvjena/cifair/releases/download/v1.0/ciFAIR-100.zip'
@@ -69,6 +96,4 @@ def load_data(image_key: str = "x",
     x_test = x_test.astype(x_train.dtype)
     y_test = y_test.astype(y_train.dtype)
 
-    train_data = NumpyDataset({image_key: x_train, label_key: y_train})
-    test_data = NumpyDataset({image_key: x_test, label_key: y_test})
-    return train_data, test_data
+    return {"x_train": x_train, "y_train": y_train, "x_test": x_test, "y_test": y_test}
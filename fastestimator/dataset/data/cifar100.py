@@ -12,24 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Tuple
+import os
+from functools import partial
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-import tensorflow as tf
+import numpy as np
 
+from fastestimator.dataset.array_cache import cache_arrays
 from fastestimator.dataset.numpy_dataset import NumpyDataset
 
 
+def _build(label_mode: str) -> Dict[str, np.ndarray]:
+    """Read the CIFAR100 data for packing into a cache.
+
+    Args:
+        label_mode: Either "fine" for 100 classes or "coarse" for 20 classes.
+
+    Returns:
+        The train and eval arrays.
+    """
+    import tensorflow as tf  # Only needed the first time, so avoid the import cost when loading from the cache
+    (x_train, y_train), (x_eval, y_eval) = tf.keras.datasets.cifar100.load_data(label_mode=label_mode)
+    return {"x_train": x_train, "y_train": y_train, "x_eval": x_eval, "y_eval": y_eval}
+
+
 def load_data(image_key: str = "x",
               label_key: str = "y",
-              label_mode: str = "fine") -> Tuple[NumpyDataset, NumpyDataset]:
+              label_mode: str = "fine",
+              root_dir: Optional[str] = None) -> Tuple[NumpyDataset, NumpyDataset]:
     """Load and return the CIFAR100 dataset.
 
     Please consider using the ciFAIR100 dataset instead. CIFAR100 contains duplicates between its train and test sets.
 
+    The first call packs the data into a cache of contiguous arrays, which later calls memory-map rather than reading.
+
     Args:
         image_key: The key for image.
         label_key: The key for label.
         label_mode: Either "fine" for 100 classes or "coarse" for 20 classes.
+        root_dir: The path to store the packed data. When `path` is not provided, the data will be saved into
+            `fastestimator_data` under the user's home directory.
 
     Returns:
         (train_data, eval_data)
@@ -40,7 +63,11 @@ def load_data(image_key: str = "x",
     print("\033[93m {}\033[00m".format("FastEstimator-Warn: Consider using the ciFAIR100 dataset instead."))
     if label_mode not in ['fine', 'coarse']:
         raise ValueError("label_mode must be one of either 'fine' or 'coarse'.")
-    (x_train, y_train), (x_eval, y_eval) = tf.keras.datasets.cifar100.load_data(label_mode=label_mode)
-    train_data = NumpyDataset({image_key: x_train, label_key: y_train})
-    eval_data = NumpyDataset({image_key: x_eval, label_key: y_eval})
+    if root_dir is None:
+        root_dir = os.path.join(str(Path.home()), 'fastestimator_data', 'CIFAR100')
+    else:
+        root_dir = os.path.join(os.path.abspath(root_dir), 'CIFAR100')
+    arrays = cache_arrays(os.path.join(root_dir, "packed_{}".format(label_mode)), partial(_build, label_mode))
+    train_data = NumpyDataset({image_key: arrays["x_train"], label_key: arrays["y_train"]})
+    eval_data = NumpyDataset({image_key: arrays["x_eval"], label_key: arrays["y_eval"]})
     return train_data, eval_data
@@ -16,62 +16,15 @@ import os
 import random
 import tarfile
 from pathlib import Path
-from typing import Optional, TypeVar
+from typing import Optional
 
 import pandas as pd
-import requests
-from tqdm import tqdm
 
 from fastestimator.dataset.csv_dataset import CSVDataset
+from fastestimator.util.download_util import RemoteFile, download_files, extract_archive
 
-Response = TypeVar('Response', bound=requests.models.Response)
-
-
-def _download_file_from_google_drive(id: str, destination: str) -> None:
-    """Download the data from the Google drive public URL.
-
-    This method will create a session instance to persist the requests and reuse TCP connection for the large files.
-
-    Args:
-        id: File ID of Google drive URL.
-        destination: Destination path where the data needs to be stored.
-    """
-    URL = "https://drive.google.com/uc?export=download"
-    CHUNK_SIZE = 128
-    session = requests.Session()
-
-    response = session.get(URL, params={'id': id}, stream=True)
-    token = _get_confirm_token(response)
-
-    if token:
-        params = {'id': id, 'confirm': token}
-        response = session.get(URL, params=params, stream=True)
-
-    total_size = int(response.headers.get('content-length', 0))
-    progress = tqdm(total=total_size, unit='B', unit_scale=True)
-    with open(destination, "wb") as f:
-        for chunk in response.iter_content(CHUNK_SIZE):
-            if chunk:  # filter out keep-alive new chunks
-                progress.update(len(chunk))
-                f.write(chunk)
-    progress.close()
-
-
-def _get_confirm_token(response: Response) -> str:
-    """Retrieve the token from the cookie jar of HTTP request to keep the session alive.
-
-    Args:
-        response: Response object of the HTTP request.
-
-    Returns"
-        The value of cookie in the response object.
-
-    """
-    for key, value in response.cookies.items():
-        if key.startswith('download_warning'):
-            return value
-
-    return None
+# Google Drive's direct download endpoint, which skips the virus scan confirmation page served for large files
+_GOOGLE_DRIVE_URL = "https://drive.usercontent.google.com/download?id={}&export=download&confirm=t"
 
 
 def load_data(root_dir: Optional[str] = None) -> CSVDataset:
@@ -103,17 +56,18 @@ def load_data(root_dir: Optional[str] = None) -> CSVDataset:
 
     if not (os.path.exists(image_extracted_path) and os.path.exists(annotation_extracted_path)):
         # download
-        if not (os.path.exists(image_compressed_path) and os.path.exists(annotation_compressed_path)):
-            print("Downloading data to {}".format(root_dir))
-            _download_file_from_google_drive('1GDr1OkoXdhaXWGA8S3MAq3a522Tak-nx', image_compressed_path)
-            _download_file_from_google_drive('16NsbTpMs5L6hT4hUJAmpW2u7wH326WTR', annotation_compressed_path)
-
+        files = [
+            RemoteFile(_GOOGLE_DRIVE_URL.format('1GDr1OkoXdhaXWGA8S3MAq3a522Tak-nx'), image_compressed_path),
+            RemoteFile(_GOOGLE_DRIVE_URL.format('16NsbTpMs5L6hT4hUJAmpW2u7wH326WTR'), annotation_compressed_path)
+        ]
+        download_files(files)
         # extract
-        print("\nExtracting files ...")
-        with tarfile.open(image_compressed_path) as img_tar:
-            img_tar.extractall(root_dir)
-        with tarfile.open(annotation_compressed_path) as anno_tar:
-            anno_tar.extractall(root_dir)
+        for file in files:
+            if not tarfile.is_tarfile(file.path):
+                # Google Drive answers with an html page rather than an error code when a file can't be served
+                os.remove(file.path)
+                raise ValueError("Could not download {} from {}, please try again later".format(file.name, file.url))
+            extract_archive(file.path, root_dir)
 
     # glob and generate csv
     if not os.path.exists(csv_path):
@@ -14,17 +14,13 @@
 # ==============================================================================
 import os
 import random
-import tarfile
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import pandas as pd
-import wget
 
 from fastestimator.dataset.csv_dataset import CSVDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def _create_csv(images: List[str], label_dict: Dict[str, int], csv_path: str) -> None:
@@ -71,15 +67,9 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[CSVDataset, CSVDataset]:
     test_csv_path = os.path.join(root_dir, 'test.csv')
 
     if not os.path.exists(image_extracted_path):
-        # download
-        if not os.path.exists(image_compressed_path):
-            print("Downloading data to {}".format(root_dir))
-            wget.download('http://data.vision.ee.ethz.ch/cvl/food-101.tar.gz', root_dir, bar=bar_custom)
-
-        # extract
-        print("\nExtracting files ...")
-        with tarfile.open(image_compressed_path) as img_tar:
-            img_tar.extractall(root_dir)
+        # download and extract
+        download_files([RemoteFile('http://data.vision.ee.ethz.ch/cvl/food-101.tar.gz', image_compressed_path)],
+                       extract_dir=root_dir)
 
     labels = open(os.path.join(root_dir, "food-101/meta/classes.txt"), "r").read().split()
     label_dict = {labels[i]: i for i in range(len(labels))}
@@ -13,17 +13,12 @@
 # limitations under the License.
 # ==============================================================================
 import os
-import zipfile
 from pathlib import Path
 from typing import Optional, Tuple
 
-import wget
-
 from fastestimator.dataset.batch_dataset import BatchDataset
 from fastestimator.dataset.dir_dataset import DirDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def load_data(batch_size: int, root_dir: Optional[str] = None) -> Tuple[BatchDataset, BatchDataset]:
@@ -52,17 +47,9 @@ def load_data(batch_size: int, root_dir: Optional[str] = None) -> Tuple[BatchDat
     data_folder_path = os.path.join(root_dir, 'images')
 
     if not os.path.exists(data_folder_path):
-        # download
-        if not os.path.exists(data_compressed_path):
-            print("Downloading data to {}".format(root_dir))
-            wget.download('https://people.eecs.berkeley.edu/~taesung_park/CycleGAN/datasets/horse2zebra.zip',
-                          root_dir,
-                          bar=bar_custom)
-
-        # extract
-        print("\nExtracting files ...")
-        with zipfile.ZipFile(data_compressed_path, 'r') as zip_file:
-            zip_file.extractall(root_dir)
+        # download and extract
+        url = 'https://people.eecs.berkeley.edu/~taesung_park/CycleGAN/datasets/horse2zebra.zip'
+        download_files([RemoteFile(url, data_compressed_path)], extract_dir=root_dir)
         os.rename(os.path.join(root_dir, 'horse2zebra'), data_folder_path)
 
     test_a = DirDataset(root_dir=os.path.join(data_folder_path, 'testA'),
@@ -18,13 +18,10 @@ from typing import List, Optional, Set, Tuple
 
 import numpy as np
 import requests
-import wget
 from sklearn.model_selection import train_test_split
 
 from fastestimator.dataset.numpy_dataset import NumpyDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def get_sentences_and_labels(path: str) -> Tuple[List[str], List[List[str]], Set[str], Set[str]]:
@@ -86,11 +83,7 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[NumpyDataset, NumpyDatase
     files = [(train_data_path, 'https://groups.csail.mit.edu/sls/downloads/movie/engtrain.bio'),
              (test_data_path, 'https://groups.csail.mit.edu/sls/downloads/movie/engtest.bio')]
 
-    for data_path, download_link in files:
-        if not os.path.exists(data_path):
-            # Download
-            print("Downloading data: {}".format(data_path))
-            wget.download(download_link, data_path, bar=bar_custom)
+    download_files([RemoteFile(download_link, data_path) for data_path, download_link in files])
 
     x_train, y_train, x_vocab, y_vocab = get_sentences_and_labels(train_data_path)
     x_eval, y_eval, x_eval_vocab, y_eval_vocab = get_sentences_and_labels(test_data_path)
@@ -12,24 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Tuple
+import os
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
-import tensorflow as tf
+import numpy as np
 
+from fastestimator.dataset.array_cache import cache_arrays
 from fastestimator.dataset.numpy_dataset import NumpyDataset
 
 
-def load_data(image_key: str = "x", label_key: str = "y") -> Tuple[NumpyDataset, NumpyDataset]:
+def _build() -> Dict[str, np.ndarray]:
+    """Read the MNIST data for packing into a cache.
+
+    Returns:
+        The train and eval arrays.
+    """
+    import tensorflow as tf  # Only needed the first time, so avoid the import cost when loading from the cache
+    (x_train, y_train), (x_eval, y_eval) = tf.keras.datasets.mnist.load_data()
+    return {"x_train": x_train, "y_train": y_train, "x_eval": x_eval, "y_eval": y_eval}
+
+
+def load_data(image_key: str = "x", label_key: str = "y",
+              root_dir: Optional[str] = None) -> Tuple[NumpyDataset, NumpyDataset]:
     """Load and return the MNIST dataset.
 
+    The first call packs the data into a cache of contiguous arrays, which later calls memory-map rather than reading.
+
     Args:
         image_key: The key for image.
         label_key: The key for label.
+        root_dir: The path to store the packed data. When `path` is not provided, the data will be saved into
+            `fastestimator_data` under the user's home directory.
 
     Returns:
         (train_data, eval_data)
     """
-    (x_train, y_train), (x_eval, y_eval) = tf.keras.datasets.mnist.load_data()
-    train_data = NumpyDataset({image_key: x_train, label_key: y_train})
-    eval_data = NumpyDataset({image_key: x_eval, label_key: y_eval})
+    if root_dir is None:
+        root_dir = os.path.join(str(Path.home()), 'fastestimator_data', 'MNIST')
+    else:
+        root_dir = os.path.join(os.path.abspath(root_dir), 'MNIST')
+    arrays = cache_arrays(os.path.join(root_dir, "packed"), _build)
+    train_data = NumpyDataset({image_key: arrays["x_train"], label_key: arrays["y_train"]})
+    eval_data = NumpyDataset({image_key: arrays["x_eval"], label_key: arrays["y_eval"]})
     return train_data, eval_data
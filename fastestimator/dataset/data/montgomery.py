@@ -13,18 +13,14 @@
 # limitations under the License.
 # ==============================================================================
 import os
-import zipfile
 from glob import glob
 from pathlib import Path
 from typing import Optional
 
 import pandas as pd
-import wget
 
 from fastestimator.dataset.csv_dataset import CSVDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files, extract_archive
 
 
 def load_data(root_dir: Optional[str] = None) -> CSVDataset:
@@ -54,17 +50,13 @@ def load_data(root_dir: Optional[str] = None) -> CSVDataset:
 
     if not os.path.exists(extract_folder_path):
         # download
-        if not os.path.exists(data_compressed_path):
-            print("Downloading data to {}".format(root_dir))
-            wget.download('http://openi.nlm.nih.gov/imgs/collections/NLM-MontgomeryCXRSet.zip',
-                          root_dir,
-                          bar=bar_custom)
+        download_files([RemoteFile('http://openi.nlm.nih.gov/imgs/collections/NLM-MontgomeryCXRSet.zip',
+                                   data_compressed_path)])
 
         # extract
-        print("\nExtracting file ...")
-        with zipfile.ZipFile(data_compressed_path, 'r') as zip_file:
-            # There's some garbage data from macOS in the zip file that gets filtered out here
-            zip_file.extractall(root_dir, filter(lambda x: x.startswith("MontgomerySet/"), zip_file.namelist()))
+        print("Extracting file ...")
+        # There's some garbage data from macOS in the zip file that gets filtered out here
+        extract_archive(data_compressed_path, root_dir, members=lambda x: x.startswith("MontgomerySet/"), max_workers=4)
 
     # glob and generate csv
     if not os.path.exists(csv_path):
@@ -12,22 +12,193 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import json
 import os
-import zipfile
-from copy import deepcopy
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import numpy as np
-import wget
-from pycocotools.coco import COCO
+from pycocotools import mask as maskUtils
 
+from fastestimator.dataset.array_cache import RaggedArray, cache_arrays
+from fastestimator.dataset.dataset import ColumnStore
 from fastestimator.dataset.dir_dataset import DirDataset
+from fastestimator.util.download_util import RemoteFile, download_files
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import Suppressor
-from fastestimator.util.wget_util import bar_custom, callback_progress
 
-wget.callback_progress = callback_progress
+
+def _to_bytes(value: Any) -> np.ndarray:
+    """Encode a JSON-compatible value as an array of bytes, so that it can be stored within a RaggedArray.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The utf-8 encoded JSON representation of the `value`.
+    """
+    return np.frombuffer(json.dumps(value).encode('utf-8'), dtype=np.uint8)
+
+
+def _from_bytes(value: np.ndarray) -> Any:
+    """Decode a value which was encoded by `_to_bytes`.
+
+    Args:
+        value: The encoded value.
+
+    Returns:
+        The original value.
+    """
+    return json.loads(value.tobytes().decode('utf-8'))
+
+
+def _group_by_image(annotations: List[Dict[str, Any]],
+                    image_ids: np.ndarray) -> Tuple[List[Dict[str, Any]], np.ndarray, np.ndarray]:
+    """Sort annotations by their image, and find which range of the sorted annotations belongs to each image.
+
+    Args:
+        annotations: The annotations to be grouped. Their relative order is preserved within each image.
+        image_ids: The (sorted) ids of the images.
+
+    Returns:
+        The sorted annotations, and the start and stop index of each image's annotations.
+    """
+    annotations = sorted(annotations, key=lambda annotation: annotation['image_id'])
+    annotation_image_ids = np.array([annotation['image_id'] for annotation in annotations], dtype=np.int64)
+    starts = np.searchsorted(annotation_image_ids, image_ids, side='left')
+    stops = np.searchsorted(annotation_image_ids, image_ids, side='right')
+    return annotations, starts, stops
+
+
+def _build_instance_index(annotation_file: str, include_masks: bool) -> Dict[str, Union[np.ndarray, RaggedArray]]:
+    """Gather the non-crowd instance annotations of every image into flat arrays.
+
+    Args:
+        annotation_file: The path to the file containing annotation data.
+        include_masks: Whether to store the segmentation of every instance.
+
+    Returns:
+        The sorted image ids, the image sizes, the range of instances belonging to each image, and the bounding box,
+        category, and (optionally) JSON encoded segmentation of each instance.
+    """
+    with open(annotation_file, 'r') as f:
+        dataset = json.load(f)
+    images = sorted(dataset['images'], key=lambda image: image['id'])
+    image_ids = np.array([image['id'] for image in images], dtype=np.int64)
+    annotations, starts, stops = _group_by_image([ann for ann in dataset['annotations'] if not ann['iscrowd']],
+                                                 image_ids)
+    index = {
+        "image_ids": image_ids,
+        "heights": np.array([image['height'] for image in images], dtype=np.int64),
+        "widths": np.array([image['width'] for image in images], dtype=np.int64),
+        "starts": starts,
+        "stops": stops,
+        "boxes": np.array([ann['bbox'] for ann in annotations], dtype=np.float64).reshape(-1, 4),
+        "categories": np.array([ann['category_id'] for ann in annotations], dtype=np.int64)
+    }
+    if include_masks:
+        index["segmentations"] = RaggedArray.from_arrays([_to_bytes(ann['segmentation']) for ann in annotations])
+    return index
+
+
+def _build_caption_index(caption_file: str) -> Dict[str, Union[np.ndarray, RaggedArray]]:
+    """Gather the captions of every image into flat arrays.
+
+    Args:
+        caption_file: The path to the file containing caption data.
+
+    Returns:
+        The sorted image ids, the range of captions belonging to each image, and the utf-8 encoded captions.
+    """
+    with open(caption_file, 'r') as f:
+        dataset = json.load(f)
+    image_ids = np.array(sorted(image['id'] for image in dataset['images']), dtype=np.int64)
+    annotations, starts, stops = _group_by_image(dataset['annotations'], image_ids)
+    captions = [np.frombuffer(ann['caption'].encode('utf-8'), dtype=np.uint8) for ann in annotations]
+    return {"image_ids": image_ids, "starts": starts, "stops": stops, "captions": RaggedArray.from_arrays(captions)}
+
+
+class _Index:
+    """Per-image annotations from an MSCOCO annotation file, packed into flat arrays for O(1) lookups.
+
+    The arrays are built once and then cached beside the annotation file, so later runs (and forked workers) simply
+    memory-map them rather than parsing the annotation json.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        arrays: The packed annotations, which must include sorted "image_ids" as well as the "starts" and "stops" of
+            each image's annotations.
+    """
+    def __init__(self, arrays: Dict[str, Union[np.ndarray, RaggedArray]]) -> None:
+        self.arrays = arrays
+        self.image_ids = arrays["image_ids"]
+        self.starts = arrays["starts"]
+        self.stops = arrays["stops"]
+
+    def rows(self, image_ids: np.ndarray) -> np.ndarray:
+        """Find where given images are stored within the index.
+
+        Args:
+            image_ids: The ids of the images to look up.
+
+        Returns:
+            The row of each image, or -1 for images which are not in the index.
+        """
+        if not len(self.image_ids):
+            return np.full(len(image_ids), -1, dtype=np.int64)
+        rows = np.minimum(np.searchsorted(self.image_ids, image_ids), len(self.image_ids) - 1)
+        return np.where(self.image_ids[rows] == image_ids, rows, -1)
+
+    def counts(self, image_ids: np.ndarray) -> np.ndarray:
+        """Count how many annotations each image has.
+
+        Args:
+            image_ids: The ids of the images to look up.
+
+        Returns:
+            The number of annotations for each image.
+        """
+        rows = self.rows(image_ids)
+        return np.where(rows >= 0, self.stops[rows] - self.starts[rows], 0)
+
+    def span(self, image_id: int) -> slice:
+        """Find the annotations of a given image.
+
+        Args:
+            image_id: The id of the image to look up.
+
+        Returns:
+            The range of the image's annotations within the annotation arrays.
+        """
+        row = int(self.rows(np.array([image_id], dtype=np.int64))[0])
+        if row < 0:
+            return slice(0, 0)
+        return slice(int(self.starts[row]), int(self.stops[row]))
+
+
+def _filter_instances(index: Dict[str, Union[np.ndarray, RaggedArray]],
+                      min_bbox_area: float) -> Dict[str, Union[np.ndarray, RaggedArray]]:
+    """Remove the instances whose bounding boxes are too small.
+
+    Args:
+        index: The packed instance annotations.
+        min_bbox_area: Bounding boxes with a total area less than (or equal to) `min_bbox_area` will be discarded.
+
+    Returns:
+        The packed instance annotations without the small boxes. Segmentations are referenced through an "instances"
+        array which gives the position of each remaining instance within the original arrays.
+    """
+    boxes = index["boxes"]
+    keep = boxes[:, 2] * boxes[:, 3] > min_bbox_area
+    kept_before = np.concatenate([[0], np.cumsum(keep)])
+    instances = np.flatnonzero(keep)
+    return dict(index,
+                starts=kept_before[index["starts"]],
+                stops=kept_before[index["stops"]],
+                boxes=boxes[instances],
+                categories=index["categories"][instances],
+                instances=instances)
 
 
 @traceable()
@@ -35,22 +206,24 @@ class MSCOCODataset(DirDataset):
     """A specialized DirDataset to handle MSCOCO data.
 
     This dataset combines images from the MSCOCO data directory with their corresponding bboxes, masks, and captions.
+    The first time an annotation file is used, its annotations are packed into arrays which are cached beside it (in a
+    directory named after the file, ending in '_index'). Later runs memory-map the cache rather than parsing the json.
 
     Args:
         image_dir: The path the directory containing MSOCO images.
         annotation_file: The path to the file containing annotation data.
         caption_file: The path the file containing caption data.
         include_bboxes: Whether images should be paired with their associated bounding boxes. If true, images without
-            bounding boxes will be ignored and other images may be oversampled in order to take their place.
+            bounding boxes will be removed from the dataset.
         include_masks: Whether images should be paired with their associated masks. If true, images without masks will
-            be ignored and other images may be oversampled in order to take their place.
+            be removed from the dataset.
         include_captions: Whether images should be paired with their associated captions. If true, images without
-            captions will be ignored and other images may be oversampled in order to take their place.
+            captions will be removed from the dataset.
         min_bbox_area: Bounding boxes with a total area less than `min_bbox_area` will be discarded.
     """
 
-    instances: Optional[COCO]
-    captions: Optional[COCO]
+    instances: Optional[_Index]
+    captions: Optional[_Index]
 
     def __init__(self,
                  image_dir: str,
@@ -66,42 +239,25 @@ class MSCOCODataset(DirDataset):
         self.include_bboxes = include_bboxes
         self.include_masks = include_masks
         self.min_bbox_area = min_bbox_area
-        with Suppressor():
-            self.instances = COCO(annotation_file)
-            self.captions = COCO(caption_file) if include_captions else None
+        self.instances, self.captions = None, None
+        images = [elem["image"] for elem in self.data.values()]
+        image_ids = np.array([int(os.path.splitext(os.path.basename(image))[0]) for image in images], dtype=np.int64)
+        keep = np.ones(len(images), dtype=bool)
+        if include_bboxes:
+            cache_dir = os.path.splitext(annotation_file)[0] + ("_masks_index" if include_masks else "_index")
+            index = cache_arrays(cache_dir, partial(_build_instance_index, annotation_file, include_masks))
+            self.instances = _Index(_filter_instances(index, min_bbox_area))
+            keep &= self.instances.counts(image_ids) > 0
+        if include_captions:
+            cache_dir = os.path.splitext(caption_file)[0] + "_index"
+            self.captions = _Index(cache_arrays(cache_dir, partial(_build_caption_index, caption_file)))
+            keep &= self.captions.counts(image_ids) > 0
+        keep = np.flatnonzero(keep).tolist()
+        self.data = ColumnStore({"image": [images[idx] for idx in keep], "image_id": image_ids[keep].tolist()})
 
     def __getitem__(self, index: Union[int, str]) -> Union[Dict[str, Any], np.ndarray, List[Any]]:
         """Look up data from the dataset.
 
-        Args:
-            index: Either an int corresponding to a particular element of data, or a string in which case the
-                corresponding column of data will be returned. If bboxes, masks, or captions are required and the data
-                at the desired index does not have one or more of these features, then data from a random index which
-                does have all necessary features will be fetched instead.
-
-        Returns:
-            A data dictionary if the index was an int, otherwise a column of data in list format.
-        """
-        has_data = False
-        response = {}
-        while not has_data:
-            has_box, has_mask, has_caption = True, True, True
-            response = self._get_single_item(index)
-            if isinstance(index, str):
-                return response
-            if self.include_bboxes and not response["bbox"]:
-                has_box = False
-            if self.include_masks and not response["mask"]:
-                has_mask = False
-            if self.captions and not response["caption"]:
-                has_caption = False
-            has_data = has_box and has_mask and has_caption
-            index = np.random.randint(len(self))
-        return response
-
-    def _get_single_item(self, index: Union[int, str]) -> Union[Dict[str, Any], np.ndarray, List[Any]]:
-        """Look up data from the dataset.
-
         Args:
             index: Either an int corresponding to a particular element of data, or a string in which case the
                 corresponding column of data will be returned.
@@ -112,14 +268,11 @@ class MSCOCODataset(DirDataset):
         response = super().__getitem__(index)
         if isinstance(index, str):
             return response
-        else:
-            response = deepcopy(response)
-        image = response["image"]
-        image_id = int(os.path.splitext(os.path.basename(image))[0])
-        response["image_id"] = image_id
-        if self.include_bboxes:
+        response = dict(response)
+        image_id = response["image_id"]
+        if self.instances is not None:
             self._populate_instance_data(response, image_id)
-        if self.captions:
+        if self.captions is not None:
             self._populate_caption_data(response, image_id)
         return response
 
@@ -130,17 +283,40 @@ class MSCOCODataset(DirDataset):
             data: The dictionary to be augmented.
             image_id: The id of the image for which to find data.
         """
-        data["bbox"] = []
+        span = self.instances.span(image_id)
+        arrays = self.instances.arrays
+        data["bbox"] = [
+            tuple(box) + (category, )
+            for box, category in zip(arrays["boxes"][span].tolist(), arrays["categories"][span].tolist())
+        ]
         if self.include_masks:
-            data["mask"] = []
-        annotation_ids = self.instances.getAnnIds(imgIds=image_id, iscrowd=False)
-        if annotation_ids:
-            annotations = self.instances.loadAnns(annotation_ids)
-            for annotation in annotations:
-                if annotation["bbox"][2] * annotation["bbox"][3] > self.min_bbox_area:
-                    data["bbox"].append(tuple(annotation['bbox'] + [annotation['category_id']]))
-                    if self.include_masks:
-                        data["mask"].append(self.instances.annToMask(annotation))
+            row = int(self.instances.rows(np.array([image_id], dtype=np.int64))[0])
+            height, width = int(arrays["heights"][row]), int(arrays["widths"][row])
+            segmentations = arrays["segmentations"]
+            data["mask"] = [
+                self._decode_mask(_from_bytes(segmentations[instance]), height, width)
+                for instance in arrays["instances"][span].tolist()
+            ]
+
+    @staticmethod
+    def _decode_mask(segmentation: Union[List[List[float]], Dict[str, Any]], height: int, width: int) -> np.ndarray:
+        """Convert an MSCOCO segmentation into a binary mask (as done by COCO.annToMask).
+
+        Args:
+            segmentation: The segmentation, either as a list of polygons or as run-length encoding.
+            height: The height of the image.
+            width: The width of the image.
+
+        Returns:
+            The mask, as a (height, width) array of 0s and 1s.
+        """
+        if isinstance(segmentation, list):
+            rle = maskUtils.merge(maskUtils.frPyObjects(segmentation, height, width))
+        elif isinstance(segmentation['counts'], list):
+            rle = maskUtils.frPyObjects(segmentation, height, width)
+        else:
+            rle = segmentation
+        return maskUtils.decode(rle)
 
     def _populate_caption_data(self, data: Dict[str, Any], image_id: int) -> None:
         """Add captions to a data dictionary.
@@ -149,12 +325,9 @@ class MSCOCODataset(DirDataset):
             data: The dictionary to be augmented.
             image_id: The id of the image for which to find captions.
         """
-        data["caption"] = []
-        annotation_ids = self.captions.getAnnIds(imgIds=image_id)
-        if annotation_ids:
-            annotations = self.captions.loadAnns(annotation_ids)
-            for annotation in annotations:
-                data["caption"].append(annotation['caption'])
+        span = self.captions.span(image_id)
+        captions = self.captions.arrays["captions"]
+        data["caption"] = [captions[idx].tobytes().decode('utf-8') for idx in range(span.start, span.stop)]
 
 
 def load_data(root_dir: Optional[str] = None,
@@ -189,17 +362,11 @@ def load_data(root_dir: Optional[str] = None,
               "annotations_trainval2017.zip",
               'http://images.cocodataset.org/annotations/annotations_trainval2017.zip')]
 
-    for data_dir, zip_name, download_url in files:
-        if not os.path.exists(data_dir):
-            zip_path = os.path.join(root_dir, zip_name)
-            # Download
-            if not os.path.exists(zip_path):
-                print("Downloading {} to {}".format(zip_name, root_dir))
-                wget.download(download_url, zip_path, bar=bar_custom)
-            # Extract
-            print("Extracting {}".format(zip_name))
-            with zipfile.ZipFile(zip_path, 'r') as zip_file:
-                zip_file.extractall(os.path.dirname(zip_path))
+    downloads = [
+        RemoteFile(url, os.path.join(root_dir, zip_name)) for data_dir, zip_name, url in files
+        if not os.path.exists(data_dir)
+    ]
+    download_files(downloads, extract_dir=root_dir)
 
     train_annotation = os.path.join(annotation_data, "instances_train2017.json")
     eval_annotation = os.path.join(annotation_data, "instances_val2017.json")
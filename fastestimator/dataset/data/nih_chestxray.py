@@ -13,30 +13,11 @@
 # limitations under the License.
 # ==============================================================================
 import os
-import tarfile
 from pathlib import Path
 from typing import Optional
 
-import wget
-
 from fastestimator.dataset.dir_dataset import DirDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
-
-
-def _download_data(link: str, data_path: str, idx: int, total_idx: int) -> None:
-    """A helper function to run wget.
-
-    Args:
-        link: The download link.
-        data_path: Where to save the downloaded data.
-        idx: The current download index.
-        total_idx: How many files total will be downloaded.
-    """
-    if not os.path.exists(data_path):
-        print("Downloading data to {}, file: {} / {}".format(data_path, idx + 1, total_idx))
-        wget.download(link, data_path, bar=bar_custom)
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def load_data(root_dir: Optional[str] = None) -> DirDataset:
@@ -73,14 +54,8 @@ def load_data(root_dir: Optional[str] = None) -> DirDataset:
             'https://nihcc.box.com/shared/static/hhq8fkdgvcari67vfhs7ppg2w6ni4jze.gz',
             'https://nihcc.box.com/shared/static/ioqwiy20ihqwyr8pf4c24eazhh281pbu.gz'
         ]
-        data_paths = [os.path.join(root_dir, "images_{}.tar.gz".format(x)) for x in range(len(links))]
-        for idx, (link, data_path) in enumerate(zip(links, data_paths)):
-            _download_data(link, data_path, idx, len(links))
-
-        # extract data
-        for idx, data_path in enumerate(data_paths):
-            print("Extracting {}, file {} / {}".format(data_path, idx + 1, len(links)))
-            with tarfile.open(data_path) as img_tar:
-                img_tar.extractall(root_dir)
+        # download data, extracting each archive as soon as it arrives
+        files = [RemoteFile(link, os.path.join(root_dir, "images_{}.tar.gz".format(x))) for x, link in enumerate(links)]
+        download_files(files, extract_dir=root_dir)
 
     return DirDataset(image_extracted_path, file_extension='.png', recursive_search=False)
@@ -13,24 +13,65 @@
 # limitations under the License.
 # ==============================================================================
 import os
-import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 
-import wget
+import numpy as np
+from PIL import Image
 
+from fastestimator.dataset.array_cache import cache_arrays
+from fastestimator.dataset.dataset import ColumnStore
 from fastestimator.dataset.siamese_dir_dataset import SiameseDirDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
-wget.callback_progress = callback_progress
 
+def _read_image(path: str) -> np.ndarray:
+    """Read an image in the same format as a grayscale ReadImage op.
 
-def load_data(root_dir: Optional[str] = None) -> Tuple[SiameseDirDataset, SiameseDirDataset]:
+    Args:
+        path: The image file to read.
+
+    Returns:
+        The image as a (height, width, 1) uint8 array.
+    """
+    with Image.open(path) as img:
+        return np.expand_dims(np.array(img.convert('L')), -1)
+
+
+def _pack(dataset: SiameseDirDataset, cache_dir: str) -> SiameseDirDataset:
+    """Replace the image paths within a dataset by images from a packed cache, building the cache first if necessary.
+
+    Args:
+        dataset: The dataset whose images should be packed.
+        cache_dir: Where to store the packed images.
+
+    Returns:
+        The `dataset`, modified in place.
+    """
+    def build() -> Dict[str, np.ndarray]:
+        paths = [elem[dataset.data_key_left] for elem in dataset.data.values()]
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            return {"x": np.stack(list(pool.map(_read_image, paths)))}
+
+    images = cache_arrays(cache_dir, build)["x"]
+    assert len(images) == len(dataset), "{} is out of date. Delete it to rebuild it.".format(cache_dir)
+    labels = [elem[dataset.label_key] for elem in dataset.data.values()]
+    dataset.data = ColumnStore({dataset.data_key_left: images, dataset.label_key: labels})
+    return dataset
+
+
+def load_data(root_dir: Optional[str] = None, packed: bool = False) -> Tuple[SiameseDirDataset, SiameseDirDataset]:
     """Load and return the Omniglot dataset.
 
+    By default the datasets contain image file paths, which need to be read by a ReadImage op. If `packed` is True, the
+    images are instead decoded once into a cache of contiguous arrays, which later calls memory-map. This avoids
+    reading thousands of small png files during every epoch, and does not require a ReadImage op.
+
     Args:
         root_dir: The path to store the downloaded data. When `path` is not provided, the data will be saved into
             `fastestimator_data` under the user's home directory.
+        packed: Whether the datasets should contain (105, 105, 1) uint8 images rather than image file paths.
 
     Returns:
         (train_data, eval_data)
@@ -49,15 +90,11 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[SiameseDirDataset, Siames
     files = [(train_path, train_zip, 'https://github.com/brendenlake/omniglot/raw/master/python/images_background.zip'),
              (eval_path, eval_zip, 'https://github.com/brendenlake/omniglot/raw/master/python/images_evaluation.zip')]
 
-    for data_path, data_zip, download_link in files:
-        if not os.path.exists(data_path):
-            # Download
-            if not os.path.exists(data_zip):
-                print("Downloading data: {}".format(data_zip))
-                wget.download(download_link, data_zip, bar=bar_custom)
-            # Extract
-            print("Extracting data: {}".format(data_path))
-            with zipfile.ZipFile(data_zip, 'r') as zip_file:
-                zip_file.extractall(root_dir)
-
-    return SiameseDirDataset(train_path), SiameseDirDataset(eval_path)
+    download_files([RemoteFile(link, data_zip) for data_path, data_zip, link in files if not os.path.exists(data_path)],
+                   extract_dir=root_dir)
+
+    train_data, eval_data = SiameseDirDataset(train_path), SiameseDirDataset(eval_path)
+    if packed:
+        train_data = _pack(train_data, os.path.join(root_dir, 'images_background_packed'))
+        eval_data = _pack(eval_data, os.path.join(root_dir, 'images_evaluation_packed'))
+    return train_data, eval_data
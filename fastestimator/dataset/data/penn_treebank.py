@@ -17,12 +17,9 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 
 import numpy as np
-import wget
 
 from fastestimator.dataset.numpy_dataset import NumpyDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def load_data(root_dir: Optional[str] = None,
@@ -53,13 +50,10 @@ def load_data(root_dir: Optional[str] = None,
              (eval_data_path, 'https://raw.githubusercontent.com/wojzaremba/lstm/master/data/ptb.valid.txt'),
              (test_data_path, 'https://raw.githubusercontent.com/wojzaremba/lstm/master/data/ptb.test.txt')]
 
-    texts = []
-    for data_path, download_link in files:
-        if not os.path.exists(data_path):
-            # Download
-            print("Downloading data: {}".format(data_path))
-            wget.download(download_link, data_path, bar=bar_custom)
+    download_files([RemoteFile(download_link, data_path) for data_path, download_link in files])
 
+    texts = []
+    for data_path, _ in files:
         text = []
         with open(data_path, 'r') as f:
             for line in f:
@@ -17,12 +17,9 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 
 import numpy as np
-import wget
 
 from fastestimator.dataset.numpy_dataset import NumpyDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def load_data(root_dir: Optional[str] = None, seq_length: int = 100) -> Tuple[NumpyDataset, List[str]]:
@@ -50,10 +47,7 @@ def load_data(root_dir: Optional[str] = None, seq_length: int = 100) -> Tuple[Nu
     file_path = os.path.join(root_dir, 'shakespeare.txt')
     download_link = 'https://storage.googleapis.com/download.tensorflow.org/data/shakespeare.txt'
 
-    if not os.path.exists(file_path):
-        # Download
-        print("Downloading data: {}".format(file_path))
-        wget.download(download_link, file_path, bar=bar_custom)
+    download_files([RemoteFile(download_link, file_path)])
 
     with open(file_path, 'rb') as f:
         text_data = f.read().decode(encoding='utf-8')
@@ -13,19 +13,21 @@
 # limitations under the License.
 # ==============================================================================
 import os
-import tarfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 
 import h5py
+import numpy as np
 import pandas as pd
 import tqdm
-import wget
+from PIL import Image
 
+from fastestimator.dataset.array_cache import RaggedArray, cache_arrays
+from fastestimator.dataset.numpy_dataset import NumpyDataset
 from fastestimator.dataset.pickle_dataset import PickleDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def _get_name(index: int, hdf5_data: h5py.File) -> str:
@@ -107,24 +109,15 @@ def _extract_metadata(data_folder: str, mode: str, save_path: str) -> None:
     print("Data summary is saved at {}".format(save_path))
 
 
-def load_data(root_dir: Optional[str] = None) -> Tuple[PickleDataset, PickleDataset]:
-    """Load and return the Street View House Numbers (SVHN) dataset.
+def _download(root_dir: str) -> Tuple[str, str]:
+    """Download the SVHN images, and gather their bounding boxes into pickle files.
 
     Args:
-        root_dir: The path to store the downloaded data. When `path` is not provided, the data will be saved into
-            `fastestimator_data` under the user's home directory.
+        root_dir: The directory in which to store the data.
 
     Returns:
-        (train_data, test_data)
+        The paths of the (train, test) pickle files.
     """
-    home = str(Path.home())
-
-    if root_dir is None:
-        root_dir = os.path.join(home, 'fastestimator_data', 'SVHN')
-    else:
-        root_dir = os.path.join(os.path.abspath(root_dir), 'SVHN')
-    os.makedirs(root_dir, exist_ok=True)
-
     train_file_path = os.path.join(root_dir, 'train.pickle')
     test_file_path = os.path.join(root_dir, 'test.pickle')
     train_compressed_path = os.path.join(root_dir, "train.tar.gz")
@@ -132,25 +125,13 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[PickleDataset, PickleData
     train_folder_path = os.path.join(root_dir, "train")
     test_folder_path = os.path.join(root_dir, "test")
 
+    # download and extract
+    files = []
     if not os.path.exists(train_folder_path):
-        # download
-        if not os.path.exists(train_compressed_path):
-            print("Downloading train data to {}".format(root_dir))
-            wget.download('http://ufldl.stanford.edu/housenumbers/train.tar.gz', root_dir, bar=bar_custom)
-        # extract
-        print("\nExtracting files ...")
-        with tarfile.open(train_compressed_path) as tar:
-            tar.extractall(root_dir)
-
+        files.append(RemoteFile('http://ufldl.stanford.edu/housenumbers/train.tar.gz', train_compressed_path))
     if not os.path.exists(test_folder_path):
-        # download
-        if not os.path.exists(test_compressed_path):
-            print("Downloading eval data to {}".format(root_dir))
-            wget.download('http://ufldl.stanford.edu/housenumbers/test.tar.gz', root_dir, bar=bar_custom)
-        # extract
-        print("\nExtracting files ...")
-        with tarfile.open(test_compressed_path) as tar:
-            tar.extractall(root_dir)
+        files.append(RemoteFile('http://ufldl.stanford.edu/housenumbers/test.tar.gz', test_compressed_path))
+    download_files(files, extract_dir=root_dir)
 
     # glob and generate bbox files
     if not os.path.exists(train_file_path):
@@ -159,5 +140,72 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[PickleDataset, PickleData
     if not os.path.exists(test_file_path):
         print("\nConstructing bounding box data ...")
         _extract_metadata(test_folder_path, "test", test_file_path)
+    return train_file_path, test_file_path
+
+
+def _read_image(path: str) -> np.ndarray:
+    """Read an image in the same format as a color ReadImage op.
+
+    Args:
+        path: The image file to read.
+
+    Returns:
+        The image as a (height, width, 3) uint8 RGB array.
+    """
+    with Image.open(path) as img:
+        return np.array(img.convert('RGB'))
+
+
+def _build(root_dir: str, mode: str) -> Dict[str, RaggedArray]:
+    """Download the SVHN data, and decode one of its modes for packing into a cache.
+
+    Args:
+        root_dir: The directory in which to store the data.
+        mode: Either "train" or "test".
+
+    Returns:
+        The images and bounding boxes, each packed into a RaggedArray.
+    """
+    train_file_path, test_file_path = _download(root_dir)
+    df = pd.read_pickle(train_file_path if mode == "train" else test_file_path)
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        images = list(pool.map(_read_image, [os.path.join(root_dir, image) for image in df['image']]))
+    arrays = {"image": RaggedArray.from_arrays(images)}
+    for key in ('label', 'x1', 'y1', 'width', 'height'):
+        arrays[key] = RaggedArray.from_arrays([np.array(values, dtype=np.int64) for values in df[key]])
+    return arrays
+
+
+def load_data(root_dir: Optional[str] = None,
+              packed: bool = False) -> Union[Tuple[PickleDataset, PickleDataset], Tuple[NumpyDataset, NumpyDataset]]:
+    """Load and return the Street View House Numbers (SVHN) dataset.
+
+    By default the datasets contain image file paths (relative to `dataset.parent_path`), which need to be read by a
+    ReadImage op. If `packed` is True, the images and bounding boxes are instead decoded once into a cache of contiguous
+    arrays, which later calls memory-map. This starts up much faster, avoids reading thousands of small png files during
+    every epoch, and does not require a ReadImage op.
+
+    Args:
+        root_dir: The path to store the downloaded data. When `path` is not provided, the data will be saved into
+            `fastestimator_data` under the user's home directory.
+        packed: Whether to return NumpyDatasets containing (height, width, 3) uint8 images and arrays of bounding box
+            coordinates rather than PickleDatasets containing image paths and lists of bounding box coordinates.
+
+    Returns:
+        (train_data, test_data)
+    """
+    home = str(Path.home())
+
+    if root_dir is None:
+        root_dir = os.path.join(home, 'fastestimator_data', 'SVHN')
+    else:
+        root_dir = os.path.join(os.path.abspath(root_dir), 'SVHN')
+    os.makedirs(root_dir, exist_ok=True)
+
+    if packed:
+        train_arrays = cache_arrays(os.path.join(root_dir, "packed_train"), partial(_build, root_dir, "train"))
+        test_arrays = cache_arrays(os.path.join(root_dir, "packed_test"), partial(_build, root_dir, "test"))
+        return NumpyDataset(train_arrays), NumpyDataset(test_arrays)
 
+    train_file_path, test_file_path = _download(root_dir)
     return PickleDataset(train_file_path), PickleDataset(test_file_path)
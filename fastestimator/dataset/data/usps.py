@@ -14,18 +14,18 @@
 # ==============================================================================
 import gzip
 import os
+from functools import partial
 from multiprocessing import Pool
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple, Union
 
 import numpy as np
-import wget
 from PIL import Image
 
+from fastestimator.dataset.array_cache import cache_arrays
 from fastestimator.dataset.labeled_dir_dataset import LabeledDirDataset
-from fastestimator.util.wget_util import bar_custom, callback_progress
-
-wget.callback_progress = callback_progress
+from fastestimator.dataset.numpy_dataset import NumpyDataset
+from fastestimator.util.download_util import RemoteFile, download_files
 
 
 def _write_image(image: np.ndarray, path: str, idx: int, mode: str) -> None:
@@ -84,12 +84,60 @@ def _extract_images_labels(filename: str) -> Tuple[np.ndarray, np.ndarray]:
     return images, labels
 
 
-def load_data(root_dir: Optional[str] = None) -> Tuple[LabeledDirDataset, LabeledDirDataset]:
+def _pack_images(images: np.ndarray) -> np.ndarray:
+    """Perform the same pre-processing as `_write_image` on a whole batch of images, without writing them to disk.
+
+    Args:
+        images: The images to be processed.
+
+    Returns:
+        The images as uint8 arrays with a trailing channel dimension, matching what ReadImage would produce from the
+        written files in grayscale mode.
+    """
+    low = images.min(axis=(1, 2), keepdims=True)
+    high = images.max(axis=(1, 2), keepdims=True)
+    images = (images - low) / np.maximum(high - low, 1e-8) * 255
+    return np.expand_dims(images.astype(np.uint8), -1)
+
+
+def _build(train_compressed_path: str, test_compressed_path: str) -> Dict[str, np.ndarray]:
+    """Download and parse the USPS data for packing into a cache.
+
+    Args:
+        train_compressed_path: Where to save the compressed training data.
+        test_compressed_path: Where to save the compressed test data.
+
+    Returns:
+        The train and test arrays.
+    """
+    download_files([
+        RemoteFile('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.train.gz', train_compressed_path),
+        RemoteFile('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.test.gz', test_compressed_path)
+    ])
+    train_images, train_labels = _extract_images_labels(train_compressed_path)
+    test_images, test_labels = _extract_images_labels(test_compressed_path)
+    return {
+        "x_train": _pack_images(train_images),
+        "y_train": train_labels,
+        "x_test": _pack_images(test_images),
+        "y_test": test_labels
+    }
+
+
+def load_data(root_dir: Optional[str] = None,
+              packed: bool = False) -> Union[Tuple[LabeledDirDataset, LabeledDirDataset],
+                                             Tuple[NumpyDataset, NumpyDataset]]:
     """Load and return the USPS dataset.
 
+    By default the images are written to disk as individual png files, which need to be read by a ReadImage op. If
+    `packed` is True, the images are instead stored in a cache of contiguous arrays, which later calls memory-map. This
+    starts up much faster, and does not require a ReadImage op.
+
     Args:
         root_dir: The path to store the downloaded data. When `path` is not provided, the data will be saved into
             `fastestimator_data` under the user's home directory.
+        packed: Whether to return NumpyDatasets of (16, 16, 1) uint8 images rather than LabeledDirDatasets of image
+            file paths.
 
     Returns:
         (train_data, test_data)
@@ -108,21 +156,27 @@ def load_data(root_dir: Optional[str] = None) -> Tuple[LabeledDirDataset, Labele
     train_base_path = os.path.join(root_dir, "train")
     test_base_path = os.path.join(root_dir, "test")
 
+    if packed:
+        arrays = cache_arrays(os.path.join(root_dir, "packed"),
+                              partial(_build, train_compressed_path, test_compressed_path))
+        train_data = NumpyDataset({"x": arrays["x_train"], "y": arrays["y_train"]})
+        test_data = NumpyDataset({"x": arrays["x_test"], "y": arrays["y_test"]})
+        return train_data, test_data
+
+    files = []
+    if not os.path.exists(train_base_path):
+        files.append(RemoteFile('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.train.gz',
+                                train_compressed_path))
+    if not os.path.exists(test_base_path):
+        files.append(RemoteFile('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.test.gz',
+                                test_compressed_path))
+    download_files(files)
+
     if not os.path.exists(train_base_path):
-        if not os.path.exists(train_compressed_path):
-            print("Downloading train data to {}".format(root_dir))
-            wget.download('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.train.gz',
-                          root_dir,
-                          bar=bar_custom)
         train_images, train_labels = _extract_images_labels(train_compressed_path)
         _write_data(train_images, train_labels, train_base_path, "train")
 
     if not os.path.exists(test_base_path):
-        if not os.path.exists(test_compressed_path):
-            print("Downloading test data to {}".format(root_dir))
-            wget.download('http://statweb.stanford.edu/~tibs/ElemStatLearn/datasets/zip.test.gz',
-                          root_dir,
-                          bar=bar_custom)
         test_images, test_labels = _extract_images_labels(test_compressed_path)
         _write_data(test_images, test_labels, test_base_path, "test")
 
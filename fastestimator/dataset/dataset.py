@@ -13,20 +13,296 @@
 # limitations under the License.
 # ==============================================================================
 import math
-import random
+import weakref
 from collections import defaultdict
 from copy import deepcopy
-from functools import lru_cache
-from typing import Any, Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+from functools import lru_cache, partial
+from typing import Any, Dict, Hashable, Iterable, Iterator, List, Mapping, MutableMapping, Optional, Sequence, Tuple, \
+    Union
 
 import jsonpickle
 import numpy as np
 from torch.utils.data import Dataset
 
-from fastestimator.util.traceability_util import FeSplitSummary, traceable
+from fastestimator.util.traceability_util import FeSplitSummary, FeSummaryTable, add_trace_update, inherit_trace, \
+    is_traceable, traceable
 from fastestimator.util.util import FEID, get_shape, get_type
 
 
+def _add_split(tables: Dict[FEID, FeSummaryTable], fe_id: FEID, parent: Union[FEID, str], fraction: str) -> None:
+    """Record a split event in the summary table of a dataset.
+
+    Args:
+        tables: The summary tables of the dataset.
+        fe_id: The id of the table describing the dataset.
+        parent: The id of the dataset which was split, or 'self' if the split was performed on this dataset.
+        fraction: A description of the split.
+    """
+    table = tables[fe_id]
+    split_summary = table.fields.get('split', FeSplitSummary())
+    split_summary.add_split(parent=parent, fraction=fraction)
+    table.fields['split'] = split_summary
+
+
+def _add_parent_table(tables: Dict[FEID, FeSummaryTable], fe_id: FEID, parent: 'FEDataset') -> None:
+    """Copy the summary table of a parent dataset into the summary tables of one of its children.
+
+    Args:
+        tables: The summary tables of the child dataset.
+        fe_id: The id of the table describing the child dataset.
+        parent: The dataset which was split in order to create the child.
+    """
+    parent_id = FEID(id(parent))
+    # noinspection PyProtectedMember
+    tables[parent_id] = deepcopy(parent._fe_traceability_summary[parent_id])
+
+
+def _encode_column(column: np.ndarray) -> Tuple[np.ndarray, int]:
+    """Convert a column of values into integer codes.
+
+    Args:
+        column: The values to be encoded.
+
+    Returns:
+        The code of every value (equal values share a code), and an upper bound on the codes. Some codes below the
+        bound may be unused.
+    """
+    if column.dtype.kind in 'iub' and column.size and column.min() >= 0 and column.max() < 2 * column.size:
+        # Small non-negative integers (ex. class labels) can be used as codes directly, which avoids sorting
+        return column.astype(np.int64, copy=False), int(column.max()) + 1
+    _, codes = np.unique(column, return_inverse=True)
+    return codes.reshape(-1), int(codes.max()) + 1 if codes.size else 0
+
+
+def _to_split_column(values: List[Any], key: str) -> np.ndarray:
+    """Convert the values of a key into a column which can be used for stratified or grouped splits.
+
+    Args:
+        values: The value of the `key` for every element of a dataset.
+        key: The key which the `values` correspond to.
+
+    Returns:
+        A 1D array of the `values`.
+
+    Raises:
+        ValueError: If the `values` are not scalars.
+    """
+    column = np.array(values)
+    if column.size != len(values):
+        raise ValueError(f"stratify and group keys must correspond to scalar values, but '{key}' does not")
+    return column.reshape(-1)
+
+
+def _stratified_sample(codes: np.ndarray, n_classes: int, n_select: int,
+                       rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    """Randomly select elements while preserving the class balance.
+
+    Args:
+        codes: The class code of every element.
+        n_classes: An upper bound on the class codes.
+        n_select: How many elements to select.
+        rng: The random number generator to use.
+
+    Returns:
+        The indices of the selected elements, and a sort key for each of them. Every prefix of the selection, when
+        sorted by the key, has (nearly) the same class balance as the whole.
+    """
+    counts = np.bincount(codes, minlength=n_classes)
+    # Divide the selection between the classes using the largest remainder method, breaking ties randomly
+    quota = counts * (n_select / codes.size)
+    n_chosen = np.floor(quota).astype(np.int64)
+    n_chosen[np.lexsort((rng.random(n_classes), n_chosen - quota))[:n_select - n_chosen.sum()]] += 1
+    # Stable sorting of small integers is a linear-time radix sort in numpy
+    by_class = np.argsort(codes.astype(np.min_scalar_type(n_classes)), kind='stable')
+    starts = np.cumsum(counts) - counts
+    chosen, keys = [np.zeros(0, dtype=np.int64)], [np.zeros(0)]
+    for start, count, n in zip(starts.tolist(), counts.tolist(), n_chosen.tolist()):
+        if n:
+            chosen.append(by_class[start + rng.choice(count, n, replace=False)])
+            # The k-th selected element of a class goes at the k-th quantile of the selection
+            keys.append((np.arange(n) + rng.random(n)) / n)
+    return np.concatenate(chosen), np.concatenate(keys)
+
+
+class DataView(MutableMapping[int, Dict[str, Any]]):
+    """A zero-copy view of selected entries of an index-based data dictionary.
+
+    InMemoryDatasets use this to implement .split(), so that the new datasets share the original data storage rather
+    than copying it. View index `i` maps onto `storage[indices[i]]`.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        storage: A dictionary like {data_index: {<instance dictionary>}}.
+        indices: Which entries of the `storage` are visible through this view, in order.
+    """
+    def __init__(self, storage: Dict[int, Dict[str, Any]], indices: np.ndarray) -> None:
+        self.storage = storage
+        self.indices = indices
+
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(len(self)))
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        return self.storage[int(self.indices[index])]
+
+    def __setitem__(self, index: int, value: Dict[str, Any]) -> None:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        self.storage[int(self.indices[index])] = value
+
+    def __delitem__(self, index: int) -> None:
+        if not 0 <= index < len(self):
+            raise KeyError(index)
+        self.indices = np.delete(self.indices, index)
+
+    def values(self) -> List[Dict[str, Any]]:
+        storage = self.storage
+        return [storage[idx] for idx in self.indices.tolist()]
+
+
+class _ColumnRow(dict):
+    """An entry of a ColumnStore, which registers itself with the store when it is modified.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        store: The store which this row belongs to.
+        index: The index of this row within the `store`.
+        values: The contents of the row.
+    """
+    __slots__ = ('_store', '_index', '__weakref__')
+
+    def __init__(self, store: 'ColumnStore', index: int, values: Dict[str, Any]) -> None:
+        super().__init__(values)
+        self._store = store
+        self._index = index
+
+    def _mark_modified(self) -> None:
+        self._store._modified[self._index] = self
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self._mark_modified()
+
+    def __delitem__(self, key: str) -> None:
+        super().__delitem__(key)
+        self._mark_modified()
+
+    def __ior__(self, other: Mapping[str, Any]) -> '_ColumnRow':
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        super().update(*args, **kwargs)
+        self._mark_modified()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        self._mark_modified()
+        return super().setdefault(key, default)
+
+    def pop(self, *args: Any) -> Any:
+        self._mark_modified()
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[str, Any]:
+        self._mark_modified()
+        return super().popitem()
+
+    def clear(self) -> None:
+        super().clear()
+        self._mark_modified()
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[str, Any]]]:
+        # Copies (and rows sent to other processes) are plain dictionaries which don't drag the whole store along
+        return dict, (dict(self), )
+
+
+class ColumnStore(Mapping[int, Dict[str, Any]]):
+    """An index-based data dictionary which is backed by whole columns of data.
+
+    Entry `i` is assembled on request as {key: column[i]}, so no per-instance objects are created up front. When the
+    columns are memory-mapped arrays, their contents are only read from disk as they are accessed, and are shared with
+    any worker processes forked from this one via the OS page cache. Requesting the same entry repeatedly returns the
+    same dictionary for as long as it is in use. Modifying an entry in place keeps it alive for good, and from then on
+    the store is read entry-by-entry rather than column-by-column so that the modification is visible everywhere.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        columns: A dictionary like {"key1": <numpy array>, "key2": [list]}, where every column has the same length.
+    """
+    def __init__(self, columns: Dict[str, Sequence[Any]]) -> None:
+        self.columns = dict(columns)
+        self.size = len(next(iter(self.columns.values()))) if self.columns else 0
+        self._rows = weakref.WeakValueDictionary()  # type: MutableMapping[int, _ColumnRow]
+        self._modified = {}  # type: Dict[int, _ColumnRow]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(range(self.size))
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        row = self._modified.get(index)
+        if row is None:
+            row = self._rows.get(index)
+        if row is None:
+            if not 0 <= index < self.size:
+                raise KeyError(index)
+            row = _ColumnRow(self, index, {key: column[index] for key, column in self.columns.items()})
+            self._rows[index] = row
+        return row
+
+    def is_modified(self) -> bool:
+        """Whether any of the entries have been modified in place, such that the columns are no longer up to date.
+
+        Returns:
+            True iff an entry has been modified.
+        """
+        return bool(self._modified)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state['_rows'] = None
+        state['_modified'] = {index: dict(row) for index, row in self._modified.items()}
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._rows = weakref.WeakValueDictionary()
+        self._modified = {index: _ColumnRow(self, index, row) for index, row in self._modified.items()}
+
+
+def _get_column(data: Mapping[int, Dict[str, Any]], key: str) -> Optional[Sequence[Any]]:
+    """Read a whole column out of column-backed data without assembling every entry.
+
+    Args:
+        data: An index-based data dictionary.
+        key: Which column to read.
+
+    Returns:
+        The column (which may share memory with the `data`), or None if the `data` is not column-backed.
+    """
+    indices = None
+    if isinstance(data, DataView):
+        data, indices = data.storage, data.indices
+    if not isinstance(data, ColumnStore) or data.is_modified():
+        return None
+    column = data.columns[key]
+    if indices is None:
+        return column
+    if isinstance(column, np.ndarray):
+        return column[indices]
+    return [column[idx] for idx in indices.tolist()]
+
+
 class KeySummary:
     """A summary of the dataset attributes corresponding to a particular key.
 
@@ -117,6 +393,20 @@ class FEDataset(Dataset):
         """
         raise NotImplementedError
 
+    def get_items(self, indices: Sequence[int]) -> List[Dict[str, Any]]:
+        """Fetch several data instances at once.
+
+        Datasets which can read many elements more efficiently than one at a time (for example by batching disk access)
+        may override this method. It is used by BatchDataset.
+
+        Args:
+            indices: Which datapoints to retrieve.
+
+        Returns:
+            The data dictionaries from the specified indices.
+        """
+        return [self[index] for index in indices]
+
     @classmethod
     def fix_split_traceabilty(cls,
                               parent: 'FEDataset',
@@ -132,39 +422,28 @@ class FEDataset(Dataset):
             children: The datasets generated by performing the split.
             fractions: The fraction arguments used to generate the children (should be one-to-one with the children).
         """
-        if hasattr(parent, '_fe_traceability_summary'):
+        if is_traceable(parent):
             parent_id = FEID(id(parent))
             fractions = [
                 f"range({frac.start}, {frac.stop}, {frac.step})" if isinstance(frac, range) else f"{frac}"
                 for frac in fractions
             ]
+            # The summary tables are only built if somebody asks for them, so just record the split for now
             for child, frac in zip(children, fractions):
-                # noinspection PyProtectedMember
-                tables = deepcopy(child._fe_traceability_summary)
-                # Update the ID if necessary
-                child_id = FEID(id(child))
-                if child_id not in tables:
-                    # The child was created without invoking its __init__ method, so its internal summary will have the
-                    # wrong id
-                    table = tables.pop(parent_id)
-                    table.fe_id = child_id
-                    tables[child_id] = table
-                else:
-                    table = tables[child_id]
-                split_summary = table.fields.get('split', FeSplitSummary())
-                split_summary.add_split(parent=parent_id, fraction=frac)
-                table.fields['split'] = split_summary
-                child._fe_traceability_summary = tables
-            # noinspection PyUnresolvedReferences
-            table = parent._fe_traceability_summary.get(parent_id)
-            split_summary = table.fields.get('split', FeSplitSummary())
-            split_summary.add_split(parent='self', fraction=", ".join([f"-{frac}" for frac in fractions]))
-            table.fields['split'] = split_summary
-            # Put the new parent summary into the child table to ensure it will always exist in the final set of tables
-            for child in children:
-                child._fe_traceability_summary[parent_id] = deepcopy(table)
-
-    def split(self, *fractions: Union[float, int, Iterable[int]]) -> Union['FEDataset', List['FEDataset']]:
+                if child.__dict__.get('_fe_traceability_args') is parent.__dict__.get('_fe_traceability_args'):
+                    # The child was created without invoking its __init__ method, so it is carrying a copy of the
+                    # parent's traceability information
+                    inherit_trace(child, parent)
+                add_trace_update(child, partial(_add_split, parent=parent_id, fraction=frac))
+                # Put the parent summary into the child tables to ensure it will always exist in the final set of tables
+                add_trace_update(child, partial(_add_parent_table, parent=parent))
+            add_trace_update(parent,
+                             partial(_add_split, parent='self', fraction=", ".join([f"-{frac}" for frac in fractions])))
+
+    def split(self,
+              *fractions: Union[float, int, Iterable[int]],
+              stratify: Optional[str] = None,
+              group: Optional[str] = None) -> Union['FEDataset', List['FEDataset']]:
         """Split this dataset into multiple smaller datasets.
 
         This function enables several types of splitting:
@@ -186,16 +465,33 @@ class FEDataset(Dataset):
             ds2 = ds.split([87,2,3,100,121,158])  # len(ds) == 994, len(ds2) == 6
             ds3 = ds.split(range(100))  # len(ds) == 894, len(ds3) == 100
             ```
+        Fraction and count based splits can also be stratified and / or grouped:
+            ```python
+            ds = fe.dataset.FEDataset(...)  # {"x": <100>, "y": <int>, "patient": <str>}, len(ds) == 1000
+            ds2 = ds.split(0.1, stratify="y")  # ds and ds2 have the same class balance as the original ds
+            ds3 = ds.split(0.1, group="patient")  # No patient has data in both ds and ds3
+            ```
 
         Args:
             *fractions: Floating point values will be interpreted as percentages, integers as an absolute number of
                 datapoints, and an iterable of integers as the exact indices of the data that should be removed in order
                 to create the new dataset.
+            stratify: The key of a (hashable) label. If provided, then every new dataset (and the remainder of this
+                dataset) will have approximately the same label distribution as this dataset.
+            group: The key of a group identifier (ex. a patient id). If provided, then all of the datapoints belonging
+                to a group will end up in the same dataset. In this case the sizes of the new datasets are rounded up
+                to the nearest group boundary. When combined with `stratify`, each group is treated as having the label
+                of one of its datapoints (so groups should be homogeneous, ex. one diagnosis per patient).
 
         Returns:
             One or more new datasets which are created by removing elements from the current dataset. The number of
             datasets returned will be equal to the number of `fractions` provided. If only a single value is provided
             then the return will be a single dataset rather than a list of datasets.
+
+        Raises:
+            ValueError: If `stratify` or `group` are combined with index-based splits, or are used on a dataset which
+                is not split by element (ex. SiameseDirDataset), or if rounding up to group boundaries would leave this
+                dataset or any of the new datasets empty.
         """
         assert len(fractions) > 0, "split requires at least one fraction argument"
         original_size = self._split_length()
@@ -229,23 +525,94 @@ class FEDataset(Dataset):
         assert int_sum < original_size, \
             "total split requirements ({}) should sum to less than dataset size ({})".format(int_sum, original_size)
 
+        if (stratify is not None or group is not None) and (method == 'indices' or original_size != len(self)):
+            raise ValueError("stratify and group are only supported for fraction or count based splits of datasets "
+                             "which are split by element")
         splits = []
+        descriptions = list(fractions)
         if method == 'number':
-            # TODO - convert to a linear congruential generator for large datasets?
-            # https://stackoverflow.com/questions/9755538/how-do-i-create-a-list-of-random-numbers-without-duplicates
-            indices = random.sample(range(original_size), int_sum)
-            start = 0
-            for stop in n_samples:
-                splits.append((indices[i] for i in range(start, start + stop)))
-                start += stop
+            splits = self._sample_splits(n_samples, stratify=stratify, group=group)
+            for key, how in ((stratify, "stratified"), (group, "grouped")):
+                if key is not None:
+                    descriptions = [f"{desc} {how} by '{key}'" for desc in descriptions]
         elif method == 'indices':
             splits = fractions
         splits = self._do_split(splits)
-        FEDataset.fix_split_traceabilty(self, splits, fractions)
+        FEDataset.fix_split_traceabilty(self, splits, tuple(descriptions))
         if len(fractions) == 1:
             return splits[0]
         return splits
 
+    def _sample_splits(self,
+                       n_samples: List[int],
+                       stratify: Optional[str] = None,
+                       group: Optional[str] = None) -> List[np.ndarray]:
+        """Randomly choose which indices should be moved into each new dataset.
+
+        Args:
+            n_samples: How many datapoints should be placed into each new dataset.
+            stratify: The key of a label whose distribution should be preserved by the split.
+            group: The key of a group identifier whose members must not be divided between datasets.
+
+        Returns:
+            The indices to be removed from this dataset for each new dataset.
+
+        Raises:
+            ValueError: If `group` is provided and rounding up to group boundaries would leave this dataset or any of
+                the new datasets empty.
+        """
+        stops = np.cumsum(n_samples)
+        # Draw the seed from the global numpy generator so that fe_deterministic_seed still applies
+        rng = np.random.default_rng(np.random.randint(np.iinfo(np.int32).max))
+        if group is None:
+            if stratify is None:
+                order = rng.choice(self._split_length(), stops[-1], replace=False)
+            else:
+                order, key = _stratified_sample(*_encode_column(self._split_column(stratify)), stops[-1], rng)
+                # Only the boundaries between the new datasets matter, so a full sort isn't required
+                boundaries = stops[:-1][(stops[:-1] > 0) & (stops[:-1] < order.size)]
+                if boundaries.size:
+                    order = order[np.argpartition(key, boundaries - 1)]
+            return np.split(order, stops[:-1])
+        members, n_groups = _encode_column(self._split_column(group))
+        if stratify is None:
+            order = rng.permutation(n_groups)
+        else:
+            labels = np.zeros(n_groups, dtype=np.int64)
+            labels[members] = _encode_column(self._split_column(stratify))[0]
+            order, key = _stratified_sample(labels, int(labels.max()) + 1, n_groups, rng)
+            order = order[np.argsort(key)]
+        # Take whole groups (in the chosen order) until each new dataset has at least the requested number of elements
+        sizes = np.bincount(members, minlength=n_groups)
+        cuts = np.where(stops > 0, np.searchsorted(np.cumsum(sizes[order]), stops, side='left') + 1, 0)
+        assignment = np.full(n_groups, -1, dtype=np.min_scalar_type(-len(n_samples)))
+        start = 0
+        for split_idx, (stop, n_sample) in enumerate(zip(cuts.tolist(), n_samples)):
+            if n_sample > 0 and stop <= start:
+                raise ValueError(f"Grouping by '{group}' leaves no data for split {split_idx}, since earlier splits "
+                                 "were rounded up to consume its groups. Try requesting smaller splits.")
+            assignment[order[start:stop]] = split_idx
+            start = max(start, stop)
+        if start >= n_groups:
+            raise ValueError(f"Grouping by '{group}' leaves no data in the original dataset, since the requested "
+                             "splits were rounded up to consume every group. Try requesting smaller splits.")
+        assignment = assignment[members]
+        return [np.flatnonzero(assignment == split_idx) for split_idx in range(len(n_samples))]
+
+    def _split_column(self, key: str) -> np.ndarray:
+        """Get every value of a given key, for use in stratified or grouped splits.
+
+        Args:
+            key: The key to look up.
+
+        Returns:
+            A 1D array containing the value of `key` for every element of the dataset.
+
+        Raises:
+            ValueError: If the values of `key` are not scalars.
+        """
+        return _to_split_column([self[idx][key] for idx in range(len(self))], key)
+
     def _split_length(self) -> int:
         """The length of a dataset to be used for the purpose of computing splits.
 
@@ -284,12 +651,12 @@ class InMemoryDataset(FEDataset):
     """A dataset abstraction to simplify the implementation of datasets which hold their data in memory.
 
     Args:
-        data: A dictionary like {data_index: {<instance dictionary>}}.
+        data: A dictionary like {data_index: {<instance dictionary>}}, or a ColumnStore.
     """
-    data: Dict[int, Dict[str, Any]]  # Index-based data dictionary
+    data: Mapping[int, Dict[str, Any]]  # Index-based data dictionary (or a ColumnStore, or a DataView after splitting)
     summary: lru_cache
 
-    def __init__(self, data: Dict[int, Dict[str, Any]]) -> None:
+    def __init__(self, data: Mapping[int, Dict[str, Any]]) -> None:
         self.data = data
         # Normally lru cache annotation is shared over all class instances, so calling cache_clear would reset all
         # caches (for example when calling .split()). Instead we make the lru cache per-instance
@@ -317,11 +684,21 @@ class InMemoryDataset(FEDataset):
         if isinstance(index, int):
             return self.data[index]
         else:
-            result = [elem[index] for elem in self.data.values()]
+            result = _get_column(self.data, index)
+            if isinstance(result, np.ndarray):
+                return np.array(result) if result.ndim > 1 else list(result)
+            result = list(result) if result is not None else [elem[index] for elem in self.data.values()]
             if isinstance(result[0], np.ndarray):
                 return np.array(result)
             return result
 
+    def get_items(self, indices: Sequence[int]) -> List[Dict[str, Any]]:
+        if type(self).__getitem__ is not InMemoryDataset.__getitem__:
+            # Subclasses like SiameseDirDataset build their elements in __getitem__, so reading self.data would be wrong
+            return [self[index] for index in indices]
+        data = self.data
+        return [data[index] for index in indices]
+
     def __setitem__(self, key: Union[int, str], value: Union[Dict[str, Any], Sequence[Any]]) -> None:
         """Modify data in the dataset.
 
@@ -343,14 +720,31 @@ class InMemoryDataset(FEDataset):
         """
         if isinstance(key, int):
             assert isinstance(value, Dict), "if setting a value using an integer index, must provide a dictionary"
+            self._make_mutable()
             self.data[key] = value
         else:
             assert len(value) == len(self.data), \
                 "input value must be of length {}, but had length {}".format(len(self.data), len(value))
-            for i in range(len(self.data)):
-                self.data[i][key] = value[i]
+            if isinstance(self.data, ColumnStore) and not self.data.is_modified() and isinstance(
+                    value, (np.ndarray, list)):
+                # Whole columns can be swapped out without touching the other columns
+                self.data = ColumnStore({**self.data.columns, key: value})
+            else:
+                self._make_mutable()
+                for i in range(len(self.data)):
+                    self.data[i][key] = value[i]
         self.summary.cache_clear()
 
+    def _make_mutable(self) -> None:
+        """Convert column-backed data into an ordinary index-based dictionary so that it can be modified in place.
+
+        Only the entries visible to this dataset are converted, so other datasets which were split off from the same
+        storage are unaffected.
+        """
+        storage = self.data.storage if isinstance(self.data, DataView) else self.data
+        if isinstance(storage, ColumnStore):
+            self.data = dict(enumerate(self.data.values()))
+
     def _skip_init(self, data: Dict[int, Dict[str, Any]], **kwargs) -> 'InMemoryDataset':
         """A helper method to create new dataset instances without invoking their __init__ methods.
 
@@ -381,15 +775,29 @@ class InMemoryDataset(FEDataset):
         Returns:
             New Datasets generated by removing data at the indices specified by `splits` from the current dataset.
         """
+        if isinstance(self.data, DataView):
+            storage, indices = self.data.storage, self.data.indices
+        else:
+            storage, indices = self.data, np.arange(len(self.data))
+        keep = np.ones(len(indices), dtype=bool)
         results = []
         for split in splits:
-            data = {new_idx: self.data.pop(old_idx) for new_idx, old_idx in enumerate(split)}
-            results.append(self._skip_init(data, **{k: v for k, v in self.__dict__.items() if k not in {'data'}}))
-        # Re-key the remaining data to be contiguous from 0 to new max index
-        self.data = {new_idx: v for new_idx, (old_idx, v) in enumerate(self.data.items())}
+            split = np.asarray(split if isinstance(split, (Sequence, np.ndarray)) else list(split), dtype=np.int64)
+            keep[split] = False
+            # The new dataset is a view onto the same storage, so none of the data is copied
+            results.append(
+                self._skip_init(DataView(storage, indices[split]),
+                                **{k: v
+                                   for k, v in self.__dict__.items() if k not in {'data'}}))
+        self.data = DataView(storage, indices[keep])
         self.summary.cache_clear()
         return results
 
+    def _split_column(self, key: str) -> np.ndarray:
+        column = _get_column(self.data, key)
+        return _to_split_column(list(column) if column is not None else [elem[key] for elem in self.data.values()],
+                                key)
+
     def summary(self) -> DatasetSummary:
         """Generate a summary representation of this dataset.
         Returns:
@@ -418,7 +826,10 @@ class InMemoryDataset(FEDataset):
                 # If no changes, then we can relatively quickly count the unique values using self.data
                 if dtypes[key] == original_dtype and shapes[key] == original_shape and isinstance(
                         original_val, Hashable):
-                    n_unique_vals[key] = len({self.data[i][key] for i in range(len(self.data))})
+                    column = _get_column(self.data, key)
+                    if column is None:
+                        column = [self.data[i][key] for i in range(len(self.data))]
+                    n_unique_vals[key] = len(set(column))
 
         key_summary = {
             key: KeySummary(dtype=dtypes[key], num_unique_values=n_unique_vals[key] or None, shape=shapes[key])
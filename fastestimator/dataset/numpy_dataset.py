@@ -16,7 +16,8 @@ from typing import Dict, List, Union
 
 import numpy as np
 
-from fastestimator.dataset.dataset import InMemoryDataset
+from fastestimator.dataset.array_cache import RaggedArray
+from fastestimator.dataset.dataset import ColumnStore, InMemoryDataset
 from fastestimator.util.traceability_util import traceable
 
 
@@ -24,18 +25,21 @@ from fastestimator.util.traceability_util import traceable
 class NumpyDataset(InMemoryDataset):
     """A dataset constructed from a dictionary of Numpy data or list of data.
 
+    The data are kept as whole columns rather than being split into a dictionary per instance, so construction is cheap
+    even for memory-mapped arrays (see `fe.dataset.cache_arrays`), which are then only read as they are accessed.
+
     Args:
-        data: A dictionary of data like {"key1": <numpy array>, "key2": [list]}.
+        data: A dictionary of data like {"key1": <numpy array>, "key2": [list], "key3": <RaggedArray>}.
     Raises:
         AssertionError: If any of the Numpy arrays or lists have differing numbers of elements.
         ValueError: If any dictionary value is not instance of Numpy array or list.
     """
-    def __init__(self, data: Dict[str, Union[np.ndarray, List]]) -> None:
+    def __init__(self, data: Dict[str, Union[np.ndarray, List, RaggedArray]]) -> None:
         size = None
         for val in data.values():
             if isinstance(val, np.ndarray):
                 current_size = val.shape[0]
-            elif isinstance(val, list):
+            elif isinstance(val, (list, RaggedArray)):
                 current_size = len(val)
             else:
                 raise ValueError("Please ensure you are passing numpy array or list in the data dictionary.")
@@ -43,4 +47,4 @@ class NumpyDataset(InMemoryDataset):
                 assert size == current_size, "All data arrays must have the same number of elements"
             else:
                 size = current_size
-        super().__init__({i: {k: v[i] for k, v in data.items()} for i in range(size)})
+        super().__init__(ColumnStore(data))
@@ -12,16 +12,72 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import multiprocessing as mp
+import random
 from copy import deepcopy
-from typing import Any, List, Mapping
+from typing import Any, List, Mapping, MutableMapping, Optional, Sequence, Tuple
 
 import numpy as np
-from torch.utils.data import Dataset
+from torch.utils.data import Dataset, get_worker_info
 
-from fastestimator.dataset import BatchDataset
+from fastestimator.dataset import BatchDataset, ShardDataset, SiameseDirDataset
+from fastestimator.op.numpyop.meta.one_of import OneOf
+from fastestimator.op.numpyop.meta.sometimes import Sometimes
 from fastestimator.op.numpyop.numpyop import NumpyOp, forward_numpyop
+from fastestimator.util.random_util import OP_STREAM, get_base_seed, get_rng, seed_global_rngs
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import pad_batch
+from fastestimator.util.util import pad_collate
+
+
+class OpProfile:
+    """Cumulative timing statistics for a list of NumpyOps, shared between all of the processes of a data loader.
+
+    The counters live in shared memory, so that updates made inside forked data loader workers are visible from the
+    main process. Each update acquires a lock only once, so the overhead is negligible compared to the ops themselves.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        ops: The ops whose execution is being profiled.
+    """
+    def __init__(self, ops: List[NumpyOp]) -> None:
+        self.op_names = [self._get_op_name(op) for op in ops]
+        self._lock = mp.Lock()
+        self._op_times = mp.RawArray('d', len(ops))
+        self._op_calls = mp.RawArray('q', len(ops))
+        self._samples = mp.RawValue('q', 0)
+
+    @staticmethod
+    def _get_op_name(op: NumpyOp) -> str:
+        if isinstance(op, Sometimes) and op.op:
+            return op.__class__.__name__ + " (" + op.op.__class__.__name__ + ")"
+        if isinstance(op, OneOf) and op.ops:
+            return op.__class__.__name__ + " (" + ", ".join([sub_op.__class__.__name__ for sub_op in op.ops]) + ")"
+        return op.__class__.__name__
+
+    def update(self, op_times: Sequence[float], num_calls: int, num_samples: int) -> None:
+        """Add new measurements to the shared counters.
+
+        Args:
+            op_times: The time (in seconds) spent in each op.
+            num_calls: How many times each op was invoked while accumulating `op_times`.
+            num_samples: How many samples were produced while accumulating `op_times`.
+        """
+        with self._lock:
+            for idx, duration in enumerate(op_times):
+                self._op_times[idx] += duration
+                self._op_calls[idx] += num_calls
+            self._samples.value += num_samples
+
+    def get_stats(self) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Get a consistent snapshot of the shared counters.
+
+        Returns:
+            The cumulative time (in seconds) spent in each op, the number of calls to each op, and the number of samples
+            produced so far.
+        """
+        with self._lock:
+            return np.array(self._op_times[:]), np.array(self._op_calls[:], dtype=np.int64), self._samples.value
 
 
 @traceable()
@@ -35,13 +91,57 @@ class OpDataset(Dataset):
         dataset: The base dataset to wrap.
         ops: A list of ops to be applied after the base `dataset` `__getitem__` is invoked.
         mode: What mode the system is currently running in ('train', 'eval', 'test', or 'infer').
+        profile: Where to record the time spent in each of the `ops`. If None, a new OpProfile will be created.
+        seed: The base seed of the random streams used by the `ops` (and by datasets which sample their own data). Each
+            sample gets its own stream, keyed by (`epoch`, sample index), which the ops can draw from via state["rng"].
+            The global `random` and `np.random` states are also re-seeded from that stream before the ops run. The
+            results therefore don't depend on the number of loader workers or on which samples were loaded before. If
+            None, a new seed will be drawn (or the deterministic seed will be used if one has been set).
+        epoch: The epoch index which the random streams are keyed by.
     """
-    def __init__(self, dataset: Dataset, ops: List[NumpyOp], mode: str) -> None:
+    def __init__(self,
+                 dataset: Dataset,
+                 ops: List[NumpyOp],
+                 mode: str,
+                 profile: Optional[OpProfile] = None,
+                 seed: Optional[int] = None,
+                 epoch: int = 0) -> None:
         self.dataset = dataset
+        self.seed = get_base_seed() if seed is None else seed
+        self.epoch = epoch
         if isinstance(self.dataset, BatchDataset):
-            self.dataset.reset_index_maps()
+            self.dataset.reset_index_maps(seed=self.seed, epoch=epoch)
+        elif isinstance(self.dataset, (SiameseDirDataset, ShardDataset)):
+            self.dataset.set_random_stream(seed=self.seed, epoch=epoch)
         self.ops = ops
         self.mode = mode
+        self.profile = profile or OpProfile(ops)
+
+    def _forward(self, item: MutableMapping[str, Any], key: Tuple[int, ...], op_times: List[float]) -> None:
+        """Apply the ops to a single data instance using the random stream identified by `key`.
+
+        Args:
+            item: The data instance to be modified in place.
+            key: The key of the random stream, after the stream type and epoch.
+            op_times: Where to accumulate the time spent in each op.
+        """
+        rng = get_rng(self.seed, OP_STREAM, self.epoch, *key)
+        # Key the global random states per sample too, for ops which draw from them. The seeds come from a jumped copy
+        # of the stream so that the draws seen through state['rng'] are unaffected.
+        global_rng = np.random.Generator(rng.bit_generator.jumped())
+        if get_worker_info() is not None:
+            # Loader workers own their global random states
+            seed_global_rngs(global_rng)
+            forward_numpyop(self.ops, item, {'mode': self.mode, 'rng': rng}, op_times=op_times)
+            return
+        # The main process's global random states belong to the user, so put them back afterwards
+        saved_states = random.getstate(), np.random.get_state()
+        seed_global_rngs(global_rng)
+        try:
+            forward_numpyop(self.ops, item, {'mode': self.mode, 'rng': rng}, op_times=op_times)
+        finally:
+            random.setstate(saved_states[0])
+            np.random.set_state(saved_states[1])
 
     def __getitem__(self, index: int) -> Mapping[str, Any]:
         """Fetch a data instance at a specified index, and apply transformations to it.
@@ -53,18 +153,20 @@ class OpDataset(Dataset):
             The data dictionary from the specified index, with transformations applied.
         """
         items = deepcopy(self.dataset[index])  # Deepcopy to prevent ops from overwriting values in datasets
+        op_times = [0.0] * len(self.ops)
         if isinstance(self.dataset, BatchDataset):
             # BatchDataset may randomly sample the same elements multiple times, so need to avoid reprocessing
             unique_samples = set()
-            for item in items:
+            for position, item in enumerate(items):
                 if id(item) not in unique_samples:
-                    forward_numpyop(self.ops, item, {'mode': self.mode})
+                    self._forward(item, (index, position), op_times)
                     unique_samples.add(id(item))
-            if self.dataset.pad_value is not None:
-                pad_batch(items, self.dataset.pad_value)
-            items = {key: np.array([item[key] for item in items]) for key in items[0]}
+            self.profile.update(op_times, num_calls=len(unique_samples), num_samples=len(items))
+            items = pad_collate(items, self.dataset.pad_value, self.dataset.pad_multiple)
+            items = {key: value if isinstance(value, np.ndarray) else np.array(value) for key, value in items.items()}
         else:
-            forward_numpyop(self.ops, items, {'mode': self.mode})
+            self._forward(items, (index, ), op_times)
+            self.profile.update(op_times, num_calls=1, num_samples=1)
         return items
 
     def __len__(self):
@@ -0,0 +1,342 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import pickle
+from typing import Any, Dict, Generator, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from torch.utils.data import Dataset, get_worker_info
+
+from fastestimator.dataset.dataset import DatasetSummary, FEDataset, KeySummary
+from fastestimator.op.numpyop.numpyop import NumpyOp, forward_numpyop
+from fastestimator.schedule.schedule import Scheduler, get_current_items
+from fastestimator.util.distributed import get_rank, get_world_size
+from fastestimator.util.random_util import DATASET_STREAM
+from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import get_shape, get_type, to_list
+
+_INDEX_FILE = "index.json"
+_FORMAT_NAME = "fastestimator-shards"
+_FORMAT_VERSION = 1
+
+
+def write_shards(dataset: Dataset,
+                 save_dir: str,
+                 ops: Union[None, NumpyOp, List[NumpyOp]] = None,
+                 mode: str = "train",
+                 max_shard_size: int = 256 * 1024 * 1024,
+                 records_per_shard: Optional[int] = None) -> str:
+    """Convert a dataset into a set of shard files which can be read back by a ShardDataset.
+
+    Every record is pickled and appended to the current shard file, and a new shard is started whenever the current one
+    exceeds `max_shard_size` bytes (or `records_per_shard` records). The byte offsets of the records are written into an
+    index file so that the shards can later be streamed using large sequential reads.
+
+    ```python
+    ds = fe.dataset.LabeledDirDataset("/data/images")
+    write_shards(ds, "/nfs/images_sharded", ops=[ReadImage(inputs="x", outputs="x"), Resize(...)])
+    ds = fe.dataset.ShardDataset("/nfs/images_sharded")
+    ```
+
+    Args:
+        dataset: The dataset to be converted.
+        save_dir: The directory into which to write the shards and their index. It will be created if it doesn't exist.
+        ops: NumpyOps to be applied to every record before it is written. Since the results are stored permanently,
+            only deterministic ops (ex. reading and resizing images) should be used here.
+        mode: The mode to use when filtering and executing the `ops`.
+        max_shard_size: The approximate maximum size of a shard file (in bytes).
+        records_per_shard: The maximum number of records per shard file, or None to only limit the shards by size.
+
+    Returns:
+        The path to the index file which was written.
+
+    Raises:
+        ValueError: If the `ops` contain Schedulers, or if the shard limits are invalid.
+    """
+    ops = to_list(ops)
+    if any(isinstance(op, Scheduler) for op in ops):
+        raise ValueError("write_shards does not support scheduled ops")
+    if max_shard_size < 1 or (records_per_shard is not None and records_per_shard < 1):
+        raise ValueError("write_shards requires max_shard_size and records_per_shard to be positive")
+    ops = get_current_items(ops, run_modes=mode)
+    os.makedirs(save_dir, exist_ok=True)
+    shards = []
+    shard_file, offsets = None, None
+
+    def _close_shard() -> None:
+        shard_file.close()
+        shards.append({"file": os.path.basename(shard_file.name), "offsets": offsets})
+
+    for idx in range(len(dataset)):
+        if shard_file is None:
+            shard_file = open(os.path.join(save_dir, "shard-{:05d}.bin".format(len(shards))), "wb")
+            offsets = [0]
+        data = dict(dataset[idx])
+        if ops:
+            forward_numpyop(ops, data, {"mode": mode})
+        shard_file.write(pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL))
+        offsets.append(shard_file.tell())
+        if offsets[-1] >= max_shard_size or (records_per_shard and len(offsets) > records_per_shard):
+            _close_shard()
+            shard_file = None
+    if shard_file is not None:
+        _close_shard()
+    index_path = os.path.join(save_dir, _INDEX_FILE)
+    with open(index_path, "w") as f:
+        json.dump({"format": _FORMAT_NAME, "version": _FORMAT_VERSION, "shards": shards}, f)
+    return index_path
+
+
+@traceable()
+class ShardDataset(FEDataset):
+    """A dataset which streams records out of shard files written by `write_shards`.
+
+    Rather than performing a random read for every sample, each data loader worker is assigned its own subset of the
+    shards and reads through them sequentially. Randomness comes from shuffling the order of the shards at the start of
+    every pass, plus an in-memory shuffle buffer. This makes the dataset well suited to network filesystems and other
+    storage where random small-file reads are slow.
+
+    Since the records are streamed, the `index` given to __getitem__ is ignored: each call returns the next record for
+    the calling worker. Every worker starts a new pass over its shards whenever it runs out of records, so a record may
+    occasionally be seen twice (and another not at all) in a given epoch when the shards cannot be divided evenly
+    between the workers.
+
+    Args:
+        root_dir: The directory containing the shards (or the path of their index file).
+        shuffle: Whether to shuffle the shard order and the records within the shuffle buffer.
+        shuffle_buffer: How many records to hold in memory for shuffling. Larger values give better randomness.
+        read_buffer: The size (in bytes) of the buffer used when reading shard files.
+        seed: The seed for shuffling. Every worker shuffles with its own generator, keyed by epoch and worker index. If
+            None, the seed provided by the Pipeline is used (or a fresh one outside of a Pipeline).
+
+    Raises:
+        ValueError: If the index file is not a recognized shard index, or if the buffer sizes are invalid.
+    """
+    def __init__(self,
+                 root_dir: str,
+                 shuffle: bool = True,
+                 shuffle_buffer: int = 1000,
+                 read_buffer: int = 8 * 1024 * 1024,
+                 seed: Optional[int] = None) -> None:
+        index_path = os.path.join(root_dir, _INDEX_FILE) if os.path.isdir(root_dir) else root_dir
+        with open(index_path, "r") as f:
+            index = json.load(f)
+        if index.get("format") != _FORMAT_NAME or index.get("version", 0) > _FORMAT_VERSION:
+            raise ValueError("{} is not a supported shard index".format(index_path))
+        if shuffle_buffer < 0 or read_buffer < 1:
+            raise ValueError("ShardDataset requires a non-negative shuffle_buffer and a positive read_buffer")
+        self.root_dir = os.path.dirname(index_path)
+        self.shuffle = shuffle
+        self.shuffle_buffer = shuffle_buffer
+        self.read_buffer = read_buffer
+        self.seed = seed
+        self.stream_seed = seed
+        self.epoch = 0
+        self.shard_files = [os.path.join(self.root_dir, shard["file"]) for shard in index["shards"]]
+        self.offsets = [np.array(shard["offsets"], dtype=np.int64) for shard in index["shards"]]
+        # Which records from each shard belong to this dataset (this changes when the dataset is split)
+        self.records = [np.arange(len(offsets) - 1) for offsets in self.offsets]
+        self._stream = None
+        self._stream_owner = None
+        self._summary = None
+
+    def __len__(self) -> int:
+        return sum(len(records) for records in self.records)
+
+    def set_random_stream(self, seed: Optional[int], epoch: int = 0) -> None:
+        """Choose the seed used for shuffling, unless one was given to the constructor.
+
+        This method is invoked every epoch by OpDataset.
+
+        Args:
+            seed: The base seed for shuffling, or None to draw a fresh seed in every worker.
+            epoch: The epoch index which the shuffling is keyed by.
+        """
+        self.stream_seed = seed if self.seed is None else self.seed
+        self.epoch = epoch
+        self._stream, self._stream_owner = None, None
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Fetch the next record for the current worker.
+
+        Args:
+            index: Ignored, since the records are streamed (see the class docstring).
+
+        Returns:
+            A data dictionary.
+        """
+        worker = get_worker_info()
+        owner = (os.getpid(), None if worker is None else worker.id)
+        if self._stream is None or self._stream_owner != owner:
+            # Workers are forked from the main process, so they must not continue a stream which they inherited
+            worker_id, num_workers = (0, 1) if worker is None else (worker.id, worker.num_workers)
+            # During distributed training every process streams from its own disjoint set of shards
+            self._stream = self._generate(get_rank() * num_workers + worker_id, get_world_size() * num_workers)
+            self._stream_owner = owner
+        return next(self._stream)
+
+    def get_worker_units(self, worker_id: int, num_workers: int) -> List[Tuple[int, np.ndarray]]:
+        """Decide which records a given worker is responsible for.
+
+        Whole shards are handed out whenever there are at least as many shards as workers, balancing the number of
+        records per worker. Otherwise every shard is cut into `num_workers` contiguous pieces.
+
+        Args:
+            worker_id: The index of the worker.
+            num_workers: How many workers there are in total.
+
+        Returns:
+            A list of (shard index, sorted record indices) tuples.
+        """
+        shards = [idx for idx, records in enumerate(self.records) if len(records) > 0]
+        if len(shards) >= num_workers:
+            loads = np.zeros(num_workers, dtype=np.int64)
+            units = []
+            for shard in sorted(shards, key=lambda s: len(self.records[s]), reverse=True):
+                target = int(np.argmin(loads))
+                loads[target] += len(self.records[shard])
+                if target == worker_id:
+                    units.append((shard, self.records[shard]))
+            return sorted(units, key=lambda unit: unit[0])
+        units = [(shard, np.array_split(self.records[shard], num_workers)[worker_id]) for shard in shards]
+        return [unit for unit in units if len(unit[1]) > 0]
+
+    def _generate(self, worker_id: int, num_workers: int) -> Generator[Dict[str, Any], None, None]:
+        """Produce an endless stream of records for a particular worker.
+
+        Args:
+            worker_id: The index of the worker.
+            num_workers: How many workers there are in total.
+
+        Yields:
+            Data dictionaries.
+        """
+        units = self.get_worker_units(worker_id, num_workers)
+        if not units:
+            # More workers than records, so fall back to reading everything
+            units = self.get_worker_units(0, 1)
+        seed = None
+        if self.stream_seed is not None:
+            seed = np.random.SeedSequence(self.stream_seed, spawn_key=(DATASET_STREAM, self.epoch, worker_id))
+        rng = np.random.default_rng(seed)
+        while True:
+            order = rng.permutation(len(units)) if self.shuffle else range(len(units))
+            records = (record for idx in order for record in self._read_unit(*units[idx]))
+            if self.shuffle and self.shuffle_buffer > 1:
+                records = self._shuffle(records, rng)
+            yield from records
+
+    def _read_unit(self, shard: int, records: np.ndarray) -> Generator[Dict[str, Any], None, None]:
+        """Sequentially read a collection of records from a shard file.
+
+        Args:
+            shard: Which shard to read from.
+            records: The (sorted) indices of the records to read.
+
+        Yields:
+            Data dictionaries.
+        """
+        offsets = self.offsets[shard]
+        with open(self.shard_files[shard], "rb", buffering=self.read_buffer) as f:
+            position = 0
+            for record in records:
+                if offsets[record] != position:
+                    f.seek(offsets[record])
+                position = offsets[record + 1]
+                yield pickle.loads(f.read(position - offsets[record]))
+
+    def _shuffle(self, records: Iterable[Dict[str, Any]],
+                 rng: np.random.Generator) -> Generator[Dict[str, Any], None, None]:
+        """Shuffle a stream of records using a fixed-size buffer.
+
+        Args:
+            records: The records to be shuffled.
+            rng: The random number generator to shuffle with.
+
+        Yields:
+            The same records, in a random order.
+        """
+        buffer = []
+        for record in records:
+            if len(buffer) < self.shuffle_buffer:
+                buffer.append(record)
+                continue
+            idx = rng.integers(len(buffer))
+            yield buffer[idx]
+            buffer[idx] = record
+        rng.shuffle(buffer)
+        yield from buffer
+
+    def _read_record(self, index: int) -> Dict[str, Any]:
+        """Randomly access a single record.
+
+        Args:
+            index: The index of the record within this dataset.
+
+        Returns:
+            The data dictionary of the record.
+        """
+        for shard, records in enumerate(self.records):
+            if index < len(records):
+                return next(self._read_unit(shard, records[index:index + 1]))
+            index -= len(records)
+        raise IndexError("ShardDataset index out of range")
+
+    def _do_split(self, splits: Sequence[Iterable[int]]) -> List['ShardDataset']:
+        """Split the current dataset apart into several smaller datasets.
+
+        The new datasets read from the same shard files as this one.
+
+        Args:
+            splits: Which indices to remove from the current dataset in order to create new dataset(s). One dataset will
+                be generated for every iterable within the `splits` sequence.
+
+        Returns:
+            New datasets generated by removing data at the indices specified by `splits` from the current dataset.
+        """
+        boundaries = np.cumsum([0] + [len(records) for records in self.records])
+        keep = [np.ones(len(records), dtype=bool) for records in self.records]
+        results = []
+        for split in splits:
+            split = np.array(sorted(split), dtype=np.int64)
+            shards = np.searchsorted(boundaries, split, side='right') - 1
+            child_records = []
+            for shard, records in enumerate(self.records):
+                local = split[shards == shard] - boundaries[shard]
+                keep[shard][local] = False
+                child_records.append(records[local])
+            child = self.__class__.__new__(self.__class__)
+            child.__dict__.update(self.__dict__)
+            child.records = child_records
+            child._stream, child._stream_owner, child._summary = None, None, None
+            results.append(child)
+        self.records = [records[mask] for records, mask in zip(self.records, keep)]
+        self._stream, self._stream_owner, self._summary = None, None, None
+        return results
+
+    def summary(self) -> DatasetSummary:
+        """Generate a summary representation of this dataset.
+        Returns:
+            A summary representation of this dataset.
+        """
+        if self._summary is None:
+            # Reading a record can be slow on network storage, so the result is cached until the dataset is split
+            sample = self._read_record(0)
+            key_summary = {}
+            for key, val in sample.items():
+                key_summary[key] = KeySummary(num_unique_values=None, shape=get_shape(val), dtype=get_type(val))
+            self._summary = DatasetSummary(num_instances=len(self), keys=key_summary)
+        return self._summary
@@ -13,12 +13,13 @@
 # limitations under the License.
 # ==============================================================================
 from copy import deepcopy
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Set, Tuple
 
 import numpy as np
 
 from fastestimator.dataset.dataset import DatasetSummary
 from fastestimator.dataset.labeled_dir_dataset import LabeledDirDataset
+from fastestimator.util.random_util import DATASET_STREAM, get_rng
 from fastestimator.util.traceability_util import traceable
 
 
@@ -58,9 +59,11 @@ class SiameseDirDataset(LabeledDirDataset):
         self.data_key_left = data_key_left
         self.data_key_right = data_key_right
         self.label_key = label_key
+        self.seed = None
+        self.epoch = 0
 
     @staticmethod
-    def _data_to_class(data: Dict[int, Dict[str, Any]], label_key: str) -> Dict[Any, Set[int]]:
+    def _data_to_class(data: Mapping[int, Dict[str, Any]], label_key: str) -> Dict[Any, Set[int]]:
         """A helper method to build a mapping from classes to their corresponding data indices.
 
         Args:
@@ -96,26 +99,28 @@ class SiameseDirDataset(LabeledDirDataset):
             New datasets generated by removing classes at the indices specified by `splits` from the current dataset.
         """
         # Splits in this context refer to class indices rather than the typical data indices
-        results = []
-        for split in splits:
-            # Convert class indices to data indices
-            int_class_keys = list(sorted(self.class_data.keys()))
-            split = [item for i in split for item in self.class_data[int_class_keys[i]]]
-            data = {new_idx: self.data.pop(old_idx) for new_idx, old_idx in enumerate(split)}
-            class_data = self._data_to_class(data, self.label_key)
-            results.append(
-                self._skip_init(data,
-                                class_data=class_data,
-                                **{k: v
-                                   for k, v in self.__dict__.items() if k not in {'data', 'class_data'}}))
-        # Re-key the remaining data to be contiguous from 0 to new max index
-        self.data = {new_idx: v for new_idx, (old_idx, v) in enumerate(self.data.items())}
+        int_class_keys = list(sorted(self.class_data.keys()))
+        splits = [[item for i in split for item in self.class_data[int_class_keys[i]]] for split in splits]
+        results = super()._do_split(splits)
+        for result in results:
+            result.class_data = self._data_to_class(result.data, self.label_key)
         self.class_data = self._data_to_class(self.data, self.label_key)
-        # The summary function is being cached by a base class, so reset our cache here
-        # noinspection PyUnresolvedReferences
-        self.summary.cache_clear()
         return results
 
+    def set_random_stream(self, seed: Optional[int], epoch: int = 0) -> None:
+        """Choose where the random pairings of this dataset come from.
+
+        This method is invoked every epoch by OpDataset.
+
+        Args:
+            seed: The base seed of the random streams which pick the 'right' elements. Every index uses its own stream,
+                keyed by `epoch`, so the pairs don't depend on the order in which they are requested. If None, the
+                global NumPy random state is used instead.
+            epoch: The epoch index which the random streams are keyed by.
+        """
+        self.seed = seed
+        self.epoch = epoch
+
     def __getitem__(self, index: int):
         """Extract items from the dataset based on the given `batch_idx`.
 
@@ -126,17 +131,18 @@ class SiameseDirDataset(LabeledDirDataset):
             A datapoint for the given index.
         """
         base_item = deepcopy(self.data[index])
-        if np.random.uniform(0, 1) < self.percent_matching_data:
+        rng = np.random if self.seed is None else get_rng(self.seed, DATASET_STREAM, self.epoch, index)
+        if rng.uniform(0, 1) < self.percent_matching_data:
             # Generate matching data
             clazz_items = self.class_data[base_item[self.label_key]]
-            other = np.random.choice(list(clazz_items - {index}))
+            other = rng.choice(list(clazz_items - {index}))
             base_item[self.data_key_right] = self.data[other][self.data_key_left]
             base_item[self.label_key] = 1
         else:
             # Generate non-matching data
             other_classes = self.class_data.keys() - {base_item[self.label_key]}
-            other_class = np.random.choice(list(other_classes))
-            other = np.random.choice(list(self.class_data[other_class]))
+            other_class = rng.choice(list(other_classes))
+            other = rng.choice(list(self.class_data[other_class]))
             base_item[self.data_key_right] = self.data[other][self.data_key_left]
             base_item[self.label_key] = 0
         return base_item
@@ -0,0 +1,225 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from copy import deepcopy
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from fastestimator.dataset.dataset import DatasetSummary, FEDataset
+from fastestimator.util.traceability_util import traceable
+
+
+@traceable()
+class ViewDataset(FEDataset):
+    """A dataset which presents elements of other datasets without copying them.
+
+    Element `i` of this dataset is element `indices[i]` of the dataset `datasets[sources[i]]`. Views of other views are
+    flattened when they are constructed, so looking up an element never has to pass through more than one view.
+
+    Note that views refer to their parents' elements by index. If a parent is modified afterwards (for example by
+    invoking .split() on it), then the view will see the parent's new elements.
+
+    Args:
+        datasets: The datasets to be viewed.
+        sources: Which of the `datasets` each element comes from, or None if every element comes from `datasets[0]`.
+        indices: The index of each element within its source dataset.
+    """
+    def __init__(self, datasets: Sequence[FEDataset], sources: Optional[np.ndarray], indices: np.ndarray) -> None:
+        self.datasets, self.sources, self.indices = self._flatten(list(datasets), sources, indices)
+
+    @staticmethod
+    def _flatten(datasets: List[FEDataset], sources: Optional[np.ndarray],
+                 indices: np.ndarray) -> Tuple[List[FEDataset], Optional[np.ndarray], np.ndarray]:
+        """Re-express a view so that none of the datasets it refers to are themselves views.
+
+        Args:
+            datasets: The datasets being viewed.
+            sources: Which of the `datasets` each element comes from, or None if they all come from `datasets[0]`.
+            indices: The index of each element within its source dataset.
+
+        Returns:
+            The equivalent (datasets, sources, indices) which only refer to non-view datasets.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        if sources is None:
+            sources = np.zeros(indices.shape, dtype=np.int64)
+        flat_datasets = []
+        flat_sources = np.empty(indices.shape, dtype=np.int64)
+        flat_indices = np.empty(indices.shape, dtype=np.int64)
+        for source, dataset in enumerate(datasets):
+            members = np.flatnonzero(sources == source) if len(datasets) > 1 else slice(None)
+            if isinstance(dataset, ViewDataset):
+                local = indices[members]
+                dataset_sources = np.zeros(len(dataset), dtype=np.int64) if dataset.sources is None else dataset.sources
+                flat_sources[members] = dataset_sources[local] + len(flat_datasets)
+                flat_indices[members] = dataset.indices[local]
+                flat_datasets.extend(dataset.datasets)
+            else:
+                flat_sources[members] = len(flat_datasets)
+                flat_indices[members] = indices[members]
+                flat_datasets.append(dataset)
+        if len(flat_datasets) == 1:
+            return flat_datasets, None, flat_indices
+        return flat_datasets, flat_sources.astype(np.min_scalar_type(len(flat_datasets) - 1)), flat_indices
+
+    def __len__(self) -> int:
+        return self.indices.shape[0]
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        """Fetch a data instance at a specified index.
+
+        Args:
+            index: Which datapoint to retrieve.
+
+        Returns:
+            The data dictionary from the specified index.
+        """
+        dataset = self.datasets[0] if self.sources is None else self.datasets[self.sources[index]]
+        return dataset[int(self.indices[index])]
+
+    def get_items(self, indices: Sequence[int]) -> List[Dict[str, Any]]:
+        if type(self).__getitem__ is not ViewDataset.__getitem__:
+            return [self[index] for index in indices]
+        indices = np.asarray(indices, dtype=np.int64)
+        if self.sources is None:
+            return self.datasets[0].get_items(self.indices[indices].tolist())
+        sources, local = self.sources[indices], self.indices[indices]
+        results = [None] * len(indices)
+        # Ask each source dataset for all of its elements at once, since they may be able to read them in bulk
+        for source in np.unique(sources).tolist():
+            positions = np.flatnonzero(sources == source)
+            for position, item in zip(positions.tolist(), self.datasets[source].get_items(local[positions].tolist())):
+                results[position] = item
+        return results
+
+    def _do_split(self, splits: Sequence[Iterable[int]]) -> List['ViewDataset']:
+        """Split the current dataset apart into several smaller datasets.
+
+        The new datasets are views onto the same parents as this one.
+
+        Args:
+            splits: Which indices to remove from the current dataset in order to create new dataset(s). One dataset will
+                be generated for every iterable within the `splits` sequence.
+
+        Returns:
+            New datasets generated by removing data at the indices specified by `splits` from the current dataset.
+        """
+        keep = np.ones(len(self), dtype=bool)
+        results = []
+        for split in splits:
+            split = np.asarray(split if isinstance(split, (Sequence, np.ndarray)) else list(split), dtype=np.int64)
+            keep[split] = False
+            child = self.__class__.__new__(self.__class__)
+            child.__dict__.update(self.__dict__)
+            child.sources = None if self.sources is None else self.sources[split]
+            child.indices = self.indices[split]
+            results.append(child)
+        self.sources = None if self.sources is None else self.sources[keep]
+        self.indices = self.indices[keep]
+        return results
+
+    def __getstate__(self) -> Dict[str, List[Dict[Any, Any]]]:
+        return {'datasets': [ds.__getstate__() if hasattr(ds, '__getstate__') else {} for ds in self.datasets]}
+
+    def summary(self) -> DatasetSummary:
+        """Generate a summary representation of this dataset.
+
+        The summary is derived from the summaries of the parent datasets.
+
+        Returns:
+            A summary representation of this dataset.
+        """
+        summaries = [ds.summary() for ds in {id(ds): ds for ds in self.datasets}.values()]
+        summary = deepcopy(summaries[0])
+        for other in summaries[1:]:
+            for key, key_summary in other.keys.items():
+                summary.keys.setdefault(key, deepcopy(key_summary))
+        summary.num_instances = len(self)
+        return summary
+
+
+@traceable()
+class SubsetDataset(ViewDataset):
+    """A dataset containing selected elements of another dataset, without copying them.
+
+    ```python
+    ds = fe.dataset.NumpyDataset({"x": np.arange(100)})
+    folds = np.array_split(np.random.permutation(len(ds)), 5)
+    train = fe.dataset.SubsetDataset(ds, np.concatenate(folds[1:]))  # len(train) == 80
+    test = fe.dataset.SubsetDataset(ds, folds[0])  # len(test) == 20, len(ds) == 100
+    ```
+
+    Args:
+        dataset: The dataset to select elements from.
+        indices: The indices of the elements to be selected, in order. The same index may be selected more than once.
+
+    Raises:
+        IndexError: If any of the `indices` are out of bounds.
+    """
+    def __init__(self, dataset: FEDataset, indices: Iterable[int]) -> None:
+        indices = np.asarray(indices if isinstance(indices, (Sequence, np.ndarray)) else list(indices),
+                             dtype=np.int64)
+        if indices.size and (indices.min() < 0 or indices.max() >= len(dataset)):
+            raise IndexError(f"SubsetDataset indices must be in the range [0, {len(dataset)})")
+        super().__init__(datasets=[dataset], sources=None, indices=indices)
+
+
+@traceable()
+class ConcatDataset(ViewDataset):
+    """A dataset containing all of the elements of several other datasets one after another, without copying them.
+
+    ```python
+    ds1 = fe.dataset.NumpyDataset({"x": np.arange(100)})
+    ds2 = fe.dataset.NumpyDataset({"x": np.arange(50)})
+    ds = fe.dataset.ConcatDataset([ds1, ds2])  # len(ds) == 150, ds[100] is ds2[0]
+    ```
+
+    Args:
+        datasets: The datasets to be concatenated.
+
+    Raises:
+        ValueError: If no `datasets` are provided.
+    """
+    def __init__(self, datasets: Sequence[FEDataset]) -> None:
+        if not datasets:
+            raise ValueError("ConcatDataset requires at least one dataset")
+        sizes = np.array([len(ds) for ds in datasets], dtype=np.int64)
+        sources = np.repeat(np.arange(len(datasets)), sizes)
+        indices = np.arange(sizes.sum(), dtype=np.int64) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        super().__init__(datasets=datasets, sources=sources, indices=indices)
+
+
+@traceable()
+class RepeatDataset(ViewDataset):
+    """A dataset containing all of the elements of another dataset several times over, without copying them.
+
+    This can be used to make an epoch span several passes through a small dataset.
+
+    ```python
+    ds = fe.dataset.NumpyDataset({"x": np.arange(100)})
+    ds2 = fe.dataset.RepeatDataset(ds, repeats=3)  # len(ds2) == 300, ds2[100] is ds[0]
+    ```
+
+    Args:
+        dataset: The dataset to be repeated.
+        repeats: How many times to repeat the `dataset`.
+
+    Raises:
+        ValueError: If `repeats` is not a positive integer.
+    """
+    def __init__(self, dataset: FEDataset, repeats: int) -> None:
+        if repeats < 1:
+            raise ValueError(f"repeats must be a positive integer, but got {repeats}")
+        super().__init__(datasets=[dataset], sources=None, indices=np.tile(np.arange(len(dataset)), repeats))
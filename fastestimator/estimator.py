@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import math
 import os
 import random
-from collections import ChainMap
-from typing import Any, Dict, Iterable, List, Optional, Set, Union
+import shutil
+import sys
+import tempfile
+from collections import ChainMap, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
-from tensorflow.python.distribute.input_lib import DistributedDataset
-from torch.utils.data import DataLoader
 
 import fastestimator as fe
 from fastestimator.backend.to_shape import to_shape
@@ -38,8 +39,20 @@ from fastestimator.trace.io.restore_wizard import RestoreWizard
 from fastestimator.trace.io.traceability import Traceability
 from fastestimator.trace.trace import EvalEssential, Logger, TestEssential, Trace, TrainEssential, sort_traces
 from fastestimator.util.data import Data
-from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import Suppressor, draw, to_list, to_set
+from fastestimator.util.distributed import all_reduce, get_rank, get_tf_strategy, get_world_size, is_distributed, \
+    is_main_process, launch
+from fastestimator.util.random_util import NETWORK_STREAM, get_rng, seed_global_rngs
+from fastestimator.util.traceability_util import FeSummaryTable, is_traceable, traceable
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import Suppressor, draw, is_tf_dataset, to_list, to_number, to_set
+
+if TYPE_CHECKING:
+    from torch.utils.data import DataLoader
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+_MODES = ("train", "eval", "test", "infer")  # Used to key the per-epoch random streams
 
 
 @traceable()
@@ -62,6 +75,23 @@ class Estimator:
         log_steps: Frequency (in steps) for printing log messages. 0 to disable all step-based printing (though epoch
             information will still print). None to completely disable printing.
         monitor_names: Additional keys from the data dictionary to be written into the logs.
+        history_max_steps: The maximum number of step-level values to retain per metric in the summary returned by
+            `fit` and `test`, or None to retain all of them. Epoch-level values are always retained. Bounding this can
+            significantly reduce memory usage and checkpoint size for very long training runs.
+        history_retention: How to choose which step-level values to retain once `history_max_steps` is exceeded.
+            Either 'downsample' (keep evenly spaced values) or 'reservoir' (keep a uniform random sample).
+        num_replicas: How many processes to train with (one per GPU, or any number of CPU processes). If greater than 1,
+            `fit` and `test` fork this many processes which train together using torch DistributedDataParallel. Every
+            process receives its own shard of the data, so the pipeline batch size is per process. Floating point
+            epoch-level metrics are averaged across the processes, and Traces which only produce side effects (such as
+            the Logger, ModelSaver, and TensorBoard) run only in the first process. Since the processes are forked, CUDA
+            must not have been initialized before training begins (ex. by moving a model onto a GPU), otherwise `fit`
+            and `test` raise a RuntimeError. Only TorchNetworks are supported.
+        dist_backend: The torch distributed backend to use when `num_replicas` > 1, or None to use 'nccl' on GPUs and
+            'gloo' otherwise.
+
+    Raises:
+        ValueError: If `num_replicas` is invalid or is combined with a TFNetwork.
     """
     monitor_names: Set[str]
     traces_in_use: List[Union[Trace, Scheduler[Trace]]]
@@ -75,19 +105,32 @@ class Estimator:
                  max_eval_steps_per_epoch: Optional[int] = None,
                  traces: Union[None, Trace, Scheduler[Trace], Iterable[Union[Trace, Scheduler[Trace]]]] = None,
                  log_steps: Optional[int] = 100,
-                 monitor_names: Union[None, str, Iterable[str]] = None):
+                 monitor_names: Union[None, str, Iterable[str]] = None,
+                 history_max_steps: Optional[int] = None,
+                 history_retention: str = 'downsample',
+                 num_replicas: int = 1,
+                 dist_backend: Optional[str] = None):
+        if num_replicas < 1:
+            raise ValueError("num_replicas must be a positive integer, but got {}".format(num_replicas))
+        if num_replicas > 1 and not isinstance(network, TorchNetwork):
+            raise ValueError("num_replicas > 1 is only supported for TorchNetworks")
+        self.num_replicas = num_replicas
+        self.dist_backend = dist_backend
         self.traces_in_use = []
         assert log_steps is None or log_steps >= 0, \
             "log_steps must be None or positive (or 0 to disable only train logging)"
         self.monitor_names = to_set(monitor_names) | network.get_loss_keys()
+        traces = to_list(traces)
         self.system = System(network=network,
                              pipeline=pipeline,
-                             traces=to_list(traces),
+                             traces=traces,
                              log_steps=log_steps,
                              total_epochs=epochs,
                              max_train_steps_per_epoch=max_train_steps_per_epoch,
                              max_eval_steps_per_epoch=max_eval_steps_per_epoch,
-                             system_config=self.fe_summary())
+                             system_config=self._get_system_config(traces),
+                             history_max_steps=history_max_steps,
+                             history_retention=history_retention)
 
     @property
     def pipeline(self) -> Pipeline:
@@ -115,14 +158,41 @@ class Estimator:
         Returns:
             A summary object containing the training history for this session iff a `summary` name was provided.
         """
-        draw()
-        self.system.reset(summary, self.fe_summary())
+        if self.num_replicas > 1 and not is_distributed():
+            return self._launch(self.fit, summary=summary, warmup=warmup)
+        if is_main_process():
+            draw()
+        self.system.reset(summary, self._get_system_config(self.traces))
         self._prepare_traces(run_modes={"train", "eval"})
         if warmup:
             self._warmup(warmup=warmup)
         self._start(run_modes={"train", "eval"})
         return self.system.summary or None
 
+    def _get_system_config(self, traces: List[Union[Trace, Scheduler[Trace]]]) -> Optional[List[FeSummaryTable]]:
+        """Summarize this estimator, but only if one of the `traces` is going to need the summary.
+
+        Building the summary requires tracing every object which went into this estimator, which is wasted effort for
+        runs which don't generate a Traceability report.
+
+        Args:
+            traces: The traces which will be used by this estimator.
+
+        Returns:
+            The summary tables of this estimator, or None if they aren't required.
+
+        Raises:
+            RuntimeError: If a Traceability trace is requested for an estimator built while traceability was disabled.
+        """
+        for trace in traces:
+            for candidate in trace.get_all_values() if isinstance(trace, Scheduler) else [trace]:
+                if isinstance(candidate, Traceability):
+                    if not is_traceable(self):
+                        raise RuntimeError("The Traceability trace requires objects to be built while traceability is "
+                                           "enabled. See fe.util.enable_traceability().")
+                    return self.fe_summary()
+        return None
+
     def _prepare_traces(self, run_modes: Set[str]) -> None:
         """Prepare information about the traces for training.
 
@@ -131,8 +201,8 @@ class Estimator:
         Args:
             run_modes: The current execution modes.
         """
-        self.traces_in_use = [trace for trace in self.traces]
-        if self.system.log_steps is not None:
+        self.traces_in_use = [trace for trace in self.traces if self._runs_in_this_process(trace)]
+        if self.system.log_steps is not None and is_main_process():
             self.traces_in_use.append(Logger())
         # Look for any monitor names which should be automagically added.
         trace_outputs = set()
@@ -147,7 +217,7 @@ class Estimator:
             for trace in get_current_items(self.traces_in_use, run_modes=run_modes):
                 if isinstance(trace, (ModelSaver, BestModelSaver)):
                     no_save_warning = False
-            if no_save_warning:
+            if no_save_warning and is_main_process():
                 print("FastEstimator-Warn: No ModelSaver Trace detected. Models will not be saved.")
         if "eval" in run_modes and "eval" in self.pipeline.get_modes():
             self.traces_in_use.insert(1, EvalEssential(monitor_names=self.monitor_names.union(extra_monitor_keys)))
@@ -169,16 +239,78 @@ class Estimator:
             A summary object containing the training history for this session iff the `summary` name is not None (after
             considering the default behavior above).
         """
+        if self.num_replicas > 1 and not is_distributed():
+            return self._launch(self.test, summary=summary)
         self.system.reset_for_test(summary)
         self._prepare_traces(run_modes={"test"})
         self._start(run_modes={"test"})
         return self.system.summary or None
 
+    @staticmethod
+    def _runs_in_this_process(trace: Union[Trace, Scheduler[Trace]]) -> bool:
+        """Whether a given trace should be executed by the current process.
+
+        Args:
+            trace: The trace (or scheduled traces) to consider.
+
+        Returns:
+            False iff training is distributed, this is not the main process, and the `trace` is main-process-only.
+        """
+        if is_main_process():
+            return True
+        candidates = trace.get_all_values() if isinstance(trace, Scheduler) else [trace]
+        return not all(candidate.fe_main_process_only for candidate in candidates if candidate is not None)
+
+    def _launch(self, method: Callable[..., Optional[Summary]], **kwargs: Any) -> Optional[Summary]:
+        """Run an Estimator method inside of `num_replicas` processes which train together.
+
+        Once the processes finish, the final state of the main process (models, optimizers, summary, traces, etc.) is
+        copied back into this one, exactly as if the `method` had been run here.
+
+        Args:
+            method: The method to invoke in every process (ex. self.fit).
+            **kwargs: The arguments for the `method`.
+
+        Returns:
+            The summary generated by the `method`, if any.
+        """
+        save_dir = tempfile.mkdtemp()
+        try:
+            launch(lambda: self._run_replica(method, save_dir, **kwargs),
+                   num_process=self.num_replicas,
+                   backend=self.dist_backend)
+            self.system.load_state(save_dir)
+        finally:
+            shutil.rmtree(save_dir)
+        return self.system.summary or None
+
+    def _run_replica(self, method: Callable[..., Optional[Summary]], save_dir: str, **kwargs: Any) -> None:
+        """Invoke an Estimator method as one of several distributed processes.
+
+        Args:
+            method: The method to invoke.
+            save_dir: Where the main process should save its final state.
+            **kwargs: The arguments for the `method`.
+        """
+        self.network.distribute()
+        # Forked processes inherit identical random states, which would make their augmentations identical
+        seed = fe.fe_deterministic_seed
+        seed = (int.from_bytes(os.urandom(4), 'little') if seed is None else seed) + get_rank()
+        random.seed(seed)
+        np.random.seed(seed % 2**32)
+        torch.manual_seed(seed)
+        method(**kwargs)
+        if is_main_process():
+            # Release the GPU so that the parent process can load the state without initializing CUDA
+            self.network.release_device()
+            self.system.save_state(save_dir)
+
     def _warmup(self, warmup: Union[bool, str]) -> None:
         """Perform a test run of each pipeline and network signature epoch to make sure that training won't fail later.
 
         Traces are not executed in the warmup since they are likely to contain state variables which could become
-        corrupted by running extra steps.
+        corrupted by running extra steps. Batches are only drawn once per unique pipeline configuration, and the next
+        batch is fetched in a background thread while the network runs its trial step on the current one.
 
         Args:
             warmup: Warmup arg specified by estimator.fit.
@@ -186,43 +318,95 @@ class Estimator:
         all_traces = get_current_items(self.traces_in_use, run_modes={"train", "eval"})
         sort_traces(all_traces)  # This ensures that the traces can sort properly for on_begin and on_end
         monitor_names = self.monitor_names
-        for mode in self.pipeline.get_modes() - {"test"}:
-            scheduled_items = self.pipeline.get_scheduled_items(mode) + self.network.get_scheduled_items(
-                mode) + self.get_scheduled_items(mode)
-            signature_epochs = get_signature_epochs(scheduled_items, self.system.total_epochs, mode=mode)
-            epochs_with_data = self.pipeline.get_epochs_with_data(total_epochs=self.system.total_epochs, mode=mode)
-            for epoch in signature_epochs:
-                if epoch not in epochs_with_data:
-                    continue
-                # key checking
-                loader = self._configure_loader(self.pipeline.get_loader(mode, epoch))
-                with Suppressor():
-                    if isinstance(loader, tf.data.Dataset):
-                        batch = list(loader.take(1))[0]
-                    else:
-                        batch = next(iter(loader))
-                batch = self._configure_tensor(loader, batch)
-                assert isinstance(batch, dict), "please make sure data output format is dictionary"
-                pipeline_output_keys = to_set(batch.keys())
-                network_output_keys = self.network.get_all_output_keys(mode, epoch)
-                trace_input_keys = set()
-                trace_output_keys = {"*"}
-                traces = get_current_items(self.traces_in_use, run_modes=mode, epoch=epoch)
-                for idx, trace in enumerate(traces):
-                    if idx > 0:  # ignore TrainEssential and EvalEssential's inputs for unmet requirement checking
-                        trace_input_keys.update(trace.inputs)
-                    trace_output_keys.update(trace.outputs)
-                monitor_names = monitor_names - (pipeline_output_keys | network_output_keys)
-                unmet_requirements = trace_input_keys - (pipeline_output_keys | network_output_keys | trace_output_keys)
-                assert not unmet_requirements, \
-                    "found missing key(s) during epoch {} mode {}: {}".format(epoch, mode, unmet_requirements)
-                sort_traces(traces, available_outputs=pipeline_output_keys | network_output_keys)
-                trace_input_keys.update(traces[0].inputs)
-                self.network.load_epoch(mode, epoch, output_keys=trace_input_keys, warmup=warmup)
-                self.network.run_step(batch)
-                self.network.unload_epoch()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for mode in self.pipeline.get_modes() - {"test"}:
+                pipeline_items = self.pipeline.get_scheduled_items(mode)
+                scheduled_items = pipeline_items + self.network.get_scheduled_items(mode) + self.get_scheduled_items(
+                    mode)
+                epochs_with_data = self.pipeline.get_epochs_with_data(total_epochs=self.system.total_epochs, mode=mode)
+                signature_epochs = [
+                    epoch for epoch in get_signature_epochs(scheduled_items, self.system.total_epochs, mode=mode)
+                    if epoch in epochs_with_data
+                ]
+                batch_epochs = self._get_batch_epochs(pipeline_items, signature_epochs, mode=mode)
+                batches = {}
+                for idx, epoch in enumerate(signature_epochs):
+                    for future_epoch in signature_epochs[idx:idx + 2]:
+                        batch_epoch = batch_epochs[future_epoch]
+                        if batch_epoch not in batches:
+                            batches[batch_epoch] = executor.submit(self._get_warmup_batch, mode, batch_epoch)
+                    # key checking. Suppressor swaps the process-wide stdout/stderr, so it is only entered here on
+                    # the main thread while it blocks on the fetch, never from within the background thread itself
+                    with Suppressor():
+                        batch = batches[batch_epochs[epoch]].result()
+                    pipeline_output_keys = to_set(batch.keys())
+                    network_output_keys = self.network.get_all_output_keys(mode, epoch)
+                    trace_input_keys = set()
+                    trace_output_keys = {"*"}
+                    traces = get_current_items(self.traces_in_use, run_modes=mode, epoch=epoch)
+                    for trace_idx, trace in enumerate(traces):
+                        # ignore TrainEssential and EvalEssential's inputs for unmet requirement checking
+                        if trace_idx > 0:
+                            trace_input_keys.update(trace.inputs)
+                        trace_output_keys.update(trace.outputs)
+                    monitor_names = monitor_names - (pipeline_output_keys | network_output_keys)
+                    unmet_requirements = trace_input_keys - (pipeline_output_keys | network_output_keys |
+                                                             trace_output_keys)
+                    assert not unmet_requirements, \
+                        "found missing key(s) during epoch {} mode {}: {}".format(epoch, mode, unmet_requirements)
+                    sort_traces(traces, available_outputs=pipeline_output_keys | network_output_keys)
+                    trace_input_keys.update(traces[0].inputs)
+                    self.network.load_epoch(mode, epoch, output_keys=trace_input_keys, warmup=warmup)
+                    self.network.run_step(batch)
+                    self.network.unload_epoch()
         assert not monitor_names, "found missing key(s): {}".format(monitor_names)
 
+    @staticmethod
+    def _get_batch_epochs(pipeline_items: List[Any], signature_epochs: List[int], mode: str) -> Dict[int, int]:
+        """Map each signature epoch onto the earliest signature epoch which shares its pipeline configuration.
+
+        Args:
+            pipeline_items: The schedulable items of the pipeline.
+            signature_epochs: The epochs which will be exercised during the warmup.
+            mode: Current execution mode.
+
+        Returns:
+            A mapping from each of the `signature_epochs` to the epoch whose warmup batch it can reuse.
+        """
+        batch_epochs = {}
+        known_configs = []
+        for epoch in signature_epochs:
+            epoch_config = get_current_items(pipeline_items, run_modes=mode, epoch=epoch)
+            for known_config, known_epoch in known_configs:
+                if epoch_config == known_config:
+                    batch_epochs[epoch] = known_epoch
+                    break
+            else:
+                known_configs.append((epoch_config, epoch))
+                batch_epochs[epoch] = epoch
+        return batch_epochs
+
+    def _get_warmup_batch(self, mode: str, epoch: int) -> Dict[str, Any]:
+        """Draw a single batch of data from the pipeline for use during the warmup.
+
+        This method runs on a background thread, so it must not redirect the process-wide stdout/stderr.
+
+        Args:
+            mode: Current execution mode.
+            epoch: The epoch for which to build a loader.
+
+        Returns:
+            One batch of data, converted to the tensor type required by the network.
+        """
+        loader = self._configure_loader(self.pipeline.get_loader(mode, epoch))
+        if is_tf_dataset(loader):
+            batch = list(loader.take(1))[0]
+        else:
+            batch = next(iter(loader))
+        batch = self._configure_tensor(loader, batch)
+        assert isinstance(batch, dict), "please make sure data output format is dictionary"
+        return batch
+
     def get_scheduled_items(self, mode: str) -> List[Any]:
         """Get a list of items considered for scheduling.
 
@@ -269,6 +453,8 @@ class Estimator:
 
         This method requires that the current mode and epoch already be specified within the self.system object.
         """
+        if fe.fe_deterministic_seed is not None:
+            self._reseed()
         traces = get_current_items(self.traces_in_use, run_modes=self.system.mode, epoch=self.system.epoch_idx)
         trace_input_keys = set()
         for trace in traces:
@@ -284,6 +470,9 @@ class Estimator:
             available_outputs=to_set(batch.keys())
             | self.network.get_all_output_keys(self.system.mode, self.system.epoch_idx))
         self._run_traces_on_epoch_begin(traces=traces)
+        # When the network postprocesses in the background, traces receive each step once the following one has started
+        lag = 0 if self.network.epoch_postprocessing_pool is None else 1
+        pending = deque()
         while True:
             try:
                 if self.system.mode == "train":
@@ -291,9 +480,10 @@ class Estimator:
                 self.system.update_batch_idx()
                 batch = self._configure_tensor(loader, batch)
                 self._run_traces_on_batch_begin(batch, traces=traces)
-                batch, prediction = self.network.run_step(batch)
-                self._run_traces_on_batch_end(batch, prediction, traces=traces)
-                if isinstance(loader, DataLoader) and (
+                pending.append((self.system.batch_idx, self.system.global_step, self.network.run_step_async(batch)))
+                while len(pending) > lag:
+                    self._run_traces_on_step_end(pending.popleft(), traces=traces)
+                if isinstance(loader, torch.utils.data.DataLoader) and (
                     (self.system.batch_idx == self.system.max_train_steps_per_epoch and self.system.mode == "train") or
                     (self.system.batch_idx == self.system.max_eval_steps_per_epoch and self.system.mode == "eval")):
                     raise StopIteration
@@ -301,14 +491,17 @@ class Estimator:
                     batch = next(iterator)
             except StopIteration:
                 break
+        while pending:
+            self._run_traces_on_step_end(pending.popleft(), traces=traces)
         self._run_traces_on_epoch_end(traces=traces)
         self.network.unload_epoch()
 
-    def _configure_loader(self, loader: Union[DataLoader, tf.data.Dataset]) -> Union[DataLoader, tf.data.Dataset]:
+    def _configure_loader(self,
+                          loader: Union['DataLoader', 'tf.data.Dataset']) -> Union['DataLoader', 'tf.data.Dataset']:
         """A method to configure a given dataloader for use with this Estimator's Network.
 
         This method will ensure that the `loader` returns the correct data type (tf.Tensor or torch.Tensor) depending on
-         the requirements of the Network. It also handles issues with multi-gpu data sharding.
+         the requirements of the Network. It also handles issues with multi-gpu and multi-worker data sharding.
 
         Args:
             loader: A data loader to be modified.
@@ -317,7 +510,7 @@ class Estimator:
             The potentially modified dataloader to be used for training.
         """
         new_loader = loader
-        if isinstance(new_loader, DataLoader) and isinstance(self.network, TFNetwork):
+        if isinstance(new_loader, torch.utils.data.DataLoader) and isinstance(self.network, TFNetwork):
             add_batch = True
             if hasattr(loader.dataset, "dataset") and isinstance(loader.dataset.dataset, BatchDataset):
                 add_batch = False
@@ -326,23 +519,34 @@ class Estimator:
             data_shape = to_shape(batch, add_batch=add_batch, exact_shape=False)
             new_loader = tf.data.Dataset.from_generator(lambda: loader, data_type, output_shapes=data_shape)
             new_loader = new_loader.prefetch(1)
-        if isinstance(new_loader, tf.data.Dataset):
+        if is_tf_dataset(new_loader):
+            strategy = get_tf_strategy()
+            # When the pipeline has already sharded FE datasets between workers, each worker's batches are spread over
+            # world_size global steps (TF splits every batch between all of the replicas in the cluster)
+            pre_sharded = strategy is not None and not is_tf_dataset(loader) and get_world_size() > 1
+            batches_per_step = 1 / get_world_size() if pre_sharded else 1
             if self.system.max_train_steps_per_epoch and self.system.mode == "train":
-                new_loader = new_loader.take(self.system.max_train_steps_per_epoch)
+                new_loader = new_loader.take(math.ceil(self.system.max_train_steps_per_epoch * batches_per_step))
             if self.system.max_eval_steps_per_epoch and self.system.mode == "eval":
-                new_loader = new_loader.take(self.system.max_eval_steps_per_epoch)
-            if isinstance(tf.distribute.get_strategy(),
-                          tf.distribute.MirroredStrategy) and not isinstance(new_loader, DistributedDataset):
-                new_loader = tf.distribute.get_strategy().experimental_distribute_dataset(new_loader)
+                new_loader = new_loader.take(math.ceil(self.system.max_eval_steps_per_epoch * batches_per_step))
+            from tensorflow.python.distribute.input_lib import DistributedDataset
+            if strategy and not isinstance(new_loader, DistributedDataset):
+                if pre_sharded:
+                    options = tf.data.Options()
+                    options.experimental_distribute.auto_shard_policy = tf.data.experimental.AutoShardPolicy.OFF
+                    new_loader = new_loader.with_options(options)
+                new_loader = strategy.experimental_distribute_dataset(new_loader)
         return new_loader
 
-    def _configure_tensor(self, loader: Union[DataLoader, tf.data.Dataset], batch: Dict[str, Any]) -> Dict[str, Any]:
+    def _configure_tensor(self,
+                          loader: Union['DataLoader', 'tf.data.Dataset'],
+                          batch: Dict[str, Any]) -> Dict[str, Any]:
         """A function to convert a batch of tf.Tensors to torch.Tensors if required.
 
         Returns:
             Either the original `batch`, or the `batch` converted to torch.Tensors if required.
         """
-        if isinstance(loader, tf.data.Dataset) and isinstance(self.network, TorchNetwork):
+        if is_tf_dataset(loader) and isinstance(self.network, TorchNetwork):
             batch = to_tensor(batch, target_type="torch")
         return batch
 
@@ -368,6 +572,24 @@ class Estimator:
             restore.on_begin(data)
         self._check_early_exit()
 
+    def _reseed(self) -> None:
+        """Re-seed the global random states from a stream keyed by the current epoch, mode, and rank.
+
+        This makes every epoch of a deterministic training independent of the random numbers consumed by the epochs
+        before it, so that a training which is restored by a RestoreWizard continues exactly as the original would have.
+        """
+        rng = get_rng(fe.fe_deterministic_seed,
+                      NETWORK_STREAM,
+                      self.system.epoch_idx,
+                      _MODES.index(self.system.mode),
+                      get_rank())
+        seed_global_rngs(rng)
+        tf_seed, torch_seed = rng.integers(2**31, size=2).tolist()
+        # If TensorFlow has not been imported yet then there is nothing in it to seed
+        if 'tensorflow' in sys.modules:
+            tf.random.set_seed(tf_seed)
+        torch.manual_seed(torch_seed)
+
     def _run_traces_on_epoch_begin(self, traces: Iterable[Trace]) -> None:
         """Invoke the on_epoch_begin methods of given traces.
 
@@ -405,6 +627,24 @@ class Estimator:
             trace.on_batch_end(data)
         self._check_early_exit()
 
+    def _run_traces_on_step_end(self, step: Tuple[int, Optional[int], Future], traces: Iterable[Trace]) -> None:
+        """Wait for a step to finish postprocessing, and then invoke the on_batch_end methods of given traces.
+
+        The system batch index and global step are temporarily rolled back to match the `step` while the traces run.
+
+        Args:
+            step: The (batch_idx, global_step, future) of the step, where the future resolves to (batch, prediction).
+            traces: List of traces.
+        """
+        batch_idx, global_step, future = step
+        batch, prediction = future.result()
+        current_batch_idx, current_global_step = self.system.batch_idx, self.system.global_step
+        self.system.batch_idx, self.system.global_step = batch_idx, global_step
+        try:
+            self._run_traces_on_batch_end(batch, prediction, traces=traces)
+        finally:
+            self.system.batch_idx, self.system.global_step = current_batch_idx, current_global_step
+
     def _run_traces_on_epoch_end(self, traces: Iterable[Trace]) -> None:
         """Invoke the on_epoch_end methods of of given traces.
 
@@ -413,9 +653,37 @@ class Estimator:
         """
         data = Data()
         for trace in traces:
-            trace.on_epoch_end(data)
+            if is_distributed() and not trace.fe_main_process_only:
+                # Combine the metrics from each process before any later trace (ex. EarlyStopping) makes use of them
+                previous = dict(data.read_logs())
+                trace.on_epoch_end(data)
+                self._reduce_logs(data, previous)
+            else:
+                trace.on_epoch_end(data)
         self._check_early_exit()
 
+    @staticmethod
+    def _reduce_logs(data: Data, previous: Dict[str, Any]) -> None:
+        """Average the floating point scalars which were just logged into `data` across all of the processes.
+
+        Each process only sees its own shard of the data, so its metrics need to be combined with everyone else's.
+        Integer values (ex. step counts) are left unchanged since they are expected to match between the processes.
+
+        Args:
+            data: The data into which a trace has just written its outputs.
+            previous: The logs of `data` from before the trace was invoked.
+        """
+        logs = data.read_logs()
+        for key in sorted(logs.keys()):
+            value = logs[key]
+            if (key in previous and previous[key] is value) or isinstance(value, (str, bool, int)):
+                continue
+            array = to_number(value)
+            if array.size != 1 or array.dtype.kind != 'f':
+                continue
+            reduced = all_reduce(array, op='mean').astype(array.dtype).reshape(array.shape)
+            logs[key] = float(reduced) if isinstance(value, float) else reduced
+
     @staticmethod
     def _run_traces_on_end(traces: Iterable[Trace]) -> None:
         """Invoke the on_end methods of given traces.
@@ -440,6 +708,9 @@ class Estimator:
         Raises:
             EarlyStop: If the system.stop_training flag has been set to True.
         """
+        if is_distributed():
+            # Every process must stop at the same time, otherwise the others would wait forever for it to sync
+            self.system.stop_training = bool(all_reduce(self.system.stop_training, op='max'))
         if self.system.stop_training:
             raise EarlyStop
 
@@ -0,0 +1,240 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import shutil
+from typing import Any, Callable, Dict, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from fastestimator.export import runtime
+from fastestimator.network import BaseNetwork
+from fastestimator.op.numpyop.numpyop import Delete, NumpyOp, forward_numpyop
+from fastestimator.op.numpyop.univariate.channel_transpose import ChannelTranspose
+from fastestimator.op.numpyop.univariate.expand_dims import ExpandDims
+from fastestimator.op.numpyop.univariate.minmax import Minmax
+from fastestimator.op.numpyop.univariate.normalize import Normalize
+from fastestimator.op.numpyop.univariate.reshape import Reshape
+from fastestimator.op.numpyop.univariate.to_float import ToFloat
+from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.pipeline import Pipeline
+from fastestimator.schedule.schedule import get_current_items
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import NonContext, to_list, to_set
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+# Maps each exportable NumpyOp class to a runtime kernel name and a function which extracts the kernel's arguments
+_NUMPY_OP_KERNELS = {
+    ChannelTranspose: ("channel_transpose", lambda op: {"axes": list(op.axes)}),
+    ExpandDims: ("expand_dims", lambda op: {"axis": op.axis}),
+    Minmax: ("minmax", lambda op: {"epsilon": op.epsilon}),
+    Normalize: ("normalize",
+                lambda op: {
+                    "mean": np.array(op.func.transforms[0].mean).tolist(),
+                    "std": np.array(op.func.transforms[0].std).tolist(),
+                    "max_pixel_value": op.func.transforms[0].max_pixel_value
+                }),
+    Reshape: ("reshape", lambda op: {"shape": np.array(op.shape).tolist()}),
+    ToFloat: ("to_float", lambda op: {"max_value": op.func.transforms[0].max_value}),
+}  # type: Dict[type, Tuple[str, Callable[[NumpyOp], Dict[str, Any]]]]
+
+
+def _export_numpy_ops(ops: List[NumpyOp]) -> List[Dict[str, Any]]:
+    """Convert NumpyOps into specifications which the standalone runtime can execute.
+
+    Args:
+        ops: The ops to be converted.
+
+    Returns:
+        One specification per op.
+
+    Raises:
+        ValueError: If any of the `ops` cannot be exported.
+    """
+    specs = []
+    for op in ops:
+        if isinstance(op, Delete):
+            specs.append({"kernel": "delete", "inputs": to_list(op.inputs), "outputs": [], "params": {}})
+        elif type(op) in _NUMPY_OP_KERNELS:
+            kernel, get_params = _NUMPY_OP_KERNELS[type(op)]
+            specs.append({
+                "kernel": kernel, "inputs": to_list(op.inputs), "outputs": to_list(op.outputs), "params": get_params(op)
+            })
+        else:
+            raise ValueError(f"{type(op).__name__} cannot be exported. Supported NumpyOps are: Delete, " +
+                             ", ".join(sorted(cls.__name__ for cls in _NUMPY_OP_KERNELS)))
+    return specs
+
+
+def _save_torch(network: BaseNetwork, batch: Dict[str, np.ndarray], inputs: List[str], outputs: List[str],
+                save_dir: str) -> None:
+    """Trace the network's current ops into TorchScript.
+
+    Args:
+        network: The network, which must already have been loaded for the 'infer' mode.
+        batch: An example batch, used for tracing.
+        inputs: The keys of the network inputs.
+        outputs: The keys of the network outputs.
+        save_dir: The artifact directory.
+    """
+    # Defined here since subclassing torch.nn.Module would otherwise require PyTorch to be imported with this module
+    class _TorchGraph(torch.nn.Module):
+        """A torch Module which runs a list of TensorOps on positional tensor inputs, so that it can be traced.
+
+        This class is intentionally not @traceable.
+
+        Args:
+            ops: The TensorOps to be run.
+            state: The state dictionary to run the `ops` with.
+            inputs: The keys under which to store each positional input.
+            outputs: The keys whose values should be returned.
+        """
+        def __init__(self, ops: List[TensorOp], state: Dict[str, Any], inputs: List[str], outputs: List[str]) -> None:
+            super().__init__()
+            self.ops = ops
+            self.state = state
+            self.inputs = inputs
+            self.outputs = outputs
+            # Registering the models as sub-modules lets TorchScript save their weights as parameters
+            self.models = torch.nn.ModuleList(set.union(set(), *[op.get_fe_models() for op in ops]))
+
+        def forward(self, *tensors: torch.Tensor) -> Tuple[torch.Tensor, ...]:
+            batch = dict(zip(self.inputs, tensors))
+            BaseNetwork._forward_batch(batch, self.state, self.ops)
+            return tuple(batch[key] for key in self.outputs)
+
+    state = dict(network.epoch_state, tape=NonContext())
+    graph = _TorchGraph(network.epoch_ops, state, inputs, outputs).eval()
+    example = tuple(torch.from_numpy(np.ascontiguousarray(batch[key])).to(network.device) for key in inputs)
+    with torch.no_grad():
+        traced = torch.jit.trace(graph, example, check_trace=False)
+    torch.jit.save(traced, os.path.join(save_dir, runtime.TORCH_MODEL_FILE))
+
+
+def _save_tf(network: BaseNetwork, batch: Dict[str, np.ndarray], inputs: List[str], outputs: List[str],
+             save_dir: str) -> None:
+    """Convert the network's current ops into a SavedModel with a fixed signature.
+
+    The signature accepts any batch size, but every other dimension is fixed to match the example `batch`.
+
+    Args:
+        network: The network, which must already have been loaded for the 'infer' mode.
+        batch: An example batch, used to determine the input signature.
+        inputs: The keys of the network inputs.
+        outputs: The keys of the network outputs.
+        save_dir: The artifact directory.
+    """
+    ops = network.epoch_ops
+    state = dict(network.epoch_state, tape=NonContext())
+
+    def serve(*tensors: tf.Tensor) -> Dict[str, tf.Tensor]:
+        data = dict(zip(inputs, tensors))
+        BaseNetwork._forward_batch(data, state, ops)
+        return {f"output_{idx}": data[key] for idx, key in enumerate(outputs)}
+
+    module = tf.Module()
+    module.models = list(set.union(set(), *[op.get_fe_models() for op in ops]))
+    module.serve = tf.function(serve,
+                               input_signature=[
+                                   tf.TensorSpec(shape=(None, ) + batch[key].shape[1:],
+                                                 dtype=tf.as_dtype(batch[key].dtype),
+                                                 name=f"input_{idx}") for idx, key in enumerate(inputs)
+                               ])
+    tf.saved_model.save(module,
+                        os.path.join(save_dir, runtime.TF_MODEL_DIR),
+                        signatures={"serving_default": module.serve.get_concrete_function()})
+
+
+def save(pipeline: Pipeline,
+         network: BaseNetwork,
+         sample: Dict[str, Any],
+         save_dir: str,
+         epoch: int = 1,
+         outputs: Union[None, str, Iterable[str]] = None) -> str:
+    """Export the 'infer' mode of a Pipeline and Network into a standalone artifact.
+
+    The artifact only requires NumPy and whichever of TensorFlow or PyTorch the `network` uses. It does not require
+    FastEstimator or any of the Python objects which made up the original ops. The network ops are compiled into a
+    TorchScript module (for PyTorch) or a SavedModel (for TensorFlow). The pipeline ops (and network postprocessing
+    ops) are translated into a small set of NumPy kernels which are executed by a runtime file that is copied into the
+    artifact. Only deterministic NumpyOps which have a kernel can be exported: ChannelTranspose, Delete, ExpandDims,
+    Minmax, Normalize, Reshape, and ToFloat.
+
+    ```python
+    fe.export.save(pipeline, network, sample={"x": image}, save_dir="/tmp/artifact")
+
+    # Then, in a deployment environment without FastEstimator:
+    import sys
+    sys.path.append("/tmp/artifact")
+    import runtime
+    artifact = runtime.load("/tmp/artifact")
+    result = artifact.predict({"x": image})  # {"x": <preprocessed image>, "y_pred": <prediction>}
+    ```
+
+    Args:
+        pipeline: The pipeline whose 'infer' mode ops should be exported.
+        network: The network whose 'infer' mode ops should be exported.
+        sample: An example input (without a batch dimension). It is used to trace the network, so data-dependent
+            control flow within the network will be frozen to the path which this sample takes.
+        save_dir: The directory into which to write the artifact. Any existing artifact there will be overwritten.
+        epoch: Which epoch's ops to export (relevant if the pipeline or network contain schedulers).
+        outputs: Which network outputs to export, or None to export all of them.
+
+    Returns:
+        The `save_dir`.
+
+    Raises:
+        ValueError: If any of the pipeline or postprocessing ops cannot be exported.
+    """
+    pipeline_ops = get_current_items(pipeline.ops, run_modes="infer", epoch=epoch)
+    pipeline_spec = _export_numpy_ops(pipeline_ops)
+    postprocessing_spec = _export_numpy_ops(get_current_items(network.postprocessing, run_modes="infer", epoch=epoch))
+    item = dict(sample)
+    forward_numpyop(pipeline_ops, item, {"mode": "infer"})
+    network.load_epoch(mode="infer", epoch=epoch, output_keys=to_set(outputs) if outputs else None, warmup=False)
+    try:
+        inputs = sorted(key for key in network.effective_inputs["infer"] if key in item)
+        op_outputs = set.union(set(), *[set(to_list(op.outputs)) for op in network.epoch_ops])
+        output_keys = sorted(network.effective_outputs["infer"] & op_outputs)
+        batch = {key: np.expand_dims(np.asarray(item[key]), 0) for key in inputs}
+        os.makedirs(save_dir, exist_ok=True)
+        for path in (runtime.TORCH_MODEL_FILE, runtime.TF_MODEL_DIR):
+            path = os.path.join(save_dir, path)
+            if os.path.isdir(path):
+                shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
+        if network.target_type == "torch":
+            _save_torch(network, batch, inputs, output_keys, save_dir)
+        else:
+            _save_tf(network, batch, inputs, output_keys, save_dir)
+    finally:
+        network.unload_epoch()
+    with open(os.path.join(save_dir, runtime.ARTIFACT_FILE), 'w') as file:
+        json.dump(
+            {
+                "format_version": runtime.FORMAT_VERSION,
+                "backend": network.target_type,
+                "pipeline": pipeline_spec,
+                "postprocessing": postprocessing_spec,
+                "inputs": inputs,
+                "outputs": output_keys
+            },
+            file,
+            indent=4)
+    shutil.copyfile(runtime.__file__, os.path.join(save_dir, "runtime.py"))
+    return save_dir
@@ -0,0 +1,169 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""A minimal runtime for artifacts written by `fe.export.save`.
+
+This file is copied into every exported artifact, so it must only depend upon the Python standard library, NumPy, and
+(lazily) whichever of TensorFlow or PyTorch the artifact was exported from. It must never import FastEstimator.
+"""
+import json
+import os
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+ARTIFACT_FILE = "artifact.json"
+FORMAT_VERSION = 1
+TORCH_MODEL_FILE = "model.pt"
+TF_MODEL_DIR = "saved_model"
+
+_MAX_VALUES_BY_DTYPE = {
+    np.dtype(np.uint8): 255,
+    np.dtype(np.uint16): 65535,
+    np.dtype(np.uint32): 4294967295,
+    np.dtype(np.float32): 1.0,
+}
+
+
+def _minmax(data: np.ndarray, epsilon: float) -> np.ndarray:
+    data_max, data_min = np.max(data), np.min(data)
+    return ((data - data_min) / max(data_max - data_min, epsilon)).astype(np.float32)
+
+
+def _to_float(data: np.ndarray, max_value: Any) -> np.ndarray:
+    if max_value is None:
+        max_value = _MAX_VALUES_BY_DTYPE[data.dtype]
+    return data.astype(np.float32) / max_value
+
+
+def _normalize(data: np.ndarray, mean: Any, std: Any, max_pixel_value: float) -> np.ndarray:
+    mean = np.array(mean, dtype=np.float32) * max_pixel_value
+    std = np.array(std, dtype=np.float32) * max_pixel_value
+    return (data.astype(np.float32) - mean) * np.reciprocal(std)
+
+
+# Each kernel takes a single (un-batched) array and returns the transformed array
+KERNELS = {
+    "channel_transpose": lambda data, axes: np.transpose(data, axes),
+    "expand_dims": lambda data, axis: np.expand_dims(data, axis),
+    "minmax": _minmax,
+    "normalize": _normalize,
+    "reshape": lambda data, shape: np.reshape(data, shape),
+    "to_float": _to_float,
+}  # type: Dict[str, Callable[..., np.ndarray]]
+
+
+def _run_ops(ops: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+    """Apply exported NumpyOps to a single data instance in place.
+
+    Args:
+        ops: The exported op specifications.
+        data: The data instance to be modified.
+    """
+    for op in ops:
+        if op["kernel"] == "delete":
+            for key in op["inputs"]:
+                del data[key]
+            continue
+        kernel = KERNELS[op["kernel"]]
+        for key_in, key_out in zip(op["inputs"], op["outputs"]):
+            data[key_out] = kernel(data[key_in], **op["params"])
+
+
+class Artifact:
+    """An exported Pipeline and Network, ready to make predictions without FastEstimator.
+
+    ```python
+    import runtime  # The copy of this file which is stored inside of the artifact directory
+    artifact = runtime.load("/path/to/artifact")
+    result = artifact.predict({"x": image})  # {"x": <preprocessed image>, "y_pred": <prediction>}
+    ```
+
+    This class is intentionally not @traceable.
+
+    Args:
+        path: The artifact directory.
+
+    Raises:
+        ValueError: If the artifact was written by an incompatible exporter.
+    """
+    def __init__(self, path: str) -> None:
+        with open(os.path.join(path, ARTIFACT_FILE), 'r') as file:
+            spec = json.load(file)
+        if spec["format_version"] != FORMAT_VERSION:
+            raise ValueError(f"Unsupported artifact format version: {spec['format_version']}")
+        self.backend = spec["backend"]
+        self.pipeline = spec["pipeline"]
+        self.postprocessing = spec["postprocessing"]
+        self.inputs = spec["inputs"]
+        self.outputs = spec["outputs"]
+        if self.backend == "torch":
+            import torch
+            self._torch = torch
+            self.model = torch.jit.load(os.path.join(path, TORCH_MODEL_FILE), map_location="cpu")
+        else:
+            import tensorflow as tf
+            self._tf = tf
+            self.model = tf.saved_model.load(os.path.join(path, TF_MODEL_DIR)).signatures["serving_default"]
+
+    def predict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute a prediction for a single data instance.
+
+        Args:
+            data: A single (un-batched) data instance, like {"x": <image>}.
+
+        Returns:
+            The pipeline outputs overlaid with the network predictions for the `data`, without a batch dimension.
+        """
+        return self.predict_batch([data])[0]
+
+    def predict_batch(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Compute predictions for several data instances at once.
+
+        Args:
+            data: A list of (un-batched) data instances. The inputs to the network must have matching shapes.
+
+        Returns:
+            The pipeline outputs overlaid with the network predictions for each element of `data`.
+        """
+        items = []
+        for elem in data:
+            elem = dict(elem)
+            _run_ops(self.pipeline, elem)
+            items.append(elem)
+        batch = [np.stack([np.asarray(item[key]) for item in items]) for key in self.inputs]
+        if self.backend == "torch":
+            with self._torch.no_grad():
+                outputs = self.model(*[self._torch.from_numpy(np.ascontiguousarray(value)) for value in batch])
+            outputs = [output.cpu().numpy() for output in outputs]
+        else:
+            outputs = self.model(**{f"input_{idx}": value for idx, value in enumerate(batch)})
+            outputs = [outputs[f"output_{idx}"].numpy() for idx in range(len(self.outputs))]
+        for idx, item in enumerate(items):
+            for key, output in zip(self.outputs, outputs):
+                item[key] = output[idx] if output.ndim > 0 and output.shape[0] == len(items) else output
+            _run_ops(self.postprocessing, item)
+        return items
+
+
+def load(path: str) -> Artifact:
+    """Load an artifact which was written by `fe.export.save`.
+
+    Args:
+        path: The artifact directory.
+
+    Returns:
+        The loaded artifact.
+    """
+    return Artifact(path)
@@ -0,0 +1,241 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import asyncio
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from fastestimator.backend.to_tensor import to_tensor
+from fastestimator.network import BaseNetwork
+from fastestimator.op.numpyop.numpyop import forward_numpyop
+from fastestimator.pipeline import Pipeline
+from fastestimator.schedule.schedule import get_current_items
+from fastestimator.util.distributed import get_tf_strategy
+from fastestimator.util.util import pad_collate, to_number, to_set
+
+_STOP = object()  # Placed on the request queue to shut down the batching thread
+
+
+class InferenceSession:
+    """Serve predictions from a Pipeline and Network with low latency.
+
+    Calling `Pipeline.transform` followed by `Network.transform` for every request re-plans the ops, re-loads the
+    models (which in torch means moving them onto the GPU and back), and runs the network on batches of 1. A session
+    instead prepares the 'infer' mode ops and models once and keeps them resident until it is closed. The pipeline ops
+    of incoming requests run concurrently in a pool of worker threads. Requests which arrive close together are then
+    grouped into micro-batches for the network: a batch is launched as soon as it holds `max_batch_size` requests, or
+    once its oldest request has waited `max_latency` seconds.
+
+    ```python
+    with fe.InferenceSession(pipeline, network, max_batch_size=32, max_latency=0.005) as session:
+        result = session.predict({"x": image})  # {"x": <preprocessed image>, "y_pred": <prediction>}
+        result = await session.predict_async({"x": image})  # From inside of a coroutine
+        future = session.submit({"x": image})  # A concurrent.futures.Future
+    ```
+
+    This class is intentionally not @traceable.
+
+    Args:
+        pipeline: The pipeline whose 'infer' mode ops should be applied to each request.
+        network: The network whose 'infer' mode ops should be applied to each batch of requests.
+        epoch: Which epoch's ops to use (relevant if the pipeline or network contain schedulers).
+        max_batch_size: The largest number of requests to run through the network at once.
+        max_latency: How long (in seconds) a request may wait for other requests to join its batch. Zero still batches
+            together any requests which are already waiting, which gives the lowest latency under light load.
+        num_workers: How many threads to use for the pipeline ops. Defaults to the number of CPUs.
+        outputs: Which network outputs should be returned, or None to return all of them.
+
+    Raises:
+        ValueError: If any of the arguments are invalid, or if a multi-device TF strategy is active.
+    """
+    def __init__(self,
+                 pipeline: Pipeline,
+                 network: BaseNetwork,
+                 epoch: int = 1,
+                 max_batch_size: int = 32,
+                 max_latency: float = 0.005,
+                 num_workers: Optional[int] = None,
+                 outputs: Union[None, str, Iterable[str]] = None) -> None:
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be a positive integer, but got {max_batch_size}")
+        if max_latency < 0:
+            raise ValueError(f"max_latency must be non-negative, but got {max_latency}")
+        if network.target_type == "tf" and get_tf_strategy() is not None:
+            raise ValueError("InferenceSession runs on a single device, but a distributed TF strategy is active")
+        self.pipeline = pipeline
+        self.network = network
+        self.max_batch_size = max_batch_size
+        self.max_latency = max_latency
+        self.state = {"mode": "infer"}
+        self.pipeline_ops = get_current_items(pipeline.ops, run_modes="infer", epoch=epoch)
+        network.load_epoch(mode="infer", epoch=epoch, output_keys=to_set(outputs) if outputs else None, warmup=False)
+        self._closed = False
+        self._requests = queue.SimpleQueue()
+        self._workers = ThreadPoolExecutor(max_workers=num_workers or os.cpu_count())
+        self._batcher = threading.Thread(target=self._serve, name="InferenceSession", daemon=True)
+        self._batcher.start()
+
+    def submit(self, data: Dict[str, Any]) -> Future:
+        """Request a prediction without waiting for it.
+
+        Args:
+            data: A single (un-batched) data instance, like {"x": <image>}. The dictionary itself is not modified, but
+                it is not deep-copied either.
+
+        Returns:
+            A Future which will resolve to the pipeline outputs overlaid with the network predictions for the `data`,
+            without a batch dimension.
+
+        Raises:
+            RuntimeError: If this session has already been closed.
+        """
+        if self._closed:
+            raise RuntimeError("Cannot submit requests to an InferenceSession which has been closed")
+        result = Future()
+        self._requests.put((self._workers.submit(self._preprocess, data), result, time.perf_counter()))
+        return result
+
+    def predict(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute a prediction, blocking until it is ready.
+
+        Args:
+            data: A single (un-batched) data instance, like {"x": <image>}.
+
+        Returns:
+            The pipeline outputs overlaid with the network predictions for the `data`, without a batch dimension.
+        """
+        return self.submit(data).result()
+
+    async def predict_async(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Compute a prediction from within an asyncio event loop.
+
+        Args:
+            data: A single (un-batched) data instance, like {"x": <image>}.
+
+        Returns:
+            The pipeline outputs overlaid with the network predictions for the `data`, without a batch dimension.
+        """
+        return await asyncio.wrap_future(self.submit(data))
+
+    def close(self) -> None:
+        """Finish any outstanding requests and then release the models and worker threads.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        self._requests.put(_STOP)
+        self._batcher.join()
+        self._workers.shutdown(wait=True)
+        self.network.unload_epoch()
+
+    def __enter__(self) -> 'InferenceSession':
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def _preprocess(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Run the pipeline ops on a single request.
+
+        Args:
+            data: The request data.
+
+        Returns:
+            The transformed data.
+        """
+        data = dict(data)
+        forward_numpyop(self.pipeline_ops, data, self.state)
+        return data
+
+    def _serve(self) -> None:
+        """Group queued requests into batches and run them through the network until the session is closed.
+        """
+        stopping = False
+        while not stopping:
+            request = self._requests.get()
+            if request is _STOP:
+                break
+            requests = [request]
+            deadline = request[2] + self.max_latency
+            while len(requests) < self.max_batch_size:
+                try:
+                    request = self._requests.get(timeout=max(deadline - time.perf_counter(), 0))
+                except queue.Empty:
+                    break
+                if request is _STOP:
+                    stopping = True
+                    break
+                requests.append(request)
+            self._run_batch(requests)
+
+    def _run_batch(self, requests: List[Tuple[Future, Future, float]]) -> None:
+        """Run a group of requests through the network, delivering each of their results.
+
+        Args:
+            requests: The (preprocessing future, result future, arrival time) of each request.
+        """
+        items, results = [], []
+        for preprocessed, result, _ in requests:
+            if not result.set_running_or_notify_cancel():
+                continue
+            try:
+                items.append(preprocessed.result())
+                results.append(result)
+            except BaseException as err:
+                result.set_exception(err)
+        if not items:
+            return
+        try:
+            predictions = self._predict(items)
+        except BaseException as err:
+            for result in results:
+                result.set_exception(err)
+            return
+        for item, prediction, result in zip(items, predictions, results):
+            result.set_result({**item, **prediction})
+
+    def _predict(self, items: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run a batch of preprocessed requests through the network.
+
+        Args:
+            items: The preprocessed requests.
+
+        Returns:
+            The network predictions for each of the `items`.
+        """
+        n_items = len(items)
+        if self.network.target_type == "tf":
+            # TF retraces its graph for every new batch size, so only ever use power-of-2 sizes
+            n_padded = min(1 << (n_items - 1).bit_length(), max(self.max_batch_size, n_items))
+            items = items + [items[-1]] * (n_padded - n_items)
+        batch = pad_collate(items, self.pipeline.pad_value, self.pipeline.pad_multiple)
+        for key, value in batch.items():
+            if not isinstance(value, np.ndarray):
+                array = np.array(value)
+                if array.dtype.kind in 'biufc':
+                    batch[key] = array
+        _, prediction = self.network.run_step(to_tensor(batch, target_type=self.network.target_type))
+        results = [{} for _ in range(n_items)]
+        for key, value in prediction.items():
+            value = to_number(value)
+            for idx, result in enumerate(results):
+                # Batch-level values (ex. a scalar loss) are given to every request
+                result[key] = value[idx] if value.ndim > 0 and value.shape[0] == len(items) else value
+        return results
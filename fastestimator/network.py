@@ -12,33 +12,169 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import multiprocessing as mp
 import os
 import tempfile
 from collections import ChainMap
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from typing import Any, Callable, Dict, Iterable, List, MutableMapping, Optional, Set, Tuple, TypeVar, Union
 
 import gdown
 import numpy as np
-import tensorflow as tf
-import torch
-from tensorflow.keras.mixed_precision import experimental as mixed_precision_tf
-from tensorflow.python.distribute.values import DistributedValues
 
 from fastestimator.backend.load_model import load_model
 from fastestimator.backend.to_tensor import to_tensor
-from fastestimator.op.numpyop import NumpyOp, forward_numpyop
+from fastestimator.op.numpyop import Delete, NumpyOp, forward_numpyop
 from fastestimator.op.op import get_inputs_by_op, write_outputs_by_op
 from fastestimator.op.tensorop.tensorop import TensorOp
 from fastestimator.op.tensorop.model.update import UpdateOp
 from fastestimator.schedule.schedule import EpochScheduler, RepeatScheduler, Scheduler, get_current_items
+from fastestimator.util.distributed import enable_tf_multi_worker, get_rank, get_replica_module, get_tf_strategy, \
+    register_replica_module
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import trace_model, traceable
-from fastestimator.util.util import NonContext, get_batch_size, to_list
+from fastestimator.util.util import NonContext, get_batch_size, is_tf_model, is_torch_model, to_list, to_number
 
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 T = TypeVar('T')
 
 GOOGLE_DRIVE_URL = "https://drive.google.com"
 
+# Postprocessing ops for the process pools, keyed by pool id. Worker processes are forked after their pool registers its
+# ops here, so the ops (which are often not picklable) never need to be sent to them.
+_postprocessing_ops = {}
+
+
+def _run_postprocessing(ops: List[NumpyOp], data: MutableMapping[str, Any],
+                        state: Dict[str, Any]) -> MutableMapping[str, Any]:
+    """Run postprocessing ops on a batch of data.
+
+    Args:
+        ops: The postprocessing ops to execute.
+        data: The batch and prediction data.
+        state: Information about the current execution context, ex. {"mode": "eval"}.
+
+    Returns:
+        The `data`, modified in place by the `ops`.
+    """
+    forward_numpyop(ops=ops, data=data, state=state, batched=True)
+    return data
+
+
+def _run_postprocessing_in_worker(pool_id: int, data: Dict[str, Any], state: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the postprocessing ops of a given pool from inside one of its worker processes.
+
+    Args:
+        pool_id: The id of the pool which submitted this work.
+        data: The batch and prediction data required by the ops.
+        state: Information about the current execution context, ex. {"mode": "eval"}.
+
+    Returns:
+        The `data`, modified by the ops.
+    """
+    return _run_postprocessing(_postprocessing_ops[pool_id], data, state)
+
+
+class PostprocessingPool:
+    """A worker pool which runs Network postprocessing ops in the background.
+
+    Steps are executed in the order that they are submitted, and each submission returns a Future so that results can
+    be delivered to traces in order. Threads share the batch dictionaries with the training loop and so have no
+    overhead, but will be limited by the GIL for ops which do a lot of pure-python work. Processes avoid the GIL at the
+    cost of copying the op inputs / outputs between processes. Process pools require the 'fork' start method, and will
+    fall back to threads if it is not available.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        ops: The postprocessing ops to be executed.
+        state: Information about the current execution context, ex. {"mode": "eval"}.
+        num_workers: How many workers to use.
+        multiprocess: Whether to use processes rather than threads.
+    """
+    def __init__(self, ops: List[NumpyOp], state: Dict[str, Any], num_workers: int, multiprocess: bool = False) -> None:
+        self.ops = ops
+        self.state = state
+        if multiprocess and 'fork' not in mp.get_all_start_methods():
+            print("FastEstimator-Warn: Postprocessing will use threads rather than processes. OS must support the "
+                  "'fork' start method.")
+            multiprocess = False
+        self.multiprocess = multiprocess
+        self.inputs = {key for op in ops for key in op.inputs}
+        self.outputs = {key for op in ops for key in op.outputs}
+        self.deletions = {key for op in ops if isinstance(op, Delete) for key in op.inputs}
+        if multiprocess:
+            _postprocessing_ops[id(self)] = ops
+            # Use a private fork context rather than changing the start method of the whole program
+            self.executor = ProcessPoolExecutor(max_workers=num_workers, mp_context=mp.get_context('fork'))
+        else:
+            self.executor = ThreadPoolExecutor(max_workers=num_workers)
+
+    def submit(self, batch: MutableMapping[str, Any], prediction: MutableMapping[str, Any]) -> Future:
+        """Schedule postprocessing for a step.
+
+        Args:
+            batch: The batch data for the step.
+            prediction: The prediction data for the step. Postprocessing outputs will be written into this dictionary.
+
+        Returns:
+            A Future which will resolve to (batch, prediction) once the postprocessing is complete.
+        """
+        if not self.multiprocess:
+            return self.executor.submit(self._run_local, batch, prediction)
+        data = ChainMap(prediction, batch)
+        data = {key: to_number(data[key]) for key in self.inputs if key in data}
+        result = Future()
+        future = self.executor.submit(_run_postprocessing_in_worker, id(self), data, self.state)
+        future.add_done_callback(lambda done: self._merge(done, batch, prediction, result))
+        return result
+
+    def _run_local(self, batch: MutableMapping[str, Any],
+                   prediction: MutableMapping[str, Any]) -> Tuple[MutableMapping[str, Any], MutableMapping[str, Any]]:
+        """Run postprocessing inside of a worker thread.
+
+        Args:
+            batch: The batch data for the step.
+            prediction: The prediction data for the step.
+
+        Returns:
+            (batch, prediction)
+        """
+        _run_postprocessing(self.ops, ChainMap(prediction, batch), self.state)
+        return batch, prediction
+
+    def _merge(self,
+               done: Future,
+               batch: MutableMapping[str, Any],
+               prediction: MutableMapping[str, Any],
+               result: Future) -> None:
+        """Write the outputs of a worker process back into the prediction dictionary of its step.
+
+        Args:
+            done: The completed worker Future.
+            batch: The batch data for the step.
+            prediction: The prediction data for the step.
+            result: The Future which should receive the final (batch, prediction).
+        """
+        try:
+            data = done.result()
+            for key in self.deletions:
+                prediction.pop(key, None)
+            prediction.update({key: data[key] for key in self.outputs if key in data})
+        except BaseException as err:
+            result.set_exception(err)
+        else:
+            result.set_result((batch, prediction))
+
+    def shutdown(self) -> None:
+        """Release the workers held by this pool.
+        """
+        self.executor.shutdown(wait=True)
+        _postprocessing_ops.pop(id(self), None)
+
 
 @traceable()
 class BaseNetwork:
@@ -52,14 +188,21 @@ class BaseNetwork:
             more model ops, as well as loss ops and update ops.
         postprocessing: A collection of NumpyOps to be run on the CPU after all of the normal `ops` have been executed.
             Unlike the NumpyOps found in the pipeline, these ops will run on batches of data rather than single points.
+        postprocessing_workers: How many background workers to use for the `postprocessing`. If 0, postprocessing runs
+            synchronously after every step. Otherwise it is pipelined one step behind the network, so that the
+            postprocessing of one batch overlaps with the network execution of the next one.
+        postprocessing_multiprocess: Whether the `postprocessing_workers` should be processes rather than threads.
+            Processes are not limited by the GIL, but require the op inputs and outputs to be copied between processes.
 
     """
     def __init__(
         self,
         target_type: str,
-        device: Optional[torch.device],
+        device: Optional['torch.device'],
         ops: Iterable[Union[TensorOp, Scheduler[TensorOp]]],
-        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None
+        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None,
+        postprocessing_workers: int = 0,
+        postprocessing_multiprocess: bool = False
     ) -> None:
         self.ops = to_list(ops)
         self.target_type = target_type
@@ -68,6 +211,8 @@ class BaseNetwork:
             op.build(framework=self.target_type, device=self.device)
         self.models = to_list(_collect_models(ops))
         self.postprocessing = to_list(postprocessing)
+        self.postprocessing_workers = postprocessing_workers
+        self.postprocessing_multiprocess = postprocessing_multiprocess
         self._verify_inputs()
         self.effective_inputs = dict()
         self.effective_outputs = dict()
@@ -75,6 +220,7 @@ class BaseNetwork:
         self.epoch_postprocessing = []
         self.epoch_models = set()
         self.epoch_state = dict()
+        self.epoch_postprocessing_pool = None
         self.scaler = None
 
     def _verify_inputs(self) -> None:
@@ -87,6 +233,7 @@ class BaseNetwork:
             assert isinstance(op, TensorOp), "unsupported op format, Network ops must be TensorOps"
         for op in get_current_items(self.postprocessing):
             assert isinstance(op, NumpyOp), "unsupported op format, Network postprocessing must be NumpyOps"
+        assert self.postprocessing_workers >= 0, "postprocessing_workers must be non-negative"
 
     def get_scheduled_items(self, mode: str) -> List[Any]:
         """Get a list of items considered for scheduling.
@@ -141,11 +288,24 @@ class BaseNetwork:
                     model.current_optimizer = model.optimizer.get_current_value(epoch)
                 else:
                     model.current_optimizer = model.optimizer
+        if self.epoch_postprocessing_pool is not None:
+            self.epoch_postprocessing_pool.shutdown()
+            self.epoch_postprocessing_pool = None
+        if self.postprocessing_workers and self.epoch_postprocessing:
+            self.epoch_postprocessing_pool = PostprocessingPool(
+                ops=self.epoch_postprocessing,
+                state={
+                    "warmup": warmup, "mode": mode, "epoch": epoch
+                } if self.postprocessing_multiprocess else self.epoch_state,
+                num_workers=self.postprocessing_workers,
+                multiprocess=self.postprocessing_multiprocess)
 
     def unload_epoch(self) -> None:
         """Clean up the network after running an epoch.
         """
-        pass
+        if self.epoch_postprocessing_pool is not None:
+            self.epoch_postprocessing_pool.shutdown()
+            self.epoch_postprocessing_pool = None
 
     def get_loss_keys(self) -> Set[str]:
         """Find all of the keys associated with model losses.
@@ -238,12 +398,31 @@ class BaseNetwork:
         Returns:
             (batch_data, prediction_data)
         """
+        return self.run_step_async(batch).result()
+
+    def run_step_async(self, batch: Dict[str, Any]) -> Future:
+        """Run a forward step through the Network on a batch of data, deferring postprocessing to the background.
+
+        The network ops are executed immediately. If this Network has `postprocessing_workers` then the postprocessing
+        is handed off to them, otherwise it is performed before this method returns. This method expects that
+        Network.load_epoch() has already been invoked. The return data will be on the CPU.
+
+        Args:
+            batch: The batch of data serving as input to the Network.
+
+        Returns:
+            A Future which will resolve to (batch_data, prediction_data) once postprocessing is complete.
+        """
         batch, prediction = self._run_step(batch)
+        if self.epoch_postprocessing_pool is not None:
+            return self.epoch_postprocessing_pool.submit(batch, prediction)
         forward_numpyop(ops=self.epoch_postprocessing,
                         data=ChainMap(prediction, batch),
                         state=self.epoch_state,
                         batched=True)
-        return batch, prediction
+        result = Future()
+        result.set_result((batch, prediction))
+        return result
 
     def _run_step(self, batch: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:  # Batch, Prediction
         """Run a forward step through the Network on a batch of data, excluding postprocessing.
@@ -295,7 +474,9 @@ def _collect_models(ops: Iterable[Union[TensorOp, Scheduler[TensorOp]]]) -> Set[
 # noinspection PyPep8Naming
 def Network(
     ops: Iterable[Union[TensorOp, Scheduler[TensorOp]]],
-    pops: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None
+    pops: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None,
+    pops_workers: int = 0,
+    pops_multiprocess: bool = False
 ) -> BaseNetwork:
     """A function to automatically instantiate the correct Network derived class based on the given `ops`.
 
@@ -306,6 +487,10 @@ def Network(
         pops: Postprocessing Ops. A collection of NumpyOps to be run on the CPU after all of the normal `ops` have been
             executed. Unlike the NumpyOps found in the pipeline, these ops will run on batches of data rather than
             single points.
+        pops_workers: How many background workers to use for the `pops`. If 0, postprocessing runs synchronously after
+            every step. Otherwise it is pipelined one step behind the network so that heavy postprocessing (ex. NMS)
+            does not block the next training / evaluation step. Traces still receive the steps in order.
+        pops_multiprocess: Whether the `pops_workers` should be processes rather than threads.
 
     Returns:
         A network instance containing the given `ops`.
@@ -320,9 +505,9 @@ def Network(
     for model in models:
         # 'Model' and 'model' should not be considered unique in case you are saving on a non-case-sensitive filesystem
         model_names.add(model.model_name.lower())
-        if isinstance(model, tf.keras.Model):
+        if is_tf_model(model):
             framework.add("tf")
-        elif isinstance(model, torch.nn.Module):
+        elif is_torch_model(model):
             framework.add("torch")
         else:
             framework.add("unknown")
@@ -333,9 +518,9 @@ def Network(
 
     framework = framework.pop()
     if framework == "tf":
-        network = TFNetwork(ops, pops)
+        network = TFNetwork(ops, pops, pops_workers, pops_multiprocess)
     elif framework == "torch":
-        network = TorchNetwork(ops, pops)
+        network = TorchNetwork(ops, pops, pops_workers, pops_multiprocess)
     else:
         raise ValueError("Unknown model type")
     return network
@@ -349,25 +534,67 @@ class TorchNetwork(BaseNetwork):
         ops: The ops defining the execution graph for this Network.
         postprocessing: A collection of NumpyOps to be run on the CPU after all of the normal `ops` have been executed.
             Unlike the NumpyOps found in the pipeline, these ops will run on batches of data rather than single points.
+        postprocessing_workers: How many background workers to use for the `postprocessing`. If 0, postprocessing runs
+            synchronously after every step. Otherwise it is pipelined one step behind the network, so that the
+            postprocessing of one batch overlaps with the network execution of the next one.
+        postprocessing_multiprocess: Whether the `postprocessing_workers` should be processes rather than threads.
+            Processes are not limited by the GIL, but require the op inputs and outputs to be copied between processes.
 
     """
     def __init__(
         self,
         ops: Iterable[Union[TensorOp, Scheduler[TensorOp]]],
-        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None
+        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None,
+        postprocessing_workers: int = 0,
+        postprocessing_multiprocess: bool = False
     ) -> None:
         super().__init__(target_type='torch',
                          device=torch.device("cuda:0" if torch.cuda.is_available() else "cpu"),
                          ops=ops,
-                         postprocessing=postprocessing)
+                         postprocessing=postprocessing,
+                         postprocessing_workers=postprocessing_workers,
+                         postprocessing_multiprocess=postprocessing_multiprocess)
         if any([model.mixed_precision for model in self.models]):
             self.scaler = torch.cuda.amp.GradScaler()
+        self.distributed = False
+
+    def distribute(self) -> None:
+        """Prepare this network to train as one member of a torch distributed process group.
+
+        Every model with trainable parameters is wrapped in a DistributedDataParallel, so that gradients are averaged
+        across all of the processes during the backward pass. When training on GPUs, each process uses the GPU matching
+        its rank. Since a process owns its device for the entire run, models are no longer moved back to the CPU between
+        epochs. This is invoked automatically by an Estimator with `num_replicas` > 1.
+        """
+        if self.device.type == "cuda":
+            self.device = torch.device("cuda", get_rank())
+            for op in get_current_items(self.ops):
+                op.build(framework=self.target_type, device=self.device)
+        for model in self.models:
+            if not any(param.requires_grad for param in model.parameters()):
+                continue
+            model.to(self.device)
+            device_ids = [self.device] if self.device.type == "cuda" else None
+            register_replica_module(model, torch.nn.parallel.DistributedDataParallel(model, device_ids=device_ids))
+        self.distributed = True
+
+    def release_device(self) -> None:
+        """Move all of the models and their optimizer states back onto the CPU.
+        """
+        for model in self.models:
+            model.to("cpu")
+            optimizers = model.optimizer
+            for optimizer in optimizers.get_all_values() if isinstance(optimizers, Scheduler) else [optimizers]:
+                if optimizer is not None:
+                    self._move_optimizer_between_device(optimizer.state, "cpu")
 
     def load_epoch(self, mode: str, epoch: int, output_keys: Optional[Set[str]] = None, warmup: bool = False) -> None:
         """Prepare the network to run a given epoch and mode.
 
         This method is necessary since schedulers and op mode restrictions may result in different computation graphs
-        every epoch. This also moves all of the necessary models from the CPU onto the GPU(s).
+        every epoch. This also moves all of the necessary models from the CPU onto the GPU(s). When several GPUs are
+        available (and training is not distributed), the forward passes of the models are run through a DataParallel.
+        That wrapping happens here rather than in `fe.build` so that building a model never initializes CUDA.
 
         Args:
             mode: The mode to prepare to execute. One of 'train', 'eval', 'test', or 'infer'.
@@ -377,9 +604,12 @@ class TorchNetwork(BaseNetwork):
         """
         super().load_epoch(mode, epoch, output_keys, warmup)
         if self.device.type == "cuda":
+            multi_gpu = not self.distributed and torch.cuda.device_count() > 1
             for model in self.epoch_models:
                 # move model variables to gpu
                 model.to(self.device)
+                if multi_gpu and get_replica_module(model) is model:
+                    register_replica_module(model, torch.nn.DataParallel(model))
                 if model.current_optimizer and mode == "train":
                     # move optimizer variables to gpu
                     self._move_optimizer_between_device(model.current_optimizer.state, self.device)
@@ -392,7 +622,7 @@ class TorchNetwork(BaseNetwork):
             else:
                 break
 
-    def _move_optimizer_between_device(self, data: Dict[str, Any], device: Union[str, torch.device]) -> None:
+    def _move_optimizer_between_device(self, data: Dict[str, Any], device: Union[str, 'torch.device']) -> None:
         """Move optimizer state between gpu and cpu recursively.
 
         Args:
@@ -411,9 +641,10 @@ class TorchNetwork(BaseNetwork):
     def unload_epoch(self) -> None:
         """Clean up the network after running an epoch.
 
-        In this case we move all of the models from the GPU(s) back to the CPU.
+        In this case we move all of the models from the GPU(s) back to the CPU (unless training is distributed).
         """
-        if self.device.type == "cuda":
+        super().unload_epoch()
+        if self.device.type == "cuda" and not self.distributed:
             for model in self.epoch_models:
                 # move model variables to cpu
                 model.to("cpu")
@@ -485,7 +716,7 @@ class TorchNetwork(BaseNetwork):
             }
         return batch, prediction
 
-    def _move_tensor_between_device(self, data: T, device: Union[str, torch.device]) -> T:
+    def _move_tensor_between_device(self, data: T, device: Union[str, 'torch.device']) -> T:
         """Move tensor between gpu and cpu recursively.
 
         Args:
@@ -537,13 +768,27 @@ class TFNetwork(BaseNetwork):
         ops: The ops defining the execution graph for this Network.
         postprocessing: A collection of NumpyOps to be run on the CPU after all of the normal `ops` have been executed.
             Unlike the NumpyOps found in the pipeline, these ops will run on batches of data rather than single points.
+        postprocessing_workers: How many background workers to use for the `postprocessing`. If 0, postprocessing runs
+            synchronously after every step. Otherwise it is pipelined one step behind the network, so that the
+            postprocessing of one batch overlaps with the network execution of the next one.
+        postprocessing_multiprocess: Whether the `postprocessing_workers` should be processes rather than threads.
+            Processes are not limited by the GIL, but require the op inputs and outputs to be copied between processes.
     """
     def __init__(
         self,
         ops: Iterable[Union[TensorOp, Scheduler[TensorOp]]],
-        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None
+        postprocessing: Union[None, NumpyOp, Scheduler[NumpyOp], Iterable[Union[NumpyOp, Scheduler[NumpyOp]]]] = None,
+        postprocessing_workers: int = 0,
+        postprocessing_multiprocess: bool = False
     ) -> None:
-        super().__init__(target_type='tf', device=None, ops=ops, postprocessing=postprocessing)
+        super().__init__(target_type='tf',
+                         device=None,
+                         ops=ops,
+                         postprocessing=postprocessing,
+                         postprocessing_workers=postprocessing_workers,
+                         postprocessing_multiprocess=postprocessing_multiprocess)
+        # Compiled here rather than with a decorator so that defining this class does not import TensorFlow
+        self._forward_step_static = tf.function(self._forward_step_static)
 
     def load_epoch(self, mode: str, epoch: int, output_keys: Optional[Set[str]] = None, warmup: bool = False) -> None:
         """Prepare the network to run a given epoch and mode.
@@ -574,8 +819,8 @@ class TFNetwork(BaseNetwork):
         """
         mode = self.epoch_state["mode"]
         batch_in = self._get_effective_batch_input(batch, mode)
-        strategy = tf.distribute.get_strategy()
-        if isinstance(strategy, tf.distribute.MirroredStrategy):
+        strategy = get_tf_strategy()
+        if strategy:
             if self.epoch_state["warmup"] == "debug":
                 prediction = strategy.run(
                     self._forward_step_eager,
@@ -603,7 +848,8 @@ class TFNetwork(BaseNetwork):
         """Combine data from "per-replica" values recursively.
 
         For multi-GPU training, data are distributed using `tf.distribute.Strategy.experimental_distribute_dataset`.
-        This method collects data from all replicas and combines them into one.
+        This method collects data from all of the local replicas and combines them into one. When training across
+        several workers, only the replicas of the current worker are combined.
 
         Args:
             data: Distributed data.
@@ -611,6 +857,7 @@ class TFNetwork(BaseNetwork):
         Returns:
             Combined data from all replicas.
         """
+        from tensorflow.python.distribute.values import DistributedValues
         if isinstance(data, DistributedValues):
             if data.values[0].shape.rank == 0:
                 return tf.reduce_mean(tuple(d for d in data.values if not tf.math.is_nan(d)))
@@ -675,7 +922,6 @@ class TFNetwork(BaseNetwork):
                 prediction[key] = batch[key]
         return prediction
 
-    @tf.function
     def _forward_step_static(self,
                              batch: Dict[str, Any],
                              state: Dict[str, Any],
@@ -718,8 +964,8 @@ class TFNetwork(BaseNetwork):
         """
         # Distribute multi-gpu data for processing
         sub_sample = False
-        strategy = tf.distribute.get_strategy()
-        if isinstance(strategy, tf.distribute.MirroredStrategy):
+        strategy = get_tf_strategy()
+        if strategy:
             batch_size, num_devices = get_batch_size(data), strategy.num_replicas_in_sync
             if batch_size < num_devices:
                 data = self._fill_batch(data, num_devices - batch_size)
@@ -811,6 +1057,11 @@ def build(model_fn: Callable[[], Union[Model, List[Model]]],
             should match the number of models generated by the `model_fn`.
         mixed_precision: Whether to enable mix precision network operations.
 
+    TensorFlow models are automatically built under a MirroredStrategy when multiple GPUs are available. To train
+    across several machines, set the TF_CONFIG environment variable on every worker and a MultiWorkerMirroredStrategy
+    will be used instead. Any strategy from `fe.util.TF_DATA_PARALLEL_STRATEGIES` which has already been activated via
+    `tf.distribute.experimental_set_strategy` is left in place.
+
     Returns:
         models: The model(s) built by FastEstimator.
     """
@@ -821,29 +1072,30 @@ def build(model_fn: Callable[[], Union[Model, List[Model]]],
 
     if not hasattr(build, "count"):
         build.count = 0
+    # Multi-worker collectives must be configured before any TF variables are created
+    enable_tf_multi_worker()
     models, optimizer_fn = to_list(model_fn()), to_list(optimizer_fn)
     # fill optimizer
     if not optimizer_fn:
         optimizer_fn = [None]
     # check framework
-    if isinstance(models[0], tf.keras.Model):
+    if is_tf_model(models[0]):
         framework = "tf"
         # tensorflow mix-precision instantiation
+        from tensorflow.keras.mixed_precision import experimental as mixed_precision_tf
         if mixed_precision:
             mixed_precision_tf.set_policy(mixed_precision_tf.Policy('mixed_float16'))
         else:
             mixed_precision_tf.set_policy(mixed_precision_tf.Policy('float32'))
-    elif isinstance(models[0], torch.nn.Module):
+    elif is_torch_model(models[0]):
         framework = "torch"
     else:
         raise ValueError("unrecognized model format: {}".format(type(models[0])))
-    # multi-gpu handling
-    if torch.cuda.device_count() > 1:
-        if framework == "tf" and not isinstance(tf.distribute.get_strategy(), tf.distribute.MirroredStrategy):
-            tf.distribute.experimental_set_strategy(tf.distribute.MirroredStrategy())
-            models = to_list(model_fn())
-        if framework == "torch":
-            models = [torch.nn.DataParallel(model) for model in models]
+    # multi-gpu handling. Torch models are wrapped in a DataParallel by the TorchNetwork instead, since wrapping them
+    # here would initialize CUDA and prevent the Estimator from forking distributed replicas
+    if framework == "tf" and get_tf_strategy() is None and len(tf.config.list_physical_devices('GPU')) > 1:
+        tf.distribute.experimental_set_strategy(tf.distribute.MirroredStrategy())
+        models = to_list(model_fn())
     # mark models with its mixed_precision flag
     for model in models:
         model.mixed_precision = mixed_precision
@@ -916,7 +1168,7 @@ def _fe_compile(model: Model,
 
 
 def _build_optimizer(optimizer_fn: Union[str, Callable, None], model: Model,
-                     framework: str) -> Union[None, tf.optimizers.Optimizer, torch.optim.Optimizer]:
+                     framework: str) -> Union[None, 'tf.optimizers.Optimizer', 'torch.optim.Optimizer']:
     """A helper method to instantiate an optimizer.
 
     Args:
@@ -945,12 +1197,12 @@ def _optimizer_fn_from_string(name: str, framework: str) -> Callable:
         An optimizer instance corresponding to the given `name` and `framework`.
     """
     tf_optimizer_fn = {
-        'adadelta': tf.optimizers.Adadelta,
-        'adagrad': tf.optimizers.Adagrad,
-        'adam': tf.optimizers.Adam,
-        'adamax': tf.optimizers.Adamax,
-        'rmsprop': tf.optimizers.RMSprop,
-        'sgd': tf.optimizers.SGD
+        'adadelta': lambda: tf.optimizers.Adadelta(),
+        'adagrad': lambda: tf.optimizers.Adagrad(),
+        'adam': lambda: tf.optimizers.Adam(),
+        'adamax': lambda: tf.optimizers.Adamax(),
+        'rmsprop': lambda: tf.optimizers.RMSprop(),
+        'sgd': lambda: tf.optimizers.SGD()
     }
     pytorch_optimizer_fn = {
         'adadelta': lambda x: torch.optim.Adadelta(params=x),
@@ -968,7 +1220,7 @@ def _optimizer_fn_from_string(name: str, framework: str) -> Callable:
 
 
 def _optimizer_fn_to_optimizer(optimizer_fn: Union[Callable, None], model: Model,
-                               framework: str) -> Union[None, tf.optimizers.Optimizer, torch.optim.Optimizer]:
+                               framework: str) -> Union[None, 'tf.optimizers.Optimizer', 'torch.optim.Optimizer']:
     """A helper function to invoke an optimizer function.
 
     Args:
@@ -993,6 +1245,7 @@ def _optimizer_fn_to_optimizer(optimizer_fn: Union[Callable, None], model: Model
             optimizer._create_hypers()
             optimizer._create_slots(model.trainable_variables)
             # handle mixed precision loss scaling
+            from tensorflow.keras.mixed_precision import experimental as mixed_precision_tf
             if mixed_precision_tf.global_policy().name != "float32":
                 optimizer = mixed_precision_tf.LossScaleOptimizer(optimizer, loss_scale='dynamic')
             assert isinstance(optimizer, tf.optimizers.Optimizer), "optimizer_fn should generate tensorflow optimizer"
@@ -14,5 +14,6 @@
 # ==============================================================================
 from fastestimator.op.numpyop.meta.fuse import Fuse
 from fastestimator.op.numpyop.meta.one_of import OneOf
+from fastestimator.op.numpyop.meta.parallel import Parallel
 from fastestimator.op.numpyop.meta.repeat import Repeat
 from fastestimator.op.numpyop.meta.sometimes import Sometimes
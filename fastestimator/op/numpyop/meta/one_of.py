@@ -57,4 +57,6 @@ class OneOf(NumpyOp):
         Returns:
             The `data` after application of one of the available numpyOps.
         """
+        if 'rng' in state:
+            return self.ops[state['rng'].integers(len(self.ops))].forward(data, state)
         return random.choice(self.ops).forward(data, state)
@@ -0,0 +1,153 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Set, Union
+
+import numpy as np
+
+from fastestimator.op.numpyop.meta.fuse import Fuse
+from fastestimator.op.numpyop.numpyop import Delete, NumpyOp, forward_numpyop
+from fastestimator.op.op import get_inputs_by_op, write_outputs_by_op
+from fastestimator.util.traceability_util import traceable
+
+
+@traceable()
+class Parallel(Fuse):
+    """Run a collection of NumpyOps as a single Op, executing independent branches concurrently.
+
+    The data dependencies between the `ops` are resolved from their input and output keys. An op waits for every earlier
+    op which writes a key it reads or writes, as well as for every earlier op which reads a key it overwrites (or
+    deletes). Ops without any such relationship are dispatched to a thread pool so that they can run at the same time.
+    Since most image libraries (OpenCV, NumPy, etc.) release the GIL while they work, this is useful when each sample
+    carries several independent fields (ex. two views of an image, or an image and an unrelated signal), especially
+    when the Pipeline has few worker processes available. The results are identical to those of Fuse, except for random
+    ops: the relative order of calls into the global random number generators may differ between independent branches,
+    and when more than one thread is used each op draws from its own (reproducible) stream in state["rng"].
+
+    ```python
+    op = Parallel([ReadImage(inputs="x1", outputs="x1"), ReadImage(inputs="x2", outputs="x2"),
+                   Rotate(image_in="x1", limit=30), HorizontalFlip(image_in="x2")])
+    # The "x1" branch and the "x2" branch will run in separate threads.
+    ```
+
+    Args:
+        ops: A sequence of NumpyOps to run. They must all share the same mode. It also doesn't support scheduled ops at
+            the moment, though the Parallel itself may be scheduled.
+        num_threads: The maximum number of threads to use. If None, it will be the maximum number of ops which could run
+            simultaneously according to their dependencies.
+
+    Raises:
+        ValueError: If `ops` or `num_threads` are invalid.
+    """
+    def __init__(self, ops: Union[NumpyOp, List[NumpyOp]], num_threads: Optional[int] = None) -> None:
+        super().__init__(ops=ops)
+        if num_threads is not None and num_threads < 1:
+            raise ValueError(f"Parallel requires num_threads to be >= 1, but got {num_threads}")
+        self.dependencies = self._build_dependencies(self.ops)
+        self.dependents = [[idx for idx, deps in enumerate(self.dependencies) if parent in deps]
+                           for parent in range(len(self.ops))]
+        width = self._get_max_width(self.dependencies)
+        self.num_threads = min(num_threads, width) if num_threads else width
+        self._executor = None
+        self._executor_pid = None
+
+    @staticmethod
+    def _build_dependencies(ops: List[NumpyOp]) -> List[Set[int]]:
+        """Compute which earlier ops each of the `ops` must wait for.
+
+        Args:
+            ops: The ops to be analyzed, in their sequential order.
+
+        Returns:
+            A list containing, for each op, the set of indices of the ops which must complete before it can start.
+        """
+        dependencies = []
+        last_writer = {}  # key -> index of the most recent op to write (or delete) that key
+        readers = {}  # key -> indices of the ops which read that key since its most recent write
+        for idx, op in enumerate(ops):
+            writes = list(op.inputs) if isinstance(op, Delete) else list(op.outputs)
+            deps = {last_writer[key] for key in op.inputs if key in last_writer}
+            for key in writes:
+                if key in last_writer:
+                    deps.add(last_writer[key])
+                deps.update(readers.get(key, ()))
+            deps.discard(idx)
+            dependencies.append(deps)
+            for key in op.inputs:
+                readers.setdefault(key, set()).add(idx)
+            for key in writes:
+                last_writer[key] = idx
+                readers[key] = set()
+        return dependencies
+
+    @staticmethod
+    def _get_max_width(dependencies: List[Set[int]]) -> int:
+        """Estimate how many ops could run at the same time.
+
+        Args:
+            dependencies: The output of `_build_dependencies`.
+
+        Returns:
+            The size of the largest group of ops sharing the same depth within the dependency graph.
+        """
+        depths = []
+        for deps in dependencies:
+            depths.append(1 + max((depths[dep] for dep in deps), default=-1))
+        return int(max(np.bincount(depths))) if depths else 1
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        # Pipeline workers are forked, and a thread pool does not survive a fork, so each process builds its own
+        pid = os.getpid()
+        if self._executor is None or self._executor_pid != pid:
+            self._executor = ThreadPoolExecutor(max_workers=self.num_threads)
+            self._executor_pid = pid
+        return self._executor
+
+    def _run_op(self, idx: int, data: Dict[str, Any], state: Dict[str, Any]) -> None:
+        op = self.ops[idx]
+        op_data = op.forward(get_inputs_by_op(op, data), state)
+        if isinstance(op, Delete):
+            for key in op.inputs:
+                del data[key]
+        if op.outputs:
+            write_outputs_by_op(op, data, op_data)
+
+    def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
+        data = {key: elem for key, elem in zip(self.inputs, data)}
+        if self.num_threads == 1:
+            forward_numpyop(self.ops, data, state)
+            return [data[key] for key in self.outputs]
+        executor = self._get_executor()
+        states = [state] * len(self.ops)
+        if 'rng' in state:
+            # The branches would race to draw from a shared generator, so derive a separate one for each op up front
+            seeds = state['rng'].integers(2**63, size=len(self.ops)).tolist()
+            states = [{**state, 'rng': np.random.Generator(np.random.Philox(seed))} for seed in seeds]
+        remaining = [len(deps) for deps in self.dependencies]
+        running: Dict[Future, int] = {}
+        for idx, count in enumerate(remaining):
+            if count == 0:
+                running[executor.submit(self._run_op, idx, data, states[idx])] = idx
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx = running.pop(future)
+                future.result()  # Re-raise any exception from the worker thread
+                for child in self.dependents[idx]:
+                    remaining[child] -= 1
+                    if remaining[child] == 0:
+                        running[executor.submit(self._run_op, child, data, states[child])] = child
+        return [data[key] for key in self.outputs]
@@ -58,7 +58,7 @@ class Sometimes(NumpyOp):
         Returns:
             The original `data`, or the `data` after running it through the wrapped operator.
         """
-        if self.prob > np.random.uniform():
+        if self.prob > state.get('rng', np.random).uniform():
             data = data[:self.inp_idx]  # Cut off the unnecessary inputs
             if not self.op.in_list:
                 data = data[0]
@@ -12,17 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Callable, Dict, Iterable, List, MutableMapping, TypeVar, Union
+import time
+from typing import Any, Callable, Dict, Iterable, List, MutableMapping, MutableSequence, Optional, TypeVar, Union, \
+    TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 
 from fastestimator.op.op import Op, get_inputs_by_op, write_outputs_by_op
 from fastestimator.util.traceability_util import traceable
 from fastestimator.util.util import to_number
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor, np.ndarray)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor', np.ndarray)
 
 
 @traceable()
@@ -40,7 +44,9 @@ class NumpyOp(Op):
 
         Args:
             data: The arrays from the data dictionary corresponding to whatever keys this Op declares as its `inputs`.
-            state: Information about the current execution context, for example {"mode": "train"}.
+            state: Information about the current execution context, for example {"mode": "train"}. Within a Pipeline it
+                also contains an "rng" (a np.random.Generator dedicated to the current sample), which random ops should
+                draw from so that their results are reproducible.
 
         Returns:
             The `data` after applying whatever transform this Op is responsible for. It will be written into the data
@@ -95,6 +101,9 @@ class Delete(NumpyOp):
     def forward(self, data: Union[np.ndarray, List[np.ndarray]], state: Dict[str, Any]) -> None:
         pass
 
+    def forward_batch(self, data: Union[Tensor, List[Tensor]], state: Dict[str, Any]) -> None:
+        pass
+
 
 @traceable()
 class LambdaOp(NumpyOp):
@@ -121,17 +130,25 @@ class LambdaOp(NumpyOp):
         return self.fn(*data)
 
 
-def forward_numpyop(ops: List[NumpyOp], data: MutableMapping[str, Any], state: Dict[str, Any],
-                    batched: bool = False) -> None:
+def forward_numpyop(ops: List[NumpyOp],
+                    data: MutableMapping[str, Any],
+                    state: Dict[str, Any],
+                    batched: bool = False,
+                    op_times: Optional[MutableSequence[float]] = None) -> None:
     """Call the forward function for list of NumpyOps, and modify the data dictionary in place.
 
     Args:
         ops: A list of NumpyOps to execute.
         data: The data dictionary.
         state: Information about the current execution context, ex. {"mode": "train"}. Must contain at least the mode.
+            It may also contain an "rng" (a np.random.Generator) for the ops to draw random numbers from.
         batched: Whether the `data` is batched or not.
+        op_times: If provided, the time (in seconds) spent executing each of the `ops` will be added to the
+            corresponding entry of this sequence.
     """
-    for op in ops:
+    for idx, op in enumerate(ops):
+        if op_times is not None:
+            start = time.perf_counter()
         op_data = get_inputs_by_op(op, data)
         op_data = op.forward_batch(op_data, state) if batched else op.forward(op_data, state)
         if isinstance(op, Delete):
@@ -139,3 +156,5 @@ def forward_numpyop(ops: List[NumpyOp], data: MutableMapping[str, Any], state: D
                 del data[key]
         if op.outputs:
             write_outputs_by_op(op, data, op_data)
+        if op_times is not None:
+            op_times[idx] += time.perf_counter() - start
@@ -16,8 +16,9 @@ from typing import Any, Dict, Iterable, List, Union
 
 import numpy as np
 
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -43,3 +44,6 @@ class Binarize(NumpyOp):
 
     def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
         return [(dat >= self.threshold).astype(np.float32) for dat in data]
+
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        return [(to_number(dat) >= self.threshold).astype(np.float32) for dat in data]
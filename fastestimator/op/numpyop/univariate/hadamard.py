@@ -18,8 +18,9 @@ import numpy as np
 from scipy.linalg import hadamard
 
 from fastestimator.backend.gather import gather
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -64,3 +65,12 @@ class Hadamard(NumpyOp):
     def forward(self, data: List[Union[int, np.ndarray]], state: Dict[str, Any]) -> List[np.ndarray]:
         # TODO - also support one hot with smoothed labels?
         return [gather(tensor=self.labels, indices=np.array(inp)) for inp in data]
+
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        results = []
+        for inp in data:
+            inp = to_number(inp)
+            # Squeeze every dimension except for the batch dimension, matching what gather() does for each element
+            inp = np.reshape(inp, (inp.shape[0], ) + tuple(dim for dim in inp.shape[1:] if dim != 1))
+            results.append(np.take(self.labels, inp.astype('int64'), axis=0))
+        return results
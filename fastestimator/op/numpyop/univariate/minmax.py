@@ -16,8 +16,9 @@ from typing import Any, Dict, Iterable, List, Union
 
 import numpy as np
 
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -44,6 +45,17 @@ class Minmax(NumpyOp):
     def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
         return [self._apply_minmax(elem) for elem in data]
 
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        return [self._apply_batch_minmax(to_number(elem)) for elem in data]
+
+    def _apply_batch_minmax(self, data: np.ndarray) -> np.ndarray:
+        flat = np.reshape(data, (data.shape[0], -1))
+        shape = (data.shape[0], ) + (1, ) * (data.ndim - 1)
+        data_max = np.reshape(np.max(flat, axis=1), shape)
+        data_min = np.reshape(np.min(flat, axis=1), shape)
+        data = (data - data_min) / np.maximum(data_max - data_min, self.epsilon)
+        return data.astype(np.float32)
+
     def _apply_minmax(self, data: np.ndarray) -> np.ndarray:
         data_max = np.max(data)
         data_min = np.min(data)
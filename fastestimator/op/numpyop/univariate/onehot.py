@@ -16,8 +16,9 @@ from typing import Any, Dict, Iterable, List, Union
 
 import numpy as np
 
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -51,6 +52,20 @@ class Onehot(NumpyOp):
     def forward(self, data: List[Union[int, np.ndarray]], state: Dict[str, Any]) -> List[np.ndarray]:
         return [self._apply_onehot(elem) for elem in data]
 
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        return [self._apply_batch_onehot(to_number(elem)) for elem in data]
+
+    def _apply_batch_onehot(self, data: np.ndarray) -> np.ndarray:
+        assert "int" in str(data.dtype)
+        batch_size = data.shape[0]
+        assert data.size == batch_size, "data must have only one item"
+        class_index = np.reshape(data, (batch_size, ))
+        assert np.all(class_index < self.num_classes), "label value should be smaller than num_classes"
+        smoothing = self.label_smoothing / self.num_classes
+        output = np.full((batch_size, self.num_classes), fill_value=smoothing)
+        output[np.arange(batch_size), class_index] = 1.0 - self.label_smoothing + smoothing
+        return output
+
     def _apply_onehot(self, data: Union[int, np.ndarray]) -> np.ndarray:
         class_index = np.array(data)
         assert "int" in str(class_index.dtype)
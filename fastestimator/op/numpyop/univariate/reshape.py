@@ -16,8 +16,9 @@ from typing import Any, Dict, Iterable, List, Tuple, Union
 
 import numpy as np
 
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -44,6 +45,10 @@ class Reshape(NumpyOp):
     def forward(self, data: List[np.ndarray], state: Dict[str, Any]) -> List[np.ndarray]:
         return [self._apply_reshape(elem) for elem in data]
 
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        shape = (self.shape, ) if isinstance(self.shape, int) else tuple(self.shape)
+        return [np.reshape(to_number(elem), (elem.shape[0], ) + shape) for elem in data]
+
     def _apply_reshape(self, data):
         data = np.reshape(data, self.shape)
         return data
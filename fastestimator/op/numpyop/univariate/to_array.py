@@ -16,8 +16,9 @@ from typing import Any, Dict, Iterable, List, Optional, Union
 
 import numpy as np
 
-from fastestimator.op.numpyop.numpyop import NumpyOp
+from fastestimator.op.numpyop.numpyop import NumpyOp, Tensor
 from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import to_number
 
 
 @traceable()
@@ -44,5 +45,8 @@ class ToArray(NumpyOp):
     def forward(self, data: List[Any], state: Dict[str, Any]) -> List[np.ndarray]:
         return [self._apply_transform(elem) for elem in data]
 
+    def forward_batch(self, data: List[Tensor], state: Dict[str, Any]) -> List[np.ndarray]:
+        return [np.array(to_number(elem), dtype=self.dtype) for elem in data]
+
     def _apply_transform(self, data: Any) -> np.ndarray:
         return np.array(data, dtype=self.dtype)
@@ -12,6 +12,13 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+from fastestimator.op.tensorop.augmentation.affine import Affine
 from fastestimator.op.tensorop.augmentation.cutmix_batch import CutMixBatch
+from fastestimator.op.tensorop.augmentation.elastic_transform import ElasticTransform
+from fastestimator.op.tensorop.augmentation.grid_distortion import GridDistortion
+from fastestimator.op.tensorop.augmentation.hue_saturation_value import HueSaturationValue
 from fastestimator.op.tensorop.augmentation.mixup_batch import MixUpBatch
-
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation
+from fastestimator.op.tensorop.augmentation.random_resized_crop import RandomResizedCrop
+from fastestimator.op.tensorop.augmentation.rotate import Rotate
+from fastestimator.op.tensorop.augmentation.shift_scale_rotate import ShiftScaleRotate
@@ -0,0 +1,127 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Iterable, Optional, Tuple, TypeVar, Union, TYPE_CHECKING
+
+from fastestimator.backend.matmul import matmul
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation, Number, rotation_matrix, \
+    shear_matrix, to_range, uniform
+from fastestimator.util.traceability_util import traceable
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+@traceable()
+class Affine(MultiVariateAugmentation):
+    """Perform affine transformations on a batch of inputs, drawing new factors for every element of the batch.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.multivariate.Affine.
+
+    Args:
+        rotate: How much to rotate an image (in degrees). If a single value is given then images will be rotated by
+                a value sampled from the range [-n, n]. If a tuple (a, b) is given then each image will be rotated
+                by a value sampled from the range [a, b].
+        scale: How much to scale an image (in percentage). If a single value is given then all images will be scaled
+                by a value drawn from the range [1.0, n]. If a tuple (a,b) is given then each image will be scaled
+                based on a value drawn from the range [a,b].
+        shear: How much to shear an image (in degrees). If a single value is given then all images will be sheared
+                on X and Y by two values sampled from the range [-n, n]. If a tuple (a, b) is given then images will
+                be sheared on X and Y by two values randomly sampled from the range [a, b].
+        translate: How much to translate an image. If a single value is given then the translation extent will be
+                sampled from the range [0,n]. If a tuple (a,b) is given then the extent will be sampled from
+                the range [a,b]. If integers are given then the translation will be in pixels. If a float then
+                it will be as a fraction of the image size.
+        border_handling: What to do in order to fill newly created pixels. Options are 'constant', 'edge', and
+                'reflect'.
+        fill_value: What pixel value to insert when border_handling is 'constant'.
+        interpolation: What interpolation method to use for images. Options are 'nearest' and 'bilinear'. Masks always
+                use 'nearest'.
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        bbox_in: The key of a bounding box(es) to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        bbox_out: The key to write the modified bounding box(es) (defaults to `bbox_in` if None).
+        bbox_format: The format of the bounding boxes, either 'pascal_voc' (x1, y1, x2, y2) or 'coco' (x1, y1, w, h).
+            Any additional columns (such as class labels) are passed through unmodified.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 rotate: Union[Number, Tuple[Number, Number]] = 0,
+                 scale: Union[float, Tuple[float, float]] = 1.0,
+                 shear: Union[Number, Tuple[Number, Number]] = 0,
+                 translate: Union[Number, Tuple[Number, Number]] = 0,
+                 border_handling: str = "reflect",
+                 fill_value: Number = 0,
+                 interpolation: str = "bilinear",
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 bbox_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None,
+                 bbox_out: Optional[str] = None,
+                 bbox_format: str = 'pascal_voc'):
+        super().__init__(mode=mode,
+                         image_in=image_in,
+                         mask_in=mask_in,
+                         bbox_in=bbox_in,
+                         image_out=image_out,
+                         mask_out=mask_out,
+                         bbox_out=bbox_out,
+                         bbox_format=bbox_format,
+                         interpolation=interpolation,
+                         border_mode=border_handling,
+                         value=fill_value,
+                         mask_value=fill_value)
+        self.rotate = to_range(rotate)
+        self.scale = tuple(float(elem) for elem in scale) if isinstance(scale, (tuple, list)) else (1.0, float(scale))
+        self.shear = to_range(shear)
+        if isinstance(translate, (tuple, list)):
+            self.translate = (float(translate[0]), float(translate[1]))
+            self.translate_px = isinstance(translate[0], int)
+        else:
+            self.translate = (0.0, float(translate))
+            self.translate_px = isinstance(translate, int)
+
+    def get_transform(self,
+                      reference: Tensor,
+                      batch_size: Union[int, Tensor],
+                      height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        matrix = rotation_matrix(reference,
+                                 batch_size,
+                                 height,
+                                 width,
+                                 angle=uniform(reference, batch_size, *self.rotate),
+                                 scale=uniform(reference, batch_size, *self.scale),
+                                 dx=uniform(reference, batch_size, *self.translate),
+                                 dy=uniform(reference, batch_size, *self.translate),
+                                 shift_in_pixels=self.translate_px)
+        shear = shear_matrix(reference,
+                             batch_size,
+                             height,
+                             width,
+                             shear_x=uniform(reference, batch_size, *self.shear),
+                             shear_y=uniform(reference, batch_size, *self.shear))
+        return matmul(matrix, shear), height, width
@@ -14,10 +14,6 @@
 # ==============================================================================
 from typing import Any, Dict, Iterable, Optional, Tuple, TypeVar, Union
 
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
-
 from fastestimator.backend.cast import cast
 from fastestimator.backend.clip_by_value import clip_by_value
 from fastestimator.backend.get_image_dims import get_image_dims
@@ -26,8 +22,14 @@ from fastestimator.backend.roll import roll
 from fastestimator.backend.tensor_round import tensor_round
 from fastestimator.backend.tensor_sqrt import tensor_sqrt
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_tf_tensor
+
+tf = lazy_import('tensorflow')
+tfp = lazy_import('tensorflow_probability')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 class CutMixBatch(TensorOp):
@@ -62,7 +64,7 @@ class CutMixBatch(TensorOp):
         self.beta = None
         self.uniform = None
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         if framework == 'tf':
             self.beta = tfp.distributions.Beta(self.alpha, self.alpha)
             self.uniform = tfp.distributions.Uniform()
@@ -111,7 +113,7 @@ class CutMixBatch(TensorOp):
         cut_x = self.uniform.sample()
         cut_y = self.uniform.sample()
         bbox_x1, bbox_x2, bbox_y1, bbox_y2, width, height = self._get_patch_coordinates(data, cut_x, cut_y, lam=lam)
-        if tf.is_tensor(data):
+        if is_tf_tensor(data):
             patches = roll(data, shift=1, axis=0)[:, bbox_y1:bbox_y2,
                                                   bbox_x1:bbox_x2, :] - data[:, bbox_y1:bbox_y2, bbox_x1:bbox_x2, :]
             patches = tf.pad(patches, [[0, 0], [bbox_y1, height - bbox_y2], [bbox_x1, width - bbox_x2], [0, 0]],
@@ -0,0 +1,104 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import math
+from typing import Iterable, Optional, Tuple, TypeVar, Union
+
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation, Number, build_matrix, \
+    uniform
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import is_tf_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+F = lazy_import('torch.nn.functional')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+@traceable()
+class ElasticTransform(MultiVariateAugmentation):
+    """Elastically deform every element of a batch using its own random displacement field.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.multivariate.ElasticTransform. The random affine
+    component of the NumpyOp version (`alpha_affine`) is not included; combine with ShiftScaleRotate if it is needed.
+    Bounding boxes are not supported.
+
+    Args:
+        alpha: The magnitude of the displacement field (in pixels).
+        sigma: The standard deviation of the Gaussian filter used to smooth the displacement field.
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        interpolation: The interpolation to use for images. One of 'bilinear' or 'nearest'. Masks always use 'nearest'.
+        border_mode: How to fill newly created pixels. One of 'constant', 'edge', or 'reflect'.
+        value: Padding value for images if `border_mode` is 'constant'.
+        mask_value: Padding value for masks if `border_mode` is 'constant'.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 alpha: float = 34.0,
+                 sigma: float = 4.0,
+                 interpolation: str = 'bilinear',
+                 border_mode: str = 'reflect',
+                 value: Number = 0,
+                 mask_value: Number = 0,
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None):
+        super().__init__(mode=mode,
+                         image_in=image_in,
+                         mask_in=mask_in,
+                         image_out=image_out,
+                         mask_out=mask_out,
+                         interpolation=interpolation,
+                         border_mode=border_mode,
+                         value=value,
+                         mask_value=mask_value)
+        self.alpha = alpha
+        radius = max(1, int(math.ceil(3 * sigma)))
+        kernel = [math.exp(-0.5 * (x / sigma)**2) for x in range(-radius, radius + 1)]
+        self.kernel = [elem / sum(kernel) for elem in kernel]
+
+    def get_transform(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        return build_matrix(reference, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], batch_size), height, width
+
+    def get_displacement(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                         width: Union[int, Tensor]) -> Optional[Tensor]:
+        noise = uniform(reference, batch_size, -1.0, 1.0, shape=(height, width, 2))
+        size = len(self.kernel)
+        if is_tf_tensor(reference):
+            # Treat the x and y fields as two independent channels of a depthwise convolution
+            kernel = tf.constant(self.kernel, dtype=tf.float32)
+            kernel_x = tf.tile(tf.reshape(kernel, [1, size, 1, 1]), [1, 1, 2, 1])
+            kernel_y = tf.tile(tf.reshape(kernel, [size, 1, 1, 1]), [1, 1, 2, 1])
+            noise = tf.nn.depthwise_conv2d(noise, kernel_x, strides=[1, 1, 1, 1], padding='SAME')
+            noise = tf.nn.depthwise_conv2d(noise, kernel_y, strides=[1, 1, 1, 1], padding='SAME')
+        else:
+            kernel = torch.tensor(self.kernel, dtype=torch.float32, device=reference.device)
+            noise = noise.permute(0, 3, 1, 2)
+            noise = F.conv2d(noise, kernel.view(1, 1, 1, size).repeat(2, 1, 1, 1), padding=(0, size // 2), groups=2)
+            noise = F.conv2d(noise, kernel.view(1, 1, size, 1).repeat(2, 1, 1, 1), padding=(size // 2, 0), groups=2)
+            noise = noise.permute(0, 2, 3, 1)
+        return noise * self.alpha
@@ -0,0 +1,118 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Iterable, Optional, Tuple, TypeVar, Union
+
+from fastestimator.backend.clip_by_value import clip_by_value
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation, Number, build_matrix, \
+    to_float, to_range, uniform
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import is_tf_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+@traceable()
+class GridDistortion(MultiVariateAugmentation):
+    """Distort every element of a batch by independently stretching the cells of a regular grid.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.multivariate.GridDistortion. Bounding boxes are not
+    supported.
+
+    Args:
+        num_steps: Count of grid cells on each side.
+        distort_limit: Range from which to draw the stretch factor of each cell. If distort_limit is a single float, the
+            range will be (-distort_limit, distort_limit). The sampled value is added to 1.
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        interpolation: The interpolation to use for images. One of 'bilinear' or 'nearest'. Masks always use 'nearest'.
+        border_mode: How to fill newly created pixels. One of 'constant', 'edge', or 'reflect'.
+        value: Padding value for images if `border_mode` is 'constant'.
+        mask_value: Padding value for masks if `border_mode` is 'constant'.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 num_steps: int = 5,
+                 distort_limit: Union[float, Tuple[float, float]] = 0.3,
+                 interpolation: str = 'bilinear',
+                 border_mode: str = 'reflect',
+                 value: Number = 0,
+                 mask_value: Number = 0,
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None):
+        super().__init__(mode=mode,
+                         image_in=image_in,
+                         mask_in=mask_in,
+                         image_out=image_out,
+                         mask_out=mask_out,
+                         interpolation=interpolation,
+                         border_mode=border_mode,
+                         value=value,
+                         mask_value=mask_value)
+        self.num_steps = num_steps
+        self.distort_limit = to_range(distort_limit, bias=1.0)
+
+    def get_transform(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        return build_matrix(reference, [[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.0, 0.0, 1.0]], batch_size), height, width
+
+    def get_displacement(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                         width: Union[int, Tensor]) -> Optional[Tensor]:
+        dx = self._get_axis_displacement(reference, batch_size, width)
+        dy = self._get_axis_displacement(reference, batch_size, height)
+        if is_tf_tensor(reference):
+            shape = [batch_size, height, width]
+            return tf.stack([tf.broadcast_to(dx[:, None, :], shape), tf.broadcast_to(dy[:, :, None], shape)], axis=-1)
+        return torch.stack([dx[:, None, :].expand(-1, height, -1), dy[:, :, None].expand(-1, -1, width)], dim=-1)
+
+    def _get_axis_displacement(self, reference: Tensor, batch_size: Union[int, Tensor],
+                               size: Union[int, Tensor]) -> Tensor:
+        """Compute the piecewise-linear displacement along one image axis.
+
+        Args:
+            reference: A tensor used to infer the framework and device.
+            batch_size: The number of elements in the batch.
+            size: The length of the image axis.
+
+        Returns:
+            The displacement for every pixel along the axis, of shape (`batch_size`, `size`).
+        """
+        cell = to_float(size) / self.num_steps
+        stretch = uniform(reference, batch_size, *self.distort_limit, shape=(self.num_steps, ))
+        if is_tf_tensor(reference):
+            starts = tf.math.cumsum(stretch * cell, axis=1, exclusive=True)
+            coords = tf.range(to_float(size)) + 0.5
+            cells = tf.cast(clip_by_value(tf.floor(coords / cell), 0, self.num_steps - 1), tf.int32)
+            src = tf.gather(starts, cells, axis=1) + (coords - tf.cast(cells, tf.float32) * cell) * tf.gather(
+                stretch, cells, axis=1)
+        else:
+            starts = torch.cumsum(stretch * cell, dim=1) - stretch * cell
+            coords = torch.arange(size, dtype=torch.float32, device=reference.device) + 0.5
+            cells = clip_by_value(torch.floor(coords / cell), 0, self.num_steps - 1).long()
+            src = starts[:, cells] + (coords - cells.to(torch.float32) * cell) * stretch[:, cells]
+        return src - coords
@@ -0,0 +1,110 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import math
+from typing import Any, Dict, Iterable, List, Tuple, TypeVar, Union
+
+from fastestimator.backend.matmul import matmul
+from fastestimator.op.tensorop.augmentation.multivariate import Number, build_matrix, to_range, uniform
+from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import is_tf_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+_RGB_TO_YIQ = [[0.299, 0.587, 0.114], [0.596, -0.274, -0.322], [0.211, -0.523, 0.312]]
+_YIQ_TO_RGB = [[1.0, 0.956, 0.621], [1.0, -0.272, -0.647], [1.0, -1.106, 1.703]]
+
+
+@traceable()
+class HueSaturationValue(TensorOp):
+    """Randomly modify the hue, saturation and value of every RGB image in a batch.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.univariate.HueSaturationValue. The adjustment is
+    performed in YIQ space so that every image can be transformed by a single 3x3 color matrix: hue shifts rotate the
+    chroma plane, saturation scales the chroma, and value scales the whole pixel. Note that unlike the NumpyOp, the
+    saturation and value limits are therefore relative scale factors rather than additive shifts.
+
+    Args:
+        inputs: Key(s) of RGB images to be modified, channel-last for TensorFlow and channel-first for PyTorch.
+        outputs: Key(s) into which to write the modified images.
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        hue_shift_limit: Range for changing hue (in degrees). If hue_shift_limit is a single value, the range will be
+            (-hue_shift_limit, hue_shift_limit).
+        sat_shift_limit: Range for changing saturation. If sat_shift_limit is a single value, the range will be
+            (-sat_shift_limit, sat_shift_limit). The sampled value is added to 1 to produce a scale factor.
+        val_shift_limit: Range for changing value. If val_shift_limit is a single value, the range will be
+            (-val_shift_limit, val_shift_limit). The sampled value is added to 1 to produce a scale factor.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 inputs: Union[str, Iterable[str]],
+                 outputs: Union[str, Iterable[str]],
+                 mode: Union[None, str, Iterable[str]] = None,
+                 hue_shift_limit: Union[Number, Tuple[Number, Number]] = 20,
+                 sat_shift_limit: Union[float, Tuple[float, float]] = 0.3,
+                 val_shift_limit: Union[float, Tuple[float, float]] = 0.2):
+        super().__init__(inputs=inputs, outputs=outputs, mode=mode)
+        self.in_list, self.out_list = True, True
+        self.hue_shift_limit = to_range(hue_shift_limit)
+        self.sat_shift_limit = to_range(sat_shift_limit, bias=1.0)
+        self.val_shift_limit = to_range(val_shift_limit, bias=1.0)
+
+    def forward(self, data: List[Tensor], state: Dict[str, Any]) -> List[Tensor]:
+        reference = data[0]
+        batch_size = tf.shape(reference)[0] if is_tf_tensor(reference) else reference.shape[0]
+        radians = uniform(reference, batch_size, *self.hue_shift_limit) * math.pi / 180
+        saturation = uniform(reference, batch_size, *self.sat_shift_limit)
+        value = uniform(reference, batch_size, *self.val_shift_limit)
+        if is_tf_tensor(reference):
+            cos, sin = tf.cos(radians) * saturation, tf.sin(radians) * saturation
+        else:
+            cos, sin = torch.cos(radians) * saturation, torch.sin(radians) * saturation
+        adjust = build_matrix(reference,
+                              [[value, 0.0, 0.0], [0.0, cos * value, -sin * value], [0.0, sin * value, cos * value]],
+                              batch_size)
+        to_yiq = build_matrix(reference, _RGB_TO_YIQ, batch_size)
+        to_rgb = build_matrix(reference, _YIQ_TO_RGB, batch_size)
+        color_matrix = matmul(to_rgb, matmul(adjust, to_yiq))
+        return [self._apply(elem, color_matrix) for elem in data]
+
+    @staticmethod
+    def _apply(images: Tensor, color_matrix: Tensor) -> Tensor:
+        """Multiply every pixel of a batch of images by its corresponding color matrix.
+
+        Args:
+            images: The batch of RGB images.
+            color_matrix: A float32 tensor of shape (B, 3, 3).
+
+        Returns:
+            The transformed images, with the same dtype as `images`.
+        """
+        if is_tf_tensor(images):
+            result = tf.einsum('bij,bhwj->bhwi', color_matrix, tf.cast(images, tf.float32))
+            if images.dtype.is_floating:
+                return tf.cast(result, images.dtype)
+            return tf.saturate_cast(tf.round(result), images.dtype)
+        result = torch.einsum('bij,bjhw->bihw', color_matrix, images.to(torch.float32))
+        if images.dtype.is_floating_point:
+            return result.to(images.dtype)
+        info = torch.iinfo(images.dtype)
+        return result.round().clamp(info.min, info.max).to(images.dtype)
@@ -12,18 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
-
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.backend.maximum import maximum
 from fastestimator.backend.reshape import reshape
 from fastestimator.backend.roll import roll
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+tfp = lazy_import('tensorflow_probability')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 class MixUpBatch(TensorOp):
@@ -56,7 +59,7 @@ class MixUpBatch(TensorOp):
         self.shared_beta = shared_beta
         self.in_list, self.out_list = True, True
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         if framework == 'tf':
             self.beta = tfp.distributions.Beta(self.alpha, self.alpha)
         elif framework == 'torch':
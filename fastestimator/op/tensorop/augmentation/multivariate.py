@@ -0,0 +1,500 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import math
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, TypeVar, Union
+
+from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.traceability_util import traceable
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
+F = lazy_import('torch.nn.functional')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Number = Union[int, float]
+
+
+@traceable()
+class MultiVariateAugmentation(TensorOp):
+    """A base class for batched geometric augmentations which run inside the Network.
+
+    Every element of the batch draws its own random parameters, after which the whole batch is resampled by a single
+    grid-sample operation. Images, masks, and bounding boxes are all modified using the same random parameters. Images
+    are expected to be channel-last for TensorFlow (B, H, W, C) and channel-first for PyTorch (B, C, H, W). Masks follow
+    the same layout as the images, though they may also omit the channel dimension (B, H, W). Bounding boxes should be
+    padded to a common length (B, M, 4+), for example by using the `pad_value` argument of the Pipeline. Boxes with zero
+    area (such as padding rows) are passed through unmodified.
+
+    Derived classes must implement `get_transform`, and may implement `get_displacement` in order to apply non-linear
+    distortions.
+
+    Args:
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        bbox_in: The key of a bounding box(es) to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        bbox_out: The key to write the modified bounding box(es) (defaults to `bbox_in` if None).
+        bbox_format: The format of the bounding boxes, either 'pascal_voc' (x1, y1, x2, y2) or 'coco' (x1, y1, w, h).
+            Any additional columns (such as class labels) are passed through unmodified.
+        interpolation: The interpolation to use for images. One of 'bilinear' or 'nearest'. Masks always use 'nearest'.
+        border_mode: How to fill newly created pixels. One of 'constant', 'edge', or 'reflect'.
+        value: Padding value for images if `border_mode` is 'constant'.
+        mask_value: Padding value for masks if `border_mode` is 'constant'.
+
+    Raises:
+        AssertionError: If none of the various inputs such as `image_in` or `mask_in` are provided, or if the other
+            arguments are invalid.
+    """
+    def __init__(self,
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 bbox_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None,
+                 bbox_out: Optional[str] = None,
+                 bbox_format: str = 'pascal_voc',
+                 interpolation: str = 'bilinear',
+                 border_mode: str = 'reflect',
+                 value: Number = 0,
+                 mask_value: Number = 0):
+        assert any((image_in, mask_in, bbox_in)), "At least one input must be non-None"
+        assert bbox_format in ('pascal_voc', 'coco'), "bbox_format must be either 'pascal_voc' or 'coco'"
+        assert interpolation in ('bilinear', 'nearest'), "interpolation must be either 'bilinear' or 'nearest'"
+        assert border_mode in ('constant', 'edge', 'reflect'), "border_mode must be 'constant', 'edge', or 'reflect'"
+        keys = OrderedDict([("image", image_in), ("mask", mask_in), ("bboxes", bbox_in)])
+        self.keys_in = OrderedDict([(k, v) for k, v in keys.items() if v is not None])
+        keys = OrderedDict([("image", image_out or image_in), ("mask", mask_out or mask_in),
+                            ("bboxes", bbox_out or bbox_in)])
+        self.keys_out = OrderedDict([(k, v) for k, v in keys.items() if v is not None])
+        super().__init__(inputs=list(self.keys_in.values()), outputs=list(self.keys_out.values()), mode=mode)
+        self.in_list, self.out_list = True, True
+        self.bbox_format = bbox_format
+        self.interpolation = interpolation
+        self.border_mode = border_mode
+        self.value = value
+        self.mask_value = mask_value
+
+    def get_transform(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        """Draw the random affine transformation for every element of a batch.
+
+        Coordinates are continuous pixel coordinates, where pixel (i, j) covers [j, j+1) x [i, i+1).
+
+        Args:
+            reference: A tensor from the batch, used to infer the framework and device.
+            batch_size: The number of elements in the batch.
+            height: The height of the input images.
+            width: The width of the input images.
+
+        Returns:
+            (matrix, out_height, out_width) where `matrix` is a float32 tensor of shape (B, 3, 3) which maps input
+            coordinates to output coordinates.
+        """
+        raise NotImplementedError
+
+    def get_displacement(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                         width: Union[int, Tensor]) -> Optional[Tensor]:
+        """Draw an optional per-pixel displacement field, applied after the affine transform.
+
+        Args:
+            reference: A tensor from the batch, used to infer the framework and device.
+            batch_size: The number of elements in the batch.
+            height: The height of the output images.
+            width: The width of the output images.
+
+        Returns:
+            None, or a float32 tensor of shape (B, H, W, 2) containing (x, y) offsets to add to the sampling locations.
+        """
+        return None
+
+    def forward(self, data: List[Tensor], state: Dict[str, Any]) -> List[Tensor]:
+        reference = None
+        for key, elem in zip(self.keys_in.keys(), data):
+            if key != "bboxes":
+                reference = elem
+                break
+        assert reference is not None, "{} requires an image or a mask input".format(type(self).__name__)
+        batch_size, height, width = _get_dims(reference)
+        matrix, out_height, out_width = self.get_transform(reference, batch_size, height, width)
+        src_x, src_y = _get_sample_coordinates(reference, matrix, out_height, out_width)
+        displacement = self.get_displacement(reference, batch_size, out_height, out_width)
+        if displacement is not None:
+            src_x = src_x + displacement[..., 0]
+            src_y = src_y + displacement[..., 1]
+        results = []
+        for key, elem in zip(self.keys_in.keys(), data):
+            if key == "image":
+                elem = grid_sample(elem, src_x, src_y, self.interpolation, self.border_mode, self.value)
+            elif key == "mask":
+                elem = grid_sample(elem, src_x, src_y, 'nearest', self.border_mode, self.mask_value)
+            else:
+                assert displacement is None, "{} does not support bounding boxes".format(type(self).__name__)
+                elem = transform_bboxes(elem, matrix, out_height, out_width, self.bbox_format)
+            results.append(elem)
+        return results
+
+
+def to_range(limit: Union[Number, Tuple[Number, Number]], bias: Number = 0) -> Tuple[float, float]:
+    """Convert a symmetric `limit` or an explicit (low, high) tuple into a (low, high) range.
+
+    Args:
+        limit: Either a single value n, which becomes (`bias` - n, `bias` + n), or a tuple (a, b) which becomes
+            (`bias` + a, `bias` + b).
+        bias: An offset to add to the range.
+
+    Returns:
+        The (low, high) range.
+    """
+    if isinstance(limit, (tuple, list)):
+        low, high = limit
+    else:
+        low, high = -limit, limit
+    return float(bias + low), float(bias + high)
+
+
+def uniform(reference: Tensor,
+            batch_size: Union[int, Tensor],
+            low: Union[Number, Tensor],
+            high: Union[Number, Tensor],
+            shape: Sequence[Union[int, Tensor]] = ()) -> Tensor:
+    """Draw float32 samples for every batch element from a uniform distribution over [`low`, `high`).
+
+    Args:
+        reference: A tensor used to infer the framework and device.
+        batch_size: How many elements are in the batch.
+        low: The lower bound of the distribution.
+        high: The upper bound of the distribution.
+        shape: The shape of the samples to draw for each batch element.
+
+    Returns:
+        A tensor of shape (`batch_size`, *`shape`).
+    """
+    if is_tf_tensor(reference):
+        return tf.random.uniform([batch_size, *shape], dtype=tf.float32) * (high - low) + low
+    elif is_torch_tensor(reference):
+        return torch.rand(batch_size, *shape, dtype=torch.float32, device=reference.device) * (high - low) + low
+    else:
+        raise ValueError("Unrecognized tensor type {}".format(type(reference)))
+
+
+def build_matrix(reference: Tensor, rows: Sequence[Sequence[Union[Number, Tensor]]],
+                 batch_size: Union[int, Tensor]) -> Tensor:
+    """Assemble a batch of 3x3 matrices from per-element entries.
+
+    Args:
+        reference: A tensor used to infer the framework and device.
+        rows: A 3x3 nested sequence whose entries are either python numbers or tensors of shape (`batch_size`, ).
+        batch_size: The number of elements in the batch.
+
+    Returns:
+        A float32 tensor of shape (`batch_size`, 3, 3).
+    """
+    if is_tf_tensor(reference):
+        ones = tf.ones([batch_size], dtype=tf.float32)
+        entries = [[tf.cast(entry, tf.float32) * ones for entry in row] for row in rows]
+        return tf.stack([tf.stack(row, axis=-1) for row in entries], axis=-2)
+    else:
+        ones = torch.ones(batch_size, dtype=torch.float32, device=reference.device)
+        entries = [[entry * ones for entry in row] for row in rows]
+        return torch.stack([torch.stack(row, dim=-1) for row in entries], dim=-2)
+
+
+def rotation_matrix(reference: Tensor,
+                    batch_size: Union[int, Tensor],
+                    height: Union[int, Tensor],
+                    width: Union[int, Tensor],
+                    angle: Union[Number, Tensor],
+                    scale: Union[Number, Tensor] = 1.0,
+                    dx: Union[Number, Tensor] = 0.0,
+                    dy: Union[Number, Tensor] = 0.0,
+                    shift_in_pixels: bool = False) -> Tensor:
+    """Build rotation + scale + shift matrices about the image center (matching cv2.getRotationMatrix2D).
+
+    Args:
+        reference: A tensor used to infer the framework and device.
+        batch_size: The number of elements in the batch.
+        height: The height of the images.
+        width: The width of the images.
+        angle: The counter-clockwise rotation in degrees.
+        scale: The isotropic scale factor.
+        dx: Horizontal shift as a fraction of the image width.
+        dy: Vertical shift as a fraction of the image height.
+        shift_in_pixels: Whether `dx` and `dy` are given in pixels rather than as fractions of the image size.
+
+    Returns:
+        A float32 tensor of shape (`batch_size`, 3, 3).
+    """
+    cx, cy = to_float(width) / 2, to_float(height) / 2
+    if not shift_in_pixels:
+        dx, dy = dx * 2 * cx, dy * 2 * cy
+    radians = angle * math.pi / 180
+    alpha = _cos(radians) * scale
+    beta = _sin(radians) * scale
+    return build_matrix(reference,
+                        [[alpha, beta, (1 - alpha) * cx - beta * cy + dx],
+                         [-beta, alpha, beta * cx + (1 - alpha) * cy + dy], [0.0, 0.0, 1.0]],
+                        batch_size)
+
+
+def shear_matrix(reference: Tensor,
+                 batch_size: Union[int, Tensor],
+                 height: Union[int, Tensor],
+                 width: Union[int, Tensor],
+                 shear_x: Union[Number, Tensor],
+                 shear_y: Union[Number, Tensor]) -> Tensor:
+    """Build shear matrices about the image center.
+
+    Args:
+        reference: A tensor used to infer the framework and device.
+        batch_size: The number of elements in the batch.
+        height: The height of the images.
+        width: The width of the images.
+        shear_x: The shear angle along the x axis, in degrees.
+        shear_y: The shear angle along the y axis, in degrees.
+
+    Returns:
+        A float32 tensor of shape (`batch_size`, 3, 3).
+    """
+    cx, cy = to_float(width) / 2, to_float(height) / 2
+    shear_x = _sin(shear_x * math.pi / 180) / _cos(shear_x * math.pi / 180)
+    shear_y = _sin(shear_y * math.pi / 180) / _cos(shear_y * math.pi / 180)
+    return build_matrix(reference, [[1.0, shear_x, -shear_x * cy], [shear_y, 1.0, -shear_y * cx], [0.0, 0.0, 1.0]],
+                        batch_size)
+
+
+def grid_sample(tensor: Tensor,
+                src_x: Tensor,
+                src_y: Tensor,
+                interpolation: str = 'bilinear',
+                border_mode: str = 'constant',
+                value: Number = 0) -> Tensor:
+    """Resample a batch of images at the given continuous source coordinates.
+
+    Args:
+        tensor: Images of shape (B, H, W, C) for TensorFlow, (B, C, H, W) for PyTorch, or masks of shape (B, H, W).
+        src_x: The horizontal source coordinate for every output pixel, shape (B, H', W').
+        src_y: The vertical source coordinate for every output pixel, shape (B, H', W').
+        interpolation: One of 'bilinear' or 'nearest'.
+        border_mode: One of 'constant', 'edge', or 'reflect'.
+        value: The fill value to use when `border_mode` is 'constant'.
+
+    Returns:
+        The resampled tensor, of the same dtype as `tensor`, with spatial dimensions (H', W').
+    """
+    if is_tf_tensor(tensor):
+        squeeze = len(tensor.shape) == 3
+        result = tf.cast(tensor[..., None] if squeeze else tensor, tf.float32) - value
+        result = _grid_sample_tf(result, src_x, src_y, interpolation, border_mode) + value
+        if squeeze:
+            result = result[..., 0]
+        if tensor.dtype.is_floating:
+            return tf.cast(result, tensor.dtype)
+        return tf.saturate_cast(tf.round(result), tensor.dtype)
+    elif is_torch_tensor(tensor):
+        squeeze = tensor.ndim == 3
+        result = (tensor[:, None] if squeeze else tensor).to(torch.float32) - value
+        height, width = result.shape[-2:]
+        grid = torch.stack([2 * src_x / width - 1, 2 * src_y / height - 1], dim=-1)
+        padding_mode = {'constant': 'zeros', 'edge': 'border', 'reflect': 'reflection'}[border_mode]
+        result = F.grid_sample(result, grid, mode=interpolation, padding_mode=padding_mode, align_corners=False) + value
+        if squeeze:
+            result = result[:, 0]
+        if tensor.dtype.is_floating_point:
+            return result.to(tensor.dtype)
+        info = torch.iinfo(tensor.dtype)
+        return result.round().clamp(info.min, info.max).to(tensor.dtype)
+    else:
+        raise ValueError("Unrecognized tensor type {}".format(type(tensor)))
+
+
+def transform_bboxes(bboxes: Tensor, matrix: Tensor, height: Union[int, Tensor], width: Union[int, Tensor],
+                     bbox_format: str = 'pascal_voc') -> Tensor:
+    """Apply a batch of affine transforms to padded bounding boxes.
+
+    The transformed corners of each box are enclosed in a new axis-aligned box which is then clipped to the image.
+    Boxes with zero area (for example padding rows) are returned unmodified.
+
+    Args:
+        bboxes: A tensor of shape (B, M, 4+).
+        matrix: A float32 tensor of shape (B, 3, 3) mapping input coordinates to output coordinates.
+        height: The output image height.
+        width: The output image width.
+        bbox_format: Either 'pascal_voc' or 'coco'.
+
+    Returns:
+        The transformed bounding boxes, of the same shape and dtype as `bboxes`.
+    """
+    if is_tf_tensor(bboxes):
+        coords = tf.cast(bboxes[..., :4], tf.float32)
+        x1, y1, x2, y2 = tf.unstack(coords, axis=-1)
+    else:
+        coords = bboxes[..., :4].to(torch.float32)
+        x1, y1, x2, y2 = coords.unbind(dim=-1)
+    if bbox_format == 'coco':
+        x2, y2 = x1 + x2, y1 + y2
+    valid = (x2 > x1) & (y2 > y1)
+    corner_x = [x1, x2, x2, x1]
+    corner_y = [y1, y1, y2, y2]
+    m = [[matrix[:, row, col][:, None] for col in range(3)] for row in range(2)]
+    new_x = [m[0][0] * x + m[0][1] * y + m[0][2] for x, y in zip(corner_x, corner_y)]
+    new_y = [m[1][0] * x + m[1][1] * y + m[1][2] for x, y in zip(corner_x, corner_y)]
+    if is_tf_tensor(bboxes):
+        width, height = tf.cast(width, tf.float32), tf.cast(height, tf.float32)
+        nx1 = tf.clip_by_value(tf.reduce_min(tf.stack(new_x, axis=-1), axis=-1), 0, width)
+        nx2 = tf.clip_by_value(tf.reduce_max(tf.stack(new_x, axis=-1), axis=-1), 0, width)
+        ny1 = tf.clip_by_value(tf.reduce_min(tf.stack(new_y, axis=-1), axis=-1), 0, height)
+        ny2 = tf.clip_by_value(tf.reduce_max(tf.stack(new_y, axis=-1), axis=-1), 0, height)
+        if bbox_format == 'coco':
+            nx2, ny2 = nx2 - nx1, ny2 - ny1
+        new_coords = tf.where(valid[..., None], tf.stack([nx1, ny1, nx2, ny2], axis=-1), coords)
+        return tf.concat([tf.cast(new_coords, bboxes.dtype), bboxes[..., 4:]], axis=-1)
+    else:
+        nx1 = torch.stack(new_x, dim=-1).min(dim=-1)[0].clamp(0, width)
+        nx2 = torch.stack(new_x, dim=-1).max(dim=-1)[0].clamp(0, width)
+        ny1 = torch.stack(new_y, dim=-1).min(dim=-1)[0].clamp(0, height)
+        ny2 = torch.stack(new_y, dim=-1).max(dim=-1)[0].clamp(0, height)
+        if bbox_format == 'coco':
+            nx2, ny2 = nx2 - nx1, ny2 - ny1
+        new_coords = torch.where(valid[..., None], torch.stack([nx1, ny1, nx2, ny2], dim=-1), coords)
+        return torch.cat([new_coords.to(bboxes.dtype), bboxes[..., 4:]], dim=-1)
+
+
+def to_float(value: Union[Number, Tensor]) -> Union[float, Tensor]:
+    """Convert a python number or a scalar tensor (such as a dynamic image dimension) to float32.
+
+    Args:
+        value: The value to convert.
+
+    Returns:
+        The `value` as a python float or a float32 tensor.
+    """
+    if is_tf_tensor(value):
+        return tf.cast(value, tf.float32)
+    if is_torch_tensor(value):
+        return value.to(torch.float32)
+    return float(value)
+
+
+def _get_dims(tensor: Tensor) -> Tuple[Union[int, Tensor], Union[int, Tensor], Union[int, Tensor]]:
+    """Get the batch size, height, and width of an image or mask batch.
+
+    Args:
+        tensor: The image or mask batch.
+
+    Returns:
+        (batch_size, height, width). These may be scalar tensors for TensorFlow inputs with dynamic shapes.
+    """
+    if is_tf_tensor(tensor):
+        shape = tf.shape(tensor)
+        return shape[0], shape[1], shape[2]
+    if tensor.ndim == 3:
+        return tensor.shape[0], tensor.shape[1], tensor.shape[2]
+    return tensor.shape[0], tensor.shape[2], tensor.shape[3]
+
+
+def _get_sample_coordinates(reference: Tensor, matrix: Tensor, out_height: Union[int, Tensor],
+                            out_width: Union[int, Tensor]) -> Tuple[Tensor, Tensor]:
+    """Compute the continuous source coordinates for every output pixel.
+
+    Args:
+        reference: A tensor used to infer the framework and device.
+        matrix: A float32 tensor of shape (B, 3, 3) mapping input coordinates to output coordinates.
+        out_height: The output height.
+        out_width: The output width.
+
+    Returns:
+        (src_x, src_y), each of shape (B, `out_height`, `out_width`).
+    """
+    if is_tf_tensor(reference):
+        inverse = tf.linalg.inv(matrix)
+        xs = tf.range(tf.cast(out_width, tf.float32)) + 0.5
+        ys = tf.range(tf.cast(out_height, tf.float32)) + 0.5
+        grid_y, grid_x = tf.meshgrid(ys, xs, indexing='ij')
+    else:
+        inverse = torch.inverse(matrix)
+        xs = torch.arange(out_width, dtype=torch.float32, device=reference.device) + 0.5
+        ys = torch.arange(out_height, dtype=torch.float32, device=reference.device) + 0.5
+        grid_y, grid_x = torch.meshgrid(ys, xs)
+    m = [[inverse[:, row, col][:, None, None] for col in range(3)] for row in range(2)]
+    src_x = m[0][0] * grid_x[None] + m[0][1] * grid_y[None] + m[0][2]
+    src_y = m[1][0] * grid_x[None] + m[1][1] * grid_y[None] + m[1][2]
+    return src_x, src_y
+
+
+def _grid_sample_tf(images: 'tf.Tensor', src_x: 'tf.Tensor', src_y: 'tf.Tensor', interpolation: str,
+                    border_mode: str) -> 'tf.Tensor':
+    """Sample a float32 (B, H, W, C) image batch at continuous coordinates, treating out-of-bounds pixels as zero.
+
+    Args:
+        images: The images to sample from.
+        src_x: The horizontal source coordinates, shape (B, H', W').
+        src_y: The vertical source coordinates, shape (B, H', W').
+        interpolation: One of 'bilinear' or 'nearest'.
+        border_mode: One of 'constant', 'edge', or 'reflect'.
+
+    Returns:
+        The sampled images, shape (B, H', W', C).
+    """
+    shape = tf.shape(images)
+    height, width = tf.cast(shape[1], tf.float32), tf.cast(shape[2], tf.float32)
+    if border_mode == 'reflect':
+        src_x = width - tf.abs(tf.math.floormod(src_x, 2 * width) - width)
+        src_y = height - tf.abs(tf.math.floormod(src_y, 2 * height) - height)
+    # Convert from continuous coordinates to pixel indices
+    idx_x, idx_y = src_x - 0.5, src_y - 0.5
+    if border_mode != 'constant':
+        idx_x = tf.clip_by_value(idx_x, 0, width - 1)
+        idx_y = tf.clip_by_value(idx_y, 0, height - 1)
+    if interpolation == 'nearest':
+        corners = [(tf.floor(idx_x + 0.5), tf.floor(idx_y + 0.5), tf.ones_like(idx_x))]
+    else:
+        x0, y0 = tf.floor(idx_x), tf.floor(idx_y)
+        wx, wy = idx_x - x0, idx_y - y0
+        corners = [(x0, y0, (1 - wx) * (1 - wy)), (x0 + 1, y0, wx * (1 - wy)), (x0, y0 + 1, (1 - wx) * wy),
+                   (x0 + 1, y0 + 1, wx * wy)]
+    batch_idx = tf.broadcast_to(tf.range(shape[0])[:, None, None], tf.shape(idx_x))
+    result = 0.0
+    for corner_x, corner_y, weight in corners:
+        valid = (corner_x >= 0) & (corner_x <= width - 1) & (corner_y >= 0) & (corner_y <= height - 1)
+        weight = weight * tf.cast(valid, tf.float32)
+        corner_x = tf.cast(tf.clip_by_value(corner_x, 0, width - 1), tf.int32)
+        corner_y = tf.cast(tf.clip_by_value(corner_y, 0, height - 1), tf.int32)
+        values = tf.gather_nd(images, tf.stack([batch_idx, corner_y, corner_x], axis=-1))
+        result = result + values * weight[..., None]
+    return result
+
+
+def _cos(value: Union[Number, Tensor]) -> Union[float, Tensor]:
+    if is_tf_tensor(value):
+        return tf.cos(value)
+    if is_torch_tensor(value):
+        return torch.cos(value)
+    return math.cos(value)
+
+
+def _sin(value: Union[Number, Tensor]) -> Union[float, Tensor]:
+    if is_tf_tensor(value):
+        return tf.sin(value)
+    if is_torch_tensor(value):
+        return torch.sin(value)
+    return math.sin(value)
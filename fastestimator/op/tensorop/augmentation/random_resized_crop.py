@@ -0,0 +1,103 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import math
+from typing import Iterable, Optional, Tuple, TypeVar, Union, TYPE_CHECKING
+
+from fastestimator.backend.clip_by_value import clip_by_value
+from fastestimator.backend.exp import exp
+from fastestimator.backend.tensor_sqrt import tensor_sqrt
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation, build_matrix, to_float, \
+    uniform
+from fastestimator.util.traceability_util import traceable
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+@traceable()
+class RandomResizedCrop(MultiVariateAugmentation):
+    """Crop a random part of every element of a batch and rescale it to a fixed size.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.multivariate.RandomResizedCrop. Rather than
+    re-drawing crops which do not fit inside the image, the crop size is clipped to the image bounds.
+
+    Args:
+        height: Height after crop and resize.
+        width: Width after crop and resize.
+        scale: Range of size of the origin size cropped.
+        ratio: Range of aspect ratio of the origin aspect ratio cropped.
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        bbox_in: The key of a bounding box(es) to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        bbox_out: The key to write the modified bounding box(es) (defaults to `bbox_in` if None).
+        bbox_format: The format of the bounding boxes, either 'pascal_voc' (x1, y1, x2, y2) or 'coco' (x1, y1, w, h).
+            Any additional columns (such as class labels) are passed through unmodified.
+        interpolation: The interpolation to use for images. One of 'bilinear' or 'nearest'. Masks always use 'nearest'.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 height: int,
+                 width: int,
+                 scale: Tuple[float, float] = (0.08, 1.0),
+                 ratio: Tuple[float, float] = (0.75, 4 / 3),
+                 interpolation: str = 'bilinear',
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 bbox_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None,
+                 bbox_out: Optional[str] = None,
+                 bbox_format: str = 'pascal_voc'):
+        super().__init__(mode=mode,
+                         image_in=image_in,
+                         mask_in=mask_in,
+                         bbox_in=bbox_in,
+                         image_out=image_out,
+                         mask_out=mask_out,
+                         bbox_out=bbox_out,
+                         bbox_format=bbox_format,
+                         interpolation=interpolation,
+                         border_mode='edge')
+        self.height = height
+        self.width = width
+        self.scale = scale
+        self.log_ratio = (math.log(ratio[0]), math.log(ratio[1]))
+
+    def get_transform(self, reference: Tensor, batch_size: Union[int, Tensor], height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        height, width = to_float(height), to_float(width)
+        target_area = height * width * uniform(reference, batch_size, *self.scale)
+        aspect_ratio = exp(uniform(reference, batch_size, *self.log_ratio))
+        crop_width = clip_by_value(tensor_sqrt(target_area * aspect_ratio), min_value=1.0, max_value=width)
+        crop_height = clip_by_value(tensor_sqrt(target_area / aspect_ratio), min_value=1.0, max_value=height)
+        x1 = uniform(reference, batch_size, 0.0, 1.0) * (width - crop_width)
+        y1 = uniform(reference, batch_size, 0.0, 1.0) * (height - crop_height)
+        scale_x = self.width / crop_width
+        scale_y = self.height / crop_height
+        matrix = build_matrix(reference,
+                              [[scale_x, 0.0, -x1 * scale_x], [0.0, scale_y, -y1 * scale_y], [0.0, 0.0, 1.0]],
+                              batch_size)
+        return matrix, self.height, self.width
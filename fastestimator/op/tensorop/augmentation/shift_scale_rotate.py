@@ -0,0 +1,105 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+from typing import Iterable, Optional, Tuple, TypeVar, Union, TYPE_CHECKING
+
+from fastestimator.op.tensorop.augmentation.multivariate import MultiVariateAugmentation, Number, rotation_matrix, \
+    to_range, uniform
+from fastestimator.util.traceability_util import traceable
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+@traceable()
+class ShiftScaleRotate(MultiVariateAugmentation):
+    """Randomly translate, scale and rotate a batch of inputs, drawing new factors for every element of the batch.
+
+    This is the batched, in-Network counterpart of fe.op.numpyop.multivariate.ShiftScaleRotate.
+
+    Args:
+        shift_limit: Shift factor range for both height and width. If shift_limit is a single float value, the range
+            will be (-shift_limit, shift_limit). Absolute values for lower and upper bounds should lie in range [0, 1].
+        scale_limit: Scaling factor range. If scale_limit is a single float value, the range will be
+            (-scale_limit, scale_limit). The sampled value is added to 1 to produce the scale factor.
+        rotate_limit: Rotation range. If rotate_limit is a single int value, the range will be
+            (-rotate_limit, rotate_limit).
+        mode: What mode(s) to execute this Op in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        image_in: The key of an image to be modified.
+        mask_in: The key of a mask to be modified (with the same random factors as the image).
+        bbox_in: The key of a bounding box(es) to be modified (with the same random factors as the image).
+        image_out: The key to write the modified image (defaults to `image_in` if None).
+        mask_out: The key to write the modified mask (defaults to `mask_in` if None).
+        bbox_out: The key to write the modified bounding box(es) (defaults to `bbox_in` if None).
+        bbox_format: The format of the bounding boxes, either 'pascal_voc' (x1, y1, x2, y2) or 'coco' (x1, y1, w, h).
+            Any additional columns (such as class labels) are passed through unmodified.
+        interpolation: The interpolation to use for images. One of 'bilinear' or 'nearest'. Masks always use 'nearest'.
+        border_mode: How to fill newly created pixels. One of 'constant', 'edge', or 'reflect'.
+        value: Padding value for images if `border_mode` is 'constant'.
+        mask_value: Padding value for masks if `border_mode` is 'constant'.
+
+    Image types:
+        uint8, float16, float32
+    """
+    def __init__(self,
+                 shift_limit: Union[float, Tuple[float, float]] = 0.0625,
+                 scale_limit: Union[float, Tuple[float, float]] = 0.1,
+                 rotate_limit: Union[Number, Tuple[Number, Number]] = 45,
+                 interpolation: str = 'bilinear',
+                 border_mode: str = 'reflect',
+                 value: Number = 0,
+                 mask_value: Number = 0,
+                 mode: Union[None, str, Iterable[str]] = None,
+                 image_in: Optional[str] = None,
+                 mask_in: Optional[str] = None,
+                 bbox_in: Optional[str] = None,
+                 image_out: Optional[str] = None,
+                 mask_out: Optional[str] = None,
+                 bbox_out: Optional[str] = None,
+                 bbox_format: str = 'pascal_voc'):
+        super().__init__(mode=mode,
+                         image_in=image_in,
+                         mask_in=mask_in,
+                         bbox_in=bbox_in,
+                         image_out=image_out,
+                         mask_out=mask_out,
+                         bbox_out=bbox_out,
+                         bbox_format=bbox_format,
+                         interpolation=interpolation,
+                         border_mode=border_mode,
+                         value=value,
+                         mask_value=mask_value)
+        self.shift_limit = to_range(shift_limit)
+        self.scale_limit = to_range(scale_limit, bias=1.0)
+        self.rotate_limit = to_range(rotate_limit)
+
+    def get_transform(self,
+                      reference: Tensor,
+                      batch_size: Union[int, Tensor],
+                      height: Union[int, Tensor],
+                      width: Union[int, Tensor]) -> Tuple[Tensor, Union[int, Tensor], Union[int, Tensor]]:
+        matrix = rotation_matrix(reference,
+                                 batch_size,
+                                 height,
+                                 width,
+                                 angle=uniform(reference, batch_size, *self.rotate_limit),
+                                 scale=uniform(reference, batch_size, *self.scale_limit),
+                                 dx=uniform(reference, batch_size, *self.shift_limit),
+                                 dy=uniform(reference, batch_size, *self.shift_limit))
+        return matrix, height, width
@@ -12,18 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, Iterable, List, TypeVar, Union
-
-import tensorflow as tf
-import torch
+from typing import Any, Dict, Iterable, List, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.backend.gather_from_batch import gather_from_batch
 from fastestimator.backend.reduce_max import reduce_max
 from fastestimator.op.tensorop.tensorop import TensorOp
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import to_list
+from fastestimator.util.util import is_tf_tensor, is_torch_tensor, to_list
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 @traceable()
@@ -58,7 +59,7 @@ class Gather(TensorOp):
         results = []
         for idx, tensor in enumerate(inputs):
             # Check len(indices[0]) since an empty indices element is used to trigger the else
-            if tf.is_tensor(indices[0]) or isinstance(indices[0], torch.Tensor):
+            if is_tf_tensor(indices[0]) or is_torch_tensor(indices[0]):
                 elem_len = indices[0].shape[0]
             else:
                 elem_len = len(indices[0])
@@ -12,10 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
-
-import tensorflow as tf
-import torch
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.backend.clip_by_value import clip_by_value
 from fastestimator.backend.get_gradient import get_gradient
@@ -25,7 +22,11 @@ from fastestimator.backend.sign import sign
 from fastestimator.op.tensorop.tensorop import TensorOp
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 @traceable()
@@ -14,15 +14,16 @@
 # ==============================================================================
 from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
 
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.get_gradient import get_gradient
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import to_list
+from fastestimator.util.util import is_tf_model, is_torch_model, to_list
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 @traceable()
@@ -42,7 +43,7 @@ class GradientOp(TensorOp):
                  finals: Union[str, List[str]],
                  outputs: Union[str, List[str]],
                  inputs: Union[None, str, List[str]] = None,
-                 model: Union[None, tf.keras.Model, torch.nn.Module] = None,
+                 model: Union[None, 'tf.keras.Model', 'torch.nn.Module'] = None,
                  mode: Union[None, str, Iterable[str]] = None):
         inputs = to_list(inputs)
         finals = to_list(finals)
@@ -52,7 +53,7 @@ class GradientOp(TensorOp):
             assert len(inputs) == len(finals) == len(outputs), \
                 "GradientOp requires the same number of inputs, finals, and outputs"
         else:
-            assert isinstance(model, (tf.keras.Model, torch.nn.Module)), "Unrecognized model format"
+            assert is_tf_model(model) or is_torch_model(model), "Unrecognized model format"
             assert len(finals) == len(outputs), "GradientOp requires the same number of finals, and outputs"
         inputs.extend(finals)
         super().__init__(inputs=inputs, outputs=outputs, mode=mode)
@@ -74,8 +75,8 @@ class GradientOp(TensorOp):
                 results.append(get_gradient(final, initial, tape=state['tape'], retain_graph=retain_graph))
         else:
             finals = data
-            trainable_params = [p for p in self.model.parameters() if p.requires_grad] if isinstance(
-                self.model, torch.nn.Module) else self.model.trainable_variables
+            trainable_params = [p for p in self.model.parameters()
+                                if p.requires_grad] if is_torch_model(self.model) else self.model.trainable_variables
             for idx, final in enumerate(finals):
                 retain_graph = self.retain_graph or not idx == len(finals) - 1
                 results.append(get_gradient(final, trainable_params, tape=state['tape'], retain_graph=retain_graph))
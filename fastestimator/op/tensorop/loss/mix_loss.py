@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, List, TypeVar
-
-import tensorflow as tf
-import torch
+from typing import Any, Dict, List, TypeVar, TYPE_CHECKING
 
 import fastestimator as fe
 from fastestimator.backend.roll import roll
 from fastestimator.op.tensorop.loss.loss import LossOp
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 class MixLoss(LossOp):
@@ -15,9 +15,6 @@
 from math import e
 from typing import Any, Dict, List, Optional, TypeVar, Union
 
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.exp import exp
 from fastestimator.backend.lambertw import lambertw
 from fastestimator.backend.maximum import maximum
@@ -25,9 +22,13 @@ from fastestimator.backend.ones_like import ones_like
 from fastestimator.backend.pow import pow
 from fastestimator.backend.reduce_mean import reduce_mean
 from fastestimator.op.tensorop.loss.loss import LossOp
-from fastestimator.util.util import to_number
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import is_torch_tensor, to_number
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
 
-Tensor = TypeVar('Tensor', tf.Tensor, tf.Variable, torch.Tensor)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'tf.Variable', 'torch.Tensor')
 
 
 class SuperLoss(LossOp):
@@ -69,7 +70,7 @@ class SuperLoss(LossOp):
         self.initialized = {}
         self.tau = {}
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         self.loss.build(framework, device)
         if framework == 'tf':
             self.initialized = {'train': tf.Variable(False), 'eval': tf.Variable(False), 'test': tf.Variable(False),
@@ -101,8 +102,9 @@ class SuperLoss(LossOp):
     def forward(self, data: List[Tensor], state: Dict[str, Any]) -> Tensor:
         base_loss = self.loss.forward(data, state)
         tau = self._accumulate_tau(base_loss, state['mode'], state['warmup'])
-        beta = (base_loss - tau) / self.lam
-        # TODO The authors say to remove the gradients. Need to check whether this is necessary (speed or metrics)
+        # sigma is the closed-form minimizer of the super loss, so its gradient contribution is zero and it can be
+        # computed as a constant. This keeps the lambertw iterations out of the backward pass entirely.
+        beta = _stop_gradient(base_loss - tau) / self.lam
         ln_sigma = -lambertw(0.5 * maximum(self.cap, beta))
         super_loss = (base_loss - tau) * exp(ln_sigma) + self.lam * pow(ln_sigma, 2)
 
@@ -136,6 +138,21 @@ class SuperLoss(LossOp):
         return self.tau[mode]
 
 
+def _stop_gradient(value: Tensor) -> Tensor:
+    """Treat `value` as a constant during backpropagation.
+
+    Args:
+        value: The tensor to be detached from the gradient computation.
+
+    Returns:
+        A tensor with the same value as `value`, but through which no gradients will flow.
+    """
+    if is_torch_tensor(value):
+        return value.detach()
+    else:
+        return tf.stop_gradient(value)
+
+
 def _assign(variable: Tensor, value: Tensor) -> None:
     """In place assignment of `value` to a `variable`.
 
@@ -143,7 +160,7 @@ def _assign(variable: Tensor, value: Tensor) -> None:
         variable: The tensor to be modified.
         value: The new value to be inserted into the `variable`.
     """
-    if isinstance(variable, torch.Tensor):
+    if is_torch_tensor(variable):
         variable.copy_(value.detach())
     else:
         variable.assign(value)
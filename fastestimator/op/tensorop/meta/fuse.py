@@ -12,18 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, List, Optional, Set, TypeVar, Union
+from typing import Any, Dict, List, Optional, Set, TypeVar, Union, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
-
-from fastestimator.network import BaseNetwork
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
 from fastestimator.util.util import to_list
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+network = lazy_import('fastestimator.network')  # fastestimator.network imports this module while loading
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -63,7 +66,7 @@ class Fuse(TensorOp):
         super().__init__(inputs=inputs, outputs=outputs, mode=mode)
         self.ops = ops
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         for op in self.ops:
             op.build(framework, device)
 
@@ -81,5 +84,5 @@ class Fuse(TensorOp):
 
     def forward(self, data: List[Tensor], state: Dict[str, Any]) -> List[Tensor]:
         data = {key: elem for key, elem in zip(self.inputs, data)}
-        BaseNetwork._forward_batch(data, state, self.ops)
+        network.BaseNetwork._forward_batch(data, state, self.ops)
         return [data[key] for key in self.outputs]
@@ -14,16 +14,17 @@
 # ==============================================================================
 from typing import Any, Dict, List, Optional, Set, TypeVar, Union
 
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
-
 from fastestimator.backend.cast import cast
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+tf = lazy_import('tensorflow')
+tfp = lazy_import('tensorflow_probability')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -50,7 +51,7 @@ class OneOf(TensorOp):
         self.prob_fn = None
         self.invoke_fn = None
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         for op in self.ops:
             op.build(framework, device)
         if framework == 'tf':
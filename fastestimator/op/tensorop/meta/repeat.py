@@ -13,17 +13,20 @@
 # limitations under the License.
 # ==============================================================================
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple, TypeVar, Union, TYPE_CHECKING
 
-import tensorflow as tf
-import torch
-
-from fastestimator.network import BaseNetwork
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+if TYPE_CHECKING:
+    import torch
+
+network = lazy_import('fastestimator.network')  # fastestimator.network imports this module while loading
+tf = lazy_import('tensorflow')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -59,7 +62,7 @@ class Repeat(TensorOp):
     def op(self) -> TensorOp:
         return self.ops[0]
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         self.op.build(framework, device)
         if framework == 'tf':
             self.while_fn = self._tf_while
@@ -88,13 +91,13 @@ class Repeat(TensorOp):
         if isinstance(self.repeat, int):
             for i in range(self.repeat - 1):
                 # Perform n-1 rounds with all ops having retain_graph == True
-                BaseNetwork._forward_batch(data, state, self.ops)
+                network.BaseNetwork._forward_batch(data, state, self.ops)
             # Let retain be whatever it was meant to be for the final sequence
             self.op.fe_retain_graph(self.retain_graph)
             # Final round of ops
-            BaseNetwork._forward_batch(data, state, self.ops)
+            network.BaseNetwork._forward_batch(data, state, self.ops)
         else:
-            BaseNetwork._forward_batch(data, state, self.ops)
+            network.BaseNetwork._forward_batch(data, state, self.ops)
             data = self.while_fn(data, state)
             # TODO - Find some magic way to invoke this at the right moment
             self.op.fe_retain_graph(self.retain_graph)
@@ -111,7 +114,7 @@ class Repeat(TensorOp):
             A reference to the updated data dictionary.
         """
         while self.repeat(*[data[var_name] for var_name in self.repeat_inputs]):
-            BaseNetwork._forward_batch(data, state, self.ops)
+            network.BaseNetwork._forward_batch(data, state, self.ops)
         return data
 
     def _tf_while(self, data: Dict[str, Tensor], state: Dict[str, Any]) -> Dict[str, Tensor]:
@@ -159,5 +162,5 @@ class Repeat(TensorOp):
         Returns:
             The updated `cnd` values, along with the modified data and state dictionaries.
         """
-        BaseNetwork._forward_batch(data, state, self.ops)
+        network.BaseNetwork._forward_batch(data, state, self.ops)
         return [data[var_name] for var_name in self.repeat_inputs], data, state
@@ -12,17 +12,20 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, List, Optional, Set, TypeVar
-
-import tensorflow as tf
-import tensorflow_probability as tfp
-import torch
+from typing import Any, Dict, List, Optional, Set, TypeVar, TYPE_CHECKING
 
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+tfp = lazy_import('tensorflow_probability')
+torch = lazy_import('torch')
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -51,7 +54,7 @@ class Sometimes(TensorOp):
         self.prob = prob
         self.prob_fn = None
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         self.op.build(framework, device)
         if framework == 'tf':
             self.prob_fn = tfp.distributions.Uniform()
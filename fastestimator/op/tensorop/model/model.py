@@ -12,17 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, Iterable, List, Set, TypeVar, Union
-
-import tensorflow as tf
-import torch
+from typing import Any, Dict, Iterable, List, Set, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.backend.feed_forward import feed_forward
 from fastestimator.op.tensorop.tensorop import TensorOp
 from fastestimator.util.traceability_util import FeInputSpec, traceable
+from fastestimator.util.util import is_torch_model
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -39,7 +41,7 @@ class ModelOp(TensorOp):
         trainable: Indicates whether the model should have its weights tracked for update.
     """
     def __init__(self,
-                 model: Union[tf.keras.Model, torch.nn.Module],
+                 model: Union['tf.keras.Model', 'torch.nn.Module'],
                  inputs: Union[None, str, Iterable[str]] = None,
                  outputs: Union[None, str, Iterable[str]] = None,
                  mode: Union[None, str, Iterable[str]] = None,
@@ -55,7 +57,7 @@ class ModelOp(TensorOp):
 
     def forward(self, data: Union[Tensor, List[Tensor]], state: Dict[str, Any]) -> Union[Tensor, List[Tensor]]:
         training = state['mode'] == "train" and self.trainable
-        if isinstance(self.model, torch.nn.Module) and self.epoch_spec != state['epoch']:
+        if is_torch_model(self.model) and self.epoch_spec != state['epoch']:
             # Gather model input specs for the sake of TensorBoard and Traceability
             self.model.fe_input_spec = FeInputSpec(data, self.model)
             self.epoch_spec = state['epoch']
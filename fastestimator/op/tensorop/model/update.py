@@ -12,18 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Dict, Iterable, List, Optional, Set, TypeVar, Union
-
-import tensorflow as tf
-import torch
+from typing import Any, Dict, Iterable, List, Optional, Set, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.backend.update_model import update_model
 from fastestimator.op.tensorop.tensorop import TensorOp
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import to_set
+from fastestimator.util.util import is_tf_model, to_set
+
+if TYPE_CHECKING:
+    import torch
+
+tf = lazy_import('tensorflow')
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -42,14 +45,14 @@ class UpdateOp(TensorOp):
             never need to worry about this flag, but it's here for you if you need it.
     """
     def __init__(self,
-                 model: Union[tf.keras.Model, torch.nn.Module],
+                 model: Union['tf.keras.Model', 'torch.nn.Module'],
                  loss_name: str,
                  gradients: Optional[str] = None,
                  mode: Union[None, str, Iterable[str]] = "train",
                  defer: bool = False):
         self.model = model
         self.retain_graph = False
-        self.weight_decay = isinstance(self.model, tf.keras.Model) and self.model.losses
+        self.weight_decay = is_tf_model(self.model) and self.model.losses
         self.defer = defer
         self.gradients = gradients
         self.loss_name = loss_name
@@ -12,16 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TypeVar, Union
-
-import tensorflow as tf
-import torch
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, TypeVar, Union, TYPE_CHECKING
 
 from fastestimator.op.op import Op
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 @traceable()
@@ -45,7 +46,7 @@ class TensorOp(Op):
         """
         return data
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         """A method which will be invoked during Network instantiation.
 
         This method can be used to augment the natural __init__ method of the TensorOp once the desired backend
@@ -13,11 +13,9 @@
 # limitations under the License.
 # ==============================================================================
 import math
-from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union
+from typing import Any, Dict, Iterable, List, Optional, TypeVar, Union, TYPE_CHECKING
 
 import numpy as np
-import tensorflow as tf
-import torch
 from scipy.linalg import hadamard
 
 from fastestimator.backend.expand_dims import expand_dims
@@ -27,7 +25,11 @@ from fastestimator.backend.to_tensor import to_tensor
 from fastestimator.op.tensorop.tensorop import TensorOp
 from fastestimator.util.traceability_util import traceable
 
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
 
 
 @traceable()
@@ -62,7 +64,7 @@ class UnHadamard(TensorOp):
         self.labels = None
         self.eps = None
 
-    def build(self, framework: str, device: Optional[torch.device] = None) -> None:
+    def build(self, framework: str, device: Optional['torch.device'] = None) -> None:
         labels = hadamard(self.code_length).astype(np.float32)
         labels[np.arange(0, self.code_length, 2), 0] = -1  # Make first column alternate
         labels = labels[:self.n_classes]
@@ -18,23 +18,35 @@ import random
 import time
 import warnings
 from copy import deepcopy
-from typing import Any, Callable, Dict, List, MutableMapping, Optional, Set, TypeVar, Union
+from typing import Any, Callable, Dict, List, MutableMapping, Optional, Set, Tuple, TYPE_CHECKING, TypeVar, Union
 
+import cv2
 import numpy as np
-import tensorflow as tf
-from torch.utils.data import DataLoader, Dataset, RandomSampler
+import torch
+from torch.utils.data import DataLoader, Dataset, DistributedSampler, RandomSampler
 from torch.utils.data.dataloader import default_collate
 
 from fastestimator.dataset.batch_dataset import BatchDataset
 from fastestimator.dataset.op_dataset import OpDataset
-from fastestimator.op.numpyop.meta.one_of import OneOf
-from fastestimator.op.numpyop.meta.sometimes import Sometimes
 from fastestimator.op.numpyop.numpyop import NumpyOp, forward_numpyop
 from fastestimator.schedule.schedule import Scheduler, get_current_items
+from fastestimator.util.distributed import get_rank, get_world_size
+from fastestimator.util.random_util import LOADER_STREAM, get_base_seed, get_stream_seed
 from fastestimator.util.traceability_util import traceable
-from fastestimator.util.util import pad_batch, to_list, to_set
+from fastestimator.util.util import is_tf_dataset, pad_collate, to_list, to_set
 
-DataSource = TypeVar('DataSource', Dataset, DataLoader, tf.data.Dataset)
+if TYPE_CHECKING:
+    import tensorflow as tf
+
+DataSource = TypeVar('DataSource', Dataset, DataLoader, 'tf.data.Dataset')
+
+# Fix known bugs with libraries which use multi-processing in a way which conflicts with pytorch data loader
+cv2.setNumThreads(0)
+try:
+    import SimpleITK as sitk
+    sitk.ProcessObject.SetGlobalDefaultNumberOfThreads(1)
+except ModuleNotFoundError:
+    pass
 
 
 @traceable()
@@ -56,6 +68,10 @@ class Pipeline:
         pad_value: The padding value if batch padding is needed. None indicates that no padding is needed. NOTE: This
             argument is only applicable when using a FastEstimator Dataset.
         collate_fn: Function to merge data into one batch with input being list of elements.
+        pad_multiple: Round padded shapes up to multiples of this value in order to limit how many distinct batch shapes
+            the network sees (and therefore how often it has to be retraced). Either an int applied to every dimension,
+            or a dictionary mapping keys to an int or a per-dimension tuple (use None for dimensions which should not be
+            rounded). Only used when `pad_value` is not None and `collate_fn` is None.
     """
     ops: List[Union[NumpyOp, Scheduler[NumpyOp]]]
 
@@ -68,7 +84,8 @@ class Pipeline:
                  num_process: Optional[int] = None,
                  drop_last: bool = False,
                  pad_value: Optional[Union[int, float]] = None,
-                 collate_fn: Optional[Callable] = None):
+                 collate_fn: Optional[Callable] = None,
+                 pad_multiple: Union[None, int, Dict[str, Union[int, Tuple[Optional[int], ...]]]] = None):
         self.data = {x: y for (x, y) in zip(["train", "eval", "test"], [train_data, eval_data, test_data]) if y}
         self.batch_size = batch_size
         self.ops = to_list(ops)
@@ -81,6 +98,8 @@ class Pipeline:
         self.drop_last = drop_last
         self.pad_value = pad_value
         self.collate_fn = collate_fn
+        self.pad_multiple = pad_multiple
+        self.op_profiles = {}  # The OpProfile of the most recent loader for each mode
         self._verify_inputs(**{k: v for k, v in locals().items() if k != 'self'})
 
     def _verify_inputs(self, **kwargs) -> None:
@@ -130,7 +149,7 @@ class Pipeline:
             # num_process check
             assert isinstance(self.num_process, int), "number of processes must be an integer"
             return True
-        elif isinstance(dataset, (DataLoader, tf.data.Dataset)):
+        elif isinstance(dataset, DataLoader) or is_tf_dataset(dataset):
             if kwargs['batch_size'] is not None:
                 warnings.warn("batch_size will only be used for built-in dataset")
             if kwargs['ops'] is not None:
@@ -177,7 +196,7 @@ class Pipeline:
             detailed: Whether to display the detailed time used by each operator.
         """
         loader = self.get_loader(mode=mode, epoch=epoch)
-        if isinstance(loader, tf.data.Dataset):
+        if is_tf_dataset(loader):
             loader = loader.take(num_steps)
         start = time.perf_counter()
         for idx, _ in enumerate(loader, start=1):
@@ -188,52 +207,15 @@ class Pipeline:
                 start = time.perf_counter()
             if idx == num_steps:
                 break
-        # Pipeline Operations Benchmarking when using FEDataset
+        # Pipeline Operations Benchmarking when using FEDataset. The op timings are collected by the data loader
+        # workers themselves, so they reflect the real (concurrent) execution of the ops
         if isinstance(loader, DataLoader) and isinstance(loader.dataset, OpDataset) and detailed:
             op_list = loader.dataset.ops
-            duration_list = np.zeros(shape=(len(op_list)))
-
-            data_len = len(loader.dataset.dataset)
-            if self.batch_size:
-                batch_size = self.batch_size.get_current_value(epoch) if isinstance(self.batch_size,
-                                                                                    Scheduler) else self.batch_size
-                batch_size = batch_size[mode] if isinstance(batch_size, dict) else batch_size
-                log_interval = log_interval * batch_size
+            duration_list, _, _ = loader.dataset.profile.get_stats()
+            total_time = max(np.sum(duration_list), 1e-12)
+            op_names = ["Op"] + loader.dataset.profile.op_names
 
             print("\nBreakdown of time taken by Pipeline Operations ({} epoch {})".format(mode, epoch))
-            for _ in range(log_interval):
-                index = np.random.randint(data_len)
-                items = deepcopy(loader.dataset.dataset[index])
-                if isinstance(loader.dataset.dataset, BatchDataset):
-                    # BatchDataset may randomly sample the same elements multiple times, so need to avoid reprocessing
-                    unique_samples = set()
-                    for item in items:
-                        if id(item) not in unique_samples:
-                            for i, op in enumerate(op_list):
-                                start = time.perf_counter()
-                                forward_numpyop([op], item, {'mode': loader.dataset.mode})
-                                duration = time.perf_counter() - start
-                                duration_list[i] += duration
-                            unique_samples.add(id(item))
-                else:
-                    for i, op in enumerate(op_list):
-                        start = time.perf_counter()
-                        forward_numpyop([op], items, {'mode': loader.dataset.mode})
-                        duration = time.perf_counter() - start
-                        duration_list[i] += duration
-
-            total_time = np.sum(duration_list)
-            op_names = ["Op"]
-
-            for op in op_list:
-                if isinstance(op, Sometimes) and op.op:
-                    op_names.append(op.__class__.__name__ + " (" + op.op.__class__.__name__ + ")")
-                elif isinstance(op, OneOf) and op.ops:
-                    op_names.append(op.__class__.__name__ + " (" +
-                                    ", ".join([sub_op.__class__.__name__ for sub_op in op.ops]) + ")")
-                else:
-                    op_names.append(op.__class__.__name__)
-
             max_op_len = max(len(op_name) for op_name in op_names)
             max_in_len = max([len(", ".join(op.inputs)) for op in op_list] + [len("Inputs")])
             max_out_len = max([len(", ".join(op.outputs)) for op in op_list] + [len("Outputs")])
@@ -311,7 +293,7 @@ class Pipeline:
         """
         results = []
         loader = self.get_loader(mode=mode, epoch=epoch, shuffle=shuffle)
-        if isinstance(loader, tf.data.Dataset):
+        if is_tf_dataset(loader):
             loader = loader.take(num_steps)
         for idx, batch in enumerate(loader, start=1):
             results.append(batch)
@@ -322,9 +304,14 @@ class Pipeline:
         return results
 
     def get_loader(self, mode: str, epoch: int = 1,
-                   shuffle: Optional[bool] = None) -> Union[DataLoader, tf.data.Dataset]:
+                   shuffle: Optional[bool] = None) -> Union[DataLoader, 'tf.data.Dataset']:
         """Get a data loader from the Pipeline for a given `mode` and `epoch`.
 
+        When training is distributed across several processes, each process's loader only covers its own shard of the
+        data. With torch DistributedDataParallel the batch size is per process. With a TF MultiWorkerMirroredStrategy
+        the batch size remains global, since TF splits every batch between all of the replicas in the cluster.
+        tf.data.Datasets are not sharded here (TF shards them itself under a MultiWorkerMirroredStrategy).
+
         Args:
             mode: The execution mode for the loader. This can be 'train', 'eval' or 'test'.
             epoch: The epoch index for the loader. Note that epoch indices are 1-indexed.
@@ -347,6 +334,7 @@ class Pipeline:
             # batch dataset
             if isinstance(data, BatchDataset):
                 data.pad_value = self.pad_value
+                data.pad_multiple = self.pad_multiple
             # shuffle
             if shuffle is None:
                 shuffle = mode == "train" and batch_size is not None
@@ -354,16 +342,33 @@ class Pipeline:
             collate_fn = self.collate_fn
             if collate_fn is None and self.pad_value is not None:
                 collate_fn = self._pad_batch_collate
-            op_dataset = OpDataset(data, get_current_items(self.ops, mode, epoch), mode)
+            # Every sample draws its randomness from its own stream, keyed by epoch and index, so the results don't
+            # depend on how many workers are used (and an epoch can be reproduced after restoring a training)
+            seed = get_base_seed()
+            op_dataset = OpDataset(data, get_current_items(self.ops, mode, epoch), mode, seed=seed, epoch=epoch)
+            self.op_profiles[mode] = op_dataset.profile
             batch_size = None if isinstance(data, BatchDataset) else batch_size
+            generator = torch.Generator()
+            generator.manual_seed(get_stream_seed(seed, LOADER_STREAM, epoch))
+            sampler = None
+            if isinstance(data, BatchDataset) and shuffle:
+                sampler = RandomSampler(op_dataset, generator=generator)
+            if get_world_size() > 1:
+                # Every process / worker loads its own 1/world_size of the data
+                sampler = DistributedSampler(op_dataset,
+                                             num_replicas=get_world_size(),
+                                             rank=get_rank(),
+                                             shuffle=shuffle)
+                sampler.set_epoch(epoch)
             data = DataLoader(op_dataset,
                               batch_size=batch_size,
-                              shuffle=False if isinstance(data, BatchDataset) else shuffle,
-                              sampler=RandomSampler(op_dataset) if isinstance(data, BatchDataset) and shuffle else None,
+                              shuffle=False if isinstance(data, BatchDataset) or sampler is not None else shuffle,
+                              sampler=sampler,
                               num_workers=self.num_process,
                               drop_last=False if batch_size is None else self.drop_last,
                               worker_init_fn=lambda _: np.random.seed(random.randint(0, 2**32 - 1)),
-                              collate_fn=collate_fn)
+                              collate_fn=collate_fn,
+                              generator=generator)
         return data
 
     def _pad_batch_collate(self, batch: List[MutableMapping[str, Any]]) -> Dict[str, Any]:
@@ -375,5 +380,8 @@ class Pipeline:
         Returns:
             A padded and collated batch of data.
         """
-        pad_batch(batch, self.pad_value)
-        return default_collate(batch)
+        batch = pad_collate(batch, self.pad_value, self.pad_multiple)
+        return {
+            key: torch.from_numpy(value) if isinstance(value, np.ndarray) else default_collate(value)
+            for key, value in batch.items()
+        }
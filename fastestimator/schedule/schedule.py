@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import math
+from functools import reduce
 from typing import Any, Dict, Generic, Iterable, List, Optional, TypeVar, Union
 
 from fastestimator.util.traceability_util import traceable
@@ -43,6 +45,25 @@ class Scheduler(Generic[T]):
         """
         raise NotImplementedError
 
+    def get_change_epochs(self) -> Optional[List[int]]:
+        """Get the epochs at which the `Scheduler` may begin a new segment of its schedule.
+
+        Within a segment the value of the `Scheduler` is periodic with a period given by `get_period()`. Schedulers
+        which cannot describe themselves in this way should return None, in which case every epoch will be inspected.
+
+        Returns:
+            A sorted list of segment start epochs, or None if the change points of this `Scheduler` are unknown.
+        """
+        return None
+
+    def get_period(self) -> int:
+        """Get the period with which the `Scheduler` value repeats within a segment (see `get_change_epochs()`).
+
+        Returns:
+            The number of epochs after which the value of the `Scheduler` repeats within a segment.
+        """
+        return 1
+
 
 @traceable()
 class RepeatScheduler(Scheduler[T]):
@@ -80,6 +101,12 @@ class RepeatScheduler(Scheduler[T]):
     def get_all_values(self) -> List[Optional[T]]:
         return self.repeat_list
 
+    def get_change_epochs(self) -> Optional[List[int]]:
+        return [1]
+
+    def get_period(self) -> int:
+        return self.cycle_length
+
     def __getstate__(self) -> Dict[str, List[Dict[Any, Any]]]:
         return {
             'repeat_list': [elem.__getstate__() if hasattr(elem, '__getstate__') else {} for elem in self.repeat_list]
@@ -133,6 +160,9 @@ class EpochScheduler(Scheduler[T]):
     def get_all_values(self) -> List[Optional[T]]:
         return list(self.epoch_dict.values())
 
+    def get_change_epochs(self) -> Optional[List[int]]:
+        return self.keys
+
     def _get_last_key(self, epoch: int) -> Union[int, None]:
         """Find the nearest prior key to the given epoch.
 
@@ -160,6 +190,10 @@ class EpochScheduler(Scheduler[T]):
 def get_signature_epochs(items: List[Any], total_epochs: int, mode: Optional[str] = None) -> List[int]:
     """Find all epochs of changes due to schedulers.
 
+    Rather than evaluating every epoch, this method only inspects the candidate epochs implied by the change points of
+    the given schedulers (see `Scheduler.get_change_epochs()` and `Scheduler.get_period()`). Every other epoch is
+    guaranteed to share its configuration with an earlier candidate epoch.
+
     Args:
         items: List of items to scan from.
         total_epochs: The maximum epoch number to consider when searching for signature epochs.
@@ -168,16 +202,57 @@ def get_signature_epochs(items: List[Any], total_epochs: int, mode: Optional[str
     Returns:
         The epoch numbers of changes.
     """
-    unique_configs = []
+    unique_configs = set()
+    unhashable_configs = []
     signature_epochs = []
-    for epoch in range(1, total_epochs + 1):
+    for epoch in _get_candidate_epochs(items, total_epochs):
         epoch_config = get_current_items(items, run_modes=mode, epoch=epoch)
-        if epoch_config not in unique_configs:
-            unique_configs.append(epoch_config)
-            signature_epochs.append(epoch)
+        try:
+            config_key = tuple(epoch_config)
+            if config_key in unique_configs:
+                continue
+            unique_configs.add(config_key)
+        except TypeError:
+            # Some scheduled values (dicts of batch sizes, for example) are not hashable
+            if epoch_config in unhashable_configs:
+                continue
+            unhashable_configs.append(epoch_config)
+        signature_epochs.append(epoch)
     return signature_epochs
 
 
+def _get_candidate_epochs(items: Iterable[Any], total_epochs: int) -> List[int]:
+    """Find a superset of the signature epochs for a collection of `items`.
+
+    The schedule is split into segments at the union of all scheduler change epochs. Within each segment the combined
+    configuration repeats with a period equal to the least common multiple of the scheduler periods, so only the first
+    period of each segment needs to be considered.
+
+    Args:
+        items: List of items to scan from.
+        total_epochs: The maximum epoch number to consider.
+
+    Returns:
+        A sorted list of the epochs which must be inspected.
+    """
+    schedulers = [item for item in items if isinstance(item, Scheduler)]
+    change_epochs = {1}
+    periods = set()
+    for scheduler in schedulers:
+        scheduler_changes = scheduler.get_change_epochs()
+        if scheduler_changes is None:
+            return list(range(1, total_epochs + 1))
+        change_epochs.update(epoch for epoch in scheduler_changes if epoch <= total_epochs)
+        periods.add(scheduler.get_period())
+    period = reduce(lambda a, b: a * b // math.gcd(a, b), periods, 1)
+    segment_starts = sorted(change_epochs)
+    segment_ends = segment_starts[1:] + [total_epochs + 1]
+    candidates = []
+    for start, end in zip(segment_starts, segment_ends):
+        candidates.extend(range(start, min(start + period, end)))
+    return candidates
+
+
 def get_current_items(items: Iterable[Union[T, Scheduler[T]]],
                       run_modes: Optional[Union[str, Iterable[str]]] = None,
                       epoch: Optional[int] = None) -> List[T]:
@@ -12,6 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from fastestimator.summary import logs
-from fastestimator.summary.summary import Summary
-from fastestimator.summary.system import System
+from fastestimator.util.lazy_util import make_lazy
+
+make_lazy(__name__, {
+    "logs": "fastestimator.summary.logs",
+    "Summary": "fastestimator.summary.summary",
+    "System": "fastestimator.summary.system",
+})
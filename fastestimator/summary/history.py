@@ -0,0 +1,343 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import random
+from typing import Any, Dict, Iterator, List, MutableMapping, Optional, Tuple
+
+import numpy as np
+
+RETENTION_POLICIES = ('downsample', 'reservoir')
+
+
+class MetricHistory(MutableMapping[int, Any]):
+    """An array-backed {step: value} mapping which records the history of a single metric.
+
+    Numeric scalar values are stored in a numpy array rather than as individual python objects. Values which are
+    recorded as `pinned` (for example, epoch-level metrics) are always kept. If `max_steps` is specified, then at most
+    that many un-pinned (step-level) values are kept, using one of two retention policies:
+
+    * 'downsample': Keep evenly spaced values. Every time the limit is exceeded, every other step-level value is
+        discarded and the spacing between newly accepted values is doubled.
+    * 'reservoir': Keep a uniform random sample of all of the step-level values which have been recorded.
+
+    ```python
+    history = MetricHistory(max_steps=100)
+    for step in range(1, 10001):
+        history[step] = 1.0 / step
+    history.record(10000, 0.0001, pinned=True)
+    len(history)  # <= 101
+    ```
+
+    This class is intentionally not @traceable.
+
+    Args:
+        max_steps: The maximum number of step-level values to retain, or None to retain everything.
+        retention: The retention policy to use once `max_steps` is exceeded. One of 'downsample' or 'reservoir'.
+
+    Raises:
+        ValueError: If `max_steps` or `retention` are invalid.
+    """
+    def __init__(self, max_steps: Optional[int] = None, retention: str = 'downsample') -> None:
+        if max_steps is not None and max_steps < 1:
+            raise ValueError(f"max_steps must be None or a positive integer, but got {max_steps}")
+        if retention not in RETENTION_POLICIES:
+            raise ValueError(f"retention must be one of {RETENTION_POLICIES}, but got {retention}")
+        self.max_steps = max_steps
+        self.retention = retention
+        self._size = 0
+        self._steps = np.empty(16, dtype=np.int64)
+        self._values = None  # type: Optional[np.ndarray]
+        self._pinned = np.zeros(16, dtype=bool)
+        self._n_pinned = 0
+        self._seen = 0  # How many step-level values have been offered to the retention policy
+        self._stride = 1  # For 'downsample', only every n-th step-level value is accepted
+        self._rng = random.Random()
+        self._evicted = False  # Whether any entries have ever been removed
+        self._dirty_step = None  # type: Optional[int]  # The smallest step which changed since the last `pop_changes`
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._steps[:self._size].tolist())
+
+    def __contains__(self, step: Any) -> bool:
+        return self._find(step) is not None
+
+    def __getitem__(self, step: int) -> Any:
+        idx = self._find(step)
+        if idx is None:
+            raise KeyError(step)
+        value = self._values[idx]
+        return value.item() if self._values.dtype != object else value
+
+    def __setitem__(self, step: int, value: Any) -> None:
+        self.record(step, value)
+
+    def __delitem__(self, step: int) -> None:
+        idx = self._find(step)
+        if idx is None:
+            raise KeyError(step)
+        self._remove(np.array([idx]))
+
+    def __repr__(self) -> str:
+        return "MetricHistory({})".format(dict(self.items()))
+
+    def items(self) -> List[Tuple[int, Any]]:
+        """Get all of the (step, value) pairs in this history, in order of increasing step.
+
+        Returns:
+            A list of (step, value) pairs.
+        """
+        steps, values = self.to_arrays()
+        return list(zip(steps.tolist(), values.tolist()))
+
+    def values(self) -> List[Any]:
+        """Get all of the values in this history, in order of increasing step.
+
+        Returns:
+            A list of values.
+        """
+        return [value for _, value in self.items()]
+
+    def to_arrays(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the steps and values of this history as arrays.
+
+        Returns:
+            The (steps, values) of this history. Values will be an object array if any non-numeric entries are present.
+        """
+        if self._values is None:
+            return np.empty(0, dtype=np.int64), np.empty(0)
+        return self._steps[:self._size].copy(), self._values[:self._size].copy()
+
+    def record(self, step: int, value: Any, pinned: bool = False) -> None:
+        """Record a new value.
+
+        Args:
+            step: The step associated with the `value`. If a value already exists for this step it will be replaced.
+            value: The value to be recorded.
+            pinned: Whether this value must be retained regardless of the retention policy (ex. epoch-level values).
+        """
+        step = int(step)
+        value = self._prepare(value)
+        idx = self._find(step)
+        if idx is not None:
+            self._values[idx] = value
+            if pinned and not self._pinned[idx]:
+                self._pinned[idx] = True
+                self._n_pinned += 1
+        else:
+            if not pinned and self.max_steps is not None and not self._accept():
+                return
+            self._insert(step, value, pinned)
+            if self.retention == 'downsample' and self._n_unpinned() > (self.max_steps or self._size):
+                # Discard every other step-level value and halve the acceptance rate of new ones
+                unpinned = np.flatnonzero(~self._pinned[:self._size])
+                self._remove(unpinned[1::2])
+                self._stride *= 2
+        if self._dirty_step is None or step < self._dirty_step:
+            self._dirty_step = step
+
+    def update(self, other: Any = (), **kwargs: Any) -> None:
+        """Record many values at once.
+
+        Args:
+            other: A mapping or iterable of (step, value) pairs.
+            **kwargs: Not supported, since steps are integers.
+        """
+        if isinstance(other, MetricHistory):
+            other = other.items()
+        super().update(other, **kwargs)
+
+    def pop_changes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Get the entries which have been added or modified since the previous invocation of this method.
+
+        Returns:
+            The (steps, values) of the changed entries.
+        """
+        steps, values = self.to_arrays()
+        if self._dirty_step is None:
+            return steps[:0], values[:0]
+        changed = steps >= self._dirty_step
+        self._dirty_step = None
+        return steps[changed], values[changed]
+
+    def is_numeric(self) -> bool:
+        """Whether every value in this history is a number.
+
+        Returns:
+            True iff the values are stored in a numeric (rather than object) array.
+        """
+        return self._values is None or self._values.dtype.kind in 'biuf'
+
+    def is_saved(self) -> bool:
+        """Whether any entries have changed since the previous invocation of `pop_changes`.
+
+        Returns:
+            True iff there are no un-popped changes.
+        """
+        return self._dirty_step is None
+
+    def get_config(self) -> Dict[str, Any]:
+        """Get everything needed to rebuild this history, except for the values themselves.
+
+        Returns:
+            A small dictionary describing the configuration and retention state of this history. Its size is bounded
+            by `max_steps` and the number of pinned entries.
+        """
+        steps = self._steps[:self._size]
+        return {
+            'max_steps': self.max_steps,
+            'retention': self.retention,
+            'seen': self._seen,
+            'stride': self._stride,
+            'pinned': steps[self._pinned[:self._size]].tolist(),
+            # If nothing was ever removed then every persisted step is retained, so there's no need to list them
+            'retained': steps.tolist() if self._evicted else None
+        }
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], entries: MutableMapping[int, Any]) -> 'MetricHistory':
+        """Rebuild a history based on its config and its persisted entries.
+
+        Args:
+            config: The output of `get_config`.
+            entries: All of the persisted {step: value} entries for this metric. This may be a superset of the entries
+                which were retained at the time `config` was generated.
+
+        Returns:
+            A new history with the same content and retention state as the original.
+        """
+        history = cls(max_steps=config['max_steps'], retention=config['retention'])
+        retained = entries.keys() if config['retained'] is None else config['retained']
+        pinned = set(config['pinned'])
+        for step in sorted(retained):
+            if step in entries:
+                history._insert(step, history._prepare(entries[step]), step in pinned)
+        history._seen = config['seen']
+        history._stride = config['stride']
+        history._evicted = config['retained'] is not None
+        return history
+
+    def __getstate__(self) -> Dict[str, Any]:
+        steps, values = self.to_arrays()
+        return {'config': self.get_config(), 'entries': dict(zip(steps.tolist(), values.tolist()))}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(self.from_config(state['config'], state['entries']).__dict__)
+
+    def _n_unpinned(self) -> int:
+        return self._size - self._n_pinned
+
+    def _accept(self) -> bool:
+        """Offer a new step-level value to the retention policy, evicting an old value if necessary.
+
+        Returns:
+            Whether the new value should be recorded.
+        """
+        self._seen += 1
+        if self.retention == 'downsample':
+            return (self._seen - 1) % self._stride == 0
+        if self._n_unpinned() < self.max_steps:
+            return True
+        # Reservoir sampling (Algorithm R): keep the new value with probability max_steps / seen
+        victim = self._rng.randrange(self._seen)
+        if victim >= self.max_steps:
+            return False
+        unpinned = np.flatnonzero(~self._pinned[:self._size])
+        self._remove(unpinned[victim:victim + 1])
+        return True
+
+    def _prepare(self, value: Any) -> Any:
+        """Convert a value into the form in which it will be stored, promoting the storage dtype if necessary.
+
+        Args:
+            value: The value to be stored.
+
+        Returns:
+            The `value`, as a numpy scalar if it is numeric, otherwise unchanged.
+        """
+        if isinstance(value, np.ndarray) and value.size == 1 and value.dtype.kind in 'biuf':
+            value = value.reshape(()).item()
+        if isinstance(value, (bool, int, float, np.number, np.bool_)):
+            dtype = np.asarray(value).dtype
+        else:
+            dtype = np.dtype(object)
+        if self._values is None:
+            self._values = np.empty(self._steps.shape[0], dtype=dtype)
+        elif self._values.dtype != object and dtype != self._values.dtype:
+            new_dtype = np.promote_types(self._values.dtype, dtype) if dtype != object else dtype
+            if new_dtype.kind not in 'biuf':
+                new_dtype = np.dtype(object)
+            self._values = self._values.astype(new_dtype)
+        return value
+
+    def _find(self, step: Any) -> Optional[int]:
+        """Find the index at which a given step is stored.
+
+        Args:
+            step: The step to look for.
+
+        Returns:
+            The index of the step, or None if it is not present.
+        """
+        if self._size == 0 or not isinstance(step, (int, np.integer)):
+            return None
+        if self._steps[self._size - 1] == step:
+            return self._size - 1  # Fast path for the most common case
+        idx = int(np.searchsorted(self._steps[:self._size], step))
+        if idx < self._size and self._steps[idx] == step:
+            return idx
+        return None
+
+    def _insert(self, step: int, value: Any, pinned: bool) -> None:
+        """Insert a new entry, keeping the entries sorted by step.
+
+        Args:
+            step: The step of the new entry.
+            value: The value of the new entry.
+            pinned: Whether the new entry is pinned.
+        """
+        if self._size == self._steps.shape[0]:
+            capacity = 2 * self._steps.shape[0]
+            self._steps = np.resize(self._steps, capacity)
+            self._values = np.resize(self._values, capacity)
+            self._pinned = np.resize(self._pinned, capacity)
+        idx = self._size
+        if idx > 0 and self._steps[idx - 1] > step:
+            idx = int(np.searchsorted(self._steps[:self._size], step))
+            for array in (self._steps, self._values, self._pinned):
+                array[idx + 1:self._size + 1] = array[idx:self._size]
+        self._steps[idx] = step
+        self._values[idx] = value
+        self._pinned[idx] = pinned
+        self._n_pinned += int(pinned)
+        self._size += 1
+
+    def _remove(self, indices: np.ndarray) -> None:
+        """Remove entries from this history.
+
+        Args:
+            indices: The indices of the entries to be removed.
+        """
+        if indices.size == 0:
+            return
+        self._evicted = True
+        keep = np.ones(self._size, dtype=bool)
+        keep[indices] = False
+        self._n_pinned -= int(np.count_nonzero(self._pinned[indices]))
+        n_keep = int(np.count_nonzero(keep))
+        for array in (self._steps, self._values, self._pinned):
+            array[:n_keep] = array[:self._size][keep]
+        self._size = n_keep
@@ -12,45 +12,348 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import json
 import os
 import re
-from typing import List, Optional, Set
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import DefaultDict, Dict, List, Mapping, Optional, Set, Tuple
+
+import numpy as np
 
-from fastestimator.dataset.dir_dataset import DirDataset
 from fastestimator.summary.logs.log_plot import visualize_logs
+from fastestimator.summary.metric_log import METRIC_LOG_EXTENSION
 from fastestimator.summary.summary import Summary
 from fastestimator.util.util import strip_suffix
 
+_CACHE_VERSION = 2
+_METRIC_REGEX = re.compile(r"([^:;]+):[\s]*([-]?[0-9]+[.]?[0-9]*(e[-]?[0-9]+[.]?[0-9]*)?);")
+_MODE_PREFIXES = (("FastEstimator-Train", "train"), ("FastEstimator-Finish", "train"), ("FastEstimator-Eval", "eval"),
+                  ("FastEstimator-Test", "test"))
+_TAIL_BYTES = 256  # How many bytes to remember in order to detect whether a log file was rewritten
+
+Columns = Dict[str, Dict[str, Tuple[np.ndarray, np.ndarray]]]  # {mode: {metric: (steps, values)}}
+
+
+class _LogIndex:
+    """A columnar index of the metrics contained within a log file, which can be updated incrementally.
+
+    The index remembers how many bytes of the log file it has consumed, so that when a log file is appended to (as
+    happens while training is still running) only the new bytes need to be parsed. Indices are cached in a hidden .npz
+    file next to the log they describe, and are invalidated based on the size and modification time of the log. The
+    cache is loaded with allow_pickle=False, so a tampered cache file cannot execute code.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        file_path: The path to the log file to be indexed.
+    """
+    def __init__(self, file_path: str) -> None:
+        self.file_path = file_path
+        self.version = _CACHE_VERSION
+        self.size = -1
+        self.mtime = -1.0
+        self.offset = 0  # How many bytes of complete lines have been consumed
+        self.tail = b''  # The bytes immediately preceding `offset`
+        self.columns = {}  # type: Columns
+        self.pending = {}  # type: Columns  # Metrics from a trailing line which may still be being written
+
+    @staticmethod
+    def get_cache_path(file_path: str) -> str:
+        """Get the path of the cache file corresponding to a given log file.
+
+        Args:
+            file_path: The path to a log file.
+
+        Returns:
+            The path where the index of the `file_path` is cached.
+        """
+        root, name = os.path.split(file_path)
+        return os.path.join(root, ".{}.feidx".format(name))
+
+    @classmethod
+    def load(cls, file_path: str) -> '_LogIndex':
+        """Load the cached index of a log file, or create an empty index if no valid cache exists.
+
+        Args:
+            file_path: The path to a log file.
+
+        Returns:
+            An index for the given `file_path`.
+        """
+        try:
+            with np.load(cls.get_cache_path(file_path), allow_pickle=False) as cache:
+                meta = json.loads(cache['meta'].tobytes().decode('utf-8'))
+                if meta['version'] == _CACHE_VERSION:
+                    index = cls(file_path)
+                    index.size, index.mtime, index.offset = meta['size'], meta['mtime'], meta['offset']
+                    index.tail = cache['tail'].tobytes()
+                    index.columns = cls._unpack_columns(cache, meta['columns'], 'columns')
+                    index.pending = cls._unpack_columns(cache, meta['pending'], 'pending')
+                    return index
+        except Exception:
+            # Any problem with the cache (missing, corrupted, from an older version, etc.) just means a fresh parse
+            pass
+        return cls(file_path)
+
+    def save(self) -> None:
+        """Write this index to its cache file.
+
+        Failures (for example due to a read-only log directory) are ignored, since the cache is only an optimization.
+        """
+        cache_path = self.get_cache_path(self.file_path)
+        tmp_path = "{}.{}.tmp".format(cache_path, os.getpid())
+        arrays = {'tail': np.frombuffer(self.tail, dtype=np.uint8)}
+        meta = {
+            'version': self.version,
+            'size': self.size,
+            'mtime': self.mtime,
+            'offset': self.offset,
+            'columns': self._pack_columns(self.columns, 'columns', arrays),
+            'pending': self._pack_columns(self.pending, 'pending', arrays)
+        }
+        arrays['meta'] = np.frombuffer(json.dumps(meta).encode('utf-8'), dtype=np.uint8)
+        try:
+            with open(tmp_path, 'wb') as cache:
+                np.savez(cache, **arrays)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    @staticmethod
+    def _pack_columns(columns: Columns, prefix: str, arrays: Dict[str, np.ndarray]) -> List[Tuple[str, str]]:
+        """Flatten columns into named arrays so that they can be saved without pickling.
+
+        Args:
+            columns: The columns to be flattened.
+            prefix: A prefix for the array names, so that several sets of columns can share the same `arrays`.
+            arrays: A dictionary into which the step and value arrays will be written.
+
+        Returns:
+            The (mode, metric) of each column, in the order in which their arrays were numbered.
+        """
+        keys = []
+        for mode, metrics in columns.items():
+            for metric, (steps, values) in metrics.items():
+                arrays["{}_{}_steps".format(prefix, len(keys))] = steps
+                arrays["{}_{}_values".format(prefix, len(keys))] = values
+                keys.append((mode, metric))
+        return keys
+
+    @staticmethod
+    def _unpack_columns(arrays: Mapping[str, np.ndarray], keys: List[Tuple[str, str]], prefix: str) -> Columns:
+        """Rebuild columns which were flattened by `_pack_columns`.
+
+        Args:
+            arrays: The saved arrays.
+            keys: The (mode, metric) of each column.
+            prefix: The prefix which was used when the columns were flattened.
+
+        Returns:
+            The original columns.
+        """
+        columns = {}
+        for idx, (mode, metric) in enumerate(keys):
+            columns.setdefault(mode, {})[metric] = (arrays["{}_{}_steps".format(prefix, idx)],
+                                                    arrays["{}_{}_values".format(prefix, idx)])
+        return columns
+
+    def update(self) -> bool:
+        """Bring this index up to date with its log file, parsing only bytes which have not been seen before.
+
+        Returns:
+            Whether the index was modified.
+        """
+        stat = os.stat(self.file_path)
+        if stat.st_size == self.size and stat.st_mtime == self.mtime:
+            return False
+        with open(self.file_path, 'rb') as file:
+            if not self._is_prefix(file, stat.st_size):
+                # The file was truncated or rewritten, so the existing index is no longer valid
+                self.offset, self.tail, self.columns = 0, b'', {}
+            file.seek(self.offset)
+            data = file.read()
+        # Only commit complete lines to the index, since the last line might still be in the middle of being written
+        end = data.rfind(b'\n') + 1
+        _extend_columns(self.columns, _parse_lines(data[:end], self.file_path))
+        self.pending = _parse_lines(data[end:], self.file_path)
+        self.tail = (self.tail + data[:end])[-_TAIL_BYTES:]
+        self.offset += end
+        self.size = stat.st_size
+        self.mtime = stat.st_mtime
+        return True
+
+    def _is_prefix(self, file, size: int) -> bool:
+        """Check whether the bytes consumed by this index are still present at the start of a file.
+
+        Args:
+            file: An open binary handle to the log file.
+            size: The current size of the log file.
+
+        Returns:
+            True if the file appears to have only been appended to since this index was last updated.
+        """
+        if self.offset > size:
+            return False
+        if not self.tail:
+            return True
+        file.seek(self.offset - len(self.tail))
+        return file.read(len(self.tail)) == self.tail
+
+    def to_summary(self, name: str) -> Summary:
+        """Convert this index into a `Summary`.
+
+        Args:
+            name: The name of the experiment.
+
+        Returns:
+            A `Summary` whose history contains all of the metrics from this index.
+        """
+        experiment = Summary(name)
+        for columns in (self.columns, self.pending):
+            for mode, metrics in columns.items():
+                for metric, (steps, values) in metrics.items():
+                    experiment.history[mode][metric].update(zip(steps.tolist(), values.tolist()))
+        return experiment
+
+
+def _parse_lines(data: bytes, file_path: str) -> Columns:
+    """Extract the metrics from a chunk of a log file.
+
+    Args:
+        data: The raw bytes of zero or more lines from a log file.
+        file_path: The path of the log file (used for error messages).
+
+    Returns:
+        The metrics found in `data`, in columnar format.
 
-def parse_log_file(file_path: str, file_extension: str) -> Summary:
+    Raises:
+        AssertionError: If a line is missing step information.
+    """
+    # TODO: need to handle multi-line output like confusion matrix
+    parsed = defaultdict(lambda: defaultdict(lambda: ([], [])))  # type: DefaultDict[str, DefaultDict[str, Tuple]]
+    for line in data.decode('utf-8', errors='replace').splitlines():
+        mode = None
+        for prefix, prefix_mode in _MODE_PREFIXES:
+            if line.startswith(prefix):
+                mode = prefix_mode
+                break
+        if mode is None:
+            continue
+        parsed_line = _METRIC_REGEX.findall(line)
+        step = parsed_line[0]
+        assert step[0].strip() == "step", \
+            "Log file (%s) seems to be missing step information, or step is not listed first" % file_path
+        step = int(step[1])
+        for metric in parsed_line[1:]:
+            steps, values = parsed[mode][metric[0].strip()]
+            steps.append(step)
+            values.append(float(metric[1]))
+    return {
+        mode: {metric: (np.array(steps, dtype=np.int64), np.array(values, dtype=np.float64))
+               for metric, (steps, values) in metrics.items()}
+        for mode, metrics in parsed.items()
+    }
+
+
+def _extend_columns(columns: Columns, new_columns: Columns) -> None:
+    """Append freshly parsed metrics onto existing columns.
+
+    Args:
+        columns: The existing columns, which will be modified in place.
+        new_columns: The columns to be appended.
+    """
+    for mode, metrics in new_columns.items():
+        mode_columns = columns.setdefault(mode, {})
+        for metric, (steps, values) in metrics.items():
+            if metric in mode_columns:
+                old_steps, old_values = mode_columns[metric]
+                steps, values = np.concatenate([old_steps, steps]), np.concatenate([old_values, values])
+            mode_columns[metric] = (steps, values)
+
+
+def _index_log_file(file_path: str, cache: bool = True) -> _LogIndex:
+    """Build an up to date index for a log file, re-using (and updating) its cache if available.
+
+    Args:
+        file_path: The path to a log file.
+        cache: Whether to read and write the on-disk cache of the index.
+
+    Returns:
+        The index of the log file.
+    """
+    index = _LogIndex.load(file_path) if cache else _LogIndex(file_path)
+    if index.update() and cache:
+        index.save()
+    return index
+
+
+def _get_name(file_path: str, file_extension: str) -> str:
+    """Get the experiment name corresponding to a given log file.
+
+    Args:
+        file_path: The path to a log file.
+        file_extension: The extension of the text log files.
+
+    Returns:
+        The name of the log file, without its extension.
+    """
+    if file_path.endswith(METRIC_LOG_EXTENSION):
+        file_extension = METRIC_LOG_EXTENSION
+    return strip_suffix(os.path.split(file_path)[1].strip(), file_extension)
+
+
+def parse_log_file(file_path: str, file_extension: str, cache: bool = True) -> Summary:
     """A function which will parse log files into a dictionary of metrics.
 
+    The parsed metrics are cached in a hidden file next to the log, so that re-parsing an unchanged log is nearly
+    free, and re-parsing a log which has been appended to only needs to read the new lines. Binary metric logs (as
+    written by the `BinaryLogger` Trace) are read directly, without any text parsing.
+
     Args:
         file_path: The path to a log file.
         file_extension: The extension of the log file.
+        cache: Whether to use (and update) the on-disk cache of parsed metrics.
+
     Returns:
         An experiment summarizing the given log file.
     """
-    # TODO: need to handle multi-line output like confusion matrix
-    experiment = Summary(strip_suffix(os.path.split(file_path)[1].strip(), file_extension))
-    with open(file_path) as file:
-        for line in file:
-            mode = None
-            if line.startswith("FastEstimator-Train") or line.startswith("FastEstimator-Finish"):
-                mode = "train"
-            elif line.startswith("FastEstimator-Eval"):
-                mode = "eval"
-            elif line.startswith("FastEstimator-Test"):
-                mode = "test"
-            if mode is None:
-                continue
-            parsed_line = re.findall(r"([^:;]+):[\s]*([-]?[0-9]+[.]?[0-9]*(e[-]?[0-9]+[.]?[0-9]*)?);", line)
-            step = parsed_line[0]
-            assert step[0].strip() == "step", \
-                "Log file (%s) seems to be missing step information, or step is not listed first" % file
-            for metric in parsed_line[1:]:
-                experiment.history[mode][metric[0].strip()].update({int(step[1]): float(metric[1])})
-    return experiment
+    name = _get_name(file_path, file_extension)
+    if file_path.endswith(METRIC_LOG_EXTENSION):
+        return Summary.from_metric_log(file_path, name)
+    return _index_log_file(file_path, cache).to_summary(name)
+
+
+def _parse_log_files(file_paths: List[str], file_extension: str, cache: bool,
+                     num_process: Optional[int]) -> List[Summary]:
+    """Parse many log files, in parallel if appropriate.
+
+    Args:
+        file_paths: The paths to the log files.
+        file_extension: The extension of the log files.
+        cache: Whether to use (and update) the on-disk cache of parsed metrics.
+        num_process: How many processes to use for parsing. None will use one per CPU core.
+
+    Returns:
+        An experiment summarizing each of the given log files.
+    """
+    names = [_get_name(file_path, file_extension) for file_path in file_paths]
+    # Binary metric logs don't need to be parsed, so only the text logs are sent to the process pool
+    text_paths = [file_path for file_path in file_paths if not file_path.endswith(METRIC_LOG_EXTENSION)]
+    if num_process is None:
+        num_process = os.cpu_count() or 1
+    num_process = min(num_process, len(text_paths))
+    if num_process > 1:
+        with ProcessPoolExecutor(max_workers=num_process) as executor:
+            indices = list(executor.map(_index_log_file, text_paths, [cache] * len(text_paths)))
+    else:
+        indices = [_index_log_file(file_path, cache) for file_path in text_paths]
+    indices = dict(zip(text_paths, indices))
+    return [
+        indices[file_path].to_summary(name) if file_path in indices else Summary.from_metric_log(file_path, name)
+        for file_path, name in zip(file_paths, names)
+    ]
 
 
 def parse_log_files(file_paths: List[str],
@@ -60,7 +363,9 @@ def parse_log_files(file_paths: List[str],
                     save_path: Optional[str] = None,
                     ignore_metrics: Optional[Set[str]] = None,
                     share_legend: bool = True,
-                    pretty_names: bool = False) -> None:
+                    pretty_names: bool = False,
+                    num_process: Optional[int] = None,
+                    cache: bool = True) -> None:
     """Parse one or more log files for graphing.
 
     This function which will iterate through the given log file paths, parse them to extract metrics, remove any
@@ -75,6 +380,9 @@ def parse_log_files(file_paths: List[str],
         ignore_metrics: Any metrics within the log files which will not be visualized.
         share_legend: Whether to have one legend across all graphs (True) or one legend per graph (False).
         pretty_names: Whether to modify the metric names in graph titles (True) or leave them alone (False).
+        num_process: How many processes to use when parsing the log files. None will use one per CPU core.
+        cache: Whether to cache the parsed metrics next to each log file, so that subsequent calls only need to parse
+            lines which have been added since.
 
     Raises:
         AssertionError: If no log files are provided.
@@ -84,9 +392,7 @@ def parse_log_files(file_paths: List[str],
     if save and save_path is None:
         save_path = file_paths[0]
 
-    experiments = []
-    for file_path in file_paths:
-        experiments.append(parse_log_file(file_path, log_extension))
+    experiments = _parse_log_files(file_paths, log_extension, cache=cache, num_process=num_process)
     visualize_logs(experiments,
                    save_path=save_path,
                    smooth_factor=smooth_factor,
@@ -103,7 +409,9 @@ def parse_log_dir(dir_path: str,
                   save_path: Optional[str] = None,
                   ignore_metrics: Optional[Set[str]] = None,
                   share_legend: bool = True,
-                  pretty_names: bool = False) -> None:
+                  pretty_names: bool = False,
+                  num_process: Optional[int] = None,
+                  cache: bool = True) -> None:
     """A function which will gather all log files within a given folder and pass them along for visualization.
 
     Args:
@@ -116,9 +424,20 @@ def parse_log_dir(dir_path: str,
         ignore_metrics: Any metrics within the log files which will not be visualized.
         share_legend: Whether to have one legend across all graphs (True) or one legend per graph (False).
         pretty_names: Whether to modify the metric names in graph titles (True) or leave them alone (False).
+        num_process: How many processes to use when parsing the log files. None will use one per CPU core.
+        cache: Whether to cache the parsed metrics next to each log file, so that subsequent calls only need to parse
+            lines which have been added since.
     """
-    loader = DirDataset(root_dir=dir_path, file_extension=log_extension, recursive_search=recursive_search)
-    file_paths = list(map(lambda d: d['x'], loader.data.values()))
+    # Walk the directory directly rather than using a DirDataset, which would import the deep learning frameworks
+    if not os.path.isdir(dir_path):
+        raise AssertionError("Provided path is not a directory")
+    file_paths = []
+    for root, _, files in os.walk(os.path.normpath(dir_path)):
+        file_paths.extend(
+            os.path.join(root, file_name) for file_name in files
+            if not file_name.startswith(".") and file_name.endswith(log_extension))
+        if not recursive_search:
+            break
 
     parse_log_files(file_paths,
                     log_extension,
@@ -127,4 +446,6 @@ def parse_log_dir(dir_path: str,
                     save_path,
                     ignore_metrics,
                     share_legend,
-                    pretty_names)
+                    pretty_names,
+                    num_process,
+                    cache)
@@ -16,17 +16,20 @@ import math
 import os
 import re
 from collections import defaultdict
-from typing import Any, DefaultDict, Dict, List, Optional, Set, Union
+from typing import Any, DefaultDict, Dict, List, Optional, Set, Tuple, Union
 
 import matplotlib.pyplot as plt
 import numpy as np
-import seaborn as sns
 from matplotlib.markers import MarkerStyle
-from scipy.ndimage.filters import gaussian_filter1d
 
 from fastestimator.summary.summary import Summary
 from fastestimator.util.util import prettify_metric_name, to_list, to_set
 
+_SUBPLOT_WIDTH = 4  # inches
+_SAVE_DPI = 300
+# Each subplot can only display this many distinct x values, so longer series are downsampled before plotting
+_PLOT_RESOLUTION = _SUBPLOT_WIDTH * _SAVE_DPI
+
 
 class _MetricGroup:
     """A class for wrapping the values recorded for a given metric based on its experiment id and mode.
@@ -53,6 +56,11 @@ class _MetricGroup:
             Whether the add was successful.
         """
         if values:
+            if len(values) > 1:
+                array = self._to_array(values)
+                if array is not None:
+                    self.state[exp_id][mode] = array
+                    return True
             values = list(sorted(values.items()))
             if len(values) == 1:
                 # We will allow any data types if there's only one value since it will be displayed differently
@@ -82,6 +90,24 @@ class _MetricGroup:
                     values[idx] = (step, elem)
                 self.state[exp_id][mode] = np.array(values)
 
+    @staticmethod
+    def _to_array(values: Dict[int, Any]) -> Optional[np.ndarray]:
+        """Convert a purely numeric history into a sorted (step, value) array without inspecting each element.
+
+        Args:
+            values: A dictionary of time: value pairs.
+
+        Returns:
+            An array of shape (N, 2) sorted by step, or None if `values` contains non-numeric entries and therefore
+            needs to be handled element by element.
+        """
+        steps = np.array(list(values.keys()))
+        vals = np.array(list(values.values()))
+        if steps.ndim != 1 or vals.ndim != 1 or steps.dtype.kind not in 'iu' or vals.dtype.kind not in 'biuf':
+            return None
+        order = np.argsort(steps, kind='stable')
+        return np.stack([steps[order], vals[order]], axis=1)
+
     def ndim(self) -> int:
         """Compute how many dimensions this data require to plot.
 
@@ -146,6 +172,30 @@ class _MetricGroup:
         return list(self.state[exp_id].keys())
 
 
+def _downsample(x: np.ndarray, y: np.ndarray, n_buckets: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Reduce a series to at most 2 points per bucket, keeping the extreme values so that spikes remain visible.
+
+    Args:
+        x: The x values of the series.
+        y: The y values of the series.
+        n_buckets: How many buckets to split the series into (for example, the number of pixels available to draw it).
+
+    Returns:
+        The downsampled (x, y) values.
+    """
+    n = x.shape[0]
+    if n <= 2 * n_buckets:
+        return x, y
+    bucket_size = math.ceil(n / n_buckets)
+    n_buckets = math.ceil(n / bucket_size)
+    # Pad with the final value so that every bucket is full
+    buckets = np.pad(y, (0, n_buckets * bucket_size - n), mode='edge').reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+    idx = np.concatenate([[0, n - 1], offsets + np.argmin(buckets, axis=1), offsets + np.argmax(buckets, axis=1)])
+    idx = np.unique(np.minimum(idx, n - 1))
+    return x[idx], y[idx]
+
+
 def plot_logs(experiments: List[Summary],
               smooth_factor: float = 0,
               share_legend: bool = True,
@@ -165,6 +215,10 @@ def plot_logs(experiments: List[Summary],
     Returns:
         The handle of the pyplot figure.
     """
+    # Imported here since they are only needed for plotting, and are slow to load when using the logs CLI
+    import seaborn as sns
+    from scipy.ndimage.filters import gaussian_filter1d
+
     experiments = to_list(experiments)
     n_experiments = len(experiments)
     if n_experiments == 0:
@@ -220,7 +274,7 @@ def plot_logs(experiments: List[Summary],
         idx += 1
 
     sns.set_context('paper')
-    fig, axs = plt.subplots(n_rows, n_cols, sharex='all', figsize=(4 * n_cols, 2.8 * n_rows))
+    fig, axs = plt.subplots(n_rows, n_cols, sharex='all', figsize=(_SUBPLOT_WIDTH * n_cols, 2.8 * n_rows))
 
     # If only one row, need to re-format the axs object for consistency. Likewise for columns
     if n_rows == 1:
@@ -322,8 +376,9 @@ def plot_logs(experiments: List[Summary],
                     else:
                         # We can draw a line
                         y = data[:, 1] if smooth_factor == 0 else gaussian_filter1d(data[:, 1], sigma=smooth_factor)
+                        x, y = _downsample(data[:, 0], y, _PLOT_RESOLUTION)
                         ln = axis.plot(
-                            data[:, 0],
+                            x,
                             y,
                             color=colors[exp_idx + color_offset[mode]],
                             label=title,
@@ -404,4 +459,4 @@ def visualize_logs(experiments: List[Summary],
         save_file = os.path.join(root_dir, os.path.basename(save_path) or 'parse_logs.png')
         if verbose:
             print("Saving to {}".format(save_file))
-        plt.savefig(save_file, dpi=300, bbox_inches="tight")
+        plt.savefig(save_file, dpi=_SAVE_DPI, bbox_inches="tight")
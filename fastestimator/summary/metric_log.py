@@ -0,0 +1,278 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import mmap
+import os
+import struct
+from collections import defaultdict
+from typing import Any, DefaultDict, Dict, List, Optional, Tuple
+
+import numpy as np
+
+METRIC_LOG_EXTENSION = ".femlog"
+
+# File layout: _FILE_MAGIC followed by any number of self-contained chunks. Each chunk is a _CHUNK_HEADER, a JSON list
+# of the strings (modes and keys) referenced by the chunk, one array per entry in _COLUMNS, and then a blob holding any
+# values which are not scalars.
+_FILE_MAGIC = b"FEMLOG01"
+_CHUNK_MAGIC = b"FECK"
+_CHUNK_HEADER = struct.Struct("<4sIII")  # magic, n_rows, n_table_bytes, n_blob_bytes
+_COLUMNS = (("step", "<i8"), ("epoch", "<i8"), ("value", "<f8"), ("blob_offset", "<i8"), ("mode", "<u4"),
+            ("key", "<u4"), ("kind", "u1"))
+_ROW_BYTES = sum(np.dtype(dtype).itemsize for _, dtype in _COLUMNS)
+_LENGTH = struct.Struct("<I")
+_FLOAT, _INT, _ARRAY, _STRING, _JSON = range(5)
+_MAX_EXACT_INT = 2**53  # The largest magnitude at which every integer can be stored exactly in the float64 value column
+
+History = DefaultDict[str, DefaultDict[str, Dict[int, Any]]]
+
+
+class MetricLogWriter:
+    """A class which appends metrics to a compact binary columnar file.
+
+    Rows are buffered in memory and written out as a self-contained chunk whenever `chunk_size` rows have accumulated
+    (or when `flush` is invoked), so memory usage is bounded regardless of how long training runs. Since chunks are only
+    ever appended, a file which is being written can be read at any time; a partially written final chunk is ignored by
+    `read_metric_log`.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        file_path: The file to write into. If it already exists, new metrics will be appended to it.
+        chunk_size: The maximum number of rows to buffer in memory before writing them to disk.
+    """
+    def __init__(self, file_path: str, chunk_size: int = 4096) -> None:
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+        self._rows = []  # type: List[Tuple[int, int, str, str, int, float, bytes]]
+        self._file = None
+
+    def append(self, step: int, epoch: int, mode: str, key: str, value: Any) -> None:
+        """Add a new value to the log.
+
+        Args:
+            step: The global step associated with the `value`.
+            epoch: The epoch associated with the `value`.
+            mode: The mode associated with the `value`.
+            key: The name of the metric.
+            value: The value of the metric. Numbers, strings, tensors, and arrays are all supported.
+        """
+        kind, scalar, blob = _encode(value)
+        self._rows.append((step or 0, epoch or 0, mode, key, kind, scalar, blob))
+        if len(self._rows) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write any buffered rows to disk as a new chunk.
+        """
+        if not self._rows:
+            return
+        if self._file is None:
+            self._file = open(self.file_path, 'ab')
+            if self._file.tell() == 0:
+                self._file.write(_FILE_MAGIC)
+        rows, self._rows = self._rows, []
+        table = {}  # string: index
+        blob = bytearray()
+        columns = {name: np.empty(len(rows), dtype=dtype) for name, dtype in _COLUMNS}
+        for idx, (step, epoch, mode, key, kind, scalar, data) in enumerate(rows):
+            columns['step'][idx] = step
+            columns['epoch'][idx] = epoch
+            columns['mode'][idx] = table.setdefault(mode, len(table))
+            columns['key'][idx] = table.setdefault(key, len(table))
+            columns['kind'][idx] = kind
+            columns['value'][idx] = scalar
+            columns['blob_offset'][idx] = len(blob) if data else -1
+            blob += data
+        table = json.dumps(list(table.keys())).encode('utf-8')
+        self._file.write(_CHUNK_HEADER.pack(_CHUNK_MAGIC, len(rows), len(table), len(blob)))
+        self._file.write(table)
+        for name, _ in _COLUMNS:
+            self._file.write(columns[name].tobytes())
+        self._file.write(blob)
+        self._file.flush()
+
+    def close(self) -> None:
+        """Flush any buffered rows and close the underlying file.
+        """
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def _encode(value: Any) -> Tuple[int, float, bytes]:
+    """Convert a value into the representation used by the binary log.
+
+    The type of the value is preserved wherever possible: python and NumPy scalars come back as the same type, arrays
+    keep their dtype and shape (even if they only hold a single element), and other values are stored as JSON if doing
+    so is lossless. Tensors are stored as NumPy arrays. Anything else falls back to its string representation.
+
+    Args:
+        value: The value to be encoded.
+
+    Returns:
+        The kind of the value, its value if it is a scalar (else NaN), and its serialized bytes if it is not a scalar.
+    """
+    if isinstance(value, str):
+        return _STRING, float('nan'), _pack(value.encode('utf-8'))
+    if type(value) is float:
+        return _FLOAT, value, b''
+    if type(value) is int and abs(value) <= _MAX_EXACT_INT:
+        return _INT, float(value), b''
+    array, scalar = None, None
+    if isinstance(value, (bool, int)):
+        array, scalar = np.asarray(value), 'python'
+    elif isinstance(value, np.generic):
+        array, scalar = np.asarray(value), 'numpy'
+    elif isinstance(value, np.ndarray):
+        array = value
+    elif value is not None and not isinstance(value, (list, tuple, dict)):
+        # Imported here since it pulls in the deep learning frameworks, which readers of the log don't need
+        from fastestimator.util.util import to_number
+        array = to_number(value)
+    if array is not None and array.dtype.kind in 'biuf':
+        header = {"dtype": array.dtype.str, "shape": array.shape}
+        if scalar:
+            header["scalar"] = scalar
+        return _ARRAY, float('nan'), _pack(json.dumps(header).encode('utf-8')) + array.tobytes()
+    try:
+        data = json.dumps(value, allow_nan=False)
+        if json.loads(data) == value:
+            return _JSON, float('nan'), _pack(data.encode('utf-8'))
+    except (TypeError, ValueError):
+        pass
+    return _STRING, float('nan'), _pack(str(value).encode('utf-8'))
+
+
+def _pack(data: bytes) -> bytes:
+    """Prefix some data with its length.
+
+    Args:
+        data: The data to be stored.
+
+    Returns:
+        The length-prefixed `data`.
+    """
+    return _LENGTH.pack(len(data)) + data
+
+
+def _decode(buffer: mmap.mmap, offset: int, kind: int) -> Any:
+    """Read a non-scalar value from the binary log.
+
+    Args:
+        buffer: The contents of the log.
+        offset: Where the value begins in the `buffer`.
+        kind: The kind of the value.
+
+    Returns:
+        The decoded value.
+    """
+    length, = _LENGTH.unpack_from(buffer, offset)
+    offset += _LENGTH.size
+    data = buffer[offset:offset + length]
+    if kind == _STRING:
+        return data.decode('utf-8')
+    if kind == _JSON:
+        return json.loads(data.decode('utf-8'))
+    header = json.loads(data.decode('utf-8'))
+    dtype = np.dtype(header['dtype'])
+    shape = tuple(header['shape'])
+    array = np.frombuffer(buffer, dtype=dtype, count=int(np.prod(shape)), offset=offset + length).reshape(shape).copy()
+    scalar = header.get('scalar')
+    if scalar == 'python':
+        return array.item()
+    if scalar == 'numpy':
+        return array[()]
+    return array
+
+
+def _read_chunk(buffer: mmap.mmap, offset: int, n_rows: int, n_table_bytes: int, history: History) -> None:
+    """Read a single chunk of the binary log into a `history` dictionary.
+
+    Args:
+        buffer: The contents of the log.
+        offset: The location of the chunk's string table within the `buffer`.
+        n_rows: How many rows are in the chunk.
+        n_table_bytes: The size of the chunk's string table.
+        history: The dictionary to be filled, in the format {mode: {key: {step: value}}}. Existing entries will be
+            overwritten by more recent values.
+    """
+    table = json.loads(buffer[offset:offset + n_table_bytes].decode('utf-8'))
+    offset += n_table_bytes
+    columns = {}
+    for name, dtype in _COLUMNS:
+        # Copy out of the memory map so that no views of it outlive this function
+        columns[name] = np.frombuffer(buffer, dtype=dtype, count=n_rows, offset=offset).copy()
+        offset += columns[name].nbytes
+    blob_start = offset
+    kind = columns['kind']
+    scalar = kind <= _INT
+    # Scalars are the vast majority of entries, so group them by mode, key, and kind in order to convert them in bulk
+    n_strings = len(table)
+    group = (columns['mode'].astype(np.int64) * n_strings + columns['key']) * 2 + kind
+    for code in np.unique(group[scalar]).tolist():
+        # Non-scalar kinds would otherwise collide with the scalar codes of the next key
+        mask = scalar & (group == code)
+        values = columns['value'][mask]
+        if code % 2 == _INT:
+            values = values.astype(np.int64)
+        mode, key = divmod(code // 2, n_strings)
+        history[table[mode]][table[key]].update(zip(columns['step'][mask].tolist(), values.tolist()))
+    for idx in np.flatnonzero(~scalar).tolist():
+        value = _decode(buffer, blob_start + int(columns['blob_offset'][idx]), int(kind[idx]))
+        history[table[int(columns['mode'][idx])]][table[int(columns['key'][idx])]][int(columns['step'][idx])] = value
+
+
+def read_metric_log(file_path: str, history: Optional[History] = None, end: Optional[int] = None) -> History:
+    """Read a binary metric log which was written by a `MetricLogWriter`.
+
+    The file is memory mapped, so only the pages which are actually needed get read from disk.
+
+    Args:
+        file_path: The path to the binary log file.
+        history: An existing history dictionary to be updated, or None to create a new one.
+        end: If provided, any data after this many bytes of the file will be ignored.
+
+    Returns:
+        The logged metrics, in the format {mode: {key: {step: value}}}.
+
+    Raises:
+        ValueError: If `file_path` is not a binary metric log.
+    """
+    if history is None:
+        history = defaultdict(lambda: defaultdict(dict))
+    with open(file_path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if end is not None:
+            size = min(size, end)
+        if size == 0:
+            return history
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if buffer[:len(_FILE_MAGIC)] != _FILE_MAGIC:
+                raise ValueError("{} is not a FastEstimator binary metric log".format(file_path))
+            offset = len(_FILE_MAGIC)
+            while offset + _CHUNK_HEADER.size <= size:
+                magic, n_rows, n_table_bytes, n_blob_bytes = _CHUNK_HEADER.unpack_from(buffer, offset)
+                start = offset + _CHUNK_HEADER.size
+                chunk_end = start + n_table_bytes + n_rows * _ROW_BYTES + n_blob_bytes
+                if magic != _CHUNK_MAGIC or chunk_end > size:
+                    break  # The final chunk is still being written
+                _read_chunk(buffer, start, n_rows, n_table_bytes, history)
+                offset = chunk_end
+        finally:
+            buffer.close()
+    return history
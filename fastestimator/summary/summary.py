@@ -12,10 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import functools
+import os
 from collections import defaultdict
-from typing import Any, Dict, List, Optional
+from contextlib import contextmanager
+from typing import Any, DefaultDict, Dict, Generator, List, MutableMapping, Optional, TYPE_CHECKING
 
-from fastestimator.util.traceability_util import FeSummaryTable
+from fastestimator.summary.history import RETENTION_POLICIES, MetricHistory
+
+if TYPE_CHECKING:
+    from fastestimator.util.traceability_util import FeSummaryTable
 
 
 class Summary:
@@ -23,15 +29,126 @@ class Summary:
 
     This class is intentionally not @traceable.
 
+    Each metric in the history is stored in a `MetricHistory`, which is array-backed and can optionally bound how many
+    step-level values it retains. Epoch-level values are always retained.
+
     Args:
         name: Name of the experiment. If None then experiment results will be ignored.
         system_config: A description of the initialization parameters defining the estimator associated with this
             experiment.
+        max_steps: The maximum number of step-level values to retain per metric, or None to retain all of them.
+        retention: How to choose which step-level values to retain once `max_steps` is exceeded. Either 'downsample'
+            (keep evenly spaced values) or 'reservoir' (keep a uniform random sample).
+
+    Raises:
+        ValueError: If `max_steps` or `retention` are invalid.
     """
-    def __init__(self, name: Optional[str], system_config: Optional[List[FeSummaryTable]] = None) -> None:
+    def __init__(self,
+                 name: Optional[str],
+                 system_config: Optional[List['FeSummaryTable']] = None,
+                 max_steps: Optional[int] = None,
+                 retention: str = 'downsample') -> None:
+        if max_steps is not None and max_steps < 1:
+            raise ValueError(f"max_steps must be None or a positive integer, but got {max_steps}")
+        if retention not in RETENTION_POLICIES:
+            raise ValueError(f"retention must be one of {RETENTION_POLICIES}, but got {retention}")
         self.name = name
         self.system_config = system_config
-        self.history = defaultdict(lambda: defaultdict(dict))  # {mode: {key: {step: value}}}
+        self.max_steps = max_steps
+        self.retention = retention
+        self.history = self._new_history()  # {mode: {key: {step: value}}}
+        self._history_file = None  # type: Optional[str]  # Where the history is being incrementally persisted
+        self._history_offset = 0  # How many bytes of the _history_file correspond to this summary
+        self._external_history = False  # Whether pickling should refer to the _history_file rather than copy values
+
+    def _new_history(self) -> DefaultDict[str, DefaultDict[str, MutableMapping[int, Any]]]:
+        """Create an empty history dictionary.
+
+        Returns:
+            A history which will create new metrics using this summary's retention settings.
+        """
+        factory = functools.partial(MetricHistory, max_steps=self.max_steps, retention=self.retention)
+        return defaultdict(lambda: defaultdict(factory))
+
+    @classmethod
+    def from_metric_log(cls, file_path: str, name: Optional[str] = None) -> 'Summary':
+        """Create a `Summary` from a binary metric log (as written by the `BinaryLogger` Trace).
+
+        ```python
+        summary = fe.summary.Summary.from_metric_log("mnist.femlog")
+        fe.summary.logs.visualize_logs(summary)
+        ```
+
+        Args:
+            file_path: The path to the binary metric log.
+            name: The name of the experiment. Defaults to the name of the log file (without its extension).
+
+        Returns:
+            A `Summary` containing all of the metrics from the log.
+        """
+        # Imported here to avoid loading the binary log format unless it is actually needed
+        from fastestimator.summary.metric_log import read_metric_log
+        if name is None:
+            name = os.path.splitext(os.path.basename(file_path))[0]
+        summary = cls(name)
+        read_metric_log(file_path, summary.history)
+        return summary
+
+    def save_history(self, file_path: str) -> None:
+        """Incrementally persist the history of this summary into a binary metric log.
+
+        Only the values which have changed since the previous call are appended to `file_path`, so the cost of each
+        call is proportional to how much history was added rather than to the total size of the history. Pickling
+        this summary within the `external_history` context will then only record a small description of each metric,
+        and unpickling it will reload the values from `file_path`.
+
+        Args:
+            file_path: Where to persist the history. If this differs from the previous invocation, then the full history
+                will be written into a new file.
+        """
+        # Imported here to avoid loading the binary log format unless it is actually needed
+        from fastestimator.summary.metric_log import MetricLogWriter
+        full = file_path != self._history_file
+        if full:
+            open(file_path, 'wb').close()
+        else:
+            # Discard anything written after the last successful save, for example by a save that crashed part way
+            with open(file_path, 'ab') as file:
+                file.truncate(self._history_offset)
+        writer = MetricLogWriter(file_path)
+        for mode, metrics in self.history.items():
+            for key, metric in metrics.items():
+                if isinstance(metric, MetricHistory):
+                    steps, values = metric.pop_changes()
+                    if full:
+                        steps, values = metric.to_arrays()
+                    entries = zip(steps.tolist(), values.tolist())
+                else:
+                    entries = metric.items()
+                for step, value in entries:
+                    writer.append(step, 0, mode, key, value)
+        writer.close()
+        self._history_file = file_path
+        self._history_offset = os.path.getsize(file_path)
+
+    @contextmanager
+    def external_history(self) -> Generator[None, None, None]:
+        """A context within which pickling this summary will refer to the file written by `save_history`.
+
+        ```python
+        summary.save_history("history.femlog")
+        with summary.external_history():
+            pickle.dump(summary, file)  # Only a description of each metric, the values stay in history.femlog
+        ```
+
+        Outside of this context (or if the history has changed since `save_history` was last invoked) a pickle of this
+        summary contains all of its values, so it can be restored without access to the history file.
+        """
+        self._external_history = True
+        try:
+            yield
+        finally:
+            self._external_history = False
 
     def merge(self, other: 'Summary'):
         """Merge another `Summary` into this one.
@@ -51,17 +168,32 @@ class Summary:
         """
         return bool(self.name)
 
-    def __getstate__(self):
+    def __getstate__(self) -> Dict[str, Any]:
         """Get a representation of the state of this object.
 
-        This method is invoked by pickle.
+        This method is invoked by pickle. Within the `external_history` context, if the history has been persisted by
+        `save_history` and has not changed since, only a description of each numeric metric is recorded rather than all
+        of its values. Metrics holding other kinds of values are always recorded in full so that their types survive.
 
         Returns:
             The information to be recorded by a pickle summary of this object.
         """
         state = self.__dict__.copy()
-        del state['system_config']
-        state['history'] = dict(state['history'])
+        state.pop('system_config', None)
+        state['_external_history'] = False
+        history = {mode: dict(metrics) for mode, metrics in self.history.items()}
+        persisted = self._external_history and self._history_file is not None and all(
+            metric.is_saved() for metrics in history.values()
+            for metric in metrics.values() if isinstance(metric, MetricHistory))
+        if persisted:
+            # Only numeric metrics are restored from the file, since their values are the only ones it stores exactly
+            state['persisted_history'] = {mode: {} for mode in history}
+            for mode, metrics in history.items():
+                for key, metric in list(metrics.items()):
+                    if isinstance(metric, MetricHistory) and metric.is_numeric():
+                        state['persisted_history'][mode][key] = metric.get_config()
+                        del metrics[key]
+        state['history'] = history
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
@@ -72,7 +204,24 @@ class Summary:
         Args:
             state: The saved state to be used by this object.
         """
-        history = defaultdict(lambda: defaultdict(dict))
-        history.update(state.get('history', {}))
-        state['history'] = history
+        # Summaries pickled by older versions of FastEstimator won't have the retention or persistence information
+        self.__dict__.update({
+            'max_steps': None,
+            'retention': 'downsample',
+            '_history_file': None,
+            '_history_offset': 0,
+            '_external_history': False
+        })
+        persisted = state.pop('persisted_history', None)
+        saved_history = state.pop('history', {})
         self.__dict__.update(state)
+        self.history = self._new_history()
+        for mode, metrics in saved_history.items():
+            self.history[mode].update(metrics)
+        if persisted:
+            # Imported here to avoid loading the binary log format unless it is actually needed
+            from fastestimator.summary.metric_log import read_metric_log
+            entries = read_metric_log(self._history_file, end=self._history_offset)
+            for mode, metrics in persisted.items():
+                for key, config in metrics.items():
+                    self.history[mode][key] = MetricHistory.from_config(config, entries[mode][key])
@@ -18,21 +18,25 @@ import os
 import pickle
 from typing import Any, Dict, List, Optional, TYPE_CHECKING, TypeVar, Union
 
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.load_model import load_model
 from fastestimator.backend.save_model import save_model
 from fastestimator.network import BaseNetwork
 from fastestimator.pipeline import Pipeline
 from fastestimator.schedule.schedule import Scheduler
+from fastestimator.summary.history import MetricHistory
 from fastestimator.summary.summary import Summary
+from fastestimator.util.lazy_util import lazy_import
 from fastestimator.util.traceability_util import FeSummaryTable, is_restorable
+from fastestimator.util.util import NonContext, is_tf_model, is_torch_model
 
 if TYPE_CHECKING:
+    import tensorflow as tf
+
     from fastestimator.trace.trace import Trace
 
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+torch = lazy_import('torch')
+
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
 
 
 class System:
@@ -45,12 +49,16 @@ class System:
         pipeline: The pipeline instance being used by the current fe.Estimator.
         traces: The traces provided to the current fe.Estimator.
         mode: The current execution mode (or None for warmup).
-        num_devices: How many GPUs are available for training.
+        num_devices: How many GPUs are available for training, or None to count the GPUs which are visible to PyTorch.
         log_steps: Log every n steps (0 to disable train logging, None to disable all logging).
         total_epochs: How many epochs training is expected to run for.
         max_train_steps_per_epoch: Whether training epochs will be cut short after N steps (or use None if they will run
             to completion)
         system_config: A description of the initialization parameters defining the associated estimator.
+        history_max_steps: The maximum number of step-level values to retain per metric in the `summary`, or None to
+            retain all of them.
+        history_retention: How to choose which step-level values to retain once `history_max_steps` is exceeded.
+            Either 'downsample' or 'reservoir'.
 
     Attributes:
         mode: What is the current execution mode of the estimator ('train', 'eval', 'test'), None if warmup.
@@ -67,6 +75,8 @@ class System:
         max_train_steps_per_epoch: Training will complete after n steps even if loader is not yet exhausted.
         max_eval_steps_per_epoch: Evaluation will complete after n steps even if loader is not yet exhausted.
         summary: An object to write experiment results to.
+        history_max_steps: The maximum number of step-level values to retain per metric in the `summary`.
+        history_retention: How to choose which step-level values to retain once `history_max_steps` is exceeded.
         experiment_time: A timestamp indicating when this model was trained.
     """
 
@@ -84,6 +94,8 @@ class System:
     max_train_steps_per_epoch: Optional[int]
     max_eval_steps_per_epoch: Optional[int]
     summary: Summary
+    history_max_steps: Optional[int]
+    history_retention: str
     experiment_time: str
 
     def __init__(self,
@@ -91,25 +103,29 @@ class System:
                  pipeline: Pipeline,
                  traces: List[Union['Trace', Scheduler['Trace']]],
                  mode: Optional[str] = None,
-                 num_devices: int = torch.cuda.device_count(),
+                 num_devices: Optional[int] = None,
                  log_steps: Optional[int] = None,
                  total_epochs: int = 0,
                  max_train_steps_per_epoch: Optional[int] = None,
                  max_eval_steps_per_epoch: Optional[int] = None,
-                 system_config: Optional[List[FeSummaryTable]] = None) -> None:
+                 system_config: Optional[List[FeSummaryTable]] = None,
+                 history_max_steps: Optional[int] = None,
+                 history_retention: str = 'downsample') -> None:
 
         self.network = network
         self.pipeline = pipeline
         self.traces = traces
         self.mode = mode
-        self.num_devices = num_devices
+        self.num_devices = torch.cuda.device_count() if num_devices is None else num_devices
         self.log_steps = log_steps
         self.total_epochs = total_epochs
         self.batch_idx = None
         self.max_train_steps_per_epoch = max_train_steps_per_epoch
         self.max_eval_steps_per_epoch = max_eval_steps_per_epoch
         self.stop_training = False
-        self.summary = Summary(None, system_config)
+        self.history_max_steps = history_max_steps
+        self.history_retention = history_retention
+        self.summary = Summary(None, system_config, max_steps=history_max_steps, retention=history_retention)
         self.experiment_time = ""
         self._initialize_state()
 
@@ -147,7 +163,10 @@ class System:
         self._initialize_state()
         self.batch_idx = None
         self.stop_training = False
-        self.summary = Summary(summary_name, system_config)
+        self.summary = Summary(summary_name,
+                               system_config,
+                               max_steps=self.history_max_steps,
+                               retention=self.history_retention)
 
     def reset_for_test(self, summary_name: Optional[str] = None) -> None:
         """Partially reset the current `System` object for a new round of testing.
@@ -163,23 +182,34 @@ class System:
         self.summary.name = summary_name or self.summary.name  # Keep old experiment name if new one not provided
         self.summary.history.pop('test', None)
 
-    def write_summary(self, key: str, value: Any) -> None:
+    def write_summary(self, key: str, value: Any, epoch_level: bool = False) -> None:
         """Write an entry into the `Summary` object (iff the experiment was named).
 
         Args:
             key: The key to write into the summary object.
             value: The value to write into the summary object.
+            epoch_level: Whether the value summarizes an entire epoch. Epoch-level values are always retained, whereas
+                step-level values may be downsampled depending on the `history_max_steps` setting.
         """
         if self.summary:
-            self.summary.history[self.mode][key][self.global_step or 0] = value
+            metric = self.summary.history[self.mode][key]
+            if isinstance(metric, MetricHistory):
+                metric.record(self.global_step or 0, value, pinned=epoch_level)
+            else:
+                metric[self.global_step or 0] = value
 
-    def save_state(self, save_dir: str) -> None:
+    def save_state(self, save_dir: str, history_path: Optional[str] = None) -> None:
         """Load training state.
 
         Args:
             save_dir: The directory into which to save the state
+            history_path: If provided, the summary history will be incrementally persisted into this file (which should
+                live outside of `save_dir`), so that each save only needs to write the history recorded since the
+                previous one. Otherwise the entire history will be saved into `save_dir`.
         """
         os.makedirs(save_dir, exist_ok=True)
+        if history_path:
+            self.summary.save_history(history_path)
         # Start with the high-level info. We could use pickle for this but having it human readable is nice.
         state = {key: value for key, value in self.__dict__.items() if is_restorable(value)[0]}
         with open(os.path.join(save_dir, 'system.json'), 'w') as fp:
@@ -199,7 +229,9 @@ class System:
              for key, value in self.pipeline.data.items() if hasattr(value, '__getstate__')}
         }
         with open(os.path.join(save_dir, 'objects.pkl'), 'wb') as file:
-            pickle.dump(objects, file)
+            # Only refer to the history file if it was just brought up to date, otherwise embed the full history
+            with self.summary.external_history() if history_path else NonContext():
+                pickle.dump(objects, file)
 
     def load_state(self, load_dir: str) -> None:
         """Load training state.
@@ -245,9 +277,9 @@ class System:
             ValueError: If the model is of an unknown type.
             FileNotFoundError: If the model weights or optimizer state is missing.
         """
-        if isinstance(model, tf.keras.Model):
+        if is_tf_model(model):
             model_ext, optimizer_ext = 'h5', 'pkl'
-        elif isinstance(model, torch.nn.Module):
+        elif is_torch_model(model):
             model_ext, optimizer_ext = 'pt', 'pt'
         else:
             raise ValueError(f"Unknown model type: {type(model)}")
@@ -12,5 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from fastestimator.trace import adapt, io, metric, xai
 from fastestimator.trace.trace import EvalEssential, Logger, TestEssential, Trace, TrainEssential, sort_traces
+from fastestimator.util.lazy_util import make_lazy
+
+# Many of the traces depend on TensorFlow or PyTorch, so the subpackages are only imported when they are first used
+make_lazy(
+    __name__, {
+        "adapt": "fastestimator.trace.adapt",
+        "io": "fastestimator.trace.io",
+        "metric": "fastestimator.trace.metric",
+        "xai": "fastestimator.trace.xai",
+    })
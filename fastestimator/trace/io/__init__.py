@@ -12,12 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from fastestimator.trace.io.best_model_saver import BestModelSaver
-from fastestimator.trace.io.csv_logger import CSVLogger
-from fastestimator.trace.io.image_saver import ImageSaver
-from fastestimator.trace.io.image_viewer import ImageViewer
-from fastestimator.trace.io.model_saver import ModelSaver
-from fastestimator.trace.io.restore_wizard import RestoreWizard
-from fastestimator.trace.io.tensorboard import TensorBoard
-from fastestimator.trace.io.test_report import TestReport
-from fastestimator.trace.io.traceability import Traceability
+from fastestimator.util.lazy_util import make_lazy
+
+make_lazy(
+    __name__, {
+        "BestModelSaver": "fastestimator.trace.io.best_model_saver",
+        "BinaryLogger": "fastestimator.trace.io.binary_logger",
+        "CSVLogger": "fastestimator.trace.io.csv_logger",
+        "ImageSaver": "fastestimator.trace.io.image_saver",
+        "ImageViewer": "fastestimator.trace.io.image_viewer",
+        "ModelSaver": "fastestimator.trace.io.model_saver",
+        "PipelineProfiler": "fastestimator.trace.io.pipeline_profiler",
+        "RestoreWizard": "fastestimator.trace.io.restore_wizard",
+        "TensorBoard": "fastestimator.trace.io.tensorboard",
+        "TestReport": "fastestimator.trace.io.test_report",
+        "Traceability": "fastestimator.trace.io.traceability",
+    })
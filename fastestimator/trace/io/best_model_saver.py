@@ -12,18 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from typing import Optional, Union
+from typing import Optional, TYPE_CHECKING, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
-
 from fastestimator.backend.load_model import load_model
 from fastestimator.backend.save_model import save_model
 from fastestimator.trace.trace import Trace
 from fastestimator.util.data import Data
 from fastestimator.util.traceability_util import traceable
 
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
 
 @traceable()
 class BestModelSaver(Trace):
@@ -40,8 +41,10 @@ class BestModelSaver(Trace):
         AssertionError: If a `metric` is not provided and it cannot be inferred from the `model`.
         ValueError: If `save_best_mode` is an unacceptable string.
     """
+    fe_main_process_only = True
+
     def __init__(self,
-                 model: Union[tf.keras.Model, torch.nn.Module],
+                 model: Union['tf.keras.Model', 'torch.nn.Module'],
                  save_dir: str,
                  metric: Optional[str] = None,
                  save_best_mode: str = "min",
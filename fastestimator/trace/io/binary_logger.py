@@ -0,0 +1,103 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import time
+from typing import List, Optional, Set, Union
+
+from fastestimator.summary.metric_log import METRIC_LOG_EXTENSION, MetricLogWriter
+from fastestimator.trace.trace import Trace
+from fastestimator.util.data import Data
+from fastestimator.util.traceability_util import traceable
+
+
+@traceable(blacklist=('writer', 'last_flush'))
+class BinaryLogger(Trace):
+    """Log monitored quantities into a compact binary columnar file.
+
+    Every row of the file records the step, epoch, mode, key, and value of a single metric. Values are recorded whenever
+    the console Logger would print them (every `log_steps` during training, and at the end of every epoch). The file can
+    be loaded back using `fe.summary.Summary.from_metric_log`, or visualized by passing it to
+    `fe.summary.logs.parse_log_files`, without any text parsing.
+
+    Args:
+        filename: Output filename. If it does not end with '.femlog', that extension will be appended. If the file
+            already exists then new metrics will be appended to it.
+        monitor_names: List of keys to monitor. If None then all metrics will be recorded.
+        mode: What mode(s) to execute this Trace in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+        flush_secs: How often (in seconds) to flush buffered metrics to disk. Metrics are also flushed at the end of
+            every epoch.
+        chunk_size: The maximum number of metric values to hold in memory before writing them to disk.
+    """
+    fe_main_process_only = True
+
+    def __init__(self,
+                 filename: str,
+                 monitor_names: Optional[Union[List[str], str]] = None,
+                 mode: Union[None, str, Set[str]] = None,
+                 flush_secs: float = 30.0,
+                 chunk_size: int = 4096) -> None:
+        super().__init__(inputs="*" if monitor_names is None else monitor_names, mode=mode)
+        if not filename.endswith(METRIC_LOG_EXTENSION):
+            filename = filename + METRIC_LOG_EXTENSION
+        self.filename = filename
+        self.flush_secs = flush_secs
+        self.chunk_size = chunk_size
+        self.writer = None
+        self.last_flush = 0.0
+
+    def on_begin(self, data: Data) -> None:
+        root_dir = os.path.dirname(self.filename)
+        if root_dir:
+            os.makedirs(root_dir, exist_ok=True)
+        self.writer = MetricLogWriter(self.filename, chunk_size=self.chunk_size)
+        self.last_flush = time.perf_counter()
+
+    def on_batch_end(self, data: Data) -> None:
+        if self.system.mode == "train" and self.system.log_steps and (self.system.global_step % self.system.log_steps
+                                                                      == 0 or self.system.global_step == 1):
+            self._write(data)
+            if time.perf_counter() - self.last_flush > self.flush_secs:
+                self.writer.flush()
+                self.last_flush = time.perf_counter()
+
+    def on_epoch_end(self, data: Data) -> None:
+        if self.system.mode != "train" or self.system.log_steps:
+            self.writer.append(self.system.global_step, self.system.epoch_idx, self.system.mode, 'epoch',
+                               self.system.epoch_idx)
+            self._write(data)
+        self.writer.flush()
+        self.last_flush = time.perf_counter()
+
+    def on_end(self, data: Data) -> None:
+        if self.system.mode != "test":
+            self._write(data)
+        self.writer.close()
+        self.writer = None
+
+    def _write(self, data: Data) -> None:
+        """Record the monitored values from `data` into the log.
+
+        Args:
+            data: A collection of data from which to read the monitored values.
+        """
+        if "*" in self.inputs:
+            items = data.read_logs().items()
+        else:
+            items = ((key, data[key]) for key in self.inputs if key in data)
+        for key, value in items:
+            self.writer.append(self.system.global_step, self.system.epoch_idx, self.system.mode, key, value)
+
@@ -36,6 +36,8 @@ class ImageSaver(Trace):
             regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
             like "!infer" or "!train".
     """
+    fe_main_process_only = True
+
     def __init__(self,
                  inputs: Union[str, Sequence[str]],
                  save_dir: str = os.getcwd(),
@@ -37,6 +37,8 @@ class ImageViewer(Trace):
         width: The width in inches of the figure.
         height: The height in inches of the figure.
     """
+    fe_main_process_only = True
+
     def __init__(self,
                  inputs: Union[str, Sequence[str]],
                  mode: Union[str, Set[str]] = ("eval", "test"),
@@ -14,16 +14,17 @@
 # ==============================================================================
 import os
 from collections import deque
-from typing import Optional, Union
-
-import tensorflow as tf
-import torch
+from typing import Optional, TYPE_CHECKING, Union
 
 from fastestimator.backend.save_model import save_model
 from fastestimator.trace.trace import Trace
 from fastestimator.util.data import Data
 from fastestimator.util.traceability_util import traceable
 
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
 
 @traceable()
 class ModelSaver(Trace):
@@ -35,8 +36,10 @@ class ModelSaver(Trace):
         frequency: Model saving frequency in epoch(s).
         max_to_keep: Maximum number of latest saved files to keep. If 0 or None, all models will be saved.
     """
+    fe_main_process_only = True
+
     def __init__(self,
-                 model: Union[tf.keras.Model, torch.nn.Module],
+                 model: Union['tf.keras.Model', 'torch.nn.Module'],
                  save_dir: str,
                  frequency: int = 1,
                  max_to_keep: Optional[int] = None) -> None:
@@ -0,0 +1,100 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+from typing import Optional, Set, Tuple, Union
+
+import numpy as np
+
+from fastestimator.dataset.op_dataset import OpProfile
+from fastestimator.trace.trace import Trace
+from fastestimator.util.data import Data
+from fastestimator.util.traceability_util import traceable
+
+
+@traceable()
+class PipelineProfiler(Trace):
+    """Report where the Pipeline spends its time while the system is actually running.
+
+    The timings are collected by the data loader workers themselves (see OpDataset), so unlike `Pipeline.benchmark`
+    they reflect worker contention, caching effects, and the ops which are actually scheduled for the current epoch and
+    mode. Only Pipelines built on FastEstimator Datasets can be profiled.
+
+    Args:
+        log_steps: How frequently (in training steps) to report the profile. If None, the system's log_steps will be
+            used. A summary of the entire epoch is also reported at the end of every epoch.
+        mode: What mode(s) to execute this Trace in. For example, "train", "eval", "test", or "infer". To execute
+            regardless of mode, pass None. To execute in all modes except for a particular one, you can pass an argument
+            like "!infer" or "!train".
+
+    Raises:
+        ValueError: If `log_steps` is invalid.
+    """
+    fe_main_process_only = True
+
+    def __init__(self, log_steps: Optional[int] = None, mode: Union[None, str, Set[str]] = ("train", "eval")) -> None:
+        if log_steps is not None and log_steps < 1:
+            raise ValueError(f"PipelineProfiler requires log_steps to be >= 1, but got {log_steps}")
+        super().__init__(mode=mode, outputs=["pipeline_samples/sec", "pipeline_op_time"])
+        self.log_steps = log_steps
+        self.profile = None
+        self.epoch_stats = None
+        self.step_stats = None
+
+    def on_epoch_begin(self, data: Data) -> None:
+        self.profile = self.system.pipeline.op_profiles.get(self.system.mode)
+        if self.profile is not None:
+            self.epoch_stats = self._snapshot()
+            self.step_stats = self.epoch_stats
+
+    def on_batch_end(self, data: Data) -> None:
+        log_steps = self.log_steps or self.system.log_steps
+        if self.profile is None or self.system.mode != "train" or not log_steps:
+            return
+        if self.system.global_step % log_steps == 0:
+            current = self._snapshot()
+            self._write(data, self.step_stats, current)
+            self.step_stats = current
+
+    def on_epoch_end(self, data: Data) -> None:
+        if self.profile is not None:
+            self._write(data, self.epoch_stats, self._snapshot())
+
+    def _snapshot(self) -> Tuple[float, np.ndarray, int]:
+        op_times, _, samples = self.profile.get_stats()
+        return time.perf_counter(), op_times, samples
+
+    def _write(self, data: Data, start: Tuple[float, np.ndarray, int], end: Tuple[float, np.ndarray, int]) -> None:
+        elapsed = end[0] - start[0]
+        op_times = end[1] - start[1]
+        samples = end[2] - start[2]
+        if elapsed > 0:
+            data.write_with_log("pipeline_samples/sec", round(samples / elapsed, 2))
+        data.write_with_log("pipeline_op_time", self.format_op_times(self.profile, op_times))
+
+    @staticmethod
+    def format_op_times(profile: OpProfile, op_times: np.ndarray) -> str:
+        """Describe the share of the total Pipeline op time taken by each op.
+
+        Args:
+            profile: The profile which produced the `op_times`.
+            op_times: The time spent in each of the profiled ops.
+
+        Returns:
+            A string like "ReadImage: 70.12%, Minmax: 29.88%".
+        """
+        total = np.sum(op_times)
+        if total <= 0:
+            return ", ".join(f"{name}: 0.00%" for name in profile.op_names)
+        return ", ".join(f"{name}: {100 * t / total:.2f}%" for name, t in zip(profile.op_names, op_times))
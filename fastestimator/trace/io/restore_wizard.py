@@ -17,7 +17,9 @@ import shutil
 from typing import List, Union
 
 import fastestimator as fe
+from fastestimator.network import TFNetwork
 from fastestimator.trace.trace import Trace
+from fastestimator.util.distributed import is_main_process
 from fastestimator.util.data import Data
 from fastestimator.util.traceability_util import traceable
 from fastestimator.util.util import to_list
@@ -27,6 +29,11 @@ from fastestimator.util.util import to_list
 class RestoreWizard(Trace):
     """A trace that can backup and load your entire training status.
 
+    When training is distributed across several processes, every process restores from the backup but only the main
+    process writes it. Deterministic PyTorch training (see fe.enable_deterministic) can also be restored, since the
+    Pipeline and the Estimator key all of their random streams by epoch rather than advancing a single random state.
+    This does not hold for TensorFlow, whose random ops each keep their own internal state.
+
     Args:
         directory: Directory to save and load the training status.
         frequency: Saving frequency in epoch(s).
@@ -38,28 +45,35 @@ class RestoreWizard(Trace):
         # For robust saving, we need to create 2 different directories and have a key file to switch between them
         self.dirs = [os.path.join(self.directory, 'A'), os.path.join(self.directory, 'B')]
         self.key_path = os.path.join(self.directory, 'key.txt')
+        # The summary history is appended to incrementally rather than being re-written into A or B every time
+        self.history_path = os.path.join(self.directory, 'history.femlog')
         self.dir_idx = 0
 
     def on_begin(self, data: Data) -> None:
-        if fe.fe_deterministic_seed is not None:
-            raise RuntimeError("You cannot use RestoreWizard while in deterministic training mode since a restored" +
-                               " training can't guarantee that all prngs will be reset to exactly the same position")
+        if fe.fe_deterministic_seed is not None and isinstance(self.system.network, TFNetwork):
+            raise RuntimeError("You cannot use RestoreWizard while in deterministic training mode with a TensorFlow " +
+                               "network since a restored training can't guarantee that all prngs will be reset to " +
+                               "exactly the same position")
         if not self.should_restore():
-            self._cleanup(self.dirs)  # Remove any partially completed checkpoints
-            print("FastEstimator-RestoreWizard: Backing up to {}".format(self.directory))
+            if is_main_process():
+                self._cleanup(self.dirs)  # Remove any partially completed checkpoints
+                self._cleanup(self.history_path)
+                print("FastEstimator-RestoreWizard: Backing up to {}".format(self.directory))
         else:
+            # During distributed training every process restores its own state, but only the main one writes files
             self._load_key()
             directory = self.dirs[self.dir_idx]
             self.system.load_state(directory)
             data.write_with_log("epoch", self.system.epoch_idx)
-            print("FastEstimator-RestoreWizard: Restoring from {}, resume training".format(directory))
             self.dir_idx = int(not self.dir_idx)  # Flip the idx so that next save goes to other dir
-            self._cleanup(self.dirs[self.dir_idx])  # Clean out the other dir in case it had a partial save
+            if is_main_process():
+                print("FastEstimator-RestoreWizard: Restoring from {}, resume training".format(directory))
+                self._cleanup(self.dirs[self.dir_idx])  # Clean out the other dir in case it had a partial save
 
     def on_epoch_end(self, data: Data) -> None:
-        if self.system.epoch_idx % self.frequency == 0:
+        if self.system.epoch_idx % self.frequency == 0 and is_main_process():
             directory = self.dirs[self.dir_idx]
-            self.system.save_state(directory)
+            self.system.save_state(directory, history_path=self.history_path)
             self._write_key()
             # Everything after this is free to die without causing problems with restore
             self.dir_idx = int(not self.dir_idx)
@@ -98,12 +112,14 @@ class RestoreWizard(Trace):
 
     @staticmethod
     def _cleanup(paths: Union[str, List[str]]) -> None:
-        """Delete stale directories if they exist.
+        """Delete stale directories (or files) if they exist.
 
         Args:
-            paths: Which directories to delete.
+            paths: Which directories (or files) to delete.
         """
         paths = to_list(paths)
         for path in paths:
-            if os.path.exists(path):
+            if os.path.isdir(path):
                 shutil.rmtree(path)
+            elif os.path.exists(path):
+                os.remove(path)
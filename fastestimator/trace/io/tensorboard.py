@@ -13,11 +13,16 @@
 # limitations under the License.
 # ==============================================================================
 import os
+import queue
 import re
+import threading
+import time
 from collections import namedtuple
-from typing import Any, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, TypeVar, Union
 
+import matplotlib.backends.backend_agg as plt_backend_agg
 import matplotlib.pyplot as plt
+import numpy as np
 import tensorboard as tb
 import tensorflow as tf
 import torch
@@ -46,81 +51,305 @@ tf.io.gfile = tb.compat.tensorflow_stub.io.gfile
 Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
 Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
 
+DROP_POLICIES = ('block', 'drop_newest', 'drop_oldest')
+_FLUSH_SECS = 10.0  # How often the background thread flushes summaries to disk
+_MAX_PENDING_EVENTS = 1000  # Let the background thread decide when to flush rather than the underlying file writers
+
 
 class _BaseWriter:
     """A class to write various types of data into TensorBoard summary files.
 
+    Data is snapshotted onto the host by the thread which invokes the `write_*` methods, and then handed off through a
+    bounded queue to a background thread which computes any derived summaries (such as histograms) and writes them to
+    disk. The background thread processes everything which is waiting in the queue at once, and only flushes the files
+    every few seconds, so that the cost of disk access is amortized across many summaries.
+
     This class is intentionally not @traceable.
 
     Args:
         root_log_dir: The directory into which to store a new directory corresponding to this experiment's summary data
         time_stamp: The timestamp of this experiment (used as a folder name within `root_log_dir`).
         network: The network associated with the current experiment.
+        queue_size: The maximum number of pending writes. If 0, then writes will happen synchronously on the calling
+            thread.
+        drop_policy: What to do when the queue is full. 'block' will wait for space to become available, 'drop_newest'
+            will discard the new write, and 'drop_oldest' will discard the oldest pending write.
+
+    Raises:
+        ValueError: If `queue_size` or `drop_policy` are invalid.
     """
     summary_writers: Dict[str, SummaryWriter]
     network: BaseNetwork
 
-    def __init__(self, root_log_dir: str, time_stamp: str, network: BaseNetwork) -> None:
-        self.summary_writers = DefaultKeyDict(lambda key:
-                                              (SummaryWriter(log_dir=os.path.join(root_log_dir, time_stamp, key))))
+    def __init__(self,
+                 root_log_dir: str,
+                 time_stamp: str,
+                 network: BaseNetwork,
+                 queue_size: int = 0,
+                 drop_policy: str = 'block') -> None:
+        if queue_size < 0:
+            raise ValueError(f"queue_size must be a non-negative integer, but got {queue_size}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}, but got {drop_policy}")
+        self.summary_writers = DefaultKeyDict(lambda key: (SummaryWriter(
+            log_dir=os.path.join(root_log_dir, time_stamp, key), max_queue=_MAX_PENDING_EVENTS)))
         self.network = network
+        self.drop_policy = drop_policy
+        self.n_dropped = 0
+        self._queue = queue.Queue(maxsize=queue_size) if queue_size else None
+        self._thread = None  # type: Optional[threading.Thread]
+        self._error = None  # type: Optional[BaseException]
+        self._max_lag = 0.0
+        self._last_flush = time.perf_counter()
+
+    def submit(self, fn: Callable[..., None], *args: Any, droppable: bool = True) -> None:
+        """Schedule a write to be performed by the background thread.
+
+        Args:
+            fn: The function which performs the write.
+            *args: The arguments to be passed to `fn`. These should not be modified after being submitted.
+            droppable: Whether this write may be discarded if the queue is full. Otherwise the caller will block until
+                there is space in the queue.
+
+        Raises:
+            RuntimeError: If a previously submitted write failed.
+        """
+        self._raise_error()
+        if self._queue is None:
+            fn(*args)
+            return
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="FastEstimator-TensorBoard", daemon=True)
+            self._thread.start()
+        item = (time.perf_counter(), fn, args)
+        if not droppable or self.drop_policy == 'block':
+            self._queue.put(item)
+            return
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self.n_dropped += 1
+            if self.drop_policy == 'drop_oldest':
+                try:
+                    self._queue.get_nowait()
+                    self._queue.task_done()
+                except queue.Empty:
+                    pass
+                self._queue.put(item)
+
+    def wait(self) -> None:
+        """Block until all of the submitted writes have been performed.
+
+        Raises:
+            RuntimeError: If a submitted write failed.
+        """
+        if self._queue is not None:
+            self._queue.join()
+        self._raise_error()
+
+    def flush(self) -> None:
+        """Block until all of the submitted writes have been performed, and then flush them to disk.
+
+        Raises:
+            RuntimeError: If a submitted write failed.
+        """
+        self.wait()
+        self._flush_files()
+
+    def pop_lag(self) -> float:
+        """Get the longest time that any write spent waiting to be completed since the previous invocation.
+
+        Returns:
+            The maximum delay (in seconds) between a write being submitted and it being performed.
+        """
+        lag, self._max_lag = self._max_lag, 0.0
+        return lag
+
+    def _run(self) -> None:
+        """Perform submitted writes until the end of the queue is reached.
+        """
+        while True:
+            batch = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            for item in batch:
+                if item is None:
+                    self._flush_files()
+                    for _ in batch:
+                        self._queue.task_done()
+                    return
+                submit_time, fn, args = item
+                try:
+                    fn(*args)
+                except Exception as err:  # Re-raised on the training thread by the next call to submit() or wait()
+                    self._error = self._error or err
+                self._max_lag = max(self._max_lag, time.perf_counter() - submit_time)
+            if time.perf_counter() - self._last_flush > _FLUSH_SECS:
+                self._flush_files()
+            for _ in batch:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        """Propagate any error raised by the background thread.
+
+        Raises:
+            RuntimeError: If a submitted write failed.
+        """
+        if self._error is not None:
+            err, self._error = self._error, None
+            raise RuntimeError("FastEstimator-TensorBoard: Failed to write a summary") from err
+
+    def _flush_files(self) -> None:
+        """Flush all of the summary files to disk.
+        """
+        for writer in list(self.summary_writers.values()):
+            writer.flush()
+        self._last_flush = time.perf_counter()
 
     def write_epoch_models(self, mode: str) -> None:
         """Write summary graphs for all of the models in the current epoch.
 
+        Since the models may need to be invoked in order to trace their graphs, this happens on the calling thread.
+
+        Args:
+            mode: The current mode of execution ('train', 'eval', 'test', 'infer').
+        """
+        self.wait()
+        self._write_epoch_models(mode)
+
+    def _write_epoch_models(self, mode: str) -> None:
+        """Write summary graphs for all of the models in the current epoch.
+
         Args:
             mode: The current mode of execution ('train', 'eval', 'test', 'infer').
         """
         raise NotImplementedError
 
-    def write_weights(self, mode: str, models: Iterable[Model], step: int, visualize: bool) -> None:
+    def write_weights(self,
+                      mode: str,
+                      models: Iterable[Model],
+                      step: int,
+                      visualize: bool,
+                      droppable: bool = True) -> None:
         """Write summaries of all of the weights of a given collection of `models`.
 
+        The weights are copied to the host immediately, but their histograms and visualizations are computed in the
+        background.
+
         Args:
             mode: The current mode of execution ('train', 'eval', 'test', 'infer').
             models: A list of models compiled with fe.build whose weights should be recorded.
             step: The current training step.
             visualize: Whether to attempt to paint graphical representations of the weights in addition to the default
                 histogram summaries.
+            droppable: Whether the write may be discarded if the writer is falling behind.
+        """
+        self.submit(self._write_weights, mode, self._get_weights(models), step, visualize, droppable=droppable)
+
+    def _get_weights(self, models: Iterable[Model]) -> List[Tuple[str, np.ndarray]]:
+        """Take a snapshot of all of the weights of a given collection of `models`.
+
+        Args:
+            models: A list of models compiled with fe.build whose weights should be recorded.
+
+        Returns:
+            A list of (name, weight) pairs, where each weight is a copy which is safe to read from another thread.
         """
         raise NotImplementedError
 
-    def write_scalars(self, mode: str, scalars: Iterable[Tuple[str, Any]], step: int) -> None:
+    def _write_weights(self, mode: str, weights: List[Tuple[str, np.ndarray]], step: int, visualize: bool) -> None:
+        """Write summaries of a collection of weights.
+
+        Args:
+            mode: The current mode of execution ('train', 'eval', 'test', 'infer').
+            weights: The output of `_get_weights`.
+            step: The current training step.
+            visualize: Whether to attempt to paint graphical representations of the weights in addition to the default
+                histogram summaries.
+        """
+        raise NotImplementedError
+
+    def write_scalars(self, mode: str, scalars: Iterable[Tuple[str, Any]], step: int, droppable: bool = True) -> None:
         """Write summaries of scalars to TensorBoard.
 
+        Args:
+            mode: The current mode of execution ('train', 'eval', 'test', 'infer').
+            scalars: A collection of pairs like [("key", val), ("key2", val2), ...].
+            step: The current training step.
+            droppable: Whether the write may be discarded if the writer is falling behind.
+        """
+        scalars = [(key, to_number(val)) for key, val in scalars]
+        self.submit(self._write_scalars, mode, scalars, step, droppable=droppable)
+
+    def _write_scalars(self, mode: str, scalars: List[Tuple[str, np.ndarray]], step: int) -> None:
+        """Write summaries of scalars which have already been copied to the host.
+
         Args:
             mode: The current mode of execution ('train', 'eval', 'test', 'infer').
             scalars: A collection of pairs like [("key", val), ("key2", val2), ...].
             step: The current training step.
         """
         for key, val in scalars:
-            self.summary_writers[mode].add_scalar(tag=key, scalar_value=to_number(val), global_step=step)
+            self.summary_writers[mode].add_scalar(tag=key, scalar_value=val, global_step=step)
 
-    def write_images(self, mode: str, images: Iterable[Tuple[str, Any]], step: int) -> None:
+    def write_images(self, mode: str, images: Iterable[Tuple[str, Any]], step: int, droppable: bool = True) -> None:
         """Write images to TensorBoard.
 
         Args:
             mode: The current mode of execution ('train', 'eval', 'test', 'infer').
             images: A collection of pairs like [("key", image1), ("key2", image2), ...].
             step: The current training step.
+            droppable: Whether the write may be discarded if the writer is falling behind.
         """
+        snapshots = []
         for key, img in images:
+            # Figures are rendered here since painting and drawing use pyplot, which is not thread safe
             if isinstance(img, ImgData):
-                img = img.paint_figure()
-            if isinstance(img, plt.Figure):
-                self.summary_writers[mode].add_figure(tag=key, figure=img, global_step=step)
+                snapshots.append((key, img.paint_numpy(), 'NHWC'))
+            elif isinstance(img, plt.Figure):
+                snapshots.append((key, self._figure_to_numpy(img), 'NHWC'))
             else:
-                self.summary_writers[mode].add_images(tag=key,
-                                                      img_tensor=to_number(img),
-                                                      global_step=step,
-                                                      dataformats='NCHW' if isinstance(img, torch.Tensor) else 'NHWC')
-
-    def write_embeddings(
-        self,
-        mode: str,
-        embeddings: Iterable[Tuple[str, Tensor, Optional[List[Any]], Optional[Tensor]]],
-        step: int,
-    ):
+                snapshots.append((key, to_number(img), 'NCHW' if isinstance(img, torch.Tensor) else 'NHWC'))
+        if snapshots:
+            self.submit(self._write_images, mode, snapshots, step, droppable=droppable)
+
+    def _write_images(self, mode: str, images: List[Tuple[str, np.ndarray, str]], step: int) -> None:
+        """Write images which have already been copied to the host.
+
+        Args:
+            mode: The current mode of execution ('train', 'eval', 'test', 'infer').
+            images: A collection of triplets like [("key", image, data_format)].
+            step: The current training step.
+        """
+        for key, img, data_format in images:
+            self.summary_writers[mode].add_images(tag=key, img_tensor=img, global_step=step, dataformats=data_format)
+
+    @staticmethod
+    def _figure_to_numpy(fig: plt.Figure) -> np.ndarray:
+        """Render a matplotlib figure into an image, closing the figure afterwards.
+
+        Args:
+            fig: The figure to be rendered.
+
+        Returns:
+            A numpy array with dimensions (1, height, width, 3) containing the rendered figure.
+        """
+        canvas = plt_backend_agg.FigureCanvasAgg(fig)
+        canvas.draw()
+        data = np.frombuffer(canvas.buffer_rgba(), dtype=np.uint8)
+        w, h = canvas.get_width_height()
+        data = data.reshape([h, w, 4])[:, :, 0:3]
+        plt.close(fig)
+        return np.stack([data])  # Add a batch dimension
+
+    def write_embeddings(self,
+                         mode: str,
+                         embeddings: Iterable[Tuple[str, Tensor, Optional[List[Any]], Optional[Tensor]]],
+                         step: int,
+                         droppable: bool = True) -> None:
         """Write embeddings (like UMAP) to TensorBoard.
 
         Args:
@@ -129,12 +358,37 @@ class _BaseWriter:
                 Features are expected to be batched, and if labels and/or label images are provided they should have the
                 same batch dimension as the features.
             step: The current training step.
+            droppable: Whether the write may be discarded if the writer is falling behind.
         """
+        snapshots = []
         for key, features, labels, label_imgs in embeddings:
             flat = to_number(reshape(features, [features.shape[0], -1]))
-            if not isinstance(label_imgs, (torch.Tensor, type(None))):
+            if isinstance(labels, (tf.Tensor, torch.Tensor)):
+                labels = to_number(labels)
+            # Images which are not already torch tensors are assumed to be channel-last
+            channels_last = not isinstance(label_imgs, (torch.Tensor, type(None)))
+            if label_imgs is not None:
+                label_imgs = to_number(label_imgs)
+            snapshots.append((key, flat, labels, label_imgs, channels_last))
+        if snapshots:
+            self.submit(self._write_embeddings, mode, snapshots, step, droppable=droppable)
+
+    def _write_embeddings(self,
+                          mode: str,
+                          embeddings: List[Tuple[str, np.ndarray, Any, Optional[np.ndarray], bool]],
+                          step: int) -> None:
+        """Write embeddings which have already been copied to the host.
+
+        Args:
+            mode: The current mode of execution ('train', 'eval', 'test', 'infer').
+            embeddings: A collection of quintuplets like [("key", <flat features>, <labels>, <label_images>,
+                <label_images_are_channels_last>)].
+            step: The current training step.
+        """
+        for key, flat, labels, label_imgs, channels_last in embeddings:
+            if label_imgs is not None:
                 label_imgs = to_tensor(label_imgs, 'torch')
-                if len(label_imgs.shape) == 4:
+                if channels_last and len(label_imgs.shape) == 4:
                     label_imgs = permute(label_imgs, [0, 3, 1, 2])
             self.summary_writers[mode].add_embedding(mat=flat,
                                                      metadata=labels,
@@ -144,11 +398,19 @@ class _BaseWriter:
 
     def close(self) -> None:
         """A method to flush and close all connections to the files on disk.
+
+        Raises:
+            RuntimeError: If a submitted write failed.
         """
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
         modes = list(self.summary_writers.keys())  # break connection with dictionary so can delete in iteration
         for mode in modes:
             self.summary_writers[mode].close()
             del self.summary_writers[mode]
+        self._raise_error()
 
     @staticmethod
     def _weight_to_image(weight: Tensor, kernel_channels_last: bool = False) -> Optional[Tensor]:
@@ -192,15 +454,27 @@ class _TfWriter(_BaseWriter):
         root_log_dir: The directory into which to store a new directory corresponding to this experiment's summary data
         time_stamp: The timestamp of this experiment (used as a folder name within `root_log_dir`).
         network: The network associated with the current experiment.
+        queue_size: The maximum number of pending writes. If 0, then writes will happen synchronously on the calling
+            thread.
+        drop_policy: What to do when the queue is full. One of 'block', 'drop_newest', or 'drop_oldest'.
     """
     tf_summary_writers: Dict[str, tf.summary.SummaryWriter]
 
-    def __init__(self, root_log_dir: str, time_stamp: str, network: TFNetwork) -> None:
-        super().__init__(root_log_dir=root_log_dir, time_stamp=time_stamp, network=network)
-        self.tf_summary_writers = DefaultKeyDict(
-            lambda key: (tf.summary.create_file_writer(os.path.join(root_log_dir, time_stamp, key))))
-
-    def write_epoch_models(self, mode: str) -> None:
+    def __init__(self,
+                 root_log_dir: str,
+                 time_stamp: str,
+                 network: TFNetwork,
+                 queue_size: int = 0,
+                 drop_policy: str = 'block') -> None:
+        super().__init__(root_log_dir=root_log_dir,
+                         time_stamp=time_stamp,
+                         network=network,
+                         queue_size=queue_size,
+                         drop_policy=drop_policy)
+        self.tf_summary_writers = DefaultKeyDict(lambda key: (tf.summary.create_file_writer(
+            os.path.join(root_log_dir, time_stamp, key), max_queue=_MAX_PENDING_EVENTS)))
+
+    def _write_epoch_models(self, mode: str) -> None:
         with self.tf_summary_writers[mode].as_default(), summary_ops_v2.always_record_summaries():
             summary_ops_v2.graph(backend.get_graph(), step=0)
             for model in self.network.epoch_models:
@@ -209,21 +483,31 @@ class _TfWriter(_BaseWriter):
                 if summary_writable:
                     summary_ops_v2.keras_model(model.model_name, model, step=0)
 
-    def write_weights(self, mode: str, models: Iterable[Model], step: int, visualize: bool) -> None:
+    def _get_weights(self, models: Iterable[Model]) -> List[Tuple[str, np.ndarray]]:
         # Similar to TF implementation, but multiple models
+        weights = []
+        for model in models:
+            for layer in model.layers:
+                for weight in layer.weights:
+                    weight_name = weight.name.replace(':', '_')
+                    weight_name = "{}_{}".format(model.model_name, weight_name)
+                    with tfops.init_scope():
+                        weights.append((weight_name, backend.get_value(weight)))
+        return weights
+
+    def _write_weights(self, mode: str, weights: List[Tuple[str, np.ndarray]], step: int, visualize: bool) -> None:
         with self.tf_summary_writers[mode].as_default(), summary_ops_v2.always_record_summaries():
-            for model in models:
-                for layer in model.layers:
-                    for weight in layer.weights:
-                        weight_name = weight.name.replace(':', '_')
-                        weight_name = "{}_{}".format(model.model_name, weight_name)
-                        with tfops.init_scope():
-                            weight = backend.get_value(weight)
-                        summary_ops_v2.histogram(weight_name, weight, step=step)
-                        if visualize:
-                            weight = self._weight_to_image(weight=weight, kernel_channels_last=True)
-                            if weight is not None:
-                                summary_ops_v2.image(weight_name, weight, step=step, max_images=weight.shape[0])
+            for weight_name, weight in weights:
+                summary_ops_v2.histogram(weight_name, weight, step=step)
+                if visualize:
+                    weight = self._weight_to_image(weight=weight, kernel_channels_last=True)
+                    if weight is not None:
+                        summary_ops_v2.image(weight_name, weight, step=step, max_images=weight.shape[0])
+
+    def _flush_files(self) -> None:
+        for writer in list(self.tf_summary_writers.values()):
+            writer.flush()
+        super()._flush_files()
 
     def close(self) -> None:
         super().close()
@@ -238,25 +522,31 @@ class _TorchWriter(_BaseWriter):
 
     This class is intentionally not @traceable.
     """
-    def write_epoch_models(self, mode: str) -> None:
+    def _write_epoch_models(self, mode: str) -> None:
         for model in self.network.epoch_models:
             inputs = model.fe_input_spec.get_dummy_input()
             self.summary_writers[mode].add_graph(model, input_to_model=inputs)
 
-    def write_weights(self, mode: str, models: Iterable[Model], step: int, visualize: bool) -> None:
+    def _get_weights(self, models: Iterable[Model]) -> List[Tuple[str, np.ndarray]]:
+        weights = []
         for model in models:
             for name, params in model.named_parameters():
                 name = name.replace(".", "/")
                 name = "{}_{}".format(model.model_name, name)
-                weight = params.data
-                self.summary_writers[mode].add_histogram(tag=name, values=weight, global_step=step)
-                if visualize:
-                    weight = self._weight_to_image(weight=weight)
-                    if weight is not None:
-                        self.summary_writers[mode].add_images(tag=name + "/image",
-                                                              img_tensor=weight,
-                                                              global_step=step,
-                                                              dataformats='NHWC')
+                # Copy even if the parameters are already on the cpu, since the optimizer will modify them in place
+                weights.append((name, params.detach().to('cpu', copy=True).numpy()))
+        return weights
+
+    def _write_weights(self, mode: str, weights: List[Tuple[str, np.ndarray]], step: int, visualize: bool) -> None:
+        for name, weight in weights:
+            self.summary_writers[mode].add_histogram(tag=name, values=weight, global_step=step)
+            if visualize:
+                weight = self._weight_to_image(weight=weight)
+                if weight is not None:
+                    self.summary_writers[mode].add_images(tag=name + "/image",
+                                                          img_tensor=weight,
+                                                          global_step=step,
+                                                          dataformats='NHWC')
 
 
 @traceable()
@@ -286,10 +576,23 @@ class TensorBoard(Trace):
             TensorBoard embeddings.
         embedding_labels: Keys corresponding to label information for the `write_embeddings`.
         embedding_images: Keys corresponding to raw images to be associated with the `write_embeddings`.
+        queue_size: Summaries are copied to the host during training and then written to disk by a background thread.
+            This is the maximum number of writes which may be waiting for that thread. If 0, then everything will be
+            written synchronously on the training thread.
+        drop_policy: What to do with step-level summaries if the background thread falls far enough behind for the
+            queue to fill up. 'block' pauses training until there is space, 'drop_newest' discards the new summaries,
+            and 'drop_oldest' discards the oldest pending summaries. Epoch-level summaries are never dropped.
+        lag_key: If provided, the longest time (in seconds) that any summary spent waiting to be written during each
+            epoch will be written into the logs under this key.
+
+    Raises:
+        ValueError: If `queue_size` or `drop_policy` are invalid.
     """
     Freq = namedtuple('Freq', ['is_step', 'freq'])
     writer: _BaseWriter
 
+    fe_main_process_only = True
+
     def __init__(self,
                  log_dir: str = 'logs',
                  update_freq: Union[None, int, str] = 100,
@@ -299,8 +602,18 @@ class TensorBoard(Trace):
                  paint_weights: bool = False,
                  write_embeddings: Union[None, str, List[str]] = None,
                  embedding_labels: Union[None, str, List[str]] = None,
-                 embedding_images: Union[None, str, List[str]] = None) -> None:
-        super().__init__(inputs="*")
+                 embedding_images: Union[None, str, List[str]] = None,
+                 queue_size: int = 64,
+                 drop_policy: str = 'block',
+                 lag_key: Optional[str] = None) -> None:
+        super().__init__(inputs="*", outputs=lag_key)
+        if queue_size < 0:
+            raise ValueError(f"queue_size must be a non-negative integer, but got {queue_size}")
+        if drop_policy not in DROP_POLICIES:
+            raise ValueError(f"drop_policy must be one of {DROP_POLICIES}, but got {drop_policy}")
+        self.queue_size = queue_size
+        self.drop_policy = drop_policy
+        self.lag_key = lag_key
         self.root_log_dir = log_dir
         self.update_freq = self._parse_freq(update_freq)
         self.write_graph = write_graph
@@ -366,9 +679,12 @@ class TensorBoard(Trace):
     def on_begin(self, data: Data) -> None:
         print("FastEstimator-Tensorboard: writing logs to {}".format(
             os.path.abspath(os.path.join(self.root_log_dir, self.system.experiment_time))))
-        self.writer = _TfWriter(self.root_log_dir, self.system.experiment_time, self.system.network) if isinstance(
-            self.system.network, TFNetwork) else _TorchWriter(
-                self.root_log_dir, self.system.experiment_time, self.system.network)
+        writer_class = _TfWriter if isinstance(self.system.network, TFNetwork) else _TorchWriter
+        self.writer = writer_class(self.root_log_dir,
+                                   self.system.experiment_time,
+                                   self.system.network,
+                                   queue_size=self.queue_size,
+                                   drop_policy=self.drop_policy)
         if self.write_graph and self.system.global_step == 1:
             self.painted_graphs = set()
 
@@ -400,26 +716,37 @@ class TensorBoard(Trace):
                     map(lambda t: (t[0], data.get(t[0]), data.get(t[1]), data.get(t[2])), self.write_embeddings)))
 
     def on_epoch_end(self, data: Data) -> None:
+        if self.lag_key:
+            data.write_with_log(self.lag_key, self.writer.pop_lag())
         if self.system.mode == 'train' and self.histogram_freq.freq and not self.histogram_freq.is_step and \
                 self.system.epoch_idx % self.histogram_freq.freq == 0:
             self.writer.write_weights(mode=self.system.mode,
                                       models=self.system.network.models,
                                       step=self.system.global_step,
-                                      visualize=self.paint_weights)
+                                      visualize=self.paint_weights,
+                                      droppable=False)
         if self.update_freq.freq and (self.update_freq.is_step or self.system.epoch_idx % self.update_freq.freq == 0):
             self.writer.write_scalars(mode=self.system.mode,
                                       step=self.system.global_step,
-                                      scalars=filter(lambda x: is_number(x[1]), data.items()))
+                                      scalars=filter(lambda x: is_number(x[1]), data.items()),
+                                      droppable=False)
             self.writer.write_images(
                 mode=self.system.mode,
                 step=self.system.global_step,
-                images=filter(lambda x: x[1] is not None, map(lambda y: (y, data.get(y)), self.write_images)))
+                images=filter(lambda x: x[1] is not None, map(lambda y: (y, data.get(y)), self.write_images)),
+                droppable=False)
             self.writer.write_embeddings(
                 mode=self.system.mode,
                 step=self.system.global_step,
                 embeddings=filter(
                     lambda x: x[1] is not None,
-                    map(lambda t: (t[0], data.get(t[0]), data.get(t[1]), data.get(t[2])), self.write_embeddings)))
+                    map(lambda t: (t[0], data.get(t[0]), data.get(t[1]), data.get(t[2])), self.write_embeddings)),
+                droppable=False)
+        # Make sure that everything from this epoch is visible in TensorBoard, and that lag can't build across epochs
+        self.writer.flush()
 
     def on_end(self, data: Data) -> None:
         self.writer.close()
+        if self.writer.n_dropped:
+            print("FastEstimator-Tensorboard: {} summaries were dropped because the writer could not keep up. Consider "
+                  "increasing the queue_size or decreasing the update_freq.".format(self.writer.n_dropped))
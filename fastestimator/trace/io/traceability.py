@@ -30,7 +30,6 @@ import matplotlib
 import numpy as np
 import pydot
 import pytorch_model_summary as pms
-import tensorflow as tf
 import torch
 from natsort import humansorted
 from pylatex import Command, Document, Figure, Hyperref, Itemize, Label, LongTable, Marker, MultiColumn, NoEscape, \
@@ -61,7 +60,8 @@ from fastestimator.trace.trace import Trace, sort_traces
 from fastestimator.util.data import Data
 from fastestimator.util.latex_util import AdjustBox, Center, ContainerList, HrefFEID, Verbatim
 from fastestimator.util.traceability_util import FeSummaryTable, traceable
-from fastestimator.util.util import FEID, LogSplicer, Suppressor, prettify_metric_name, to_list
+from fastestimator.util.util import FEID, LogSplicer, Suppressor, is_tf_model, is_torch_model, prettify_metric_name, \
+    to_list
 
 
 @traceable()
@@ -77,6 +77,8 @@ class Traceability(Trace):
     Raises:
         OSError: If graphviz is not installed.
     """
+    fe_main_process_only = True
+
     def __init__(self, save_path: str, extra_objects: Any = None):
         # Verify that graphviz is available on this machine
         try:
@@ -249,10 +251,12 @@ class Traceability(Trace):
         """Add initialization parameters to the traceability document.
         """
         from fastestimator.estimator import Estimator  # Avoid circular import
+        # If TensorFlow has not been imported yet then none of the objects can be TensorFlow objects
+        tf = sys.modules.get('tensorflow')
         with self.doc.create(Section("Parameters")):
             model_ids = {
                 FEID(id(model))
-                for model in self.system.network.models if isinstance(model, (tf.keras.Model, torch.nn.Module))
+                for model in self.system.network.models if is_tf_model(model) or is_torch_model(model)
             }
             # Locate the datasets in order to provide extra details about them later in the summary
             datasets = {}
@@ -285,12 +289,12 @@ class Traceability(Trace):
             start = self._loop_tables(start, classes=Trace, name="Traces", model_ids=model_ids, datasets=datasets)
             start = self._loop_tables(start, classes=Op, name="Operators", model_ids=model_ids, datasets=datasets)
             start = self._loop_tables(start,
-                                      classes=(Dataset, tf.data.Dataset),
+                                      classes=(Dataset, tf.data.Dataset) if tf else Dataset,
                                       name="Datasets",
                                       model_ids=model_ids,
                                       datasets=datasets)
             start = self._loop_tables(start,
-                                      classes=(tf.keras.Model, torch.nn.Module),
+                                      classes=(tf.keras.Model, torch.nn.Module) if tf else torch.nn.Module,
                                       name="Models",
                                       model_ids=model_ids,
                                       datasets=datasets)
@@ -299,11 +303,12 @@ class Traceability(Trace):
                                       name="Functions",
                                       model_ids=model_ids,
                                       datasets=datasets)
-            start = self._loop_tables(start,
-                                      classes=(np.ndarray, tf.Tensor, tf.Variable, torch.Tensor),
-                                      name="Tensors",
-                                      model_ids=model_ids,
-                                      datasets=datasets)
+            start = self._loop_tables(
+                start,
+                classes=(np.ndarray, tf.Tensor, tf.Variable, torch.Tensor) if tf else (np.ndarray, torch.Tensor),
+                name="Tensors",
+                model_ids=model_ids,
+                datasets=datasets)
             self._loop_tables(start, classes=Any, name="Miscellaneous", model_ids=model_ids, datasets=datasets)
 
     def _loop_tables(self,
@@ -384,11 +389,12 @@ class Traceability(Trace):
         """
         with self.doc.create(Section("Models")):
             for model in humansorted(self.system.network.models, key=lambda m: m.model_name):
-                if not isinstance(model, (tf.keras.Model, torch.nn.Module)):
+                if not (is_tf_model(model) or is_torch_model(model)):
                     continue
                 self.doc.append(NoEscape(r'\FloatBarrier'))
                 with self.doc.create(Subsection(f"{model.model_name.capitalize()}")):
-                    if isinstance(model, tf.keras.Model):
+                    if is_tf_model(model):
+                        import tensorflow as tf
                         # Text Summary
                         summary = []
                         model.summary(line_length=92, print_fn=lambda x: summary.append(x))
@@ -417,11 +423,7 @@ class Traceability(Trace):
                             # Text Summary
                             # noinspection PyUnresolvedReferences
                             inputs = model.fe_input_spec.get_dummy_input()
-                            self.doc.append(
-                                Verbatim(
-                                    pms.summary(model.module if self.system.num_devices > 1 else model,
-                                                inputs,
-                                                print_summary=False)))
+                            self.doc.append(Verbatim(pms.summary(model, inputs, print_summary=False)))
                             with self.doc.create(Center()):
                                 self.doc.append(HrefFEID(FEID(id(model)), model.model_name))
                             # Visual Summary
@@ -435,8 +437,7 @@ class Traceability(Trace):
                                 sys.modules.setdefault('IPython.display', MagicMock())
                                 import hiddenlayer as hl
                                 with Suppressor():
-                                    graph = hl.build_graph(model.module if self.system.num_devices > 1 else model,
-                                                           inputs)
+                                    graph = hl.build_graph(model, inputs)
                                 graph = graph.build_dot()
                                 graph.attr(rankdir='TB')  # Switch it to Top-to-Bottom instead of Left-to-Right
                                 # LaTeX \maxdim is around 575cm (226 inches), so the image must have max dimension less
@@ -72,6 +72,9 @@ class Trace:
     # You can put keys in here to have them automatically added to EvalEssential without the user having to manually add
     # them to the Estimator monitor_names. See BestModelSaver for an example.
     fe_monitor_names: Set[str]
+    # Traces whose only job is to produce side effects (printing, writing files, etc.) set this to True so that they are
+    # only executed by the main process when training is distributed across several processes.
+    fe_main_process_only: bool = False
 
     def __init__(self,
                  inputs: Union[None, str, Iterable[str]] = None,
@@ -246,6 +249,8 @@ class Logger(Trace):
 
     Please don't add this trace into an estimator manually. FastEstimator will add it automatically.
     """
+    fe_main_process_only = True
+
     def __init__(self) -> None:
         super().__init__(inputs="*")
 
@@ -282,11 +287,11 @@ class Logger(Trace):
         log_message = header
         if log_epoch:
             log_message += "epoch: {}; ".format(self.system.epoch_idx)
-            self.system.write_summary('epoch', self.system.epoch_idx)
+            self.system.write_summary('epoch', self.system.epoch_idx, epoch_level=True)
         deferred = []
         for key, val in humansorted(data.read_logs().items(), key=lambda x: x[0]):
             val = to_number(val)
-            self.system.write_summary(key, val)
+            self.system.write_summary(key, val, epoch_level=log_epoch)
             if val.size > 1:
                 deferred.append("\n{}:\n{};".format(key, np.array2string(val, separator=',')))
             else:
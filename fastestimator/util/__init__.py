@@ -12,11 +12,67 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
-from fastestimator.util.data import Data
-from fastestimator.util.img_data import ImgData
-from fastestimator.util.latex_util import AdjustBox, Center, ContainerList, HrefFEID, PyContainer, Verbatim
-from fastestimator.util.traceability_util import FeSplitSummary, trace_model, traceable
-from fastestimator.util.util import DefaultKeyDict, FEID, Flag, LogSplicer, NonContext, Suppressor, Timer, draw, \
-    get_batch_size, get_num_devices, get_shape, get_type, is_number, pad_batch, pad_data, parse_modes, \
-    parse_string_to_python, prettify_metric_name, show_image, strip_prefix, strip_suffix, to_list, to_number, to_set
-from fastestimator.util.wget_util import bar_custom, callback_progress
+from fastestimator.util.lazy_util import make_lazy
+
+make_lazy(
+    __name__, {
+        "Data": "fastestimator.util.data",
+        "TF_DATA_PARALLEL_STRATEGIES": "fastestimator.util.distributed",
+        "all_reduce": "fastestimator.util.distributed",
+        "enable_tf_multi_worker": "fastestimator.util.distributed",
+        "get_rank": "fastestimator.util.distributed",
+        "get_tf_cluster_size": "fastestimator.util.distributed",
+        "get_tf_strategy": "fastestimator.util.distributed",
+        "get_world_size": "fastestimator.util.distributed",
+        "is_distributed": "fastestimator.util.distributed",
+        "is_main_process": "fastestimator.util.distributed",
+        "launch": "fastestimator.util.distributed",
+        "launch_tf_workers": "fastestimator.util.distributed",
+        "RemoteFile": "fastestimator.util.download_util",
+        "download_files": "fastestimator.util.download_util",
+        "extract_archive": "fastestimator.util.download_util",
+        "ImgData": "fastestimator.util.img_data",
+        "AdjustBox": "fastestimator.util.latex_util",
+        "Center": "fastestimator.util.latex_util",
+        "ContainerList": "fastestimator.util.latex_util",
+        "HrefFEID": "fastestimator.util.latex_util",
+        "PyContainer": "fastestimator.util.latex_util",
+        "Verbatim": "fastestimator.util.latex_util",
+        "get_rng": "fastestimator.util.random_util",
+        "FeSplitSummary": "fastestimator.util.traceability_util",
+        "enable_traceability": "fastestimator.util.traceability_util",
+        "trace_model": "fastestimator.util.traceability_util",
+        "traceable": "fastestimator.util.traceability_util",
+        "DefaultKeyDict": "fastestimator.util.util",
+        "FEID": "fastestimator.util.util",
+        "Flag": "fastestimator.util.util",
+        "LogSplicer": "fastestimator.util.util",
+        "NonContext": "fastestimator.util.util",
+        "Suppressor": "fastestimator.util.util",
+        "Timer": "fastestimator.util.util",
+        "draw": "fastestimator.util.util",
+        "get_batch_size": "fastestimator.util.util",
+        "get_num_devices": "fastestimator.util.util",
+        "get_shape": "fastestimator.util.util",
+        "get_type": "fastestimator.util.util",
+        "is_number": "fastestimator.util.util",
+        "is_tf_dataset": "fastestimator.util.util",
+        "is_tf_model": "fastestimator.util.util",
+        "is_tf_tensor": "fastestimator.util.util",
+        "is_torch_model": "fastestimator.util.util",
+        "is_torch_tensor": "fastestimator.util.util",
+        "pad_batch": "fastestimator.util.util",
+        "pad_collate": "fastestimator.util.util",
+        "pad_data": "fastestimator.util.util",
+        "parse_modes": "fastestimator.util.util",
+        "parse_string_to_python": "fastestimator.util.util",
+        "prettify_metric_name": "fastestimator.util.util",
+        "show_image": "fastestimator.util.util",
+        "strip_prefix": "fastestimator.util.util",
+        "strip_suffix": "fastestimator.util.util",
+        "to_list": "fastestimator.util.util",
+        "to_number": "fastestimator.util.util",
+        "to_set": "fastestimator.util.util",
+        "bar_custom": "fastestimator.util.wget_util",
+        "callback_progress": "fastestimator.util.wget_util",
+    })
@@ -0,0 +1,438 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import multiprocessing as mp
+import os
+import pickle
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TYPE_CHECKING
+from weakref import WeakKeyDictionary
+
+import numpy as np
+
+from fastestimator.util.lazy_util import make_lazy
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+REDUCE_OPS = ('mean', 'sum', 'max')
+
+# The order in which TF cluster jobs are assigned ranks
+_TF_WORKER_JOBS = ('chief', 'worker')
+
+# The DistributedDataParallel wrappers of models which are being trained by multiple processes, keyed by the model
+_replica_modules = WeakKeyDictionary()
+
+
+def _tf_multi_worker_strategy() -> type:
+    import tensorflow as tf
+    # TF < 2.4 only provides the experimental version of the multi-worker strategy
+    return getattr(tf.distribute, 'MultiWorkerMirroredStrategy', tf.distribute.experimental.MultiWorkerMirroredStrategy)
+
+
+def _tf_data_parallel_strategies() -> List[type]:
+    import tensorflow as tf
+    return [tf.distribute.MirroredStrategy, _tf_multi_worker_strategy()]
+
+
+# TF_DATA_PARALLEL_STRATEGIES lists the TF strategies under which every replica trains the same model on a different
+# slice of each batch. Other data-parallel strategy classes can be appended to it to make FastEstimator treat them the
+# same way. It is only built when first accessed, so that TensorFlow is not imported by jobs which never use it.
+make_lazy(__name__, {"TF_DATA_PARALLEL_STRATEGIES": _tf_data_parallel_strategies})
+
+
+def _get_torch_dist() -> Optional[Any]:
+    """Get the torch.distributed module, if a torch process group is active.
+
+    Returns:
+        The torch.distributed module if a process group has been initialized, otherwise None.
+    """
+    # If PyTorch has not been imported yet then no process group can possibly exist
+    if 'torch' not in sys.modules:
+        return None
+    import torch.distributed as dist
+    return dist if dist.is_available() and dist.is_initialized() else None
+
+
+def get_tf_strategy() -> Optional['tf.distribute.Strategy']:
+    """Get the active TF distribution strategy, if it splits batches between several replicas.
+
+    Returns:
+        The current strategy if it is one of the `TF_DATA_PARALLEL_STRATEGIES` (ex. a MirroredStrategy across several
+        GPUs, or a MultiWorkerMirroredStrategy across several machines), otherwise None.
+    """
+    # If TensorFlow has not been imported yet then no strategy can possibly be active
+    tf = sys.modules.get('tensorflow')
+    if tf is None:
+        return None
+    strategy = tf.distribute.get_strategy()
+    strategies = sys.modules[__name__].TF_DATA_PARALLEL_STRATEGIES
+    return strategy if isinstance(strategy, tuple(strategies)) else None
+
+
+def get_tf_cluster_size() -> int:
+    """Get the number of TF workers described by the TF_CONFIG environment variable.
+
+    Returns:
+        The number of chief and worker tasks in the TF_CONFIG cluster, or 0 if TF_CONFIG is not set.
+    """
+    if not os.environ.get('TF_CONFIG'):
+        return 0
+    import tensorflow as tf
+    cluster = tf.distribute.cluster_resolver.TFConfigClusterResolver().cluster_spec()
+    return sum(cluster.num_tasks(job) for job in _TF_WORKER_JOBS if job in cluster.jobs)
+
+
+def enable_tf_multi_worker() -> bool:
+    """Activate a TF MultiWorkerMirroredStrategy if the TF_CONFIG environment variable describes a cluster.
+
+    This must happen before any TF variables are created, so it is invoked automatically by `fe.build`.
+
+    Returns:
+        Whether a new strategy was activated. Nothing happens if a data-parallel strategy is already active.
+    """
+    if get_tf_cluster_size() < 2 or get_tf_strategy() is not None:
+        return False
+    import tensorflow as tf
+    tf.distribute.experimental_set_strategy(_tf_multi_worker_strategy()())
+    return True
+
+
+def _get_tf_worker() -> Optional[Tuple[int, int]]:
+    """Find the position of this process within a multi-worker TF cluster.
+
+    Returns:
+        (rank, world_size) if a MultiWorkerMirroredStrategy spanning more than one worker is active, otherwise None.
+    """
+    # If TensorFlow has not been imported yet then no strategy can possibly be active
+    tf = sys.modules.get('tensorflow')
+    if tf is None or not isinstance(tf.distribute.get_strategy(), _tf_multi_worker_strategy()):
+        return None
+    resolver = tf.distribute.cluster_resolver.TFConfigClusterResolver()
+    cluster = resolver.cluster_spec()
+    jobs = [job for job in _TF_WORKER_JOBS if job in cluster.jobs]
+    world_size = sum(cluster.num_tasks(job) for job in jobs)
+    if world_size < 2 or resolver.task_type not in jobs:
+        return None
+    rank = sum(cluster.num_tasks(job) for job in jobs[:jobs.index(resolver.task_type)]) + resolver.task_id
+    return rank, world_size
+
+
+def is_distributed() -> bool:
+    """Whether the current process is one of several processes which are training together.
+
+    Returns:
+        True iff a torch distributed process group has been initialized, or a TF MultiWorkerMirroredStrategy with more
+        than one worker is active.
+    """
+    return _get_torch_dist() is not None or _get_tf_worker() is not None
+
+
+def get_rank() -> int:
+    """Get the index of the current process among all of the processes which are training together.
+
+    Returns:
+        The rank of the current process, or 0 if training is not distributed.
+    """
+    dist = _get_torch_dist()
+    if dist is not None:
+        return dist.get_rank()
+    worker = _get_tf_worker()
+    return 0 if worker is None else worker[0]
+
+
+def get_world_size() -> int:
+    """Get the number of processes which are training together.
+
+    Returns:
+        The number of processes, or 1 if training is not distributed.
+    """
+    dist = _get_torch_dist()
+    if dist is not None:
+        return dist.get_world_size()
+    worker = _get_tf_worker()
+    return 1 if worker is None else worker[1]
+
+
+def is_main_process() -> bool:
+    """Whether the current process is responsible for side effects like printing logs and saving files.
+
+    Returns:
+        True iff the current process has rank 0.
+    """
+    return get_rank() == 0
+
+
+def all_reduce(value: Union[int, float, np.ndarray, 'torch.Tensor'], op: str = 'mean') -> np.ndarray:
+    """Combine a value across all of the processes which are training together.
+
+    Every process must invoke this method with a value of the same shape, otherwise the processes will deadlock.
+
+    ```python
+    fe.util.all_reduce(fe.util.get_rank(), op='sum')  # 0 + 1 + ... + (world_size - 1)
+    ```
+
+    Args:
+        value: The value from the current process.
+        op: How to combine the values. One of 'mean', 'sum', or 'max'.
+
+    Returns:
+        The combined value. This has the same dtype as the input `value` unless `op` is 'mean', in which case it will be
+        float64. If training is not distributed then the `value` is returned unchanged (as an array).
+
+    Raises:
+        ValueError: If `op` is not recognized.
+    """
+    if op not in REDUCE_OPS:
+        raise ValueError("op must be one of {}, but got {}".format(REDUCE_OPS, op))
+    torch = sys.modules.get('torch')
+    if torch is not None and isinstance(value, torch.Tensor):
+        value = value.detach().cpu().numpy()
+    value = np.asarray(value)
+    if not is_distributed():
+        return value.astype(np.float64) if op == 'mean' else value
+    dist = _get_torch_dist()
+    if dist is None:
+        return _tf_all_reduce(value, op)
+    tensor = torch.from_numpy(value.astype(np.float64))
+    if dist.get_backend() == 'nccl':
+        tensor = tensor.to(torch.device("cuda", torch.cuda.current_device()))
+    dist.all_reduce(tensor, op=dist.ReduceOp.MAX if op == 'max' else dist.ReduceOp.SUM)
+    result = tensor.cpu().numpy()
+    if op == 'mean':
+        return result / get_world_size()
+    return result.astype(value.dtype)
+
+
+def _tf_all_reduce(value: np.ndarray, op: str) -> np.ndarray:
+    """Combine a value across all of the workers of a TF MultiWorkerMirroredStrategy.
+
+    TF collectives only support sum and mean, so the values are gathered by having every worker write into its own row
+    of an otherwise empty buffer and summing the buffers. Every local replica of a worker contributes the same buffer,
+    so the result is divided by the number of replicas per worker.
+
+    Args:
+        value: The value from the current worker.
+        op: How to combine the values. One of 'mean', 'sum', or 'max'.
+
+    Returns:
+        The combined value.
+    """
+    import tensorflow as tf
+    strategy = tf.distribute.get_strategy()
+    rank, world_size = _get_tf_worker()
+    buffer = np.zeros((world_size, ) + value.shape, dtype=np.float64)
+    buffer[rank] = value
+    buffer = tf.constant(buffer)
+    total = strategy.run(lambda: tf.distribute.get_replica_context().all_reduce(tf.distribute.ReduceOp.SUM, buffer))
+    gathered = strategy.experimental_local_results(total)[0].numpy() / (strategy.num_replicas_in_sync // world_size)
+    if op == 'mean':
+        return gathered.mean(axis=0)
+    return (gathered.max(axis=0) if op == 'max' else gathered.sum(axis=0)).astype(value.dtype)
+
+
+def register_replica_module(model: 'torch.nn.Module', replica: 'torch.nn.Module') -> None:
+    """Route future forward passes of a `model` through a distributed wrapper.
+
+    Args:
+        model: The model which was built by `fe.build`.
+        replica: A module (ex. a DistributedDataParallel) which wraps the parameters of the `model`.
+    """
+    _replica_modules[model] = replica
+
+
+def get_replica_module(model: 'torch.nn.Module') -> 'torch.nn.Module':
+    """Get the module which forward passes of a given `model` should run through.
+
+    Args:
+        model: The model which was built by `fe.build`.
+
+    Returns:
+        The distributed wrapper of the `model` if one has been registered, otherwise the `model` itself.
+    """
+    return _replica_modules.get(model, model)
+
+
+def launch(fn: Callable[[], Any], num_process: int, backend: Optional[str] = None) -> Any:
+    """Run a function in several processes which train together as a torch distributed process group.
+
+    The processes are forked from the current one, so they inherit its models, pipelines, and other state without any
+    of it needing to be pickled. For the same reason CUDA must not have been initialized in the current process (ex. by
+    moving a model or tensor onto a GPU before launching). `fe.build` and `fe.Network` leave CUDA uninitialized.
+
+    ```python
+    def work():
+        return fe.util.all_reduce(fe.util.get_rank(), op='sum')
+    fe.util.launch(work, num_process=2, backend='gloo')  # 1
+    ```
+
+    Args:
+        fn: The function to invoke inside of every process.
+        num_process: How many processes to launch. When training on GPUs this should equal the number of GPUs.
+        backend: The torch distributed backend to use, or None to pick 'nccl' when GPUs are available and 'gloo'
+            otherwise.
+
+    Returns:
+        The return value of `fn` from the process with rank 0. It must be picklable.
+
+    Raises:
+        ValueError: If `num_process` is invalid.
+        RuntimeError: If the current process is already distributed, if CUDA has already been initialized in the current
+            process, or if any of the launched processes fail.
+    """
+    if num_process < 1:
+        raise ValueError("num_process must be a positive integer, but got {}".format(num_process))
+    if is_distributed():
+        raise RuntimeError("Cannot launch new processes from inside of a distributed process group")
+    # If PyTorch has not been imported yet then CUDA cannot have been initialized
+    torch = sys.modules.get('torch')
+    if torch is not None and torch.cuda.is_initialized():
+        raise RuntimeError("Cannot fork distributed processes after CUDA has been initialized in the current process, "
+                           "since forked processes are unable to use it. Make sure that nothing is moved onto a GPU "
+                           "before training begins.")
+    if backend is None:
+        import torch
+        backend = 'nccl' if torch.cuda.is_available() else 'gloo'
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        port = sock.getsockname()[1]
+    result_file, result_path = tempfile.mkstemp(suffix='.pkl')
+    os.close(result_file)
+    context = mp.get_context('fork')
+    processes = [
+        context.Process(target=_run_replica,
+                        args=(fn, rank, num_process, backend, 'tcp://127.0.0.1:{}'.format(port), result_path))
+        for rank in range(num_process)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        while any(process.is_alive() for process in processes):
+            failed = [process for process in processes if process.exitcode not in (None, 0)]
+            if failed:
+                raise RuntimeError("Distributed process {} failed with exit code {}".format(
+                    processes.index(failed[0]), failed[0].exitcode))
+            time.sleep(0.1)
+        for rank, process in enumerate(processes):
+            if process.exitcode != 0:
+                raise RuntimeError("Distributed process {} failed with exit code {}".format(rank, process.exitcode))
+        with open(result_path, 'rb') as file:
+            return pickle.load(file)
+    finally:
+        for process in processes:
+            if process.is_alive():
+                process.terminate()
+            if process.pid is not None:
+                process.join()
+        os.remove(result_path)
+
+
+def launch_tf_workers(command: List[str],
+                      num_workers: int,
+                      env: Optional[Dict[str, str]] = None,
+                      timeout: Optional[float] = None) -> List[str]:
+    """Run a command as a local multi-worker TF cluster, for example to try out multi-machine training on one host.
+
+    Every worker is a new process running the `command`, with a TF_CONFIG environment variable which places it in a
+    cluster of `num_workers` workers listening on localhost. Fresh processes are required (rather than forking the
+    current one) since TF collectives must be configured before the TF runtime starts.
+
+    ```python
+    outputs = fe.util.launch_tf_workers([sys.executable, "train.py"], num_workers=2, env={"CUDA_VISIBLE_DEVICES": ""})
+    ```
+
+    Args:
+        command: The command to be run by every worker.
+        num_workers: How many workers to launch.
+        env: Extra environment variables for the workers.
+        timeout: How long (in seconds) to wait for the workers to finish, or None to wait forever.
+
+    Returns:
+        The combined stdout and stderr of every worker, in order of rank.
+
+    Raises:
+        ValueError: If `num_workers` is invalid.
+        RuntimeError: If any of the workers fail or time out.
+    """
+    if num_workers < 1:
+        raise ValueError("num_workers must be a positive integer, but got {}".format(num_workers))
+    sockets = [socket.socket(socket.AF_INET, socket.SOCK_STREAM) for _ in range(num_workers)]
+    for sock in sockets:
+        sock.bind(('127.0.0.1', 0))
+    cluster = {'worker': ['localhost:{}'.format(sock.getsockname()[1]) for sock in sockets]}
+    for sock in sockets:
+        sock.close()
+    logs = [tempfile.TemporaryFile() for _ in range(num_workers)]
+    workers = []
+    try:
+        for rank, log in enumerate(logs):
+            worker_env = dict(os.environ, **(env or {}))
+            worker_env['TF_CONFIG'] = json.dumps({'cluster': cluster, 'task': {'type': 'worker', 'index': rank}})
+            workers.append(subprocess.Popen(command, env=worker_env, stdout=log, stderr=subprocess.STDOUT))
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while any(worker.poll() is None for worker in workers):
+            if any(worker.poll() not in (None, 0) for worker in workers):
+                break
+            if deadline is not None and time.perf_counter() > deadline:
+                break
+            time.sleep(0.1)
+        outputs = []
+        for log in logs:
+            log.seek(0)
+            outputs.append(log.read().decode('utf-8', errors='replace'))
+        for rank, worker in enumerate(workers):
+            if worker.poll() != 0:
+                status = "timed out" if worker.poll() is None else "failed with exit code {}".format(worker.poll())
+                raise RuntimeError("TF worker {} {}. Its output was:\n{}".format(rank, status, outputs[rank]))
+        return outputs
+    finally:
+        for worker in workers:
+            if worker.poll() is None:
+                worker.kill()
+            worker.wait()
+        for log in logs:
+            log.close()
+
+
+def _run_replica(fn: Callable[[], Any], rank: int, world_size: int, backend: str, init_method: str,
+                 result_path: str) -> None:
+    """Join a process group, invoke a function, and then save its result if this is the main process.
+
+    Args:
+        fn: The function to invoke.
+        rank: The rank of this process.
+        world_size: How many processes are in the group.
+        backend: The torch distributed backend to use.
+        init_method: The URL via which the processes find each other.
+        result_path: Where the rank 0 process should save the return value of `fn`.
+    """
+    import torch
+    import torch.distributed as dist
+    if backend == 'nccl':
+        torch.cuda.set_device(rank)
+    dist.init_process_group(backend, init_method=init_method, rank=rank, world_size=world_size)
+    try:
+        result = fn()
+        if rank == 0:
+            with open(result_path, 'wb') as file:
+                pickle.dump(result, file)
+        dist.barrier()
+    finally:
+        dist.destroy_process_group()
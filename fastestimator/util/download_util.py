@@ -0,0 +1,296 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import http.client
+import os
+import shutil
+import sys
+import tarfile
+import threading
+import urllib.error
+import urllib.request
+import zipfile
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Optional, Sequence
+
+from fastestimator.util.wget_util import bar_custom
+
+MIRROR_ENV = "FE_DATA_MIRROR"
+OFFLINE_ENV = "FE_DATA_OFFLINE"
+
+
+class RemoteFile:
+    """A file which should be downloaded.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        url: Where to download the file from.
+        path: Where to save the file.
+        sha256: The expected SHA-256 hex digest of the file, or None to skip verification.
+    """
+    def __init__(self, url: str, path: str, sha256: Optional[str] = None) -> None:
+        self.url = url
+        self.path = path
+        self.sha256 = sha256
+
+    @property
+    def name(self) -> str:
+        return os.path.basename(self.path)
+
+
+class _Progress:
+    """A single progress bar which tracks the combined size of several concurrent downloads.
+
+    This class is intentionally not @traceable.
+
+    Args:
+        n_files: How many files are being downloaded.
+        verbose: Whether to print anything.
+    """
+    def __init__(self, n_files: int, verbose: bool) -> None:
+        self.n_files = n_files
+        self.verbose = verbose
+        self.done = 0
+        self.current = 0
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def expect(self, n_bytes: int) -> None:
+        with self.lock:
+            self.total += n_bytes
+
+    def update(self, n_bytes: int) -> None:
+        with self.lock:
+            self.current += n_bytes
+            self._draw()
+
+    def finish(self, name: Optional[str] = None) -> None:
+        with self.lock:
+            self.done += 1
+            if self.verbose and name:
+                sys.stdout.write(f"\rDownloaded {name} ({self.done} / {self.n_files})\n")
+                self._draw()
+
+    def _draw(self) -> None:
+        if self.verbose and self.done < self.n_files:
+            sys.stdout.write("\r{}".format(bar_custom(self.current, self.total)))
+            sys.stdout.flush()
+
+
+def _is_url(location: str) -> bool:
+    return location.startswith(("http://", "https://", "ftp://"))
+
+
+def _sha256(path: str, chunk_size: int = 1 << 20) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _fetch(url: str, part_path: str, progress: _Progress, chunk_size: int) -> None:
+    """Download a `url` into a partial file, resuming from wherever the partial file currently ends.
+
+    Args:
+        url: The url to download.
+        part_path: The partial file to write into.
+        progress: The progress bar to update.
+        chunk_size: How many bytes to read at a time.
+
+    Raises:
+        http.client.IncompleteRead: If the connection ends before the whole file was received.
+    """
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    headers = {"User-Agent": "fastestimator"}
+    if offset:
+        headers["Range"] = f"bytes={offset}-"
+    try:
+        response = urllib.request.urlopen(urllib.request.Request(url, headers=headers), timeout=60)
+    except urllib.error.HTTPError as err:
+        if err.code == 416 and offset:
+            return  # The partial file already holds the whole file
+        raise
+    with response:
+        if response.status != 206:
+            offset = 0  # The server ignored the range request, so start over
+        length = response.headers.get("Content-Length")
+        expected = int(length) if length is not None else None
+        progress.expect(expected or 0)
+        received = 0
+        with open(part_path, 'ab' if offset else 'wb') as file:
+            for chunk in iter(lambda: response.read(chunk_size), b''):
+                file.write(chunk)
+                received += len(chunk)
+                progress.update(len(chunk))
+    if expected is not None and received < expected:
+        raise http.client.IncompleteRead(b'', expected - received)
+
+
+def _download(file: RemoteFile, mirror: Optional[str], offline: bool, retries: int, chunk_size: int,
+              progress: _Progress) -> str:
+    """Download a single file, consulting the mirror first and verifying the result.
+
+    Args:
+        file: The file to download.
+        mirror: A local directory or base url which may hold a copy of the file, or None.
+        offline: Whether the network (other than a url `mirror`) must not be used.
+        retries: How many times to retry a failed or corrupted download.
+        chunk_size: How many bytes to read at a time.
+        progress: The progress bar to update.
+
+    Returns:
+        The path of the downloaded file.
+
+    Raises:
+        FileNotFoundError: If the file is not available while `offline`.
+        ValueError: If the file does not match its checksum even after retrying.
+    """
+    if os.path.exists(file.path) and (file.sha256 is None or _sha256(file.path) == file.sha256):
+        progress.finish()
+        return file.path
+    os.makedirs(os.path.dirname(os.path.abspath(file.path)), exist_ok=True)
+    part_path = file.path + ".part"
+    sources = []
+    if mirror:
+        sources.append(mirror.rstrip('/') + '/' + file.name if _is_url(mirror) else os.path.join(mirror, file.name))
+    if not offline:
+        sources.append(file.url)
+    error = None
+    for _ in range(retries + 1):
+        for source in sources:
+            try:
+                if _is_url(source):
+                    _fetch(source, part_path, progress, chunk_size)
+                elif os.path.exists(source):
+                    shutil.copyfile(source, part_path)
+                else:
+                    continue
+            except (urllib.error.URLError, http.client.HTTPException, ConnectionError, TimeoutError) as err:
+                error = err  # Keep the partial file so that the next attempt can resume it
+                continue
+            if file.sha256 is None or _sha256(part_path) == file.sha256:
+                os.replace(part_path, file.path)
+                progress.finish(file.name)
+                return file.path
+            os.remove(part_path)  # Corrupted, so the next attempt must start from scratch
+            error = ValueError(f"{file.name} does not match its expected SHA-256 checksum")
+        if error is None:
+            break
+    if error is None:
+        raise FileNotFoundError(f"{file.name} is not available offline. Download it from {file.url} and place it in " +
+                                (mirror if mirror and not _is_url(mirror) else os.path.dirname(file.path)))
+    raise error
+
+
+def extract_archive(path: str, extract_dir: str, members: Optional[Callable[[str], bool]] = None,
+                    max_workers: int = 1) -> None:
+    """Extract a .zip or .tar(.gz/.bz2/.xz) archive.
+
+    Zip archives can be extracted by several threads at once, since each member is compressed independently. Tar
+    archives are a single stream, and so are always extracted by one thread.
+
+    Args:
+        path: The archive to extract.
+        extract_dir: The directory into which to extract the archive.
+        members: A function which selects which member names should be extracted, or None to extract everything.
+        max_workers: How many threads may be used to extract a zip archive.
+    """
+    if not zipfile.is_zipfile(path):
+        with tarfile.open(path) as tar:
+            # Iterate over the members lazily so that compressed archives only need to be decompressed once
+            tar.extractall(extract_dir, members=None if members is None else (m for m in tar if members(m.name)))
+        return
+    with zipfile.ZipFile(path) as archive:
+        names = [name for name in archive.namelist() if members is None or members(name)]
+    # Create the directories up front so that the workers don't race each other to make them
+    for directory in {os.path.dirname(name) for name in names}:
+        os.makedirs(os.path.join(extract_dir, directory), exist_ok=True)
+    names = [name for name in names if not name.endswith('/')]
+
+    def extract(chunk: List[str]) -> None:
+        with zipfile.ZipFile(path) as archive:
+            for name in chunk:
+                archive.extract(name, extract_dir)
+
+    n_chunks = max(1, min(max_workers, len(names)))
+    with ThreadPoolExecutor(max_workers=n_chunks) as pool:
+        for future in [pool.submit(extract, names[idx::n_chunks]) for idx in range(n_chunks)]:
+            future.result()
+
+
+def download_files(files: Sequence[RemoteFile],
+                   extract_dir: Optional[str] = None,
+                   max_workers: int = 4,
+                   mirror: Optional[str] = None,
+                   offline: Optional[bool] = None,
+                   retries: int = 3,
+                   chunk_size: int = 1 << 20,
+                   verbose: bool = True) -> List[str]:
+    """Download several files concurrently, optionally extracting each archive as soon as it arrives.
+
+    Each file is written to a '.part' file beside its destination, and only moved into place once it is complete (and
+    matches its checksum, if one was given). If a download is interrupted, the next attempt resumes from the end of the
+    '.part' file using an HTTP range request. Files which already exist at their destination are not downloaded again.
+
+    Downloads can be redirected to a mirror, which is either a local directory or a base url containing files with the
+    same names as the destination files. When offline, only files which are already present or which are in a local
+    mirror can be used.
+
+    ```python
+    files = [fe.util.RemoteFile(url="https://host/a.zip", path="/data/a.zip", sha256="9f86d08..."),
+             fe.util.RemoteFile(url="https://host/b.tar.gz", path="/data/b.tar.gz")]
+    fe.util.download_files(files, extract_dir="/data")
+    ```
+
+    Args:
+        files: The files to be downloaded.
+        extract_dir: If provided, every downloaded file is treated as an archive and extracted into this directory.
+        max_workers: How many files to download (or extract) at the same time.
+        mirror: A local directory or base url to check before the original urls. Defaults to the FE_DATA_MIRROR
+            environment variable.
+        offline: Whether to avoid the network (aside from a url `mirror`). Defaults to whether the FE_DATA_OFFLINE
+            environment variable is set to a value other than '0'.
+        retries: How many times to retry each failed download before giving up.
+        chunk_size: How many bytes to read at a time.
+        verbose: Whether to display download progress.
+
+    Returns:
+        The paths of the downloaded files.
+
+    Raises:
+        FileNotFoundError: If a file is not available while offline.
+        ValueError: If a file does not match its checksum even after retrying.
+    """
+    if mirror is None:
+        mirror = os.environ.get(MIRROR_ENV) or None
+    if offline is None:
+        offline = os.environ.get(OFFLINE_ENV, "0") not in ("", "0")
+    progress = _Progress(len(files), verbose)
+    extractions = []  # type: List[Future]
+    with ThreadPoolExecutor(max_workers=max_workers) as extractors:
+
+        def download(file: RemoteFile) -> str:
+            path = _download(file, mirror, offline, retries, chunk_size, progress)
+            if extract_dir is not None:
+                extractions.append(extractors.submit(extract_archive, path, extract_dir, max_workers=max_workers))
+            return path
+
+        with ThreadPoolExecutor(max_workers=max_workers) as downloaders:
+            paths = [future.result() for future in [downloaders.submit(download, file) for file in files]]
+        for extraction in extractions:
+            extraction.result()
+    return paths
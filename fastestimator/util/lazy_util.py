@@ -0,0 +1,109 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Callable, Dict, List, Union
+
+
+class LazyModule(types.ModuleType):
+    """A module which defers importing its attributes until they are first accessed.
+
+    This class is intentionally not @traceable.
+
+    Modules are converted into LazyModules via the `make_lazy` function rather than by instantiating this class.
+    """
+    _fe_lazy_attributes: Dict[str, Union[str, Callable[[], Any]]]
+
+    def __getattr__(self, name: str) -> Any:
+        # Only invoked when normal attribute lookup fails, so each attribute is imported at most once
+        source = self.__dict__.get('_fe_lazy_attributes', {}).get(name)
+        if source is None:
+            # Fall back to submodules (ex. fe.util.util), which used to be loaded as a side effect of eager imports
+            submodule = "{}.{}".format(self.__name__, name)
+            if name.startswith('_') or not hasattr(self, '__path__') or importlib.util.find_spec(submodule) is None:
+                raise AttributeError("module '{}' has no attribute '{}'".format(self.__name__, name))
+            source = submodule
+        if callable(source):
+            value = source()
+        else:
+            module = importlib.import_module(source)
+            value = module if source == "{}.{}".format(self.__name__, name) else getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self) -> List[str]:
+        return sorted(set(super().__dir__()) | set(self.__dict__.get('_fe_lazy_attributes', {})))
+
+
+def make_lazy(module_name: str, attributes: Dict[str, Union[str, Callable[[], Any]]]) -> None:
+    """Convert an already imported module into one which imports the given `attributes` on demand.
+
+    This keeps `import fastestimator` (and the command line tools) fast, since heavy dependencies like TensorFlow and
+    PyTorch are only loaded once something which needs them is actually used.
+
+    ```python
+    # Inside of fastestimator/__init__.py:
+    make_lazy(__name__, {"Estimator": "fastestimator.estimator", "op": "fastestimator.op"})
+    # fe.Estimator will now import fastestimator.estimator the first time that it is accessed.
+    ```
+
+    Args:
+        module_name: The name of the module to convert (usually the `__name__` of the caller).
+        attributes: A mapping from attribute names to the modules which define them. If the module name is the same as
+            the attribute name within the current module (ex. {"op": "fastestimator.op"}) then the module itself will
+            be the attribute. A function may also be given instead of a module name, in which case its return value
+            will be used as the attribute.
+    """
+    module = sys.modules[module_name]
+    module.__class__ = LazyModule
+    module._fe_lazy_attributes = attributes
+
+
+class _LazyImport(types.ModuleType):
+    """A placeholder for a module which has not been imported yet.
+
+    This class is intentionally not @traceable.
+
+    The real module is imported the first time that any of its attributes are accessed, after which the placeholder
+    mirrors the contents of the real module. Placeholders are created via the `lazy_import` function.
+    """
+    def __getattr__(self, name: str) -> Any:
+        # Only invoked when normal attribute lookup fails, so the import happens at most once per placeholder
+        module = importlib.import_module(self.__name__)
+        self.__dict__.update(module.__dict__)
+        return getattr(module, name)
+
+
+def lazy_import(module_name: str) -> types.ModuleType:
+    """Get a module which will only be imported once it is actually used.
+
+    This allows modules which support several frameworks to avoid importing every one of them up front. Code using the
+    module must not evaluate any of its attributes at import time (ex. within type hints, which should be quoted).
+
+    ```python
+    tf = lazy_import("tensorflow")  # Fast, since TensorFlow is not imported yet
+    tf.constant(5)  # TensorFlow is imported here
+    ```
+
+    Args:
+        module_name: The fully qualified name of the module to import.
+
+    Returns:
+        The module itself if it has already been imported, otherwise a placeholder which imports the module on demand.
+    """
+    module = sys.modules.get(module_name)
+    return _LazyImport(module_name) if module is None else module
@@ -0,0 +1,87 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import random
+
+import numpy as np
+
+import fastestimator as fe
+
+# The first element of every stream key, so that different consumers of the same seed never share a stream
+OP_STREAM = 0  # NumpyOps, keyed by (epoch, sample index)
+DATASET_STREAM = 1  # Datasets which sample their own data, like BatchDataset and SiameseDirDataset
+LOADER_STREAM = 2  # The order in which a data loader visits the data, keyed by epoch
+NETWORK_STREAM = 3  # The global framework random states, keyed by (epoch, mode, rank)
+
+
+def get_rng(seed: int, *key: int) -> np.random.Generator:
+    """Get the random number generator for one particular stream of random numbers.
+
+    Every (`seed`, `key`) pair identifies its own independent stream. The stream is identical to the one which would be
+    obtained by recursively spawning children from np.random.SeedSequence(`seed`) (see SeedSequence.spawn) and then
+    picking the child at position `key`, except that none of the other children need to be created along the way. The
+    streams use the counter-based Philox bit generator, so any stream can be recreated cheaply at any time, in any
+    process, without replaying the streams which came before it.
+
+    ```python
+    rng = get_rng(42, OP_STREAM, 3, 17)  # The stream for sample 17 of epoch 3
+    rng.uniform()  # Always the same value, regardless of which process (or in what order) samples are processed
+    ```
+
+    Args:
+        seed: The base seed of the stream.
+        *key: Non-negative integers which identify the stream.
+
+    Returns:
+        A new generator positioned at the start of the requested stream.
+    """
+    return np.random.Generator(np.random.Philox(np.random.SeedSequence(seed, spawn_key=key)))
+
+
+def get_base_seed() -> int:
+    """Get a base seed for a new set of random streams.
+
+    Returns:
+        The deterministic seed if one was set by fe.enable_deterministic(), otherwise a new seed drawn from python's
+        global random state.
+    """
+    seed = fe.fe_deterministic_seed
+    return random.getrandbits(64) if seed is None else seed
+
+
+def seed_global_rngs(rng: np.random.Generator) -> None:
+    """Re-seed python's and NumPy's global random states from a random stream.
+
+    This keeps code which still draws from the global random states (like 3rd party augmentation libraries) in step
+    with the stream.
+
+    Args:
+        rng: The stream from which to draw the new seeds.
+    """
+    seeds = rng.integers(2**32, size=2).tolist()
+    random.seed(seeds[0])
+    np.random.seed(seeds[1])
+
+
+def get_stream_seed(seed: int, *key: int) -> int:
+    """Draw a seed for some other random number generator from a random stream.
+
+    Args:
+        seed: The base seed of the stream.
+        *key: Non-negative integers which identify the stream.
+
+    Returns:
+        A 63 bit seed drawn from the requested stream.
+    """
+    return int(get_rng(seed, *key).integers(2**63))
@@ -22,8 +22,6 @@ from collections import ChainMap, deque, namedtuple
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, TypeVar, Union
 
 import numpy as np
-import tensorflow as tf
-import torch
 from pylatex import Document, Label, Marker, MultiColumn, NoEscape, Package, Table, Tabularx, TextColor
 from pylatex.base_classes import LatexObject
 from pylatex.utils import bold, escape_latex, italic
@@ -31,7 +29,12 @@ from pylatex.utils import bold, escape_latex, italic
 from fastestimator.backend.to_shape import to_shape
 from fastestimator.backend.to_type import to_type
 from fastestimator.util.latex_util import ContainerList, HrefFEID, PyContainer
-from fastestimator.util.util import FEID, Flag, strip_prefix
+from fastestimator.util.lazy_util import lazy_import
+from fastestimator.util.util import FEID, Flag, is_tf_model, is_tf_tensor, is_torch_model, is_torch_tensor, \
+    strip_prefix
+
+tf = lazy_import('tensorflow')
+torch = lazy_import('torch')
 
 _Function = namedtuple('_Function', ['func', 'name'])
 _BoundFn = namedtuple('_BoundFn', ['func', 'args'])
@@ -40,6 +43,7 @@ _Command = namedtuple('_Command', ['left', 'right', 'command'])
 _Condition = namedtuple('_Condition', ['left', 'right', 'condition'])
 _VarWrap = namedtuple('_VarWrap', ['var'])
 _ChunkSpec = namedtuple('_ChunkSpec', ['chunk_start', 'idx_start', 'chunk_mid', 'idx_mid', 'chunk_end', 'idx_end'])
+_InitCall = namedtuple('_InitCall', ['func', 'args', 'kwargs'])
 _CommandTable = {
     'POWER': '**',
     'MULTIPLY': '*',
@@ -64,23 +68,32 @@ _CommandTable = {
 }
 # If a collection (list, tuple, set, dict) has more than this many entries, its summary will be truncated
 _CollectionSizeLimit = 42
+# Whether newly created @traceable objects should record their initialization arguments (see enable_traceability())
+_TraceabilityEnabled = Flag(True)
+# The member variables used to hold traceability information, which should never be part of a traceable object's state
+_TraceabilityVars = ('_fe_traceability_summary',
+                     '_fe_traceability_args',
+                     '_fe_traceability_tables',
+                     '_fe_traceability_updates')
 # The data types that may be restored by the default __getstate__ method. These are not kept inside the is_restorable()
 # method due to a formatting issue, though by externalizing them an end user also has more control if they want to add
-# something that was missed.
-_RestorableClasses = (int,
-                      float,
-                      bool,
-                      str,
-                      type(None),
-                      tf.Tensor,
-                      tf.Variable,
-                      torch.Tensor,
-                      np.ndarray,
-                      np.number,
-                      np.bool_,
-                      np.flexible)
-
-Model = TypeVar('Model', tf.keras.Model, torch.nn.Module)
+# something that was missed. Tensors are also restorable (see _is_tensor), but are checked separately so that neither
+# TensorFlow nor PyTorch needs to be imported here.
+_RestorableClasses = (int, float, bool, str, type(None), np.ndarray, np.number, np.bool_, np.flexible)
+
+Model = TypeVar('Model', 'tf.keras.Model', 'torch.nn.Module')
+
+
+def _is_tensor(data: Any) -> bool:
+    """Check whether an object is a TensorFlow tensor, TensorFlow variable, or PyTorch tensor.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        True iff `data` is a tensor or variable from a framework which has already been imported.
+    """
+    return is_tf_tensor(data) or is_torch_tensor(data)
 
 
 class FeInputSpec:
@@ -95,7 +108,7 @@ class FeInputSpec:
     def __init__(self, model_input: Any, model: Model):
         self.shape = to_shape(model_input)
         self.dtype = to_type(model_input)
-        self.tensor_func = tf.ones if isinstance(model, tf.keras.Model) else torch.ones
+        self.tensor_func = tf.ones if is_tf_model(model) else torch.ones
 
     def get_dummy_input(self) -> Any:
         """Get fake input for the model.
@@ -287,9 +300,10 @@ def _trace_value(inp: Any, tables: Dict[FEID, FeSummaryTable], ret_ref: Flag, wr
             # Prevent extremely long numbers from overflowing the table
             return NoEscape(r'\seqsplit{' + str(inp) + '}')
         return inp
-    elif hasattr(inp, '_fe_traceability_summary'):
-        # The first time a traceable object goes through here it won't have it's summary instantiated yet, so it will
-        # fall through to the class check at the end to get it's id.
+    elif not isinstance(inp, type) and hasattr(inp, '_fe_traceability_summary'):
+        # While a traceable object is building its own summary it will raise an AttributeError here, so it will fall
+        # through to the class check at the end to get it's id. The same goes for objects created while traceability
+        # was disabled.
         # noinspection PyProtectedMember,PyUnresolvedReferences
         tables.update(inp._fe_traceability_summary)
         inp_id = FEID(id(inp))
@@ -417,7 +431,7 @@ def _trace_value(inp: Any, tables: Dict[FEID, FeSummaryTable], ret_ref: Flag, wr
         return _trace_value(args, tables, ret_ref, wrap_str=False).raw_input  # unwrap kwargs back into a dict
     elif isinstance(inp, _VarWrap):
         return inp.var
-    elif isinstance(inp, (tf.keras.Model, torch.nn.Module)):
+    elif is_tf_model(inp) or is_torch_model(inp):
         # FE models should never actually get here since they are given summaries by trace_model() during fe.build()
         inp_id = FEID(id(inp))
         if inp_id in tables:
@@ -444,12 +458,12 @@ def _trace_value(inp: Any, tables: Dict[FEID, FeSummaryTable], ret_ref: Flag, wr
                 v in inp.items()
             },
             truncate=_CollectionSizeLimit)
-    elif isinstance(inp, (tf.Tensor, torch.Tensor, np.ndarray, tf.Variable)):
+    elif isinstance(inp, np.ndarray) or _is_tensor(inp):
         inp_type = type(inp)
         inp_id = FEID(id(inp))
         if inp_id not in tables:
-            if isinstance(inp, (tf.Tensor, torch.Tensor, tf.Variable)):
-                if isinstance(inp, torch.Tensor):
+            if _is_tensor(inp):
+                if is_torch_tensor(inp):
                     inp = inp.cpu().detach()
                     inp.numpy()
                 # In the elif here we're sure to be tf
@@ -973,6 +987,9 @@ def fe_summary(self) -> List[FeSummaryTable]:
 
     Returns:
         A summary of the instance.
+
+    Raises:
+        AttributeError: If the instance was created while traceability was disabled.
     """
     # Delayed imports to avoid circular dependency
     from fastestimator.estimator import Estimator
@@ -1060,16 +1077,18 @@ def _setdata(current: Any, new: Any) -> Any:
         for key in current.keys():
             current[key] = _setdata(current[key], new[key])
         return current
-    if isinstance(current, tf.Variable) and isinstance(new, tf.Variable) and current.shape == new.shape:
+    if 'tensorflow' in sys.modules and isinstance(current, tf.Variable) and isinstance(
+            new, tf.Variable) and current.shape == new.shape:
         current.assign(new)
         return current
-    if isinstance(current, torch.Tensor) and isinstance(new, torch.Tensor) and current.shape == new.shape:
+    if 'torch' in sys.modules and isinstance(current, torch.Tensor) and isinstance(
+            new, torch.Tensor) and current.shape == new.shape:
         current.copy_(new)
         return current
     if isinstance(current, np.ndarray) and isinstance(new, np.ndarray) and current.shape == new.shape:
         np.copyto(dst=current, src=new)
         return current
-    if isinstance(new, _RestorableClasses):
+    if isinstance(new, _RestorableClasses) or _is_tensor(new):
         return new  # This should go before __dict__ since tensors have __dict__s
     if hasattr(current, '__setstate__'):
         current.__setstate__(new)
@@ -1093,6 +1112,8 @@ def trace_model(model: Model, model_idx: int, model_fn: Any, optimizer_fn: Any,
     Returns:
         The `model`, but now with an fe_summary() method.
     """
+    if not _TraceabilityEnabled:
+        return model
     tables = {}
     description = {'definition': _trace_value(model_fn, tables, ret_ref=Flag())}
     if model_idx != -1:
@@ -1113,6 +1134,137 @@ def trace_model(model: Model, model_idx: int, model_fn: Any, optimizer_fn: Any,
     return model
 
 
+def enable_traceability(enabled: bool = True) -> None:
+    """Globally enable or disable the traceability of FastEstimator objects.
+
+    Every @traceable object records the arguments it was built with so that it can later describe itself via
+    fe_summary(). This is what powers the Traceability trace, but it costs a little time and memory for every object
+    which is constructed. Production training jobs which do not need reports can turn it off:
+    ```python
+    fe.util.enable_traceability(False)
+    ```
+
+    The setting only affects objects which are created after it is changed. Objects created while traceability is
+    disabled will raise an AttributeError if you try to summarize them.
+
+    Args:
+        enabled: Whether newly created objects should be traceable.
+    """
+    if enabled:
+        _TraceabilityEnabled.set_true()
+    else:
+        _TraceabilityEnabled.set_false()
+
+
+def is_traceability_enabled() -> bool:
+    """Check whether newly created @traceable objects will be able to generate summaries.
+
+    Returns:
+        Whether traceability is currently enabled.
+    """
+    return bool(_TraceabilityEnabled)
+
+
+def is_traceable(obj: Any) -> bool:
+    """Check whether a given object is able to produce an fe_summary().
+
+    Unlike hasattr(obj, '_fe_traceability_summary'), this will not trigger the construction of the summary tables.
+
+    Args:
+        obj: The object to be inspected.
+
+    Returns:
+        Whether `obj` recorded its initialization arguments (or was otherwise given summary tables).
+    """
+    state = getattr(obj, '__dict__', {})
+    return '_fe_traceability_args' in state or '_fe_traceability_tables' in state
+
+
+def inherit_trace(child: Any, parent: Any) -> None:
+    """Make an object which was created without invoking its __init__ method describe itself using `parent`'s arguments.
+
+    This is intended for objects whose member variables were copied from `parent`. The `child` will build its own
+    summary tables (with its own id) from the parent's initialization arguments whenever they are requested.
+
+    Args:
+        child: The object which was built without calling its __init__ method.
+        parent: The traceable object from which the `child` was derived.
+    """
+    parent_state, child_state = parent.__dict__, child.__dict__
+    child_state.pop('_fe_traceability_tables', None)
+    child_state.pop('_fe_traceability_args', None)
+    child_state.pop('_fe_traceability_updates', None)
+    if '_fe_traceability_args' in parent_state:
+        child_state['_fe_traceability_args'] = parent_state['_fe_traceability_args']
+    if '_fe_traceability_updates' in parent_state:
+        child_state['_fe_traceability_updates'] = list(parent_state['_fe_traceability_updates'])
+
+
+def add_trace_update(obj: Any, update: Callable[[Dict[FEID, FeSummaryTable], FEID], None]) -> None:
+    """Register a modification to be applied to the summary tables of a traceable object.
+
+    If the tables of `obj` have not been built yet then the `update` will be applied when they are, otherwise it is
+    applied immediately.
+
+    Args:
+        obj: The traceable object to be modified.
+        update: A function which will be invoked with the tables of `obj` and the FEID of the table describing `obj`.
+    """
+    obj.__dict__.setdefault('_fe_traceability_updates', []).append(update)
+    tables = obj.__dict__.get('_fe_traceability_tables')
+    if tables is not None:
+        update(tables, FEID(id(obj)))
+
+
+def _get_summary_tables(self) -> Dict[FEID, FeSummaryTable]:
+    """Get the summary tables of a traceable object, building them if this is the first time they have been requested.
+
+    Args:
+        self: The bound class instance.
+
+    Returns:
+        A dictionary of the tables describing this object and everything used to create it.
+
+    Raises:
+        AttributeError: If this object was created while traceability was disabled, or if its tables are currently being
+            built (which happens when an object is referenced by its own arguments).
+    """
+    state = self.__dict__
+    if '_fe_traceability_tables' in state:
+        tables = state['_fe_traceability_tables']
+        if tables is None:
+            raise AttributeError(f"The summary of this {type(self).__name__} is still being constructed")
+        return tables
+    call = state.get('_fe_traceability_args')
+    if call is None:
+        raise AttributeError(f"This {type(self).__name__} was created while traceability was disabled, so it cannot be "
+                             "summarized. Invoke fe.util.enable_traceability() before building it.")
+    state['_fe_traceability_tables'] = None  # Mark this object as a work in progress in case of circular references
+    try:
+        bound_args = inspect.signature(call.func).bind(self, *call.args, **call.kwargs)
+        bound_args.apply_defaults()
+        tables = {}
+        _trace_value(_BoundFn(self, bound_args), tables, ret_ref=Flag())
+        fe_id = FEID(id(self))
+        for update in state.get('_fe_traceability_updates', []):
+            update(tables, fe_id)
+    except BaseException:
+        del state['_fe_traceability_tables']
+        raise
+    state['_fe_traceability_tables'] = tables
+    return tables
+
+
+def _set_summary_tables(self, tables: Dict[FEID, FeSummaryTable]) -> None:
+    """Directly assign the summary tables of a traceable object.
+
+    Args:
+        self: The bound class instance.
+        tables: The new summary tables.
+    """
+    self.__dict__['_fe_traceability_tables'] = tables
+
+
 def traceable(whitelist: Union[str, Tuple[str, ...]] = (), blacklist: Union[str, Tuple[str, ...]] = ()) -> Callable:
     """A decorator to be placed on classes in order to make them traceable and to enable a deep restore.
 
@@ -1143,20 +1295,21 @@ def traceable(whitelist: Union[str, Tuple[str, ...]] = (), blacklist: Union[str,
                 else:
                     self._fe_state_whitelist = tuple(set(self._fe_state_whitelist).union(set(whitelist)))
                 if not hasattr(self, '_fe_state_blacklist'):
-                    self._fe_state_blacklist = blacklist + (
-                        '_fe_state_whitelist', '_fe_state_blacklist', '_fe_traceability_summary')
+                    self._fe_state_blacklist = blacklist + ('_fe_state_whitelist', '_fe_state_blacklist') + \
+                        _TraceabilityVars
                 else:
                     self._fe_state_blacklist = tuple(set(self._fe_state_blacklist).union(set(blacklist)))
-                if not hasattr(self, '_fe_traceability_summary'):
-                    bound_args = inspect.signature(base_init).bind(self, *args, **kwargs)
-                    bound_args.apply_defaults()
-                    tables = {}
-                    _trace_value(_BoundFn(self, bound_args), tables, ret_ref=Flag())
-                    self._fe_traceability_summary = tables
+                if _TraceabilityEnabled and not is_traceable(self):
+                    # Only the outermost __init__ gets recorded. Turning the arguments into summary tables is expensive,
+                    # so that is put off until somebody actually asks for a summary.
+                    self._fe_traceability_args = _InitCall(base_init, args, kwargs)
                 base_init(self, *args, **kwargs)
 
             setattr(cls, '__init__', init)
 
+        if not isinstance(getattr(cls, '_fe_traceability_summary', None), property):
+            setattr(cls, '_fe_traceability_summary', property(_get_summary_tables, _set_summary_tables))
+
         base_func = getattr(cls, 'fe_summary', None)
         if base_func is None:
             setattr(cls, 'fe_summary', fe_summary)
@@ -1185,11 +1338,11 @@ def is_restorable(data: Any, memory_limit: int = 0) -> Tuple[bool, int]:
         (result, memory size) where result is True iff `data` is only comprised of 'simple' objects and does not exceed
         the `memory_limit`. If the result is False, then memory size will be <= the true memory size of the `data`.
     """
-    if isinstance(data, _RestorableClasses):
+    if isinstance(data, _RestorableClasses) or _is_tensor(data):
         size = sys.getsizeof(data)
-        if isinstance(data, tf.Tensor):
+        if 'tensorflow' in sys.modules and isinstance(data, tf.Tensor):
             size = sys.getsizeof(data.numpy())
-        elif isinstance(data, torch.Tensor):
+        elif 'torch' in sys.modules and isinstance(data, torch.Tensor):
             size = data.element_size() * data.nelement()
         return True, size
     elif isinstance(data, dict):
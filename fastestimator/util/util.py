@@ -20,85 +20,177 @@ import sys
 import time
 from ast import literal_eval
 from contextlib import ContextDecorator
-from typing import Any, Callable, Dict, KeysView, List, MutableMapping, Optional, Set, Tuple, Type, TypeVar, Union
+from typing import Any, Callable, Dict, KeysView, List, Mapping, MutableMapping, Optional, Sequence, Set, Tuple, Type, \
+    TypeVar, Union, TYPE_CHECKING
 
 import matplotlib.pyplot as plt
 import numpy as np
-import tensorflow as tf
-import torch
 from matplotlib.collections import PatchCollection
 from matplotlib.patches import Rectangle
 from pyfiglet import Figlet
 
-STRING_TO_TORCH_DTYPE = {
-    None: None,
-    'float32': torch.float32,
-    'float': torch.float,
-    'float64': torch.float64,
-    'double': torch.double,
-    'float16': torch.float16,
-    'half': torch.half,
-    'uint8': torch.uint8,
-    'int8': torch.int8,
-    'int16': torch.int16,
-    'short': torch.short,
-    'int32': torch.int32,
-    'int': torch.int,
-    'int64': torch.int64,
-    'long': torch.long,
-    'bool': torch.bool
-}
-
-STRING_TO_TF_DTYPE = {
-    None: None,
-    "string": tf.string,
-    "int8": tf.int8,
-    "uint8": tf.uint8,
-    "int16": tf.int16,
-    "uint16": tf.uint16,
-    "int32": tf.int32,
-    "uint32": tf.uint32,
-    "int64": tf.int64,
-    "uint64": tf.uint64,
-    "float16": tf.float16,
-    "float32": tf.float32,
-    "float64": tf.float64
-}
-
-TENSOR_TO_NP_DTYPE = {
-    # Abstract types like 'float' and 'long' are intentionally not included here since they are never actually a
-    # tensor's dtype and they interfere with the finer-grained keys (torch.float intercepts torch.float32, for example)
-    None: None,
-    torch.float32: np.float32,
-    torch.float64: np.float64,
-    torch.float16: np.float16,
-    torch.uint8: np.uint8,
-    torch.int8: np.int8,
-    torch.int16: np.int16,
-    torch.int32: np.int32,
-    torch.int64: np.int64,
-    torch.bool: np.bool,
-    tf.float32: np.float32,
-    tf.float64: np.float64,
-    tf.float16: np.float16,
-    tf.uint8: np.uint8,
-    tf.int8: np.int8,
-    tf.int16: np.int16,
-    tf.int32: np.int32,
-    tf.int64: np.int64,
-    tf.bool: np.bool,
-    np.dtype('float32'): np.float32,
-    np.dtype('float64'): np.float64,
-    np.dtype('float16'): np.float16,
-    np.dtype('uint8'): np.uint8,
-    np.dtype('int8'): np.int8,
-    np.dtype('int16'): np.int16,
-    np.dtype('int32'): np.int32,
-    np.dtype('int64'): np.int64,
-    np.dtype('bool'): np.bool,
-}
-
-Tensor = TypeVar('Tensor', tf.Tensor, torch.Tensor)
+from fastestimator.util.lazy_util import make_lazy
+
+if TYPE_CHECKING:
+    import tensorflow as tf
+    import torch
+
+
+def _string_to_torch_dtype() -> Dict[Optional[str], Any]:
+    import torch
+    return {
+        None: None,
+        'float32': torch.float32,
+        'float': torch.float,
+        'float64': torch.float64,
+        'double': torch.double,
+        'float16': torch.float16,
+        'half': torch.half,
+        'uint8': torch.uint8,
+        'int8': torch.int8,
+        'int16': torch.int16,
+        'short': torch.short,
+        'int32': torch.int32,
+        'int': torch.int,
+        'int64': torch.int64,
+        'long': torch.long,
+        'bool': torch.bool
+    }
+
+
+def _string_to_tf_dtype() -> Dict[Optional[str], Any]:
+    import tensorflow as tf
+    return {
+        None: None,
+        "string": tf.string,
+        "int8": tf.int8,
+        "uint8": tf.uint8,
+        "int16": tf.int16,
+        "uint16": tf.uint16,
+        "int32": tf.int32,
+        "uint32": tf.uint32,
+        "int64": tf.int64,
+        "uint64": tf.uint64,
+        "float16": tf.float16,
+        "float32": tf.float32,
+        "float64": tf.float64
+    }
+
+
+def _tensor_to_np_dtype() -> Dict[Any, Any]:
+    import tensorflow as tf
+    import torch
+    return {
+        # Abstract types like 'float' and 'long' are intentionally not included here since they are never actually a
+        # tensor's dtype and they interfere with the finer-grained keys (torch.float intercepts torch.float32, for
+        # example)
+        None: None,
+        torch.float32: np.float32,
+        torch.float64: np.float64,
+        torch.float16: np.float16,
+        torch.uint8: np.uint8,
+        torch.int8: np.int8,
+        torch.int16: np.int16,
+        torch.int32: np.int32,
+        torch.int64: np.int64,
+        torch.bool: np.bool,
+        tf.float32: np.float32,
+        tf.float64: np.float64,
+        tf.float16: np.float16,
+        tf.uint8: np.uint8,
+        tf.int8: np.int8,
+        tf.int16: np.int16,
+        tf.int32: np.int32,
+        tf.int64: np.int64,
+        tf.bool: np.bool,
+        np.dtype('float32'): np.float32,
+        np.dtype('float64'): np.float64,
+        np.dtype('float16'): np.float16,
+        np.dtype('uint8'): np.uint8,
+        np.dtype('int8'): np.int8,
+        np.dtype('int16'): np.int16,
+        np.dtype('int32'): np.int32,
+        np.dtype('int64'): np.int64,
+        np.dtype('bool'): np.bool,
+    }
+
+
+# The deep learning frameworks are slow to import, so these mappings are only built the first time they are accessed
+make_lazy(
+    __name__, {
+        'STRING_TO_TORCH_DTYPE': _string_to_torch_dtype,
+        'STRING_TO_TF_DTYPE': _string_to_tf_dtype,
+        'TENSOR_TO_NP_DTYPE': _tensor_to_np_dtype
+    })
+
+Tensor = TypeVar('Tensor', 'tf.Tensor', 'torch.Tensor')
+
+
+def is_tf_tensor(data: Any) -> bool:
+    """Check whether an object is a TensorFlow tensor, without importing TensorFlow.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        True iff `data` is a TensorFlow tensor.
+    """
+    # If TensorFlow has not been imported yet then the data cannot possibly be a TensorFlow tensor
+    tf = sys.modules.get('tensorflow')
+    return tf is not None and tf.is_tensor(data)
+
+
+def is_torch_tensor(data: Any) -> bool:
+    """Check whether an object is a PyTorch tensor, without importing PyTorch.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        True iff `data` is a PyTorch tensor.
+    """
+    # If PyTorch has not been imported yet then the data cannot possibly be a PyTorch tensor
+    torch = sys.modules.get('torch')
+    return torch is not None and isinstance(data, torch.Tensor)
+
+
+def is_tf_model(model: Any) -> bool:
+    """Check whether an object is a TensorFlow model, without importing TensorFlow.
+
+    Args:
+        model: The object to check.
+
+    Returns:
+        True iff `model` is a tf.keras.Model.
+    """
+    tf = sys.modules.get('tensorflow')
+    return tf is not None and isinstance(model, tf.keras.Model)
+
+
+def is_torch_model(model: Any) -> bool:
+    """Check whether an object is a PyTorch model, without importing PyTorch.
+
+    Args:
+        model: The object to check.
+
+    Returns:
+        True iff `model` is a torch.nn.Module.
+    """
+    torch = sys.modules.get('torch')
+    return torch is not None and isinstance(model, torch.nn.Module)
+
+
+def is_tf_dataset(data: Any) -> bool:
+    """Check whether an object is a tf.data.Dataset, without importing TensorFlow.
+
+    Args:
+        data: The object to check.
+
+    Returns:
+        True iff `data` is a tf.data.Dataset.
+    """
+    tf = sys.modules.get('tensorflow')
+    return tf is not None and isinstance(data, tf.data.Dataset)
 
 
 def parse_string_to_python(val: str) -> Any:
@@ -294,7 +386,8 @@ class Timer(ContextDecorator):
     def __exit__(self, *exc: Tuple[Optional[Type], Optional[Exception], Optional[Any]]) -> None:
         self.end = time.perf_counter()
         self.interval = self.end - self.start
-        tf.print("{} took {} seconds".format(self.name, self.interval))
+        tf = sys.modules.get('tensorflow')  # Use tf.print (when available) so that this also works inside tf.function
+        (print if tf is None else tf.print)("{} took {} seconds".format(self.name, self.interval))
 
 
 def draw() -> None:
@@ -529,6 +622,75 @@ def pad_data(data: np.ndarray, target_shape: Tuple[int, ...], pad_value: Union[f
     return np.pad(data, padded_shape, 'constant', constant_values=pad_value)
 
 
+def pad_collate(
+        batch: List[Mapping[str, Any]],
+        pad_value: Union[None, float, int],
+        pad_multiple: Union[None, int, Dict[str, Union[int, Sequence[Optional[int]]]]] = None) -> Dict[str, Any]:
+    """Combine a list of data dictionaries into a single dictionary, padding numpy arrays to a common shape if needed.
+
+    Unlike pad_batch(), samples are not padded one at a time. The target shape of each key is computed once, a single
+    output array filled with the `pad_value` is allocated, and then every sample is copied into its corner of that
+    array. Numpy arrays are stacked along a new leading batch dimension. Any other values are gathered into lists so
+    that the caller can decide how to combine them.
+
+    ```python
+    data = [{"x": np.ones((2, 2)), "y": 8}, {"x": np.ones((3, 1)), "y": 4}]
+    b = fe.util.pad_collate(data, pad_value=0)
+    # {'x': [[[1, 1], [1, 1], [0, 0]], [[1, 0], [1, 0], [1, 0]]], 'y': [8, 4]}
+    b = fe.util.pad_collate(data, pad_value=0, pad_multiple={"x": (4, None)})
+    # {'x': <2x4x2>, 'y': [8, 4]}
+    ```
+
+    Args:
+        batch: A list of data to be combined.
+        pad_value: The value to pad with, or None to disable padding (in which case arrays must already have matching
+            shapes).
+        pad_multiple: Round the padded shapes up to multiples of this value. Having fewer distinct batch shapes reduces
+            how often downstream compiled graphs need to be retraced. An int applies to every dimension of every array.
+            A dictionary configures individual keys, using either an int or a sequence with one entry per dimension
+            (None to leave that dimension alone). This is ignored when `pad_value` is None.
+
+    Returns:
+        A dictionary mapping each key to either a numpy array with a leading batch dimension or a list of values.
+
+    Raises:
+        AssertionError: If the data within the batch do not have matching keys, or arrays do not have matching ranks.
+        ValueError: If arrays have different shapes while `pad_value` is None.
+    """
+    keys = batch[0].keys()
+    for data in batch:
+        assert data.keys() == keys, "data within batch must have same keys"
+    results = {}
+    for key in keys:
+        values = [data[key] for data in batch]
+        if not all(isinstance(value, np.ndarray) for value in values):
+            results[key] = values
+            continue
+        shapes = {value.shape for value in values}
+        assert len({len(shape) for shape in shapes}) == 1, "data within batch must have same rank"
+        if pad_value is None:
+            if len(shapes) > 1:
+                raise ValueError(f"Cannot stack '{key}' with shapes {sorted(shapes)} without a pad_value")
+            results[key] = np.stack(values)
+            continue
+        target_shape = [max(dims) for dims in zip(*shapes)]
+        multiple = pad_multiple.get(key) if isinstance(pad_multiple, dict) else pad_multiple
+        if multiple is not None:
+            multiple = [multiple] * len(target_shape) if isinstance(multiple, int) else multiple
+            assert len(multiple) == len(target_shape), f"pad_multiple for '{key}' must match the rank of its data"
+            target_shape = [dim if mult is None else -(-dim // mult) * mult
+                            for dim, mult in zip(target_shape, multiple)]
+        target_shape = tuple(target_shape)
+        if len(shapes) == 1 and target_shape in shapes:
+            results[key] = np.stack(values)
+            continue
+        padded = np.full((len(values), ) + target_shape, pad_value, dtype=np.result_type(*{v.dtype for v in values}))
+        for idx, value in enumerate(values):
+            padded[(idx, *map(slice, value.shape))] = value
+        results[key] = padded
+    return results
+
+
 def is_number(arg: str) -> bool:
     """Check if a given string can be converted into a number.
 
@@ -580,6 +742,7 @@ def get_num_devices():
     Returns:
         The number of available GPUs, or 1 if none are found.
     """
+    import torch
     return max(torch.cuda.device_count(), 1)
 
 
@@ -682,7 +845,7 @@ def show_image(im: Union[np.ndarray, Tensor],
         pc = PatchCollection(boxes, match_original=True)
         axis.add_collection(pc)
     else:
-        if isinstance(im, torch.Tensor) and len(im.shape) > 2:
+        if is_torch_tensor(im) and len(im.shape) > 2:
             # Move channel first to channel last
             channels = list(range(len(im.shape)))
             channels.append(channels.pop(0))
@@ -801,7 +964,7 @@ class Flag:
         return self._val
 
 
-def to_number(data: Union[tf.Tensor, torch.Tensor, np.ndarray, int, float]) -> np.ndarray:
+def to_number(data: Union['tf.Tensor', 'torch.Tensor', np.ndarray, int, float]) -> np.ndarray:
     """Convert an input value into a Numpy ndarray.
 
     This method can be used with Python and Numpy data:
@@ -830,9 +993,9 @@ def to_number(data: Union[tf.Tensor, torch.Tensor, np.ndarray, int, float]) -> n
     Returns:
         An ndarray corresponding to the given `data`.
     """
-    if tf.is_tensor(data):
+    if is_tf_tensor(data):
         data = data.numpy()
-    elif isinstance(data, torch.Tensor):
+    elif is_torch_tensor(data):
         if data.requires_grad:
             data = data.detach().numpy()
         else:
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
 import unittest
 
 import numpy as np
@@ -71,3 +72,16 @@ class TestLoadModelAndSaveModel(unittest.TestCase):
         weight3 = get_model_weight_lenet_torch(m2)
 
         self.assertTrue(is_equal(weight1, weight3))
+
+    def test_load_model_torch_data_parallel_weights(self):
+        m1 = fe.build(fe.architecture.pytorch.LeNet, optimizer_fn="adam")
+        weight1 = get_model_weight_lenet_torch(m1)
+        # Weights saved from a DataParallel wrapper have every key prefixed by 'module.'
+        os.makedirs("tmp", exist_ok=True)
+        torch.save({"module." + key: value for key, value in m1.state_dict().items()}, "tmp/test_dp.pt")
+
+        m2 = fe.build(fe.architecture.pytorch.LeNet, optimizer_fn="adam")
+        fe.backend.load_model(m2, weights_path="tmp/test_dp.pt")
+        weight2 = get_model_weight_lenet_torch(m2)
+
+        self.assertTrue(is_equal(weight1, weight2))
@@ -0,0 +1,107 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.architecture.pytorch import LeNet
+from fastestimator.op.numpyop import Delete, LambdaOp
+from fastestimator.op.numpyop.univariate import ExpandDims, Minmax, Reshape
+from fastestimator.op.tensorop import Argmax
+from fastestimator.op.tensorop.model import ModelOp
+
+_STANDALONE_SCRIPT = """
+import json
+import sys
+import numpy as np
+sys.path.insert(0, sys.argv[1])
+import runtime
+result = runtime.load(sys.argv[1]).predict({"x": np.load(sys.argv[2]), "id": 7})
+print(json.dumps({"y_pred": result["y_pred"].tolist(), "fe_imported": "fastestimator" in sys.modules}))
+"""
+
+
+class TestExport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.images = np.random.randint(0, 256, size=(4, 28, 28), dtype=np.uint8)
+        cls.pipeline = fe.Pipeline(train_data=fe.dataset.NumpyDataset({"x": cls.images}),
+                                   batch_size=2,
+                                   ops=[Minmax(inputs="x", outputs="x"), ExpandDims(inputs="x", outputs="x", axis=0)])
+        model = fe.build(model_fn=LeNet, optimizer_fn=None)
+        cls.network = fe.Network(ops=[ModelOp(model=model, inputs="x", outputs="y_pred"),
+                                      Argmax(inputs="y_pred", outputs="label", axis=1, mode=None)],
+                                 pops=[Reshape(shape=(2, 5), inputs="y_pred", outputs="y_grid")])
+
+    def _python_path(self, image):
+        data = self.pipeline.transform({"x": image}, mode="infer")
+        return self.network.transform(data, mode="infer")
+
+    def test_parity(self):
+        with tempfile.TemporaryDirectory() as save_dir:
+            fe.export.save(self.pipeline, self.network, sample={"x": self.images[0]}, save_dir=save_dir)
+            self.assertTrue(os.path.exists(os.path.join(save_dir, "runtime.py")))
+            artifact = fe.export.load(save_dir)
+            for image in self.images:
+                expected = self._python_path(image)
+                result = artifact.predict({"x": image})
+                np.testing.assert_allclose(result["x"], expected["x"][0], rtol=1e-6)
+                np.testing.assert_allclose(result["y_pred"], expected["y_pred"][0], rtol=1e-5, atol=1e-6)
+                np.testing.assert_allclose(result["y_grid"], expected["y_grid"][0], rtol=1e-5, atol=1e-6)
+                self.assertEqual(result["label"], expected["label"][0])
+            batch = artifact.predict_batch([{"x": image} for image in self.images])
+            self.assertEqual(len(batch), 4)
+            np.testing.assert_allclose(batch[3]["y_pred"], self._python_path(self.images[3])["y_pred"][0], rtol=1e-5)
+
+    def test_standalone_runtime(self):
+        with tempfile.TemporaryDirectory() as save_dir:
+            fe.export.save(self.pipeline, self.network, sample={"x": self.images[0]}, save_dir=save_dir)
+            image_path = os.path.join(save_dir, "image.npy")
+            np.save(image_path, self.images[1])
+            output = subprocess.run([sys.executable, "-c", _STANDALONE_SCRIPT, save_dir, image_path],
+                                    check=True,
+                                    stdout=subprocess.PIPE,
+                                    cwd=tempfile.gettempdir()).stdout
+        result = json.loads(output.decode().strip().splitlines()[-1])
+        self.assertFalse(result["fe_imported"])
+        np.testing.assert_allclose(result["y_pred"], self._python_path(self.images[1])["y_pred"][0], rtol=1e-5)
+
+    def test_output_selection_and_delete(self):
+        pipeline = fe.Pipeline(train_data=fe.dataset.NumpyDataset({"x": self.images}),
+                               batch_size=2,
+                               ops=[Minmax(inputs="x", outputs="x"),
+                                    ExpandDims(inputs="x", outputs="x", axis=0),
+                                    Delete(keys="id")])
+        network = fe.Network(ops=self.network.ops)
+        with tempfile.TemporaryDirectory() as save_dir:
+            fe.export.save(pipeline, network, sample={"x": self.images[0], "id": 0}, save_dir=save_dir, outputs="label")
+            result = fe.export.load(save_dir).predict({"x": self.images[0], "id": 0})
+        self.assertNotIn("id", result)
+        self.assertNotIn("y_pred", result)
+        self.assertEqual(result["label"], self._python_path(self.images[0])["label"][0])
+
+    def test_unsupported_op(self):
+        pipeline = fe.Pipeline(train_data=fe.dataset.NumpyDataset({"x": self.images}),
+                               batch_size=2,
+                               ops=[LambdaOp(fn=lambda x: x / 255, inputs="x", outputs="x")])
+        with tempfile.TemporaryDirectory() as save_dir:
+            with self.assertRaises(ValueError):
+                fe.export.save(pipeline, self.network, sample={"x": self.images[0]}, save_dir=save_dir)
@@ -14,7 +14,8 @@
 # ==============================================================================
 import unittest
 
-from fastestimator.schedule import EpochScheduler, RepeatScheduler, get_current_items, get_signature_epochs
+from fastestimator.schedule import EpochScheduler, RepeatScheduler, Scheduler, get_current_items, \
+    get_signature_epochs
 
 
 class TestSchedule(unittest.TestCase):
@@ -36,3 +37,18 @@ class TestSchedule(unittest.TestCase):
     def test_get_signature_epochs(self):
         epochs = get_signature_epochs([self.scheduler, self.epoch_scheduler], total_epochs=50, mode="train")
         self.assertEqual(epochs, self.signature_epochs)
+
+    def test_get_signature_epochs_long_schedule(self):
+        epochs = get_signature_epochs([self.scheduler, self.epoch_scheduler], total_epochs=100000, mode="train")
+        self.assertEqual(epochs, self.signature_epochs)
+
+    def test_get_signature_epochs_unknown_change_points(self):
+        class EvenOdd(Scheduler):
+            def get_current_value(self, epoch):
+                return "even" if epoch % 2 == 0 else "odd"
+
+            def get_all_values(self):
+                return ["odd", "even"]
+
+        epochs = get_signature_epochs([EvenOdd(), self.epoch_scheduler], total_epochs=50, mode="train")
+        self.assertEqual(epochs, [1, 2, 3, 30, 31])
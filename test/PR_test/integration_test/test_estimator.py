@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
+import tempfile
 import unittest
 from io import StringIO
 
@@ -24,11 +26,14 @@ import fastestimator as fe
 from fastestimator.architecture.pytorch.lenet import LeNet as LeNetTorch
 from fastestimator.architecture.tensorflow.lenet import LeNet as LeNetTf
 from fastestimator.dataset.data import mnist
+from fastestimator.op.numpyop import LambdaOp
 from fastestimator.op.tensorop import TensorOp
 from fastestimator.op.tensorop.loss import CrossEntropy
 from fastestimator.op.tensorop.model import ModelOp, UpdateOp
 from fastestimator.schedule.schedule import get_current_items
 from fastestimator.trace import Trace
+from fastestimator.trace.io import ModelSaver
+from fastestimator.trace.metric import Accuracy
 
 
 class TorchCustomDataset(Dataset):
@@ -443,6 +448,100 @@ class TestEstimatorFit(unittest.TestCase):
         self.assertEqual(iostream.getvalue(), iostream2.getvalue())
 
 
+class RecordStepTrace(Trace):
+    def __init__(self, inputs):
+        super().__init__(inputs=inputs)
+        self.steps = []
+
+    def on_batch_end(self, data) -> None:
+        self.steps.append((self.system.batch_idx, self.system.global_step, data["y_pred"], data["y_pred_plus"]))
+
+
+class TestEstimatorAsyncPostprocessing(unittest.TestCase):
+    """This test includes:
+    * fe.estimator.Estimator._run_epoch
+    * fe.estimator.Estimator._run_traces_on_step_end
+    """
+    def test_estimator_async_postprocessing_torch_backend(self):
+        pipeline = fe.Pipeline(train_data=get_sample_torch_dataloader())
+        model = fe.build(model_fn=LeNetTorch, optimizer_fn="adam")
+        network = fe.Network(ops=[
+            ModelOp(model=model, inputs="x", outputs="y_pred"),
+            CrossEntropy(inputs=("y_pred", "y"), outputs="ce"),
+            UpdateOp(model=model, loss_name="ce")
+        ],
+                             pops=LambdaOp(fn=lambda x: x + 1, inputs="y_pred", outputs="y_pred_plus"),
+                             pops_workers=2)
+        trace = RecordStepTrace(inputs=("y_pred", "y_pred_plus"))
+        est = fe.Estimator(pipeline=pipeline, network=network, epochs=1, traces=trace, log_steps=None)
+        est.fit(warmup=False)
+
+        self.assertEqual([step[0] for step in trace.steps], list(range(1, 11)))
+        self.assertEqual([step[1] for step in trace.steps], list(range(1, 11)))
+        for _, _, y_pred, y_pred_plus in trace.steps:
+            self.assertTrue(np.allclose(y_pred.numpy() + 1, y_pred_plus))
+        self.assertIsNone(network.epoch_postprocessing_pool)
+
+
+class TestEstimatorDistributed(unittest.TestCase):
+    """This test includes:
+    * fe.estimator.Estimator._launch
+    * fe.estimator.Estimator._run_traces_on_epoch_end
+    * fe.network.TorchNetwork.distribute
+    * fe.pipeline.Pipeline.get_loader
+    """
+    @staticmethod
+    def _build_estimator(num_replicas, save_dir=None):
+        x = np.random.rand(40, 1, 28, 28).astype(np.float32)
+        y = np.random.randint(10, size=40)
+        dataset = fe.dataset.NumpyDataset({"x": x, "y": y})
+        pipeline = fe.Pipeline(train_data=dataset, eval_data=dataset, test_data=dataset, batch_size=5)
+        model = fe.build(model_fn=LeNetTorch, optimizer_fn="adam")
+        network = fe.Network(ops=[
+            ModelOp(model=model, inputs="x", outputs="y_pred"),
+            CrossEntropy(inputs=("y_pred", "y"), outputs="ce"),
+            UpdateOp(model=model, loss_name="ce")
+        ])
+        traces = [Accuracy(true_key="y", pred_key="y_pred")]
+        if save_dir:
+            traces.append(ModelSaver(model=model, save_dir=save_dir))
+        estimator = fe.Estimator(pipeline=pipeline,
+                                 network=network,
+                                 epochs=2,
+                                 traces=traces,
+                                 num_replicas=num_replicas,
+                                 dist_backend="gloo")
+        return estimator, model
+
+    def test_estimator_distributed_fit(self):
+        save_dir = tempfile.mkdtemp()
+        estimator, model = self._build_estimator(num_replicas=2, save_dir=save_dir)
+        initial_weights = {key: value.clone() for key, value in model.state_dict().items()}
+        summary = estimator.fit("distributed")
+        # Each of the 2 processes handles half of the 40 samples per epoch, in batches of 5
+        self.assertEqual(estimator.system.global_step, 8)
+        self.assertEqual(estimator.system.epoch_idx, 2)
+        self.assertEqual(list(summary.history["eval"]["accuracy"].keys()), [4, 8])
+        # The trained weights from the processes should be copied back into this one
+        self.assertTrue(
+            any(not torch.equal(initial_weights[key], value) for key, value in model.state_dict().items()))
+        self.assertEqual(sorted(os.listdir(save_dir)), ["model_epoch_1.pt", "model_epoch_2.pt"])
+        summary = estimator.test()
+        self.assertIn("accuracy", summary.history["test"])
+
+    def test_estimator_distributed_four_processes(self):
+        estimator, _ = self._build_estimator(num_replicas=4)
+        estimator.fit(warmup=False)
+        self.assertEqual(estimator.system.global_step, 4)
+
+    def test_estimator_distributed_tf_network(self):
+        model = fe.build(model_fn=LeNetTf, optimizer_fn="adam")
+        network = fe.Network(ops=[ModelOp(model=model, inputs="x", outputs="y_pred")])
+        pipeline = fe.Pipeline(train_data=get_sample_tf_dataset())
+        with self.assertRaises(ValueError):
+            fe.Estimator(pipeline=pipeline, network=network, epochs=1, num_replicas=2)
+
+
 class TestEstimatorTest(unittest.TestCase):
     """This test includes:
     * fe.estimator.Estimator.test
@@ -0,0 +1,81 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import subprocess
+import sys
+import unittest
+
+
+def run_in_new_interpreter(statement: str) -> dict:
+    """Import something in a fresh interpreter, reporting how long it took and which heavy libraries were loaded."""
+    code = "\n".join([
+        "import json, sys, time",
+        "start = time.perf_counter()",
+        statement,
+        "elapsed = time.perf_counter() - start",
+        "modules = [name for name in ('tensorflow', 'torch', 'cv2') if name in sys.modules]",
+        "print(json.dumps({'time': elapsed, 'modules': modules}))"
+    ])
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout.decode().strip().splitlines()[-1])
+
+
+class TestImport(unittest.TestCase):
+    def test_import_fastestimator(self):
+        result = run_in_new_interpreter("import fastestimator")
+        with self.subTest("Check heavy modules"):
+            self.assertListEqual(result["modules"], [])
+        with self.subTest("Check import time"):
+            self.assertLess(result["time"], 1.0)
+
+    def test_import_cli(self):
+        result = run_in_new_interpreter("import fastestimator.cli")
+        with self.subTest("Check heavy modules"):
+            self.assertListEqual(result["modules"], [])
+        with self.subTest("Check import time"):
+            self.assertLess(result["time"], 1.0)
+
+    def test_import_op_and_backend(self):
+        result = run_in_new_interpreter("import fastestimator.op; import fastestimator.backend")
+        self.assertNotIn("tensorflow", result["modules"])
+        self.assertNotIn("torch", result["modules"])
+
+    def test_distributed_queries(self):
+        result = run_in_new_interpreter(
+            "import fastestimator as fe; fe.util.is_distributed(); fe.util.get_rank(); fe.util.get_world_size()")
+        self.assertListEqual(result["modules"], [])
+
+    def test_lazy_attributes(self):
+        result = run_in_new_interpreter("import fastestimator as fe; fe.Estimator; fe.op.numpyop.NumpyOp")
+        self.assertNotIn("tensorflow", result["modules"])
+
+    def test_torch_only_fit(self):
+        result = run_in_new_interpreter("\n".join([
+            "import numpy as np",
+            "import torch",
+            "import fastestimator as fe",
+            "from fastestimator.op.tensorop.loss import MeanSquaredError",
+            "from fastestimator.op.tensorop.model import ModelOp, UpdateOp",
+            "data = {'x': np.random.rand(16, 3).astype('float32'), 'y': np.random.rand(16, 1).astype('float32')}",
+            "ds = fe.dataset.NumpyDataset(data)",
+            "pipeline = fe.Pipeline(train_data=ds, eval_data=ds, batch_size=4)",
+            "model = fe.build(lambda: torch.nn.Linear(3, 1), optimizer_fn='adam')",
+            "network = fe.Network(ops=[ModelOp(model=model, inputs='x', outputs='y_pred'),",
+            "                          MeanSquaredError(inputs=('y_pred', 'y'), outputs='mse'),",
+            "                          UpdateOp(model=model, loss_name='mse')])",
+            "fe.Estimator(pipeline=pipeline, network=network, epochs=2, log_steps=None).fit()"
+        ]))
+        self.assertIn("torch", result["modules"])
+        self.assertNotIn("tensorflow", result["modules"])
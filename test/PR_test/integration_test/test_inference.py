@@ -0,0 +1,97 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import asyncio
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.op.numpyop import LambdaOp, NumpyOp
+from fastestimator.op.tensorop.model import ModelOp
+from fastestimator.test.unittest_util import OneLayerTorchModel
+
+
+class FailOnNegative(NumpyOp):
+    def forward(self, data, state):
+        if data[0] < 0:
+            raise ValueError("Negative input")
+        return data
+
+
+class TestInferenceSession(unittest.TestCase):
+    def setUp(self):
+        self.model = fe.build(model_fn=OneLayerTorchModel, optimizer_fn=None)
+        self.network = fe.Network(ops=[ModelOp(model=self.model, inputs="x", outputs="y_pred")])
+        self.batch_sizes = []
+        self.pipeline = fe.Pipeline(train_data=fe.dataset.NumpyDataset({"x": np.ones((4, 3), dtype=np.float32)}),
+                                    batch_size=2,
+                                    ops=[
+                                        LambdaOp(fn=lambda x: np.float32(x * 2), inputs="x", outputs="x"),
+                                        FailOnNegative(inputs="x", outputs="x"),
+                                        LambdaOp(fn=lambda: None, mode="train")
+                                    ])
+
+    def test_predict_matches_transform(self):
+        data = {"x": np.array([1.0, 1.0, 1.0], dtype=np.float32)}
+        expected = self.network.transform(self.pipeline.transform(data, mode="infer"), mode="infer")
+        with fe.InferenceSession(self.pipeline, self.network) as session:
+            result = session.predict(data)
+        np.testing.assert_allclose(result["x"], [2.0, 2.0, 2.0])
+        np.testing.assert_allclose(result["y_pred"], [12.0])
+        np.testing.assert_allclose(result["y_pred"], np.squeeze(expected["y_pred"], axis=0))
+        np.testing.assert_allclose(data["x"], [1.0, 1.0, 1.0])
+
+    def test_concurrent_requests_are_batched(self):
+        run_step = self.network.run_step
+
+        def recording_run_step(batch):
+            self.batch_sizes.append(batch["x"].shape[0])
+            return run_step(batch)
+
+        self.network.run_step = recording_run_step
+        with fe.InferenceSession(self.pipeline, self.network, max_batch_size=4, max_latency=1.0) as session:
+            futures = [session.submit({"x": np.full(3, i, dtype=np.float32)}) for i in range(8)]
+            results = [future.result(timeout=30) for future in futures]
+        for i, result in enumerate(results):
+            np.testing.assert_allclose(result["y_pred"], [12.0 * i])
+        self.assertEqual(self.batch_sizes, [4, 4])
+
+    def test_errors_are_isolated(self):
+        with fe.InferenceSession(self.pipeline, self.network, max_batch_size=4, max_latency=1.0) as session:
+            futures = [session.submit({"x": np.full(3, i, dtype=np.float32)}) for i in (1, -1, 2, 3)]
+            with self.assertRaises(ValueError):
+                futures[1].result(timeout=30)
+            np.testing.assert_allclose(futures[0].result(timeout=30)["y_pred"], [12.0])
+            np.testing.assert_allclose(futures[3].result(timeout=30)["y_pred"], [36.0])
+
+    def test_predict_async(self):
+        async def run(session):
+            return await asyncio.gather(*[session.predict_async({"x": np.full(3, i, dtype=np.float32)})
+                                          for i in range(5)])
+
+        with fe.InferenceSession(self.pipeline, self.network) as session:
+            results = asyncio.run(run(session))
+        for i, result in enumerate(results):
+            np.testing.assert_allclose(result["y_pred"], [12.0 * i])
+
+    def test_closed_session(self):
+        session = fe.InferenceSession(self.pipeline, self.network)
+        session.close()
+        with self.assertRaises(RuntimeError):
+            session.submit({"x": np.ones(3, dtype=np.float32)})
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            fe.InferenceSession(self.pipeline, self.network, max_batch_size=0)
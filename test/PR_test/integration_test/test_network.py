@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import multiprocessing as mp
 import unittest
 from copy import deepcopy
 
@@ -23,7 +24,7 @@ import fastestimator as fe
 from fastestimator.architecture.pytorch import LeNet as LeNetTorch
 from fastestimator.architecture.tensorflow import LeNet as LeNetTf
 from fastestimator.network import TFNetwork, TorchNetwork
-from fastestimator.op.numpyop import NumpyOp
+from fastestimator.op.numpyop import LambdaOp, NumpyOp
 from fastestimator.op.tensorop import TensorOp
 from fastestimator.op.tensorop.loss import CrossEntropy, MeanSquaredError
 from fastestimator.op.tensorop.model import ModelOp, UpdateOp
@@ -502,3 +503,49 @@ class TestNetworkTransform(unittest.TestCase):
         with self.subTest("check whether model weight changed"):
             weight2 = get_torch_lenet_model_weight(model)
             self.assertFalse(is_equal(weight, weight2))
+
+
+class TestNetworkAsyncPostprocessing(unittest.TestCase):
+    """ This test cover:
+    * fe.network.BaseNetwork.run_step_async
+    * fe.network.PostprocessingPool
+    """
+    @staticmethod
+    def _build_network(multiprocess):
+        model = fe.build(model_fn=OneLayerTorchModel, optimizer_fn="adam")
+        return fe.Network(ops=[ModelOp(model=model, inputs="x", outputs="y_pred")],
+                          pops=[
+                              PlusOneNumpyOp(inputs="y_pred", outputs="y_pred_processed"),
+                              LambdaOp(fn=lambda x: x * 2, inputs="y_pred_processed", outputs="y_pred_processed")
+                          ],
+                          pops_workers=2,
+                          pops_multiprocess=multiprocess)
+
+    def _check_results(self, network):
+        network.load_epoch(mode="eval", epoch=1)
+        futures = []
+        for idx in range(5):
+            batch = {"x": torch.ones((2, 3), dtype=torch.float32) * idx}
+            futures.append(network.run_step_async(batch))
+        for idx, future in enumerate(futures):
+            batch, prediction = future.result()
+            self.assertTrue(np.allclose(batch["x"].numpy(), idx))
+            self.assertTrue(np.allclose(prediction["y_pred_processed"], (6 * idx + 1) * 2))
+        network.unload_epoch()
+        self.assertIsNone(network.epoch_postprocessing_pool)
+
+    def test_network_async_postprocessing_threads(self):
+        self._check_results(self._build_network(multiprocess=False))
+
+    def test_network_async_postprocessing_processes(self):
+        start_method = mp.get_start_method(allow_none=True)
+        self._check_results(self._build_network(multiprocess=True))
+        with self.subTest("global start method is unchanged"):
+            self.assertEqual(mp.get_start_method(allow_none=True), start_method)
+
+    def test_network_run_step_with_postprocessing_pool(self):
+        network = self._build_network(multiprocess=False)
+        network.load_epoch(mode="eval", epoch=1)
+        _, prediction = network.run_step({"x": torch.ones((1, 3), dtype=torch.float32)})
+        network.unload_epoch()
+        self.assertTrue(np.allclose(prediction["y_pred_processed"], 14))
@@ -535,3 +535,19 @@ class TestPipelineGetLoader(unittest.TestCase):
 
         ans = {"x": torch.tensor([[[1, -1], [1, -1]], [[1, 1], [-1, -1]]], dtype=torch.float32)}
         self.assertTrue(is_equal(ans, result))
+
+    def test_pipeline_get_loader_torch_dataset_pad_multiple(self):
+        dataset = fe.dataset.NumpyDataset({
+            "x": [np.ones((2, 1), dtype=np.float32), np.ones((1, 3), dtype=np.float32)], "y": np.array([0, 1])
+        })
+        pipeline = fe.Pipeline(train_data=dataset, pad_value=-1, batch_size=2, pad_multiple={"x": (4, None)})
+        loader = pipeline.get_loader(mode="train", shuffle=False)
+        for idx, batch in enumerate(loader, start=1):
+            result = batch
+            if idx == 1:
+                break
+
+        self.assertEqual(list(result["x"].shape), [2, 4, 3])
+        self.assertEqual(result["x"].dtype, torch.float32)
+        self.assertEqual(float(result["x"].sum()), 5 - 19)
+        self.assertTrue(is_equal(result["y"], torch.tensor([0, 1])))
@@ -0,0 +1,69 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import tensorflow as tf
+
+from fastestimator.summary import Summary
+from fastestimator.test.unittest_util import sample_system_object
+from fastestimator.trace.io import BinaryLogger
+from fastestimator.util.data import Data
+
+
+class TestBinaryLogger(unittest.TestCase):
+    def setUp(self):
+        self.log_path = os.path.join(tempfile.mkdtemp(), 'test_binary_logger')
+        self.system = sample_system_object()
+        self.system.log_steps = 2
+
+    def _run(self, logger):
+        logger.system = self.system
+        logger.on_begin(Data())
+        for step in range(1, 5):
+            self.system.global_step = step
+            data = Data()
+            data.write_with_log('ce', tf.constant(1.0 / step))
+            logger.on_batch_end(data)
+        data = Data()
+        data.write_with_log('ce', 0.1)
+        data.write_with_log('confusion', np.array([[1, 2], [3, 4]]))
+        logger.on_epoch_end(data)
+        logger.on_end(Data())
+
+    def test_filename_extension(self):
+        logger = BinaryLogger(filename=self.log_path)
+        self.assertEqual(logger.filename, self.log_path + '.femlog')
+
+    def test_log_contents(self):
+        logger = BinaryLogger(filename=self.log_path)
+        self._run(logger)
+        summary = Summary.from_metric_log(logger.filename)
+        self.assertEqual(summary.name, 'test_binary_logger')
+        self.assertEqual(set(summary.history['train']['ce'].keys()), {1, 2, 4})
+        self.assertAlmostEqual(summary.history['train']['ce'][2], 0.5)
+        # The epoch end value overwrites the batch value at the same step
+        self.assertAlmostEqual(summary.history['train']['ce'][4], 0.1)
+        self.assertEqual(summary.history['train']['epoch'], {4: self.system.epoch_idx})
+        self.assertTrue(np.array_equal(summary.history['train']['confusion'][4], np.array([[1, 2], [3, 4]])))
+
+    def test_monitor_names(self):
+        logger = BinaryLogger(filename=self.log_path, monitor_names='ce')
+        self._run(logger)
+        summary = Summary.from_metric_log(logger.filename)
+        self.assertNotIn('confusion', summary.history['train'])
+        self.assertIn('ce', summary.history['train'])
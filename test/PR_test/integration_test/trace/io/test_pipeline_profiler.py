@@ -0,0 +1,74 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.dataset.numpy_dataset import NumpyDataset
+from fastestimator.op.numpyop import LambdaOp
+from fastestimator.op.numpyop.univariate import Minmax
+from fastestimator.test.unittest_util import sample_system_object
+from fastestimator.trace.io import PipelineProfiler
+from fastestimator.util.data import Data
+
+
+class TestPipelineProfiler(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pipeline = fe.Pipeline(train_data=NumpyDataset({"x": np.random.rand(8, 4, 4, 1)}),
+                                   batch_size=2,
+                                   num_process=2,
+                                   ops=[Minmax(inputs="x", outputs="x"),
+                                        LambdaOp(fn=lambda x: x, inputs="x", outputs="x")])
+
+    def test_invalid_log_steps(self):
+        with self.assertRaises(ValueError):
+            PipelineProfiler(log_steps=0)
+
+    def test_profile(self):
+        system = sample_system_object()
+        system.pipeline = self.pipeline
+        profiler = PipelineProfiler(log_steps=2)
+        profiler.system = system
+        loader = self.pipeline.get_loader(mode="train", epoch=1)
+        profiler.on_epoch_begin(Data())
+        step_data = Data()
+        for step, _ in enumerate(loader, start=1):
+            system.global_step = step
+            profiler.on_batch_end(step_data)
+        epoch_data = Data()
+        profiler.on_epoch_end(epoch_data)
+        with self.subTest("Check step logs"):
+            self.assertIn("pipeline_samples/sec", step_data)
+            self.assertRegex(step_data["pipeline_op_time"], r"^Minmax: \d+\.\d\d%, LambdaOp: \d+\.\d\d%$")
+        with self.subTest("Check epoch logs"):
+            self.assertGreater(epoch_data["pipeline_samples/sec"], 0)
+            self.assertRegex(epoch_data["pipeline_op_time"], r"^Minmax: \d+\.\d\d%, LambdaOp: \d+\.\d\d%$")
+
+    def test_no_profile(self):
+        system = sample_system_object()
+        system.pipeline.op_profiles.clear()
+        profiler = PipelineProfiler()
+        profiler.system = system
+        profiler.on_epoch_begin(Data())
+        data = Data()
+        profiler.on_epoch_end(data)
+        self.assertNotIn("pipeline_op_time", data)
+
+    def test_format_op_times(self):
+        profile = self.pipeline.get_loader(mode="train").dataset.profile
+        self.assertEqual(PipelineProfiler.format_op_times(profile, np.array([3.0, 1.0])),
+                         "Minmax: 75.00%, LambdaOp: 25.00%")
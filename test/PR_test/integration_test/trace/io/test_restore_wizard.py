@@ -15,8 +15,10 @@
 import os
 import tempfile
 import unittest
+from unittest.mock import patch
 
-from fastestimator.test.unittest_util import sample_system_object
+import fastestimator as fe
+from fastestimator.test.unittest_util import sample_system_object, sample_system_object_torch
 from fastestimator.trace.io import RestoreWizard
 from fastestimator.util.data import Data
 
@@ -88,3 +90,15 @@ class TestRestoreWizard(unittest.TestCase):
         with self.subTest("Check system variables"):
             self.assertEqual(restore_wizard.system.global_step, global_step)
             self.assertEqual(restore_wizard.system.epoch_idx, epoch_idx)
+
+    def test_deterministic(self):
+        with patch.object(fe, 'fe_deterministic_seed', 42):
+            with self.subTest("TensorFlow"):
+                restore_wizard = RestoreWizard(directory=tempfile.mkdtemp())
+                restore_wizard.system = sample_system_object()
+                with self.assertRaises(RuntimeError):
+                    restore_wizard.on_begin(Data())
+            with self.subTest("PyTorch"):
+                restore_wizard = RestoreWizard(directory=tempfile.mkdtemp())
+                restore_wizard.system = sample_system_object_torch()
+                restore_wizard.on_begin(Data())
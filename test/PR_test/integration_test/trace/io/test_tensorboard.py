@@ -16,10 +16,12 @@ import csv
 import os
 import shutil
 import tempfile
+import threading
 import unittest
 from io import StringIO
 from unittest.mock import patch
 
+import matplotlib.pyplot as plt
 import numpy as np
 import tensorflow as tf
 import torch
@@ -181,3 +183,77 @@ class TestTensorboard(unittest.TestCase):
             self.assertEqual(tsv_data, 27 * ['1.0'])
         with self.subTest('Check embed image content'):
             self.assertTrue(is_equal(output_img, 255 * np.ones(shape=(3, 3, 3), dtype=np.int)))
+
+    def test_async_writer(self):
+        writer = _TorchWriter(self.log_dir, 'async', None, queue_size=4)
+        writer.write_scalars(mode='train', scalars=[('loss', torch.tensor(1.5))], step=1)
+        writer.flush()
+        path = os.path.join(self.log_dir, 'async', 'train')
+        values = []
+        for filename in os.listdir(path):
+            for e in tf.compat.v1.train.summary_iterator(os.path.join(path, filename)):
+                values.extend(v.simple_value for v in e.summary.value if v.tag == 'loss')
+        writer.close()
+        self.assertEqual(values, [1.5])
+
+    def test_figures_rendered_before_queueing(self):
+        writer = _TorchWriter(self.log_dir, 'figure', None, queue_size=4)
+        fig = plt.figure(figsize=(2, 1), dpi=50)
+        with patch.object(writer, 'submit') as submit:
+            writer.write_images(mode='train', images=[('fig', fig)], step=1)
+        writer.close()
+        (key, img, data_format), = submit.call_args[0][2]
+        with self.subTest('Check that an array was queued instead of the figure'):
+            self.assertIsInstance(img, np.ndarray)
+            self.assertEqual(img.shape, (1, 50, 100, 3))
+            self.assertEqual(data_format, 'NHWC')
+        with self.subTest('Check that the figure was closed'):
+            self.assertFalse(plt.fignum_exists(fig.number))
+
+    def test_drop_newest(self):
+        writer = _TorchWriter(self.log_dir, 'drop', None, queue_size=1, drop_policy='drop_newest')
+        started, release, results = threading.Event(), threading.Event(), []
+        writer.submit(lambda: (started.set(), release.wait()))
+        started.wait()
+        writer.submit(results.append, 1)
+        writer.submit(results.append, 2)
+        release.set()
+        writer.flush()
+        writer.close()
+        with self.subTest('Check that the newest write was dropped'):
+            self.assertEqual(results, [1])
+        with self.subTest('Check the drop count'):
+            self.assertEqual(writer.n_dropped, 1)
+
+    def test_drop_oldest(self):
+        writer = _TorchWriter(self.log_dir, 'drop', None, queue_size=1, drop_policy='drop_oldest')
+        started, release, results = threading.Event(), threading.Event(), []
+        writer.submit(lambda: (started.set(), release.wait()))
+        started.wait()
+        writer.submit(results.append, 1)
+        writer.submit(results.append, 2)
+        release.set()
+        writer.flush()
+        writer.close()
+        self.assertEqual(results, [2])
+
+    def test_background_error(self):
+        writer = _TorchWriter(self.log_dir, 'error', None, queue_size=4)
+        writer.submit(lambda: 1 / 0)
+        with self.assertRaises(RuntimeError):
+            writer.flush()
+        writer.close()
+
+    def test_lag_key(self):
+        tensorboard = TensorBoard(log_dir=self.log_dir, lag_key='tb_lag')
+        tensorboard.system = sample_system_object_torch()
+        tensorboard.system.global_step = 1
+        tensorboard.writer = _TorchWriter(self.log_dir, '', tensorboard.system.network, queue_size=4)
+        data = Data({'loss': torch.tensor(0.5)})
+        tensorboard.on_epoch_end(data=data)
+        tensorboard.writer.close()
+        self.assertGreaterEqual(data['tb_lag'], 0.0)
+
+    def test_invalid_drop_policy(self):
+        with self.assertRaises(ValueError):
+            TensorBoard(log_dir=self.log_dir, drop_policy='random')
@@ -18,11 +18,24 @@ import unittest
 import numpy as np
 import tensorflow as tf
 import torch
+from scipy.special import lambertw
 
 import fastestimator as fe
 
 
 class TestLambertW(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # Skip the immediate neighborhood of the branch point, where W is too poorly conditioned to compare against
+        cls.z = np.concatenate([
+            np.linspace(-1.0 / math.e + 1e-3, -0.2, 1000), np.linspace(-0.2, 5, 1000), np.geomspace(5, 1e4, 1000)
+        ])
+
+    def _check_accuracy(self, output: np.ndarray, z: np.ndarray, rtol: float) -> None:
+        target = lambertw(z.astype('float64'), k=0).real
+        rel_error = np.abs(output.astype('float64') - target) / np.maximum(np.abs(target), 1e-6)
+        self.assertLess(np.max(rel_error), rtol)
+
     def test_lambertw_np_input(self):
         n = np.array([-1.0 / math.e, -0.34, -0.32, -0.2, 0, 0.12, 0.15, math.e, 5, math.exp(1 + math.e), 100])
         obj1 = fe.backend.lambertw(n)
@@ -40,3 +53,30 @@ class TestLambertW(unittest.TestCase):
         obj1 = fe.backend.lambertw(t)
         obj2 = np.array([-1.0, -0.653695, -0.560489, -0.259171, 0, 0.107743, 0.131515, 1, 1.32672, math.e, 3.38563])
         self.assertTrue(np.allclose(obj1, obj2, atol=1e-6))
+
+    def test_lambertw_tf_accuracy(self):
+        for dtype, rtol in (('float64', 1e-12), ('float32', 1e-5), ('float16', 1e-3)):
+            with self.subTest(dtype):
+                z = self.z.astype(dtype)
+                output = fe.backend.lambertw(tf.constant(z))
+                self.assertEqual(output.dtype, tf.as_dtype(dtype))
+                self._check_accuracy(output.numpy(), z, rtol)
+
+    def test_lambertw_torch_accuracy(self):
+        for dtype, rtol in (('float64', 1e-12), ('float32', 1e-5), ('float16', 1e-3)):
+            with self.subTest(dtype):
+                z = self.z.astype(dtype)
+                output = fe.backend.lambertw(torch.tensor(z))
+                self.assertEqual(output.dtype, getattr(torch, dtype))
+                self._check_accuracy(output.numpy(), z, rtol)
+
+    def test_lambertw_tf_static_input(self):
+        output = tf.function(fe.backend.lambertw)(tf.constant(self.z, dtype=tf.float32))
+        self._check_accuracy(output.numpy(), self.z.astype('float32'), 1e-5)
+
+    def test_lambertw_torch_gradient(self):
+        z = torch.tensor([0.3, 2.0], dtype=torch.float64, requires_grad=True)
+        fe.backend.lambertw(z).sum().backward()
+        w = lambertw(np.array([0.3, 2.0])).real
+        # dW/dz = W / (z * (1 + W))
+        self.assertTrue(np.allclose(z.grad.numpy(), w / (np.array([0.3, 2.0]) * (1 + w))))
@@ -0,0 +1,110 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import os
+import tempfile
+import unittest
+
+from fastestimator.dataset.data.mscoco import MSCOCODataset
+
+
+def _annotation(ann_id, image_id, bbox, category_id=1, iscrowd=0):
+    return {"id": ann_id, "image_id": image_id, "bbox": bbox, "category_id": category_id, "iscrowd": iscrowd}
+
+
+class TestMSCOCODataset(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.image_dir = os.path.join(self.tmp_dir.name, "images")
+        os.makedirs(self.image_dir)
+        for image_id in range(1, 6):
+            open(os.path.join(self.image_dir, "{:012d}.jpg".format(image_id)), 'w').close()
+        images = [{"id": image_id, "height": 10, "width": 20} for image_id in range(1, 5)]
+        self.annotation_file = os.path.join(self.tmp_dir.name, "instances.json")
+        with open(self.annotation_file, 'w') as f:
+            json.dump(
+                {
+                    "images": images,
+                    "annotations": [
+                        _annotation(4, 3, [1.0, 1.0, 4.0, 4.0], category_id=7),
+                        _annotation(1, 1, [0.0, 0.0, 2.0, 3.0], category_id=5),
+                        _annotation(2, 1, [5.0, 5.0, 0.5, 0.5]),  # Too small
+                        _annotation(3, 2, [0.0, 0.0, 5.0, 5.0], iscrowd=1),
+                        _annotation(5, 1, [2.0, 2.0, 3.0, 3.0], category_id=6),
+                    ]
+                },
+                f)
+        self.caption_file = os.path.join(self.tmp_dir.name, "captions.json")
+        with open(self.caption_file, 'w') as f:
+            json.dump(
+                {
+                    "images": images,
+                    "annotations": [{"id": 1, "image_id": 4, "caption": "a café"},
+                                    {"id": 2, "image_id": 1, "caption": "first"},
+                                    {"id": 3, "image_id": 1, "caption": "second"}]
+                },
+                f)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _by_id(self, dataset):
+        return {dataset[idx]["image_id"]: dataset[idx] for idx in range(len(dataset))}
+
+    def test_bboxes(self):
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file)
+        self.assertEqual(sorted(dataset["image_id"]), [1, 3])
+        items = self._by_id(dataset)
+        self.assertEqual(items[1]["bbox"], [(0.0, 0.0, 2.0, 3.0, 5), (2.0, 2.0, 3.0, 3.0, 6)])
+        self.assertEqual(items[3]["bbox"], [(1.0, 1.0, 4.0, 4.0, 7)])
+        self.assertNotIn("caption", items[1])
+
+    def test_min_bbox_area(self):
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, min_bbox_area=0.1)
+        self.assertEqual(len(self._by_id(dataset)[1]["bbox"]), 3)
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, min_bbox_area=10)
+        self.assertEqual(self._by_id(dataset), {3: dataset[0]})
+
+    def test_captions(self):
+        dataset = MSCOCODataset(self.image_dir,
+                                self.annotation_file,
+                                self.caption_file,
+                                include_bboxes=False,
+                                include_captions=True)
+        items = self._by_id(dataset)
+        self.assertEqual(sorted(items), [1, 4])
+        self.assertEqual(items[1]["caption"], ["first", "second"])
+        self.assertEqual(items[4]["caption"], ["a café"])
+        self.assertNotIn("bbox", items[1])
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, include_captions=True)
+        self.assertEqual(sorted(dataset["image_id"]), [1])
+
+    def test_no_annotations(self):
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, include_bboxes=False)
+        self.assertEqual(len(dataset), 5)
+        self.assertEqual(set(dataset[0].keys()), {"image", "image_id"})
+
+    def test_index_is_reused(self):
+        MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, include_captions=True)
+        os.remove(self.annotation_file)
+        os.remove(self.caption_file)
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file, include_captions=True)
+        self.assertEqual(self._by_id(dataset)[1]["caption"], ["first", "second"])
+
+    def test_split(self):
+        dataset = MSCOCODataset(self.image_dir, self.annotation_file, self.caption_file)
+        child = dataset.split([0])
+        self.assertEqual(len(dataset) + len(child), 2)
+        self.assertEqual(len(child[0]["bbox"]), 2 if child[0]["image_id"] == 1 else 1)
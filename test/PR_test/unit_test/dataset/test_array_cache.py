@@ -0,0 +1,112 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.dataset.array_cache import read_arrays, write_arrays
+from fastestimator.dataset.dataset import ColumnStore
+
+
+class TestArrayCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = os.path.join(self.tmp_dir.name, "cache")
+        self.n_builds = 0
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _build(self):
+        self.n_builds += 1
+        return {
+            "x": np.arange(200, dtype=np.uint8).reshape(50, 2, 2),
+            "y": np.arange(50) % 5,
+            "z": fe.dataset.RaggedArray.from_arrays([np.full((idx % 3 + 1, 2), idx) for idx in range(50)])
+        }
+
+    def test_cache_is_built_once(self):
+        fe.dataset.cache_arrays(self.dir, self._build)
+        arrays = fe.dataset.cache_arrays(self.dir, self._build)
+        self.assertEqual(self.n_builds, 1)
+        self.assertIsInstance(arrays["x"], np.memmap)
+        self.assertEqual(arrays["x"].tolist(), self._build()["x"].tolist())
+        self.assertEqual(arrays["z"][7].tolist(), [[7, 7], [7, 7]])
+        self.assertEqual(len(arrays["z"]), 50)
+
+    def test_incomplete_cache_is_rebuilt(self):
+        os.makedirs(self.dir)
+        with open(os.path.join(self.dir, "array-00000.npy"), 'w') as file:
+            file.write("partial")
+        arrays = fe.dataset.cache_arrays(self.dir, self._build)
+        self.assertEqual(self.n_builds, 1)
+        self.assertEqual(arrays["y"].tolist(), (np.arange(50) % 5).tolist())
+
+    def test_copy_on_write(self):
+        arrays = fe.dataset.cache_arrays(self.dir, self._build)
+        arrays["x"][0, 0, 0] = 255
+        self.assertEqual(read_arrays(self.dir)["x"][0, 0, 0], 0)
+
+    def test_unsupported_array(self):
+        with self.assertRaises(ValueError):
+            write_arrays({"x": [1, 2, 3]}, self.dir)
+
+    def test_ragged_array_dimensions(self):
+        with self.assertRaises(ValueError):
+            fe.dataset.RaggedArray.from_arrays([np.zeros((2, 2)), np.zeros(3)])
+
+
+class TestColumnBackedDataset(unittest.TestCase):
+    def setUp(self):
+        self.ds = fe.dataset.NumpyDataset({"x": np.arange(20).reshape(10, 2), "y": np.arange(10) % 2})
+
+    def test_lookup(self):
+        self.assertIsInstance(self.ds.data, ColumnStore)
+        self.assertEqual(self.ds[3]["x"].tolist(), [6, 7])
+        self.assertEqual(self.ds["y"], [0, 1] * 5)
+        self.assertEqual(self.ds["x"].shape, (10, 2))
+
+    def test_split(self):
+        child = self.ds.split([1, 3, 5])
+        self.assertIs(child.data.storage, self.ds.data.storage)
+        self.assertEqual(child["x"][:, 0].tolist(), [2, 6, 10])
+        self.assertEqual(child["y"], [1, 1, 1])
+
+    def test_set_column(self):
+        self.ds["y"] = np.zeros(10)
+        self.assertIsInstance(self.ds.data, ColumnStore)
+        self.assertEqual(self.ds[4]["y"], 0)
+        child = self.ds.split([0, 1])
+        child["y"] = [5, 6]
+        self.assertEqual(child["y"], [5, 6])
+        self.assertEqual(self.ds["y"], [0] * 8)
+
+    def test_set_row(self):
+        child = self.ds.split([0, 1])
+        child[1] = {"x": np.zeros(2), "y": 9}
+        self.assertEqual(child[1]["y"], 9)
+        self.assertEqual(self.ds.data.storage[1]["y"], 1)
+        # The row of the converted dataset can now be modified in place
+        child[0]["y"] = 7
+        self.assertEqual(child["y"], [7, 9])
+
+    def test_summary(self):
+        summary = self.ds.summary()
+        self.assertEqual(summary.num_instances, 10)
+        self.assertEqual(summary.keys["y"].num_unique_values, 2)
+        self.assertEqual(summary.keys["x"].shape, [2])
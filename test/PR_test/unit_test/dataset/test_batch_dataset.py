@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 # ==============================================================================
+import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -40,3 +42,60 @@ class TestBatchDataset(unittest.TestCase):
         train_data.split(0.1)
 
         self.assertEqual(len(train_data), 54000)
+
+    def test_index_maps_cover_datasets(self):
+        ds1 = fe.dataset.NumpyDataset({"x": np.arange(10)})
+        ds2 = fe.dataset.NumpyDataset({"x": np.arange(10, 14)})
+        batch_ds = fe.dataset.BatchDataset(datasets=[ds1, ds2], num_samples=[2, 1])
+        samples = [item["x"] for idx in range(len(batch_ds)) for item in batch_ds[idx]]
+        with self.subTest("Every element of the larger dataset is seen exactly once"):
+            self.assertEqual(sorted(x for x in samples if x < 10), list(range(10)))
+        with self.subTest("The smaller dataset is fully covered before any element repeats"):
+            small = [x for x in samples if x >= 10]
+            self.assertEqual(len(small), 5)
+            self.assertEqual(set(small), {10, 11, 12, 13})
+
+    def test_disjoint_pairing(self):
+        ds1 = fe.dataset.NumpyDataset({"x": np.arange(10)})
+        ds2 = fe.dataset.NumpyDataset({"y": np.arange(10)})
+        batch_ds = fe.dataset.BatchDataset(datasets=[ds1, ds2], num_samples=[4, 4])
+        batch = batch_ds[0]
+        self.assertEqual(len(batch), 4)
+        for item in batch:
+            self.assertEqual(set(item.keys()), {"x", "y"})
+
+    def test_probability(self):
+        ds1 = fe.dataset.NumpyDataset({"x": np.zeros(100)})
+        ds2 = fe.dataset.NumpyDataset({"x": np.ones(100)})
+        batch_ds = fe.dataset.BatchDataset(datasets=[ds1, ds2], num_samples=8, probability=[0.75, 0.25])
+        samples = np.array([item["x"] for idx in range(len(batch_ds)) for item in batch_ds[idx]])
+        with self.subTest("Every batch has the requested size"):
+            self.assertEqual(samples.size, 8 * len(batch_ds))
+        with self.subTest("Samples are drawn in proportion to the probabilities"):
+            self.assertAlmostEqual(samples.mean(), 0.25, delta=0.1)
+
+    def test_batched_fetch(self):
+        class CountingDataset(fe.dataset.NumpyDataset):
+            def get_items(self, indices):
+                self.calls.append(len(indices))
+                return super().get_items(indices)
+
+        ds1 = CountingDataset({"x": np.arange(10)})
+        ds1.calls = []
+        ds2 = fe.dataset.NumpyDataset({"x": np.arange(10)})
+        batch_ds = fe.dataset.BatchDataset(datasets=[ds1, ds2], num_samples=[3, 2])
+        batch_ds[0]
+        self.assertEqual(ds1.calls, [3])
+
+    def test_siamese_dataset(self):
+        root_dir = tempfile.mkdtemp()
+        for clazz in ('a', 'b'):
+            os.makedirs(os.path.join(root_dir, clazz))
+            for idx in range(3):
+                open(os.path.join(root_dir, clazz, "{}{}.txt".format(clazz, idx)), 'w').close()
+        datasets = [fe.dataset.SiameseDirDataset(root_dir=root_dir) for _ in range(2)]
+        batch_ds = fe.dataset.BatchDataset(datasets=datasets, num_samples=[3, 1])
+        # The pairs are built by SiameseDirDataset.__getitem__, so the batch must not read the raw data directly
+        for item in batch_ds[0]:
+            self.assertIn("x_b", item)
+            self.assertIn(item["y"], (0, 1))
@@ -14,6 +14,7 @@
 # ==============================================================================
 import unittest
 
+import numpy as np
 import tensorflow as tf
 
 import fastestimator as fe
@@ -25,3 +26,68 @@ class TestNumpyDataset(unittest.TestCase):
         train_data = fe.dataset.NumpyDataset({"x": x_train, "y": y_train})
 
         self.assertEqual(len(train_data), 60000)
+
+    def test_split_shares_storage(self):
+        ds = fe.dataset.NumpyDataset({"x": np.arange(100)})
+        storage = ds.data
+        child = ds.split(0.1)
+        self.assertEqual(len(ds), 90)
+        self.assertEqual(len(child), 10)
+        self.assertIs(child.data.storage, storage)
+        self.assertIs(child[0], storage[child[0]["x"]])
+        grandchild = child.split([0, 1])
+        self.assertIs(grandchild.data.storage, storage)
+        self.assertEqual(sorted(ds["x"] + child["x"] + grandchild["x"]), list(range(100)))
+
+    def test_modify_entry(self):
+        ds = fe.dataset.NumpyDataset({"x": np.arange(10), "y": np.zeros(10)})
+        child = ds.split([4, 5])
+        ds[0]["y"] = 7
+        child[1]["z"] = "new"
+        self.assertEqual(ds[0]["y"], 7)
+        self.assertEqual(ds["y"][0], 7)
+        self.assertEqual(child[1], {"x": 5, "y": 0, "z": "new"})
+        # The modified entry belongs to the storage shared with the parent, just like an ordinary dictionary entry
+        self.assertEqual(ds.data.storage[5]["z"], "new")
+        ds["y"] = np.ones(len(ds))
+        self.assertEqual(ds[0]["y"], 1)
+
+    def test_split_stratified(self):
+        y = np.repeat([0, 1, 2], [600, 300, 100])
+        ds = fe.dataset.NumpyDataset({"x": np.arange(1000), "y": y})
+        child1, child2 = ds.split(0.1, 0.2, stratify="y")
+        self.assertEqual(np.bincount(child1["y"]).tolist(), [60, 30, 10])
+        self.assertEqual(np.bincount(child2["y"]).tolist(), [120, 60, 20])
+        self.assertEqual(np.bincount(ds["y"]).tolist(), [420, 210, 70])
+        self.assertEqual(sorted(ds["x"] + child1["x"] + child2["x"]), list(range(1000)))
+
+    def test_split_grouped(self):
+        patient = np.random.randint(0, 50, size=1000)
+        ds = fe.dataset.NumpyDataset({"x": np.arange(1000), "patient": patient})
+        child = ds.split(0.2, group="patient")
+        self.assertGreaterEqual(len(child), 200)
+        self.assertEqual(len(ds) + len(child), 1000)
+        self.assertFalse(set(ds["patient"]) & set(child["patient"]))
+
+    def test_split_stratified_grouped(self):
+        patient = np.arange(1000) // 10
+        ds = fe.dataset.NumpyDataset({"patient": patient, "y": (patient % 4 == 0).astype(np.int64)})
+        child = ds.split(200, stratify="y", group="patient")
+        self.assertEqual(len(child), 200)
+        self.assertFalse(set(ds["patient"]) & set(child["patient"]))
+        # Whole patients are moved, so the class balance can be off by one patient
+        self.assertAlmostEqual(np.bincount(child["y"])[1], 50, delta=10)
+
+    def test_split_grouped_too_coarse(self):
+        ds = fe.dataset.NumpyDataset({"x": np.arange(1000), "g": np.arange(1000) // 500})
+        with self.assertRaises(ValueError):
+            ds.split(0.6, group="g")
+        ds = fe.dataset.NumpyDataset({"x": np.arange(1000), "g": np.arange(1000) // 250})
+        with self.assertRaises(ValueError):
+            ds.split(0.3, 0.1, group="g")
+        self.assertEqual(len(ds), 1000)
+
+    def test_split_invalid_stratify(self):
+        ds = fe.dataset.NumpyDataset({"x": np.arange(10), "y": np.arange(10) % 2})
+        with self.assertRaises(ValueError):
+            ds.split([0, 1], stratify="y")
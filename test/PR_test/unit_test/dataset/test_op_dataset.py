@@ -0,0 +1,130 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import time
+import unittest
+
+import numpy as np
+from torch.utils.data import DataLoader
+
+from fastestimator.dataset.batch_dataset import BatchDataset
+from fastestimator.dataset.numpy_dataset import NumpyDataset
+from fastestimator.dataset.op_dataset import OpDataset
+from fastestimator.op.numpyop import LambdaOp
+from fastestimator.op.numpyop.meta import OneOf, Sometimes
+from fastestimator.op.numpyop.univariate import Minmax
+
+
+def slow_identity(x):
+    time.sleep(0.002)
+    return x
+
+
+def add_noise(x):
+    return x + np.random.rand(*x.shape)  # Draws from the global random state, like 3rd party augmentation libraries
+
+
+class TestOpDataset(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = NumpyDataset({"x": np.random.rand(8, 4, 4, 1), "y": np.arange(8)})
+
+    def test_profile_names(self):
+        ds = OpDataset(self.data, [Minmax(inputs="x", outputs="x"), Sometimes(Minmax(inputs="x", outputs="x"))],
+                       mode="train")
+        self.assertListEqual(ds.profile.op_names, ["Minmax", "Sometimes (Minmax)"])
+
+    def test_profile_single_process(self):
+        ops = [Minmax(inputs="x", outputs="x"), LambdaOp(fn=slow_identity, inputs="x", outputs="x")]
+        ds = OpDataset(self.data, ops, mode="train")
+        for idx in range(len(ds)):
+            ds[idx]
+        times, calls, samples = ds.profile.get_stats()
+        with self.subTest("Check calls"):
+            np.testing.assert_array_equal(calls, [8, 8])
+        with self.subTest("Check samples"):
+            self.assertEqual(samples, 8)
+        with self.subTest("Check times"):
+            self.assertGreaterEqual(times[1], 8 * 0.002)
+            self.assertGreater(times[1], times[0])
+
+    def test_profile_shared_between_workers(self):
+        ds = OpDataset(self.data, [LambdaOp(fn=slow_identity, inputs="x", outputs="x")], mode="train")
+        for _ in DataLoader(ds, batch_size=2, num_workers=2):
+            pass
+        times, calls, samples = ds.profile.get_stats()
+        with self.subTest("Check calls"):
+            np.testing.assert_array_equal(calls, [8])
+        with self.subTest("Check samples"):
+            self.assertEqual(samples, 8)
+        with self.subTest("Check times"):
+            self.assertGreaterEqual(times[0], 8 * 0.002)
+
+    def test_profile_batch_dataset(self):
+        # Use distinct datasets, since an element drawn by both halves of the batch would only be processed once
+        other = NumpyDataset({"x": np.random.rand(8, 4, 4, 1), "y": np.arange(8)})
+        batch_ds = BatchDataset(datasets=[self.data, other], num_samples=[2, 2])
+        ds = OpDataset(batch_ds, [Minmax(inputs="x", outputs="x")], mode="train")
+        ds[0]
+        _, calls, samples = ds.profile.get_stats()
+        with self.subTest("Check calls"):
+            np.testing.assert_array_equal(calls, [4])
+        with self.subTest("Check samples"):
+            self.assertEqual(samples, 4)
+
+    def test_random_streams(self):
+        ops = [
+            LambdaOp(fn=add_noise, inputs="x", outputs="x"),
+            Sometimes(Minmax(inputs="x", outputs="x")),
+            OneOf(LambdaOp(fn=lambda x: x + 1, inputs="x", outputs="x"),
+                  LambdaOp(fn=lambda x: x - 1, inputs="x", outputs="x"))
+        ]
+        ds = OpDataset(self.data, ops, mode="train", seed=7, epoch=2)
+        forward = [ds[idx]["x"] for idx in range(len(ds))]
+        with self.subTest("Samples don't depend on the order in which they are loaded"):
+            backward = [ds[idx]["x"] for idx in reversed(range(len(ds)))][::-1]
+            np.testing.assert_array_equal(np.array(forward), np.array(backward))
+        with self.subTest("Samples don't depend on the number of workers"):
+            for num_workers in (0, 2):
+                batches = [batch["x"].numpy() for batch in DataLoader(ds, batch_size=3, num_workers=num_workers)]
+                np.testing.assert_allclose(np.concatenate(batches), np.array(forward), rtol=1e-6)
+        with self.subTest("Different epochs use different streams"):
+            other = OpDataset(self.data, ops, mode="train", seed=7, epoch=3)
+            self.assertFalse(np.array_equal(np.array([other[idx]["x"] for idx in range(len(ds))]), np.array(forward)))
+
+    def test_global_random_states(self):
+        ds = OpDataset(self.data, [LambdaOp(fn=add_noise, inputs="x", outputs="x")], mode="train", seed=7, epoch=2)
+        with self.subTest("The main process's global random states are restored"):
+            np.random.seed(42)
+            ds[0]
+            value = np.random.rand()
+            np.random.seed(42)
+            self.assertEqual(value, np.random.rand())
+        with self.subTest("Ops drawing from the global random states don't depend on the number of workers"):
+            results = []
+            for num_workers in (0, 1, 2):
+                batches = [batch["x"].numpy() for batch in DataLoader(ds, batch_size=3, num_workers=num_workers)]
+                results.append(np.concatenate(batches))
+            np.testing.assert_allclose(results[0], results[1], rtol=1e-6)
+            np.testing.assert_allclose(results[0], results[2], rtol=1e-6)
+
+    def test_batch_dataset_streams(self):
+        ds1 = NumpyDataset({"x": np.arange(10)})
+        ds2 = NumpyDataset({"x": np.arange(10, 20)})
+        batch_ds = BatchDataset(datasets=[ds1, ds2], num_samples=8, probability=[0.5, 0.5])
+        ops = [LambdaOp(fn=lambda x: x + np.random.rand(), inputs="x", outputs="x")]
+        first = [OpDataset(batch_ds, ops, mode="train", seed=3, epoch=1)[idx]["x"] for idx in range(len(batch_ds))]
+        ds = OpDataset(batch_ds, ops, mode="train", seed=3, epoch=1)
+        second = [ds[idx]["x"] for idx in reversed(range(len(batch_ds)))][::-1]
+        np.testing.assert_array_equal(np.array(first), np.array(second))
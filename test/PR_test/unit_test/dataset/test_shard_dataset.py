@@ -0,0 +1,111 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+from torch.utils.data import DataLoader
+
+from fastestimator.dataset.numpy_dataset import NumpyDataset
+from fastestimator.dataset.shard_dataset import ShardDataset, write_shards
+from fastestimator.op.numpyop import LambdaOp
+
+
+class TestShardDataset(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.x = np.random.rand(10, 4, 4)
+        cls.root_dir = tempfile.mkdtemp()
+        write_shards(NumpyDataset({"x": cls.x, "id": np.arange(10)}), cls.root_dir, records_per_shard=3)
+
+    def test_write_shards(self):
+        files = sorted(os.listdir(self.root_dir))
+        self.assertListEqual(files, ["index.json", "shard-00000.bin", "shard-00001.bin", "shard-00002.bin",
+                                     "shard-00003.bin"])
+
+    def test_write_shards_with_ops(self):
+        root_dir = tempfile.mkdtemp()
+        write_shards(NumpyDataset({"x": self.x}),
+                     root_dir,
+                     ops=[LambdaOp(fn=lambda x: 2 * x, inputs="x", outputs="x"),
+                          LambdaOp(fn=lambda x: 0 * x, inputs="x", outputs="x", mode="eval")])
+        ds = ShardDataset(root_dir, shuffle=False)
+        self.assertEqual(len(ds), 10)
+        np.testing.assert_array_almost_equal(np.array([ds[i]["x"] for i in range(10)]), 2 * self.x)
+
+    def test_sequential_order(self):
+        ds = ShardDataset(self.root_dir, shuffle=False)
+        self.assertEqual(len(ds), 10)
+        ids = [int(ds[i]["id"]) for i in range(20)]
+        self.assertListEqual(ids, list(range(10)) * 2)
+        np.testing.assert_array_equal(ds[0]["x"], self.x[0])
+
+    def test_shuffle(self):
+        ds = ShardDataset(self.root_dir, shuffle_buffer=4)
+        for _ in range(3):
+            # Every pass over the data should be a permutation of the records
+            ids = sorted(int(ds[i]["id"]) for i in range(10))
+            self.assertListEqual(ids, list(range(10)))
+
+    def test_seeded_shuffle(self):
+        datasets = [ShardDataset(self.root_dir, shuffle_buffer=4, seed=5) for _ in range(2)]
+        ids = [[int(ds[i]["id"]) for i in range(10)] for ds in datasets]
+        self.assertListEqual(ids[0], ids[1])
+        ds = ShardDataset(self.root_dir, shuffle_buffer=4, seed=5)
+        ds.set_random_stream(seed=None, epoch=1)
+        self.assertNotEqual([int(ds[i]["id"]) for i in range(10)], ids[0])
+
+    def test_worker_units(self):
+        ds = ShardDataset(self.root_dir, shuffle=False)
+        for num_workers in (1, 2, 3, 4, 6):
+            with self.subTest(num_workers=num_workers):
+                seen = []
+                for worker_id in range(num_workers):
+                    for shard, records in ds.get_worker_units(worker_id, num_workers):
+                        seen.extend(3 * shard + records)
+                self.assertListEqual(sorted(seen), list(range(10)))
+
+    def test_data_loader_workers(self):
+        ds = ShardDataset(self.root_dir)
+        ids = [int(i) for batch in DataLoader(ds, batch_size=1, num_workers=2) for i in batch["id"]]
+        self.assertEqual(len(ids), 10)
+        self.assertTrue(set(ids).issubset(range(10)))
+        self.assertGreater(len(set(ids)), 5)
+
+    def test_split(self):
+        ds = ShardDataset(self.root_dir, shuffle=False)
+        ds2 = ds.split([1, 4, 9])
+        with self.subTest("Check lengths"):
+            self.assertEqual(len(ds), 7)
+            self.assertEqual(len(ds2), 3)
+        with self.subTest("Check records"):
+            self.assertListEqual([int(ds2[i]["id"]) for i in range(3)], [1, 4, 9])
+            self.assertListEqual([int(ds[i]["id"]) for i in range(7)], [0, 2, 3, 5, 6, 7, 8])
+
+    def test_summary(self):
+        ds = ShardDataset(self.root_dir)
+        summary = ds.summary()
+        self.assertEqual(summary.num_instances, 10)
+        self.assertListEqual(summary.keys["x"].shape, [4, 4])
+        self.assertIs(ds.summary(), summary)
+        self.assertNotIn("summary", vars(ds))  # A cached bound method would create a cycle and break pickling
+
+    def test_invalid_index(self):
+        path = os.path.join(tempfile.mkdtemp(), "index.json")
+        with open(path, "w") as f:
+            f.write('{"format": "something-else"}')
+        with self.assertRaises(ValueError):
+            ShardDataset(path)
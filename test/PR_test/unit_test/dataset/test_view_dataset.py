@@ -0,0 +1,79 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.util.util import FEID
+
+
+class TestViewDataset(unittest.TestCase):
+    def setUp(self):
+        self.ds1 = fe.dataset.NumpyDataset({"x": np.arange(10), "y": np.arange(10) % 2})
+        self.ds2 = fe.dataset.NumpyDataset({"x": np.arange(10, 15), "y": np.arange(5) % 2})
+
+    def test_subset(self):
+        subset = fe.dataset.SubsetDataset(self.ds1, [7, 3, 3])
+        self.assertEqual(len(subset), 3)
+        self.assertEqual([subset[i]["x"] for i in range(3)], [7, 3, 3])
+        self.assertIs(subset[0], self.ds1[7])
+        self.assertEqual(len(self.ds1), 10)
+
+    def test_subset_out_of_bounds(self):
+        with self.assertRaises(IndexError):
+            fe.dataset.SubsetDataset(self.ds1, [10])
+
+    def test_concat(self):
+        concat = fe.dataset.ConcatDataset([self.ds1, self.ds2])
+        self.assertEqual(len(concat), 15)
+        self.assertEqual([concat[i]["x"] for i in range(15)], list(range(15)))
+        self.assertEqual([item["x"] for item in concat.get_items([14, 0, 10, 9])], [14, 0, 10, 9])
+
+    def test_repeat(self):
+        repeat = fe.dataset.RepeatDataset(self.ds2, repeats=3)
+        self.assertEqual(len(repeat), 15)
+        self.assertEqual([repeat[i]["x"] for i in range(15)], list(range(10, 15)) * 3)
+        with self.assertRaises(ValueError):
+            fe.dataset.RepeatDataset(self.ds2, repeats=0)
+
+    def test_nesting_is_flattened(self):
+        concat = fe.dataset.ConcatDataset([fe.dataset.SubsetDataset(self.ds1, [1, 2]),
+                                           fe.dataset.RepeatDataset(self.ds2, repeats=2)])
+        subset = fe.dataset.SubsetDataset(concat, [0, 11, 3])
+        self.assertEqual([subset[i]["x"] for i in range(3)], [1, 14, 11])
+        for dataset in subset.datasets:
+            self.assertIsInstance(dataset, fe.dataset.NumpyDataset)
+
+    def test_split(self):
+        concat = fe.dataset.ConcatDataset([self.ds1, self.ds2])
+        child = concat.split([0, 14])
+        self.assertIsInstance(child, fe.dataset.ConcatDataset)
+        self.assertEqual([child[i]["x"] for i in range(2)], [0, 14])
+        self.assertEqual(len(concat), 13)
+        self.assertEqual([concat[i]["x"] for i in range(13)], list(range(1, 14)))
+        self.assertEqual(len(self.ds1), 10, "Splitting a view should not affect its parents")
+        self.assertIn(FEID(id(concat)), child._fe_traceability_summary)
+
+    def test_summary(self):
+        summary = fe.dataset.SubsetDataset(self.ds1, [0, 1, 2]).summary()
+        self.assertEqual(summary.num_instances, 3)
+        self.assertEqual(set(summary.keys.keys()), {"x", "y"})
+        self.assertEqual(self.ds1.summary().num_instances, 10)
+
+    def test_getstate(self):
+        concat = fe.dataset.ConcatDataset([self.ds1, self.ds2])
+        state = concat.__getstate__()
+        self.assertEqual(state, {'datasets': [self.ds1.__getstate__(), self.ds2.__getstate__()]})
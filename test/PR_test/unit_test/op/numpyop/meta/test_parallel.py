@@ -0,0 +1,105 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import threading
+import time
+import unittest
+
+import numpy as np
+
+from fastestimator.op.numpyop import Delete, LambdaOp
+from fastestimator.op.numpyop.meta import Fuse, Parallel
+from fastestimator.op.numpyop.univariate import Minmax
+
+
+class TestParallel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.output_shape = (28, 28, 3)
+        cls.multi_input = [np.random.randint(16, size=(28, 28, 3)), np.random.randint(16, size=(28, 28, 3))]
+
+    def test_matches_fuse(self):
+        ops = [
+            Minmax(inputs='x', outputs='y', mode='test'),
+            Minmax(inputs='z', outputs='w', mode='test'),
+            LambdaOp(fn=lambda y, w: y + w, inputs=['y', 'w'], outputs='v', mode='test')
+        ]
+        fuse = Fuse(ops)
+        parallel = Parallel(ops)
+        with self.subTest('Check op inputs'):
+            self.assertListEqual(parallel.inputs, fuse.inputs)
+        with self.subTest('Check op outputs'):
+            self.assertListEqual(parallel.outputs, fuse.outputs)
+        with self.subTest('Check op mode'):
+            self.assertSetEqual(parallel.mode, {'test'})
+        expected = fuse.forward(data=self.multi_input, state={"mode": "test"})
+        output = parallel.forward(data=self.multi_input, state={"mode": "test"})
+        with self.subTest('Check output type'):
+            self.assertEqual(type(output), list)
+        with self.subTest('Check output values'):
+            for out, exp in zip(output, expected):
+                self.assertEqual(out.shape, self.output_shape)
+                np.testing.assert_array_equal(out, exp)
+
+    def test_dependencies(self):
+        ops = [
+            LambdaOp(fn=lambda x: x, inputs='x', outputs='a'),  # 0
+            LambdaOp(fn=lambda y: y, inputs='y', outputs='b'),  # 1
+            LambdaOp(fn=lambda a: a, inputs='a', outputs='c'),  # 2: reads after 0 writes
+            LambdaOp(fn=lambda y: y, inputs='y', outputs='x'),  # 3: overwrites what 0 reads
+            LambdaOp(fn=lambda z: z, inputs='z', outputs='b'),  # 4: overwrites what 1 writes
+            Delete(keys='y'),  # 5: deletes what 1 and 3 read
+        ]
+        parallel = Parallel(ops)
+        self.assertListEqual(parallel.dependencies, [set(), set(), {0}, {0}, {1}, {1, 3}])
+        self.assertEqual(parallel.num_threads, 3)
+
+    def test_independent_branches_overlap(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fn(x):
+            barrier.wait()  # Only succeeds if both branches are running at the same time
+            return x + 1
+
+        parallel = Parallel([LambdaOp(fn=fn, inputs='x', outputs='x'), LambdaOp(fn=fn, inputs='y', outputs='y')])
+        self.assertEqual(parallel.num_threads, 2)
+        output = parallel.forward(data=[1, 2], state={"mode": "train"})
+        self.assertListEqual(output, [2, 3])
+
+    def test_chain_runs_in_order(self):
+        def fn(x):
+            time.sleep(0.01)
+            return x * 2
+
+        parallel = Parallel(
+            [LambdaOp(fn=fn, inputs='x', outputs='x'), LambdaOp(fn=lambda x: x + 1, inputs='x', outputs='x')])
+        self.assertEqual(parallel.num_threads, 1)
+        self.assertListEqual(parallel.forward(data=[3], state={"mode": "train"}), [7])
+
+    def test_exception_propagates(self):
+        def fn(x):
+            raise RuntimeError("boom")
+
+        parallel = Parallel(
+            [LambdaOp(fn=fn, inputs='x', outputs='x'), LambdaOp(fn=lambda y: y, inputs='y', outputs='y')])
+        with self.assertRaises(RuntimeError):
+            parallel.forward(data=[1, 2], state={"mode": "train"})
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            Parallel([Minmax(inputs='x', outputs='y', mode='train'), Minmax(inputs='z', outputs='w', mode='test')])
+
+    def test_invalid_num_threads(self):
+        with self.assertRaises(ValueError):
+            Parallel(Minmax(inputs='x', outputs='y'), num_threads=0)
@@ -16,6 +16,7 @@ import unittest
 
 import numpy as np
 
+from fastestimator.op.numpyop import NumpyOp
 from fastestimator.op.numpyop.univariate import Binarize
 from fastestimator.test.unittest_util import is_equal
 
@@ -37,3 +38,9 @@ class TestBinarize(unittest.TestCase):
         op = Binarize(threshold=1, inputs='x', outputs='x')
         data = op.forward(data=self.multi_input, state={})
         self.assertTrue(is_equal(data, self.multi_output))
+
+    def test_batch_input(self):
+        op = Binarize(threshold=0.5, inputs='x', outputs='x')
+        data = [np.random.rand(4, 5, 3), np.random.rand(4)]
+        expected = [NumpyOp.forward_batch(op, [elem], state={})[0] for elem in data]
+        self.assertTrue(is_equal(op.forward_batch(data=data, state={}), expected))
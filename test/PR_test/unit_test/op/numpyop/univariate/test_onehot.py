@@ -16,6 +16,7 @@ import unittest
 
 import numpy as np
 
+from fastestimator.op.numpyop import NumpyOp
 from fastestimator.op.numpyop.univariate import Onehot
 from fastestimator.test.unittest_util import is_equal
 
@@ -35,3 +36,9 @@ class TestOnehot(unittest.TestCase):
         op = Onehot(inputs='x', outputs='x', num_classes=4)
         data = op.forward(data=self.single_input, state={})
         self.assertTrue(is_equal(data, self.single_output))
+
+    def test_batch_input(self):
+        op = Onehot(inputs='x', outputs='x', num_classes=4, label_smoothing=0.1)
+        data = [np.array([1, 2, 3, 0]), np.array([[3], [3], [0], [1]])]
+        expected = [NumpyOp.forward_batch(op, [elem], state={})[0] for elem in data]
+        self.assertTrue(is_equal(op.forward_batch(data=data, state={}), expected))
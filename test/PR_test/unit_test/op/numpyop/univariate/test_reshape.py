@@ -16,6 +16,7 @@ import unittest
 
 import numpy as np
 
+from fastestimator.op.numpyop import NumpyOp
 from fastestimator.op.numpyop.univariate import Reshape
 from fastestimator.test.unittest_util import is_equal
 
@@ -37,3 +38,9 @@ class TestReshape(unittest.TestCase):
         op = Reshape(inputs='x', outputs='x', shape=(1, 2))
         data = op.forward(data=self.multi_input, state={})
         self.assertTrue(is_equal(data, self.multi_output))
+
+    def test_batch_input(self):
+        op = Reshape(inputs='x', outputs='x', shape=(3, -1))
+        data = [np.random.rand(4, 6), np.random.rand(4, 3, 2)]
+        expected = [NumpyOp.forward_batch(op, [elem], state={})[0] for elem in data]
+        self.assertTrue(is_equal(op.forward_batch(data=data, state={}), expected))
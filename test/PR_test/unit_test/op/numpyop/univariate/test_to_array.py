@@ -16,6 +16,7 @@ import unittest
 
 import numpy as np
 
+from fastestimator.op.numpyop import NumpyOp
 from fastestimator.op.numpyop.univariate import ToArray
 from fastestimator.test.unittest_util import is_equal
 
@@ -30,3 +31,9 @@ class TestToArray(unittest.TestCase):
         op = ToArray(inputs='x', outputs='x')
         data = op.forward(data=self.input, state={})
         self.assertTrue(is_equal(data, self.output))
+
+    def test_batch_input(self):
+        op = ToArray(inputs='x', outputs='x', dtype='float32')
+        data = [np.arange(4), np.ones((4, 2), dtype=np.int8)]
+        expected = [NumpyOp.forward_batch(op, [elem], state={})[0] for elem in data]
+        self.assertTrue(is_equal(op.forward_batch(data=data, state={}), expected))
@@ -0,0 +1,46 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+from fastestimator.op.tensorop.augmentation import GridDistortion
+
+
+class TestGridDistortion(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = np.random.rand(2, 20, 25, 3).astype(np.float32)
+
+    def test_tf_no_distortion(self):
+        op = GridDistortion(distort_limit=(0, 0), image_in="x")
+        op.build('tf')
+        output = op.forward(data=[tf.constant(self.image)], state={})[0]
+        np.testing.assert_allclose(output.numpy(), self.image, atol=1e-4)
+
+    def test_torch_no_distortion(self):
+        op = GridDistortion(distort_limit=(0, 0), image_in="x")
+        op.build('torch')
+        output = op.forward(data=[torch.tensor(self.image).permute(0, 3, 1, 2)], state={})[0]
+        np.testing.assert_allclose(output.permute(0, 2, 3, 1).numpy(), self.image, atol=1e-4)
+
+    def test_torch_distortion_is_monotonic(self):
+        op = GridDistortion(image_in="x")
+        op.build('torch')
+        displacement = op.get_displacement(torch.tensor(self.image), 2, 20, 25)
+        src_x = displacement[..., 0] + torch.arange(25, dtype=torch.float32) + 0.5
+        self.assertTrue(bool((src_x[:, :, 1:] > src_x[:, :, :-1]).all()))
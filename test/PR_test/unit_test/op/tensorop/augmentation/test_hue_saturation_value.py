@@ -0,0 +1,51 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+from fastestimator.op.tensorop.augmentation import HueSaturationValue
+
+
+class TestHueSaturationValue(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = np.random.rand(3, 8, 8, 3).astype(np.float32)
+
+    def test_tf_identity(self):
+        op = HueSaturationValue(inputs="x", outputs="x", hue_shift_limit=0, sat_shift_limit=0, val_shift_limit=0)
+        output = op.forward(data=[tf.constant(self.image)], state={})[0]
+        np.testing.assert_allclose(output.numpy(), self.image, atol=1e-2)
+
+    def test_torch_identity(self):
+        op = HueSaturationValue(inputs="x", outputs="x", hue_shift_limit=0, sat_shift_limit=0, val_shift_limit=0)
+        output = op.forward(data=[torch.tensor(self.image).permute(0, 3, 1, 2)], state={})[0]
+        np.testing.assert_allclose(output.permute(0, 2, 3, 1).numpy(), self.image, atol=1e-2)
+
+    def test_tf_desaturate(self):
+        op = HueSaturationValue(inputs="x", outputs="x", hue_shift_limit=0, sat_shift_limit=(-1, -1),
+                                val_shift_limit=0)
+        output = op.forward(data=[tf.constant(self.image)], state={})[0].numpy()
+        np.testing.assert_allclose(output[..., 0], output[..., 1], atol=1e-2)
+        np.testing.assert_allclose(output[..., 1], output[..., 2], atol=1e-2)
+
+    def test_torch_uint8(self):
+        image = torch.tensor((self.image * 255).astype(np.uint8)).permute(0, 3, 1, 2)
+        op = HueSaturationValue(inputs="x", outputs="x")
+        output = op.forward(data=[image], state={})[0]
+        self.assertEqual(output.dtype, torch.uint8)
+        self.assertEqual(output.shape, image.shape)
@@ -0,0 +1,51 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+from fastestimator.op.tensorop.augmentation import RandomResizedCrop
+
+
+class TestRandomResizedCrop(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = np.random.rand(4, 28, 32, 3).astype(np.float32)
+        cls.mask = np.random.randint(0, 3, size=(4, 28, 32, 1)).astype(np.int32)
+
+    def test_tf_output_shape(self):
+        op = RandomResizedCrop(height=16, width=20, image_in="x", mask_in="mask")
+        op.build('tf')
+        image, mask = op.forward(data=[tf.constant(self.image), tf.constant(self.mask)], state={})
+        self.assertEqual(image.shape, (4, 16, 20, 3))
+        self.assertEqual(mask.shape, (4, 16, 20, 1))
+        self.assertTrue(set(np.unique(mask.numpy())).issubset({0, 1, 2}))
+
+    def test_torch_output_shape(self):
+        op = RandomResizedCrop(height=16, width=20, image_in="x", mask_in="mask")
+        op.build('torch')
+        image, mask = op.forward(
+            data=[torch.tensor(self.image).permute(0, 3, 1, 2), torch.tensor(self.mask).permute(0, 3, 1, 2)], state={})
+        self.assertEqual(image.shape, (4, 3, 16, 20))
+        self.assertEqual(mask.shape, (4, 1, 16, 20))
+        self.assertTrue(set(np.unique(mask.numpy())).issubset({0, 1, 2}))
+
+    def test_torch_full_crop_is_resize(self):
+        op = RandomResizedCrop(height=28, width=32, scale=(1.0, 1.0), ratio=(32 / 28, 32 / 28), image_in="x")
+        op.build('torch')
+        image = op.forward(data=[torch.tensor(self.image).permute(0, 3, 1, 2)], state={})[0]
+        np.testing.assert_allclose(image.permute(0, 2, 3, 1).numpy(), self.image, atol=1e-4)
@@ -0,0 +1,64 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+from fastestimator.op.tensorop.augmentation import Rotate
+
+
+class TestRotate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = np.arange(2 * 4 * 4, dtype=np.float32).reshape((2, 4, 4, 1))
+        cls.bbox = np.array([[[0, 0, 2, 1, 7], [0, 0, 0, 0, 0]]] * 2, dtype=np.float32)
+        cls.expected_image = np.rot90(cls.image, k=1, axes=(1, 2))
+        cls.expected_bbox = np.array([[[0, 2, 1, 4, 7], [0, 0, 0, 0, 0]]] * 2, dtype=np.float32)
+
+    def test_tf_rotate_90(self):
+        op = Rotate(limit=(90, 90), interpolation='nearest', image_in="x", bbox_in="bbox")
+        op.build('tf')
+        image, bbox = op.forward(data=[tf.constant(self.image), tf.constant(self.bbox)], state={})
+        np.testing.assert_array_equal(image.numpy(), self.expected_image)
+        np.testing.assert_allclose(bbox.numpy(), self.expected_bbox, atol=1e-4)
+
+    def test_torch_rotate_90(self):
+        op = Rotate(limit=(90, 90), interpolation='nearest', image_in="x", bbox_in="bbox")
+        op.build('torch')
+        image, bbox = op.forward(data=[torch.tensor(self.image).permute(0, 3, 1, 2), torch.tensor(self.bbox)], state={})
+        np.testing.assert_array_equal(image.permute(0, 2, 3, 1).numpy(), self.expected_image)
+        np.testing.assert_allclose(bbox.numpy(), self.expected_bbox, atol=1e-4)
+
+    def test_tf_identity_uint8_mask(self):
+        image = tf.constant(np.random.randint(0, 255, size=(3, 8, 6, 3), dtype=np.uint8))
+        mask = tf.constant(np.random.randint(0, 2, size=(3, 8, 6), dtype=np.uint8))
+        op = Rotate(limit=(0, 0), image_in="x", mask_in="mask")
+        op.build('tf')
+        new_image, new_mask = op.forward(data=[image, mask], state={})
+        self.assertEqual(new_image.dtype, tf.uint8)
+        np.testing.assert_array_equal(new_image.numpy(), image.numpy())
+        np.testing.assert_array_equal(new_mask.numpy(), mask.numpy())
+
+    def test_torch_identity_uint8_mask(self):
+        image = torch.tensor(np.random.randint(0, 255, size=(3, 3, 8, 6), dtype=np.uint8))
+        mask = torch.tensor(np.random.randint(0, 2, size=(3, 8, 6), dtype=np.uint8))
+        op = Rotate(limit=(0, 0), image_in="x", mask_in="mask")
+        op.build('torch')
+        new_image, new_mask = op.forward(data=[image, mask], state={})
+        self.assertEqual(new_image.dtype, torch.uint8)
+        np.testing.assert_array_equal(new_image.numpy(), image.numpy())
+        np.testing.assert_array_equal(new_mask.numpy(), mask.numpy())
@@ -0,0 +1,53 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+from fastestimator.op.tensorop.augmentation import ShiftScaleRotate
+
+
+class TestShiftScaleRotate(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = np.zeros((2, 10, 10, 1), dtype=np.float32)
+        cls.image[:, 2, 3, :] = 1.0
+
+    def test_tf_shift(self):
+        op = ShiftScaleRotate(shift_limit=(0.2, 0.2), scale_limit=0, rotate_limit=0, border_mode='constant',
+                              image_in="x")
+        op.build('tf')
+        image = op.forward(data=[tf.constant(self.image)], state={})[0].numpy()
+        self.assertAlmostEqual(image[0, 4, 5, 0], 1.0, places=4)
+        self.assertAlmostEqual(image.sum(), 2.0, places=4)
+
+    def test_torch_shift(self):
+        op = ShiftScaleRotate(shift_limit=(0.2, 0.2), scale_limit=0, rotate_limit=0, border_mode='constant',
+                              image_in="x")
+        op.build('torch')
+        image = op.forward(data=[torch.tensor(self.image).permute(0, 3, 1, 2)], state={})[0].numpy()
+        self.assertAlmostEqual(image[0, 0, 4, 5], 1.0, places=4)
+        self.assertAlmostEqual(image.sum(), 2.0, places=4)
+
+    def test_tf_random_parameters_per_element(self):
+        op = ShiftScaleRotate(image_in="x")
+        op.build('tf')
+        image = tf.random.uniform((2, 16, 16, 3))
+        image = tf.concat([image[:1], image[:1]], axis=0)
+        output = op.forward(data=[image], state={})[0].numpy()
+        self.assertEqual(output.shape, (2, 16, 16, 3))
+        self.assertFalse(np.allclose(output[0], output[1]))
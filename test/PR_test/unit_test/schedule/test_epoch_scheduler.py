@@ -32,3 +32,9 @@ class TestEpochScheduler(unittest.TestCase):
 
     def test_get_last_key(self):
         self.assertEqual(self.scheduler._get_last_key(3), 3)
+
+    def test_get_change_epochs(self):
+        self.assertEqual(self.scheduler.get_change_epochs(), [1, 3, 4, 100])
+
+    def test_get_period(self):
+        self.assertEqual(self.scheduler.get_period(), 1)
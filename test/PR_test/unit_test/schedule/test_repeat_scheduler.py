@@ -28,3 +28,9 @@ class TestRepeatScheduler(unittest.TestCase):
 
     def test_repeat_scheduler_all_values(self):
         self.assertEqual(self.scheduler.get_all_values(), self.input_data)
+
+    def test_repeat_scheduler_change_epochs(self):
+        self.assertEqual(self.scheduler.get_change_epochs(), [1])
+
+    def test_repeat_scheduler_period(self):
+        self.assertEqual(self.scheduler.get_period(), 3)
@@ -0,0 +1,162 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from fastestimator.summary.logs.log_parse import _LogIndex, _parse_log_files, parse_log_file
+from fastestimator.summary.logs.log_plot import _downsample, _MetricGroup
+from fastestimator.summary.metric_log import MetricLogWriter
+
+LOG_LINES = [
+    "FastEstimator-Start: step: 1; num_device: 0;\n",
+    "FastEstimator-Train: step: 1; ce: 2.3011;\n",
+    "FastEstimator-Train: step: 100; ce: 0.4123; steps/sec: 84.12;\n",
+    "FastEstimator-Eval: step: 100; epoch: 1; ce: 0.3011; accuracy: 0.9123;\n",
+    "FastEstimator-Train: step: 200; ce: 1.5e-05;\n",
+    "FastEstimator-Finish: step: 200; total_time: 12.5 sec; model_lr: 0.001;\n",
+]
+
+
+class TestParseLogFile(unittest.TestCase):
+    def setUp(self):
+        self.log_dir = tempfile.mkdtemp()
+        self.log_path = os.path.join(self.log_dir, "exp.txt")
+
+    def _write(self, lines, mode='w'):
+        with open(self.log_path, mode) as file:
+            file.writelines(lines)
+
+    def test_parse(self):
+        self._write(LOG_LINES)
+        summary = parse_log_file(self.log_path, ".txt")
+        self.assertEqual(summary.name, "exp")
+        self.assertEqual(summary.history['train']['ce'], {1: 2.3011, 100: 0.4123, 200: 1.5e-05})
+        self.assertEqual(summary.history['train']['model_lr'], {200: 0.001})
+        self.assertEqual(summary.history['eval']['accuracy'], {100: 0.9123})
+        self.assertNotIn('num_device', summary.history['train'])
+
+    def test_cache_written(self):
+        self._write(LOG_LINES)
+        parse_log_file(self.log_path, ".txt")
+        self.assertTrue(os.path.exists(_LogIndex.get_cache_path(self.log_path)))
+
+    def test_no_cache(self):
+        self._write(LOG_LINES)
+        parse_log_file(self.log_path, ".txt", cache=False)
+        self.assertFalse(os.path.exists(_LogIndex.get_cache_path(self.log_path)))
+
+    def test_incremental_parse(self):
+        self._write(LOG_LINES[:3])
+        parse_log_file(self.log_path, ".txt")
+        self._write(LOG_LINES[3:], mode='a')
+        index = _LogIndex.load(self.log_path)
+        consumed = index.offset
+        self.assertTrue(index.update())
+        self.assertEqual(index.offset - consumed, sum(len(line) for line in LOG_LINES[3:]))
+        summary = parse_log_file(self.log_path, ".txt")
+        self.assertEqual(summary.history['train']['ce'], {1: 2.3011, 100: 0.4123, 200: 1.5e-05})
+        self.assertEqual(summary.history['eval']['ce'], {100: 0.3011})
+
+    def test_unchanged_file_uses_cache(self):
+        self._write(LOG_LINES)
+        parse_log_file(self.log_path, ".txt")
+        index = _LogIndex.load(self.log_path)
+        self.assertFalse(index.update())
+        self.assertEqual(index.to_summary("exp").history['train']['ce'], {1: 2.3011, 100: 0.4123, 200: 1.5e-05})
+
+    def test_cache_is_not_pickled(self):
+        self._write(LOG_LINES)
+        parse_log_file(self.log_path, ".txt")
+        with np.load(_LogIndex.get_cache_path(self.log_path), allow_pickle=False) as cache:
+            self.assertIn('meta', cache.files)
+        # A pickle planted in place of the cache must be ignored rather than unpickled
+        with open(_LogIndex.get_cache_path(self.log_path), 'wb') as cache:
+            pickle.dump(_LogIndex(self.log_path), cache)
+        index = _LogIndex.load(self.log_path)
+        self.assertEqual(index.offset, 0)
+        self.assertTrue(index.update())
+
+    def test_rewritten_file(self):
+        self._write(LOG_LINES)
+        parse_log_file(self.log_path, ".txt")
+        self._write(["FastEstimator-Train: step: 5; ce: 0.5;\n"])
+        summary = parse_log_file(self.log_path, ".txt")
+        self.assertEqual(dict(summary.history['train']), {'ce': {5: 0.5}})
+
+    def test_partial_line(self):
+        self._write(LOG_LINES[:2] + ["FastEstimator-Train: step: 100; ce: 0.4123;"])
+        summary = parse_log_file(self.log_path, ".txt")
+        self.assertEqual(summary.history['train']['ce'], {1: 2.3011, 100: 0.4123})
+        self._write(["\n", "FastEstimator-Train: step: 200; ce: 0.1;\n"], mode='a')
+        summary = parse_log_file(self.log_path, ".txt")
+        self.assertEqual(summary.history['train']['ce'], {1: 2.3011, 100: 0.4123, 200: 0.1})
+
+    def test_parallel_parse(self):
+        paths = []
+        for idx in range(3):
+            path = os.path.join(self.log_dir, "exp{}.txt".format(idx))
+            with open(path, 'w') as file:
+                file.writelines(LOG_LINES[:idx + 2])
+            paths.append(path)
+        summaries = _parse_log_files(paths, ".txt", cache=True, num_process=2)
+        self.assertEqual([summary.name for summary in summaries], ["exp0", "exp1", "exp2"])
+        self.assertEqual([len(summary.history['train']['ce']) for summary in summaries], [1, 2, 2])
+
+    def test_binary_log(self):
+        self._write(LOG_LINES)
+        binary_path = os.path.join(self.log_dir, "binary.femlog")
+        writer = MetricLogWriter(binary_path)
+        writer.append(5, 1, "train", "ce", 0.5)
+        writer.close()
+        summaries = _parse_log_files([binary_path, self.log_path], ".txt", cache=False, num_process=1)
+        self.assertEqual([summary.name for summary in summaries], ["binary", "exp"])
+        self.assertEqual(summaries[0].history['train']['ce'], {5: 0.5})
+        self.assertEqual(len(summaries[1].history['train']['ce']), 3)
+
+
+class TestLogPlotHelpers(unittest.TestCase):
+    def test_downsample_short_series(self):
+        x = np.arange(10)
+        y = np.random.rand(10)
+        x2, y2 = _downsample(x, y, 100)
+        self.assertIs(x2, x)
+        self.assertIs(y2, y)
+
+    def test_downsample_keeps_extremes(self):
+        x = np.arange(100000)
+        y = np.zeros(100000)
+        y[51234] = 10.0
+        y[777] = -3.0
+        x2, y2 = _downsample(x, y, 100)
+        self.assertLessEqual(len(x2), 202)
+        self.assertIn(51234, x2)
+        self.assertIn(777, x2)
+        self.assertEqual(x2[0], 0)
+        self.assertEqual(x2[-1], 99999)
+        self.assertTrue(np.all(np.diff(x2) > 0))
+
+    def test_metric_group_numeric_fast_path(self):
+        group = _MetricGroup()
+        group.add(0, 'train', {3: 0.3, 1: 0.1, 2: 0.2})
+        self.assertTrue(np.array_equal(group[0]['train'], np.array([[1, 0.1], [2, 0.2], [3, 0.3]])))
+
+    def test_metric_group_string_values(self):
+        group = _MetricGroup()
+        group.add(0, 'train', {2: "0.2 sec", 1: "0.1 sec"})
+        self.assertTrue(np.array_equal(group[0]['train'], np.array([[1, 0.1], [2, 0.2]])))
@@ -0,0 +1,182 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import pickle
+import tempfile
+import unittest
+
+import numpy as np
+
+from fastestimator.summary.history import MetricHistory
+from fastestimator.summary.metric_log import read_metric_log
+from fastestimator.summary.summary import Summary
+
+
+class TestMetricHistory(unittest.TestCase):
+    def test_unbounded(self):
+        history = MetricHistory()
+        for step in range(1, 1001):
+            history[step] = step / 2
+        self.assertEqual(len(history), 1000)
+        self.assertEqual(history[10], 5.0)
+        self.assertEqual(history, {step: step / 2 for step in range(1, 1001)})
+
+    def test_mixed_values(self):
+        history = MetricHistory()
+        history[1] = 1
+        history[2] = 2.5
+        history[3] = "hello"
+        history[4] = np.array([1, 2])
+        self.assertEqual(history[1], 1)
+        self.assertEqual(history[2], 2.5)
+        self.assertEqual(history[3], "hello")
+        np.testing.assert_array_equal(history[4], [1, 2])
+
+    def test_out_of_order(self):
+        history = MetricHistory()
+        history[5] = 5
+        history[1] = 1
+        history[3] = 3
+        self.assertEqual(list(history), [1, 3, 5])
+        del history[3]
+        self.assertEqual(history.items(), [(1, 1), (5, 5)])
+        self.assertNotIn(3, history)
+
+    def test_overwrite(self):
+        history = MetricHistory(max_steps=4)
+        history[1] = 1.0
+        history[1] = 2.0
+        self.assertEqual(history, {1: 2.0})
+
+    def test_downsample_bound(self):
+        history = MetricHistory(max_steps=100)
+        for step in range(1, 10001):
+            history[step] = float(step)
+        self.assertLessEqual(len(history), 100)
+        self.assertGreaterEqual(len(history), 50)
+        steps = np.array(list(history))
+        gaps = np.diff(steps)
+        self.assertTrue(np.all(gaps == gaps[0]))
+        self.assertEqual(steps[0], 1)
+
+    def test_reservoir_bound(self):
+        history = MetricHistory(max_steps=100, retention='reservoir')
+        for step in range(1, 10001):
+            history[step] = float(step)
+        self.assertEqual(len(history), 100)
+        # A uniform sample should include values from throughout training
+        self.assertGreater(max(history), 5000)
+        self.assertLess(min(history), 5000)
+
+    def test_pinned_retained(self):
+        for retention in ('downsample', 'reservoir'):
+            with self.subTest(retention=retention):
+                history = MetricHistory(max_steps=10, retention=retention)
+                for step in range(1, 1001):
+                    history.record(step, float(step), pinned=step % 100 == 0)
+                for step in range(100, 1001, 100):
+                    self.assertIn(step, history)
+                self.assertLessEqual(len(history), 20)
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            MetricHistory(max_steps=0)
+        with self.assertRaises(ValueError):
+            MetricHistory(retention='random')
+
+    def test_pop_changes(self):
+        history = MetricHistory()
+        history[1] = 1.0
+        history[2] = 2.0
+        steps, values = history.pop_changes()
+        self.assertEqual(steps.tolist(), [1, 2])
+        self.assertTrue(history.is_saved())
+        history[3] = 3.0
+        self.assertFalse(history.is_saved())
+        steps, values = history.pop_changes()
+        self.assertEqual(steps.tolist(), [3])
+        self.assertEqual(values.tolist(), [3.0])
+        self.assertEqual(history.pop_changes()[0].size, 0)
+
+    def test_pickle(self):
+        history = MetricHistory(max_steps=10)
+        for step in range(1, 101):
+            history.record(step, float(step), pinned=step == 50)
+        restored = pickle.loads(pickle.dumps(history))
+        self.assertEqual(restored, history)
+        self.assertEqual(restored.get_config(), history.get_config())
+        history[101] = 1.0
+        restored[101] = 1.0
+        self.assertEqual(restored, history)
+
+
+class TestSummaryHistory(unittest.TestCase):
+    def setUp(self):
+        self.file_path = os.path.join(tempfile.mkdtemp(), "history.femlog")
+
+    def test_bounded_summary(self):
+        summary = Summary(name='exp', max_steps=5)
+        for step in range(1, 101):
+            summary.history['train']['ce'][step] = 1.0 / step
+        self.assertLessEqual(len(summary.history['train']['ce']), 5)
+
+    def test_save_history_delta(self):
+        summary = Summary(name='exp')
+        for step in range(1, 11):
+            summary.history['train']['ce'][step] = float(step)
+        summary.save_history(self.file_path)
+        first_size = os.path.getsize(self.file_path)
+        summary.save_history(self.file_path)
+        self.assertEqual(os.path.getsize(self.file_path), first_size)  # Nothing new to write
+        summary.history['train']['ce'][11] = 11.0
+        summary.save_history(self.file_path)
+        self.assertEqual(read_metric_log(self.file_path)['train']['ce'],
+                         {step: float(step)
+                          for step in range(1, 12)})
+        self.assertEqual(read_metric_log(self.file_path, end=first_size)['train']['ce'],
+                         {step: float(step)
+                          for step in range(1, 11)})
+
+    def test_pickle_after_save(self):
+        summary = Summary(name='exp', max_steps=4)
+        for step in range(1, 21):
+            summary.history['train']['ce'][step] = float(step)
+        summary.history['eval']['acc'][20] = 0.5
+        summary.history['eval']['notes'] = {20: 'hello'}
+        summary.history['eval']['labels'][20] = ('cat', 'dog')
+        summary.save_history(self.file_path)
+        with summary.external_history():
+            state = pickle.dumps(summary)
+        restored = pickle.loads(state)
+        self.assertEqual(restored.history['train']['ce'], summary.history['train']['ce'])
+        self.assertEqual(restored.history['eval']['acc'], {20: 0.5})
+        self.assertEqual(restored.history['eval']['notes'], {20: 'hello'})
+        self.assertEqual(restored.history['eval']['labels'], {20: ('cat', 'dog')})
+        # Values written after the pickle was taken should not leak into the restored summary
+        summary.history['train']['ce'][100] = 100.0
+        summary.save_history(self.file_path)
+        with restored.external_history():
+            restored = pickle.loads(pickle.dumps(restored))
+        self.assertNotIn(100, restored.history['train']['ce'])
+
+    def test_pickle_without_external_history(self):
+        summary = Summary(name='exp')
+        for step in range(1, 11):
+            summary.history['train']['ce'][step] = float(step)
+        summary.save_history(self.file_path)
+        state = pickle.dumps(summary)
+        os.remove(self.file_path)  # Ex. RestoreWizard clearing out the history file at the start of a fresh run
+        restored = pickle.loads(state)
+        self.assertEqual(restored.history['train']['ce'], summary.history['train']['ce'])
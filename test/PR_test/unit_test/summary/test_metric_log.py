@@ -0,0 +1,115 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import os
+import tempfile
+import unittest
+
+import numpy as np
+
+from fastestimator.summary.metric_log import MetricLogWriter, read_metric_log
+from fastestimator.summary.summary import Summary
+
+
+class TestMetricLog(unittest.TestCase):
+    def setUp(self):
+        self.file_path = os.path.join(tempfile.mkdtemp(), "exp.femlog")
+
+    def test_round_trip(self):
+        writer = MetricLogWriter(self.file_path)
+        writer.append(1, 1, "train", "ce", 2.5)
+        writer.append(2, 1, "train", "ce", np.float32(1.5))
+        writer.append(2, 1, "eval", "epoch", 1)
+        writer.append(2, 1, "eval", "confusion", np.array([[1, 2], [3, 4]]))
+        writer.append(2, 1, "eval", "note", "hello")
+        writer.close()
+        history = read_metric_log(self.file_path)
+        self.assertEqual(history["train"]["ce"], {1: 2.5, 2: 1.5})
+        self.assertEqual(history["eval"]["epoch"], {2: 1})
+        self.assertIsInstance(history["eval"]["epoch"][2], int)
+        self.assertTrue(np.array_equal(history["eval"]["confusion"][2], np.array([[1, 2], [3, 4]])))
+        self.assertEqual(history["eval"]["note"], {2: "hello"})
+
+    def test_types_preserved(self):
+        values = [np.float32(1.5), np.int64(4), True, 2**60, np.array([7]), np.array(3.0), [1, 2], {"a": None}, (1, 2)]
+        writer = MetricLogWriter(self.file_path)
+        for idx, value in enumerate(values):
+            writer.append(1, 1, "train", str(idx), value)
+        writer.close()
+        history = read_metric_log(self.file_path)
+        for idx, value in enumerate(values[:-1]):
+            restored = history["train"][str(idx)][1]
+            with self.subTest(value=value):
+                self.assertIs(type(restored), type(value))
+                self.assertEqual(np.shape(restored), np.shape(value))
+                self.assertTrue(np.array_equal(restored, value))
+        # Values which JSON can't represent exactly are kept as strings
+        self.assertEqual(history["train"]["8"][1], "(1, 2)")
+
+    def test_mixed_kinds(self):
+        writer = MetricLogWriter(self.file_path)
+        writer.append(1, 1, "train", "ce", 0.5)
+        writer.append(2, 1, "train", "pipeline_op_time", "Minmax: 1ms")
+        writer.append(1, 1, "train", "epoch", 1)
+        writer.append(3, 1, "train", "confusion", np.array([1, 2]))
+        writer.append(1, 1, "train", "lr", 0.1)
+        writer.close()
+        history = read_metric_log(self.file_path)
+        # Each non-scalar key is directly followed in the string table by a scalar key, whose values must be untouched
+        self.assertEqual(history["train"]["epoch"], {1: 1})
+        self.assertEqual(history["train"]["lr"], {1: 0.1})
+        self.assertEqual(history["train"]["pipeline_op_time"], {2: "Minmax: 1ms"})
+        self.assertEqual(history["train"]["ce"], {1: 0.5})
+
+    def test_chunking(self):
+        writer = MetricLogWriter(self.file_path, chunk_size=3)
+        for step in range(10):
+            writer.append(step, 0, "train", "loss", float(step))
+        # Full chunks should already be on disk without waiting for close()
+        self.assertEqual(len(read_metric_log(self.file_path)["train"]["loss"]), 9)
+        writer.close()
+        self.assertEqual(read_metric_log(self.file_path)["train"]["loss"], {step: float(step) for step in range(10)})
+
+    def test_append_to_existing(self):
+        writer = MetricLogWriter(self.file_path)
+        writer.append(1, 1, "train", "ce", 2.5)
+        writer.close()
+        writer = MetricLogWriter(self.file_path)
+        writer.append(2, 1, "train", "ce", 1.5)
+        writer.close()
+        self.assertEqual(read_metric_log(self.file_path)["train"]["ce"], {1: 2.5, 2: 1.5})
+
+    def test_partial_chunk_ignored(self):
+        writer = MetricLogWriter(self.file_path)
+        writer.append(1, 1, "train", "ce", 2.5)
+        writer.flush()
+        writer.append(2, 1, "train", "ce", 1.5)
+        writer.close()
+        with open(self.file_path, 'r+b') as file:
+            file.truncate(os.path.getsize(self.file_path) - 5)
+        self.assertEqual(read_metric_log(self.file_path)["train"]["ce"], {1: 2.5})
+
+    def test_invalid_file(self):
+        with open(self.file_path, 'w') as file:
+            file.write("FastEstimator-Train: step: 1; ce: 2.3;\n")
+        with self.assertRaises(ValueError):
+            read_metric_log(self.file_path)
+
+    def test_summary_from_metric_log(self):
+        writer = MetricLogWriter(self.file_path)
+        writer.append(100, 1, "eval", "accuracy", 0.9)
+        writer.close()
+        summary = Summary.from_metric_log(self.file_path)
+        self.assertEqual(summary.name, "exp")
+        self.assertEqual(summary.history["eval"]["accuracy"], {100: 0.9})
@@ -0,0 +1,126 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import json
+import sys
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+import fastestimator as fe
+
+
+def _reduce_rank():
+    rank = fe.util.get_rank()
+    return {
+        "world_size": fe.util.get_world_size(),
+        "main": fe.util.is_main_process(),
+        "sum": fe.util.all_reduce(rank, op="sum"),
+        "mean": fe.util.all_reduce(np.float32(rank), op="mean"),
+        "max": fe.util.all_reduce(torch.tensor([rank, -rank]), op="max")
+    }
+
+
+_TF_WORKER_SCRIPT = """
+import json
+import numpy as np
+import fastestimator as fe
+fe.util.enable_tf_multi_worker()
+rank = fe.util.get_rank()
+print(json.dumps({
+    "rank": rank,
+    "world_size": fe.util.get_world_size(),
+    "main": fe.util.is_main_process(),
+    "sum": fe.util.all_reduce(rank + 1, op="sum").tolist(),
+    "mean": fe.util.all_reduce(np.float32(rank), op="mean").tolist(),
+    "max": fe.util.all_reduce(np.array([rank, -rank]), op="max").tolist()
+}))
+"""
+
+
+def _fail_on_rank_1():
+    if fe.util.get_rank() == 1:
+        raise ValueError("Intentional failure")
+    return fe.util.all_reduce(1.0)
+
+
+class TestDistributed(unittest.TestCase):
+    def test_not_distributed(self):
+        self.assertFalse(fe.util.is_distributed())
+        self.assertEqual(fe.util.get_rank(), 0)
+        self.assertEqual(fe.util.get_world_size(), 1)
+        self.assertTrue(fe.util.is_main_process())
+        self.assertEqual(fe.util.all_reduce(3, op="sum"), 3)
+
+    def test_launch_all_reduce(self):
+        result = fe.util.launch(_reduce_rank, num_process=3, backend="gloo")
+        self.assertEqual(result["world_size"], 3)
+        self.assertTrue(result["main"])
+        self.assertEqual(result["sum"], 3)
+        self.assertEqual(result["sum"].dtype, np.int64)
+        self.assertAlmostEqual(float(result["mean"]), 1.0)
+        np.testing.assert_array_equal(result["max"], [2, 0])
+        self.assertFalse(fe.util.is_distributed())
+
+    def test_launch_failure(self):
+        with self.assertRaises(RuntimeError):
+            fe.util.launch(_fail_on_rank_1, num_process=2, backend="gloo")
+
+    def test_launch_after_cuda_init(self):
+        with patch("torch.cuda.is_initialized", return_value=True):
+            with self.assertRaisesRegex(RuntimeError, "CUDA"):
+                fe.util.launch(_reduce_rank, num_process=2, backend="gloo")
+
+    def test_build_leaves_cuda_uninitialized(self):
+        fe.build(fe.architecture.pytorch.LeNet, optimizer_fn="adam")
+        self.assertFalse(torch.cuda.is_initialized())
+
+    def test_invalid_args(self):
+        with self.assertRaises(ValueError):
+            fe.util.all_reduce(1, op="min")
+        with self.assertRaises(ValueError):
+            fe.util.launch(_reduce_rank, num_process=0)
+
+
+class TestTfMultiWorker(unittest.TestCase):
+    def test_not_in_cluster(self):
+        self.assertEqual(fe.util.get_tf_cluster_size(), 0)
+        self.assertFalse(fe.util.enable_tf_multi_worker())
+        self.assertIsNone(fe.util.get_tf_strategy())
+
+    def test_data_parallel_strategies(self):
+        self.assertIn(tf.distribute.MirroredStrategy, fe.util.TF_DATA_PARALLEL_STRATEGIES)
+        with tf.distribute.MirroredStrategy(devices=["/cpu:0"]).scope():
+            self.assertIsInstance(fe.util.get_tf_strategy(), tf.distribute.MirroredStrategy)
+
+    def test_launch_tf_workers(self):
+        outputs = fe.util.launch_tf_workers([sys.executable, "-c", _TF_WORKER_SCRIPT],
+                                            num_workers=2,
+                                            env={"CUDA_VISIBLE_DEVICES": ""},
+                                            timeout=300)
+        results = [json.loads(output.strip().splitlines()[-1]) for output in outputs]
+        for rank, result in enumerate(results):
+            self.assertEqual(result["rank"], rank)
+            self.assertEqual(result["world_size"], 2)
+            self.assertEqual(result["main"], rank == 0)
+            self.assertEqual(result["sum"], 3)
+            self.assertAlmostEqual(result["mean"], 0.5)
+            self.assertEqual(result["max"], [1, 0])
+
+    def test_launch_tf_workers_failure(self):
+        with self.assertRaises(RuntimeError):
+            fe.util.launch_tf_workers([sys.executable, "-c", "raise ValueError()"], num_workers=2, timeout=300)
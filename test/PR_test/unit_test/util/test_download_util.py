@@ -0,0 +1,173 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import hashlib
+import io
+import os
+import tarfile
+import tempfile
+import threading
+import unittest
+import zipfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import fastestimator as fe
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    """A stand-in file server which supports range requests, and can be told to drop connections part way through."""
+    files = {}
+    requests = []
+    truncate = {}
+
+    def do_GET(self):
+        body = self.files.get(self.path)
+        if body is None:
+            self.send_error(404)
+            return
+        self.requests.append((self.path, self.headers.get("Range")))
+        start = 0
+        if self.headers.get("Range"):
+            start = int(self.headers["Range"].split("=")[1].split("-")[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        limit = self.truncate.pop(self.path, None)
+        self.wfile.write(body[start:limit])
+
+    def log_message(self, *args):
+        pass
+
+
+def _make_zip(members):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, data in members.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _make_tar(members):
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode='w:gz') as archive:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return buffer.getvalue()
+
+
+class TestDownloadFiles(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), _RangeHandler)
+        cls.url = "http://127.0.0.1:{}".format(cls.server.server_address[1])
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.dir = self.tmp_dir.name
+        _RangeHandler.files = {f"/file{idx}.bin": os.urandom(100000 + idx) for idx in range(3)}
+        _RangeHandler.requests = []
+        _RangeHandler.truncate = {}
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def _remote(self, name, sha256=None):
+        return fe.util.RemoteFile(self.url + "/" + name, os.path.join(self.dir, name), sha256=sha256)
+
+    def test_parallel_download(self):
+        files = [self._remote(f"file{idx}.bin") for idx in range(3)]
+        paths = fe.util.download_files(files, max_workers=3, mirror="", offline=False, verbose=False)
+        for idx, path in enumerate(paths):
+            with open(path, 'rb') as file:
+                self.assertEqual(file.read(), _RangeHandler.files[f"/file{idx}.bin"])
+        # Existing files are not downloaded again
+        fe.util.download_files(files, mirror="", offline=False, verbose=False)
+        self.assertEqual(len(_RangeHandler.requests), 3)
+
+    def test_resume(self):
+        body = _RangeHandler.files["/file0.bin"]
+        _RangeHandler.truncate["/file0.bin"] = 40000
+        path = fe.util.download_files([self._remote("file0.bin", sha256=hashlib.sha256(body).hexdigest())],
+                                      mirror="",
+                                      offline=False,
+                                      verbose=False)[0]
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read(), body)
+        self.assertEqual(_RangeHandler.requests, [("/file0.bin", None), ("/file0.bin", "bytes=40000-")])
+        self.assertFalse(os.path.exists(path + ".part"))
+
+    def test_checksum_mismatch(self):
+        with self.assertRaises(ValueError):
+            fe.util.download_files([self._remote("file0.bin", sha256="0" * 64)],
+                                   mirror="",
+                                   offline=False,
+                                   retries=1,
+                                   verbose=False)
+        self.assertEqual(len(_RangeHandler.requests), 2)
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "file0.bin")))
+
+    def test_offline_with_local_mirror(self):
+        with self.assertRaises(FileNotFoundError):
+            fe.util.download_files([self._remote("file1.bin")], mirror="", offline=True, verbose=False)
+        mirror = os.path.join(self.dir, "mirror")
+        os.makedirs(mirror)
+        with open(os.path.join(mirror, "file1.bin"), 'wb') as file:
+            file.write(b"mirrored")
+        path = fe.util.download_files([self._remote("file1.bin")], mirror=mirror, offline=True, verbose=False)[0]
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read(), b"mirrored")
+        self.assertEqual(_RangeHandler.requests, [])
+
+    def test_url_mirror(self):
+        _RangeHandler.files["/mirror/file2.bin"] = b"from mirror"
+        path = fe.util.download_files([self._remote("file2.bin")],
+                                      mirror=self.url + "/mirror",
+                                      offline=True,
+                                      verbose=False)[0]
+        with open(path, 'rb') as file:
+            self.assertEqual(file.read(), b"from mirror")
+
+    def test_extract(self):
+        _RangeHandler.files["/a.zip"] = _make_zip({f"a/{idx}.txt": str(idx) * 10 for idx in range(20)})
+        _RangeHandler.files["/b.tar.gz"] = _make_tar({"b/x.txt": b"x", "b/sub/y.txt": b"y"})
+        extract_dir = os.path.join(self.dir, "extracted")
+        fe.util.download_files([self._remote("a.zip"), self._remote("b.tar.gz")],
+                               extract_dir=extract_dir,
+                               mirror="",
+                               offline=False,
+                               verbose=False)
+        self.assertEqual(len(os.listdir(os.path.join(extract_dir, "a"))), 20)
+        with open(os.path.join(extract_dir, "a", "7.txt")) as file:
+            self.assertEqual(file.read(), "7" * 10)
+        with open(os.path.join(extract_dir, "b", "sub", "y.txt")) as file:
+            self.assertEqual(file.read(), "y")
+
+    def test_extract_members(self):
+        path = os.path.join(self.dir, "c.zip")
+        with open(path, 'wb') as file:
+            file.write(_make_zip({"keep/1.txt": "1", "__MACOSX/1.txt": "junk"}))
+        fe.util.extract_archive(path, self.dir, members=lambda name: name.startswith("keep/"), max_workers=2)
+        self.assertTrue(os.path.exists(os.path.join(self.dir, "keep", "1.txt")))
+        self.assertFalse(os.path.exists(os.path.join(self.dir, "__MACOSX")))
@@ -0,0 +1,35 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import sys
+import unittest
+
+from fastestimator.util.lazy_util import lazy_import
+
+
+class TestLazyImport(unittest.TestCase):
+    def test_imported_on_first_use(self):
+        sys.modules.pop('colorsys', None)
+        colorsys = lazy_import('colorsys')
+        self.assertNotIn('colorsys', sys.modules)
+        self.assertEqual(colorsys.rgb_to_hsv(1.0, 0.0, 0.0), (0.0, 1.0, 1.0))
+        self.assertIn('colorsys', sys.modules)
+        self.assertIs(colorsys.rgb_to_hsv, sys.modules['colorsys'].rgb_to_hsv)
+
+    def test_already_imported(self):
+        self.assertIs(lazy_import('unittest'), unittest)
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            lazy_import('json').not_a_real_attribute
@@ -0,0 +1,46 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+import unittest
+
+import numpy as np
+
+import fastestimator as fe
+from fastestimator.util.random_util import get_base_seed, seed_global_rngs
+
+
+class TestGetRng(unittest.TestCase):
+    def test_matches_spawned_children(self):
+        child = np.random.SeedSequence(42).spawn(4)[3].spawn(8)[7]
+        expected = np.random.Generator(np.random.Philox(child)).integers(2**32, size=5)
+        np.testing.assert_array_equal(fe.util.get_rng(42, 3, 7).integers(2**32, size=5), expected)
+
+    def test_streams_are_independent(self):
+        self.assertEqual(fe.util.get_rng(1, 2, 3).uniform(), fe.util.get_rng(1, 2, 3).uniform())
+        self.assertNotEqual(fe.util.get_rng(1, 2, 3).uniform(), fe.util.get_rng(1, 3, 2).uniform())
+        self.assertNotEqual(fe.util.get_rng(1, 2, 3).uniform(), fe.util.get_rng(2, 2, 3).uniform())
+
+    def test_seed_global_rngs(self):
+        seed_global_rngs(fe.util.get_rng(5, 0))
+        first = np.random.uniform()
+        seed_global_rngs(fe.util.get_rng(5, 0))
+        self.assertEqual(np.random.uniform(), first)
+
+    def test_base_seed(self):
+        fe.fe_deterministic_seed = 17
+        try:
+            self.assertEqual(get_base_seed(), 17)
+        finally:
+            fe.fe_deterministic_seed = None
+        self.assertNotEqual(get_base_seed(), get_base_seed())
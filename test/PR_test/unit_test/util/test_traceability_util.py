@@ -14,9 +14,12 @@
 # ==============================================================================
 import unittest
 
+import numpy as np
 import torch
 
-from fastestimator.util.traceability_util import FeInputSpec, _extract_args
+from fastestimator.dataset.numpy_dataset import NumpyDataset
+from fastestimator.util.traceability_util import FeInputSpec, _extract_args, enable_traceability, is_traceable
+from fastestimator.util.util import FEID
 
 
 class TestFeInputSpec(unittest.TestCase):
@@ -105,3 +108,55 @@ class TestExtractArgs(unittest.TestCase):
     def test_collection_args(self):
         resp = _extract_args('x1=[a, b, c], x2 = {5: "32", 4:[21,22,23]}, x3 = (x+22):')
         self.assertSetEqual({'x1', 'x2', 'x3'}, resp)
+
+
+class TestLazyTraceability(unittest.TestCase):
+    def setUp(self):
+        self.data = {'x': np.ones((10, 2), dtype=np.float32), 'y': np.arange(10)}
+
+    def tearDown(self):
+        enable_traceability(True)
+
+    def test_tables_built_on_demand(self):
+        ds = NumpyDataset(self.data)
+        self.assertTrue(is_traceable(ds))
+        self.assertNotIn('_fe_traceability_tables', ds.__dict__, "Tables should not be built during __init__")
+        tables = ds._fe_traceability_summary
+        self.assertIn(FEID(id(ds)), tables)
+        self.assertIs(tables, ds._fe_traceability_summary, "Tables should be cached after being built")
+
+    def test_split_tables(self):
+        ds = NumpyDataset(self.data)
+        child = ds.split(0.2)
+        self.assertNotIn('_fe_traceability_tables', child.__dict__, "Splitting should not build any tables")
+        parent_id, child_id = FEID(id(ds)), FEID(id(child))
+        tables = child._fe_traceability_summary
+        self.assertIn(child_id, tables)
+        self.assertIn(parent_id, tables)
+        self.assertIn('split', tables[child_id].fields)
+        self.assertIn('split', ds._fe_traceability_summary[parent_id].fields)
+
+    def test_split_tables_stratified(self):
+        ds = NumpyDataset({"x": np.arange(20), "y": np.arange(20) % 2})
+        child = ds.split(0.2, stratify="y")
+        split = child._fe_traceability_summary[FEID(id(child))].fields['split']
+        self.assertEqual(split.data, [(FEID(id(ds)), "0.2 stratified by 'y'")])
+
+    def test_split_after_tables_built(self):
+        ds = NumpyDataset(self.data)
+        _ = ds._fe_traceability_summary
+        child = ds.split(0.2)
+        self.assertIn(FEID(id(child)), child._fe_traceability_summary)
+        self.assertNotIn(FEID(id(child)), ds._fe_traceability_summary)
+        self.assertIn('split', ds._fe_traceability_summary[FEID(id(ds))].fields)
+
+    def test_disabled(self):
+        enable_traceability(False)
+        ds = NumpyDataset(self.data)
+        child = ds.split(0.2)
+        self.assertFalse(is_traceable(ds))
+        self.assertFalse(is_traceable(child))
+        self.assertFalse(hasattr(ds, '_fe_traceability_summary'))
+        enable_traceability(True)
+        self.assertFalse(is_traceable(ds), "Re-enabling traceability should only affect new objects")
+        self.assertTrue(is_traceable(NumpyDataset(self.data)))
@@ -344,6 +344,54 @@ class TestPadBatch(unittest.TestCase):
             fe.util.pad_batch(data, pad_value=0)
 
 
+class TestPadCollate(unittest.TestCase):
+    def test_pad_collate_pad_one_entry(self):
+        data = [{"x": np.ones((2, 2)), "y": 8}, {"x": np.ones((3, 1)), "y": 4}]
+        result = fe.util.pad_collate(data, pad_value=0)
+        obj = {"x": np.array([[[1., 1.], [1., 1.], [0., 0.]], [[1., 0.], [1., 0.], [1., 0.]]]), "y": [8, 4]}
+        self.assertTrue(is_equal(result, obj))
+
+    def test_pad_collate_matches_pad_batch(self):
+        data = [{"x": np.random.rand(3, 1), "y": np.ones((1, 1))}, {"x": np.random.rand(2, 2), "y": np.ones((1, 3))}]
+        result = fe.util.pad_collate(data, pad_value=-1)
+        fe.util.pad_batch(data, pad_value=-1)
+        for key in ("x", "y"):
+            self.assertTrue(is_equal(result[key], np.stack([elem[key] for elem in data])))
+
+    def test_pad_collate_same_shape(self):
+        data = [{"x": np.ones((2, 2), dtype=np.uint8)}, {"x": np.zeros((2, 2), dtype=np.uint8)}]
+        result = fe.util.pad_collate(data, pad_value=None)
+        self.assertEqual(result["x"].shape, (2, 2, 2))
+        self.assertEqual(result["x"].dtype, np.uint8)
+
+    def test_pad_collate_int_multiple(self):
+        data = [{"x": np.ones((2, 3))}, {"x": np.ones((5, 1))}]
+        result = fe.util.pad_collate(data, pad_value=0, pad_multiple=4)
+        self.assertEqual(result["x"].shape, (2, 8, 4))
+        self.assertEqual(result["x"].sum(), 11)
+
+    def test_pad_collate_per_dimension_multiple(self):
+        data = [{"x": np.ones((2, 3)), "y": np.ones((1, ))}, {"x": np.ones((2, 3)), "y": np.ones((1, ))}]
+        result = fe.util.pad_collate(data, pad_value=0, pad_multiple={"x": (None, 8)})
+        self.assertEqual(result["x"].shape, (2, 2, 8))
+        self.assertEqual(result["y"].shape, (2, 1))
+
+    def test_pad_collate_different_key_assertion(self):
+        data = [{"x1": np.ones((2, 2)), "y": 8}, {"x": np.ones((3, 1)), "y": 4}]
+        with self.assertRaises(AssertionError):
+            fe.util.pad_collate(data, pad_value=0)
+
+    def test_pad_collate_rank_mismatch_assertion(self):
+        data = [{"x": np.ones((2, 2, 2)), "y": 8}, {"x": np.ones((3, 1)), "y": 4}]
+        with self.assertRaises(AssertionError):
+            fe.util.pad_collate(data, pad_value=0)
+
+    def test_pad_collate_no_pad_value_mismatch(self):
+        data = [{"x": np.ones((2, 2))}, {"x": np.ones((3, 1))}]
+        with self.assertRaises(ValueError):
+            fe.util.pad_collate(data, pad_value=None)
+
+
 class TestPadData(unittest.TestCase):
     def test_pad_data_target_shape_all_dimension_larger(self):
         x = np.ones((1, 2))
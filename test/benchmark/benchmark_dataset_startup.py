@@ -0,0 +1,133 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Measure how long it takes (and how much memory it costs) to load the built-in datasets in a fresh interpreter.
+
+Every dataset is loaded two ways: the 'unpacked' way, which parses the original files and builds a dictionary for every
+instance (as the loaders did before they had packed caches), and the 'packed' way, which memory-maps a packed array
+cache. The packed cache is built before timing starts, and any downloads must already be present in `--root_dir`. The
+'synthetic' dataset needs no download: it compares an MNIST-sized .npz file to a packed cache of the same arrays.
+
+Usage:
+    python benchmark_dataset_startup.py [--datasets synthetic mnist cifar10 ...] [--root_dir ~/fastestimator_data]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+# Rebuild the per-instance dictionaries which NumpyDataset used to create, given a dictionary of train/eval arrays
+_UNPACK = "\n".join([
+    "from fastestimator.dataset.dataset import InMemoryDataset",
+    "for split in sorted({key.split('_')[1] for key in arrays}):",
+    "    x, y = arrays['x_' + split], arrays['y_' + split]",
+    "    InMemoryDataset({i: {'x': x[i], 'y': y[i]} for i in range(len(x))})",
+])
+
+_SYNTHETIC = "\n".join([
+    "import numpy as np",
+    "load = lambda: dict(np.load(os.path.join(root_dir, 'synthetic.npz')))",
+])
+_PACK = "\n".join([
+    "arrays = fe.dataset.cache_arrays(os.path.join(root_dir, 'synthetic_packed'), load)",
+    "for split in ('train', 'eval'):",
+    "    fe.dataset.NumpyDataset({'x': arrays['x_' + split], 'y': arrays['y_' + split]})",
+])
+
+CASES = {
+    "synthetic": (_SYNTHETIC + "\narrays = load()\n" + _UNPACK, _SYNTHETIC + "\n" + _PACK),
+    "mnist": ("arrays = fe.dataset.data.mnist._build()\n" + _UNPACK,
+              "fe.dataset.data.mnist.load_data(root_dir=root_dir)"),
+    "cifar10": ("arrays = fe.dataset.data.cifar10._build()\n" + _UNPACK,
+                "fe.dataset.data.cifar10.load_data(root_dir=root_dir)"),
+    "cifar100": ("arrays = fe.dataset.data.cifar100._build('fine')\n" + _UNPACK,
+                 "fe.dataset.data.cifar100.load_data(root_dir=root_dir)"),
+    "cifair10": ("arrays = fe.dataset.data.cifair10._build()\n" + _UNPACK,
+                 "fe.dataset.data.cifair10.load_data(root_dir=root_dir)"),
+    "cifair100": ("arrays = fe.dataset.data.cifair100._build('fine')\n" + _UNPACK,
+                  "fe.dataset.data.cifair100.load_data(root_dir=root_dir)"),
+    "usps": ("fe.dataset.data.usps.load_data(root_dir=root_dir)",
+             "fe.dataset.data.usps.load_data(root_dir=root_dir, packed=True)"),
+    "omniglot": ("fe.dataset.data.omniglot.load_data(root_dir=root_dir)",
+                 "fe.dataset.data.omniglot.load_data(root_dir=root_dir, packed=True)"),
+    "svhn": ("fe.dataset.data.svhn.load_data(root_dir=root_dir)",
+             "fe.dataset.data.svhn.load_data(root_dir=root_dir, packed=True)"),
+}
+
+
+def _measure(statement: str, root_dir: str) -> dict:
+    code = "\n".join([
+        "import json, os, resource, time",
+        "import fastestimator as fe",
+        "fe.dataset.NumpyDataset",  # Import the dataset modules before the clock starts
+        "root_dir = {!r}".format(root_dir),
+        "base_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024",
+        "start = time.perf_counter()",
+        statement,
+        "elapsed = time.perf_counter() - start",
+        "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024 - base_rss",
+        "print(json.dumps({'time': elapsed, 'rss': rss}))"
+    ])
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout.decode().strip().splitlines()[-1])
+
+
+def _write_synthetic(root_dir: str) -> None:
+    import numpy as np
+    path = os.path.join(root_dir, "synthetic.npz")
+    if not os.path.exists(path):
+        rng = np.random.default_rng(0)
+        np.savez(path,
+                 x_train=rng.integers(0, 256, size=(60000, 28, 28), dtype=np.uint8),
+                 y_train=rng.integers(0, 10, size=60000, dtype=np.uint8),
+                 x_eval=rng.integers(0, 256, size=(10000, 28, 28), dtype=np.uint8),
+                 y_eval=rng.integers(0, 10, size=10000, dtype=np.uint8))
+
+
+def benchmark(datasets: List[str], root_dir: str, repeats: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        print("{:<12} {:>14} {:>14} {:>14} {:>14}".format("Dataset",
+                                                          "Unpacked (s)",
+                                                          "Packed (s)",
+                                                          "Unpacked (MB)",
+                                                          "Packed (MB)"))
+        for dataset in datasets:
+            data_dir = root_dir
+            if dataset == "synthetic":
+                data_dir = tmp_dir
+                _write_synthetic(data_dir)
+            unpacked, packed = CASES[dataset]
+            _measure(packed, data_dir)  # Build the packed cache (and download anything which is missing)
+            unpacked = [_measure(unpacked, data_dir) for _ in range(repeats)]
+            packed = [_measure(packed, data_dir) for _ in range(repeats)]
+            print("{:<12} {:>14.3f} {:>14.3f} {:>14.1f} {:>14.1f}".format(dataset,
+                                                                          min(result["time"] for result in unpacked),
+                                                                          min(result["time"] for result in packed),
+                                                                          min(result["rss"] for result in unpacked),
+                                                                          min(result["rss"] for result in packed)))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--datasets", nargs="+", choices=sorted(CASES), default=["synthetic"], help="What to load")
+    parser.add_argument("--root_dir",
+                        default=os.path.join(str(Path.home()), "fastestimator_data"),
+                        help="Where the datasets are (or will be) stored")
+    parser.add_argument("--repeats", type=int, default=3, help="How many times to measure each dataset")
+    args = parser.parse_args()
+    benchmark(args.datasets, args.root_dir, args.repeats)
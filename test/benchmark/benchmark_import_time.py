@@ -0,0 +1,62 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Measure how long it takes to import FastEstimator (and which frameworks get loaded) in a fresh interpreter.
+
+Usage:
+    python benchmark_import_time.py [--repeats 5]
+"""
+import argparse
+import json
+import subprocess
+import sys
+from typing import List
+
+STATEMENTS = [
+    "import fastestimator",
+    "import fastestimator.cli",
+    "import fastestimator as fe; fe.Pipeline",
+    "import fastestimator as fe; fe.Estimator",
+]
+
+
+def _measure(statement: str) -> dict:
+    code = "\n".join([
+        "import json, resource, sys, time",
+        "start = time.perf_counter()",
+        statement,
+        "elapsed = time.perf_counter() - start",
+        "modules = [name for name in ('tensorflow', 'torch', 'cv2') if name in sys.modules]",
+        "rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024",
+        "print(json.dumps({'time': elapsed, 'rss': rss, 'modules': modules}))"
+    ])
+    result = subprocess.run([sys.executable, "-c", code], stdout=subprocess.PIPE, check=True)
+    return json.loads(result.stdout.decode().strip().splitlines()[-1])
+
+
+def benchmark(statements: List[str], repeats: int) -> None:
+    print("{:<45} {:>10} {:>10}  {}".format("Statement", "Time (s)", "RSS (MB)", "Frameworks loaded"))
+    for statement in statements:
+        results = [_measure(statement) for _ in range(repeats)]
+        print("{:<45} {:>10.3f} {:>10.1f}  {}".format(statement,
+                                                      min(result["time"] for result in results),
+                                                      min(result["rss"] for result in results),
+                                                      ", ".join(results[0]["modules"]) or "-"))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeats", type=int, default=5, help="How many times to measure each import")
+    args = parser.parse_args()
+    benchmark(STATEMENTS, args.repeats)
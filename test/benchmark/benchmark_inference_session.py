@@ -0,0 +1,111 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Compare the latency and throughput of InferenceSession against calling Pipeline.transform + Network.transform.
+
+Several client threads each send requests one after another, as a simple closed-loop load generator.
+
+Usage:
+    python benchmark_inference_session.py [--clients 1 8 32] [--requests 50] [--max_batch_size 32]
+                                          [--max_latency 0.005]
+"""
+import argparse
+import threading
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import torch
+
+import fastestimator as fe
+from fastestimator.op.numpyop.univariate import Minmax
+from fastestimator.op.tensorop.model import ModelOp
+
+
+class _ConvNet(torch.nn.Module):
+    def __init__(self) -> None:
+        super().__init__()
+        self.layers = torch.nn.Sequential(torch.nn.Conv2d(1, 32, 3), torch.nn.ReLU(), torch.nn.MaxPool2d(2),
+                                          torch.nn.Conv2d(32, 64, 3), torch.nn.ReLU(), torch.nn.MaxPool2d(2),
+                                          torch.nn.Flatten(), torch.nn.Linear(64 * 5 * 5, 10), torch.nn.Softmax(-1))
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        return self.layers(x)
+
+
+def _load_test(predict: Callable[[Dict[str, np.ndarray]], Dict], clients: int, requests: int) -> List[float]:
+    latencies = []
+    lock = threading.Lock()
+
+    def client() -> None:
+        local = []
+        for _ in range(requests):
+            image = np.random.randint(0, 256, size=(1, 28, 28), dtype=np.uint8)
+            start = time.perf_counter()
+            predict({"x": image})
+            local.append(time.perf_counter() - start)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(clients)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies
+
+
+def _report(method: str, predict: Callable[[Dict[str, np.ndarray]], Dict], clients: List[int], requests: int) -> None:
+    predict({"x": np.zeros((1, 28, 28), dtype=np.uint8)})  # Warm up any lazy initialization
+    for n_clients in clients:
+        start = time.perf_counter()
+        latencies = np.array(_load_test(predict, n_clients, requests)) * 1000
+        throughput = len(latencies) / (time.perf_counter() - start)
+        print("{:<18}{:>8}{:>12.2f}{:>12.2f}{:>14.1f}".format(method,
+                                                              n_clients,
+                                                              np.percentile(latencies, 50),
+                                                              np.percentile(latencies, 99),
+                                                              throughput))
+
+
+def benchmark(clients: List[int], requests: int, max_batch_size: int, max_latency: float) -> None:
+    model = fe.build(model_fn=_ConvNet, optimizer_fn=None)
+    network = fe.Network(ops=[ModelOp(model=model, inputs="x", outputs="y_pred")])
+    pipeline = fe.Pipeline(train_data=fe.dataset.NumpyDataset({"x": np.zeros((1, 1, 28, 28), dtype=np.uint8)}),
+                           batch_size=1,
+                           ops=[Minmax(inputs="x", outputs="x")])
+    lock = threading.Lock()
+
+    def naive(data: Dict[str, np.ndarray]) -> Dict:
+        data = pipeline.transform(data, mode="infer")
+        with lock:  # Network.transform loads and unloads the models, so it cannot be called concurrently
+            return network.transform(data, mode="infer")
+
+    print("{:<18}{:>8}{:>12}{:>12}{:>14}".format("Method", "Clients", "p50 (ms)", "p99 (ms)", "Throughput/s"))
+    _report("transform", naive, clients, requests)
+    with fe.InferenceSession(pipeline, network, max_batch_size=max_batch_size, max_latency=max_latency) as session:
+        _report("InferenceSession", session.predict, clients, requests)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark InferenceSession against Pipeline/Network.transform")
+    parser.add_argument("--clients", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--max_batch_size", type=int, default=32)
+    parser.add_argument("--max_latency", type=float, default=0.005)
+    args = parser.parse_args()
+    benchmark(clients=args.clients,
+              requests=args.requests,
+              max_batch_size=args.max_batch_size,
+              max_latency=args.max_latency)
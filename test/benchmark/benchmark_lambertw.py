@@ -0,0 +1,73 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Measure the throughput and accuracy of fe.backend.lambertw on large batches of SuperLoss-style inputs.
+
+Usage:
+    python benchmark_lambertw.py [--batch_sizes 1024 65536 1048576] [--dtypes float16 float32 float64] [--repeats 20]
+"""
+import argparse
+import math
+import time
+from typing import Callable, List
+
+import numpy as np
+import tensorflow as tf
+import torch
+from scipy.special import lambertw
+
+import fastestimator as fe
+
+
+def _time(fn: Callable[[], None], repeats: int) -> float:
+    fn()  # Warm up any lazy initialization / tracing
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(batch_sizes: List[int], dtypes: List[str], repeats: int) -> None:
+    device = torch.device("cuda:0" if torch.cuda.is_available() else "cpu")
+    tf_lambertw = tf.function(fe.backend.lambertw)
+    print("{:<10}{:>10}{:>14}{:>14}{:>14}{:>14}".format("Dtype", "Batch", "TF (s)", "Torch (s)", "TF err",
+                                                         "Torch err"))
+    for dtype in dtypes:
+        for batch_size in batch_sizes:
+            # SuperLoss evaluates lambertw on 0.5 * max(-2/e, beta), so cover the whole principal branch
+            z = np.random.uniform(-1.0 / math.e, 10.0, size=batch_size).astype(dtype)
+            target = lambertw(z.astype("float64"), k=0).real
+            tf_z = tf.constant(z)
+            tf_time = _time(lambda: tf_lambertw(tf_z).numpy(), repeats)
+            torch_z = torch.tensor(z).to(device)
+
+            def torch_fn() -> None:
+                fe.backend.lambertw(torch_z)
+                if device.type == "cuda":
+                    torch.cuda.synchronize()
+
+            torch_time = _time(torch_fn, repeats)
+            tf_err = np.max(np.abs(tf_lambertw(tf_z).numpy().astype("float64") - target))
+            torch_err = np.max(np.abs(fe.backend.lambertw(torch_z).cpu().numpy().astype("float64") - target))
+            print("{:<10}{:>10}{:>14.5f}{:>14.5f}{:>14.2e}{:>14.2e}".format(dtype, batch_size, tf_time, torch_time,
+                                                                            tf_err, torch_err))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark the fe.backend.lambertw implementations")
+    parser.add_argument("--batch_sizes", type=int, nargs="+", default=[1024, 65536, 1048576])
+    parser.add_argument("--dtypes", type=str, nargs="+", default=["float16", "float32", "float64"])
+    parser.add_argument("--repeats", type=int, default=20)
+    args = parser.parse_args()
+    benchmark(batch_sizes=args.batch_sizes, dtypes=args.dtypes, repeats=args.repeats)
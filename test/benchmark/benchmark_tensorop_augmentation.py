@@ -0,0 +1,81 @@
+# Copyright 2021 The FastEstimator Authors. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+"""Compare the CPU throughput of the batched TensorOp augmentations against their per-sample NumpyOp counterparts.
+
+Usage:
+    python benchmark_tensorop_augmentation.py [--image_size 224] [--batch_sizes 8 32 128] [--repeats 5]
+"""
+import argparse
+import time
+from typing import Callable, Dict, List
+
+import numpy as np
+import tensorflow as tf
+import torch
+
+import fastestimator as fe
+
+
+def _get_op_pairs(image_size: int) -> Dict[str, List]:
+    numpy_ops = fe.op.numpyop.multivariate
+    tensor_ops = fe.op.tensorop.augmentation
+    return {
+        "Rotate": [numpy_ops.Rotate(limit=30, image_in="x"), tensor_ops.Rotate(limit=30, image_in="x")],
+        "ShiftScaleRotate": [numpy_ops.ShiftScaleRotate(image_in="x"), tensor_ops.ShiftScaleRotate(image_in="x")],
+        "RandomResizedCrop": [
+            numpy_ops.RandomResizedCrop(height=image_size, width=image_size, image_in="x"),
+            tensor_ops.RandomResizedCrop(height=image_size, width=image_size, image_in="x")
+        ],
+        "ElasticTransform": [
+            numpy_ops.ElasticTransform(alpha_affine=0, image_in="x"), tensor_ops.ElasticTransform(image_in="x")
+        ],
+        "GridDistortion": [numpy_ops.GridDistortion(image_in="x"), tensor_ops.GridDistortion(image_in="x")],
+        "HueSaturationValue": [
+            fe.op.numpyop.univariate.HueSaturationValue(inputs="x", outputs="x"),
+            tensor_ops.HueSaturationValue(inputs="x", outputs="x")
+        ]
+    }
+
+
+def _time(fn: Callable[[], None], repeats: int) -> float:
+    fn()  # Warm up any lazy initialization
+    start = time.perf_counter()
+    for _ in range(repeats):
+        fn()
+    return (time.perf_counter() - start) / repeats
+
+
+def benchmark(image_size: int, batch_sizes: List[int], repeats: int) -> None:
+    print("{:<20}{:>8}{:>14}{:>14}{:>14}".format("Op", "Batch", "NumpyOp (s)", "TF (s)", "Torch (s)"))
+    for name, (numpy_op, tensor_op) in _get_op_pairs(image_size).items():
+        for batch_size in batch_sizes:
+            images = np.random.randint(0, 256, size=(batch_size, image_size, image_size, 3), dtype=np.uint8)
+            numpy_time = _time(lambda: [numpy_op.forward([image], {"mode": "train"}) for image in images], repeats)
+            tensor_op.build("tf")
+            tf_images = tf.constant(images)
+            tf_time = _time(lambda: tensor_op.forward([tf_images], {"mode": "train"}), repeats)
+            tensor_op.build("torch", device=torch.device("cpu"))
+            torch_images = torch.tensor(images).permute(0, 3, 1, 2)
+            torch_time = _time(lambda: tensor_op.forward([torch_images], {"mode": "train"}), repeats)
+            print("{:<20}{:>8}{:>14.4f}{:>14.4f}{:>14.4f}".format(name, batch_size, numpy_time, tf_time, torch_time))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark batched TensorOp augmentations against NumpyOps")
+    parser.add_argument("--image_size", type=int, default=224)
+    parser.add_argument("--batch_sizes", type=int, nargs="+", default=[8, 32, 128])
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    benchmark(image_size=args.image_size, batch_sizes=args.batch_sizes, repeats=args.repeats)